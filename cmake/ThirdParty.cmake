@@ -3,6 +3,11 @@
 
 find_package(tomlplusplus REQUIRED)
 
+#-----------------------------------------------------------------------
+# Threads
+
+find_package(Threads REQUIRED)
+
 #-----------------------------------------------------------------------
 # Python
 
@@ -99,13 +99,9 @@ def print_traits_data(data):
     #
     # [1] https://github.com/OpenAssetIO/OpenAssetIO-MediaCreation
 
-    as_dict = {
-        trait_id: {
-            property_key: data.getTraitProperty(trait_id, property_key)
-            for property_key in data.traitPropertyKeys(trait_id)
-        }
-        for trait_id in data.traitSet()
-    }
+    as_dict = {trait_id: {} for trait_id in data.traitSet()}
+    for trait_id, property_key, value in data.traitProperties():
+        as_dict[trait_id][property_key] = value
     print(json.dumps(as_dict))
 
 
@@ -0,0 +1,57 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <atomic>
+#include <memory>
+
+#include <openassetio/export.h>
+#include <openassetio/typedefs.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+OPENASSETIO_DECLARE_PTR(CancellationToken)
+
+/**
+ * A flag that a @ref host can set to request that an in-progress
+ * operation be abandoned.
+ *
+ * Cancellation is cooperative. A host attaches a token to the
+ * @fqref{Context.cancellationToken} "cancellationToken" of the Context
+ * used for a long-running request, such as a large batch @ref
+ * hostApi.Manager.resolve "resolve", and may later @ref cancel it from
+ * any thread. A @ref manager may poll @ref isCancelled periodically,
+ * e.g. between elements of a batch, and skip any remaining work once
+ * set.
+ *
+ * Managers are not obliged to check the token, and there is no
+ * requirement to call any further callbacks once cancelled.
+ *
+ * All member functions are thread-safe.
+ */
+class OPENASSETIO_CORE_EXPORT CancellationToken final {
+ public:
+  /**
+   * Construct a token that is not yet cancelled.
+   */
+  [[nodiscard]] static CancellationTokenPtr make();
+
+  /**
+   * Request cancellation of the operation(s) using this token.
+   *
+   * Cancellation cannot be undone.
+   */
+  void cancel();
+
+  /**
+   * Whether cancellation has been requested.
+   */
+  [[nodiscard]] bool isCancelled() const;
+
+ private:
+  CancellationToken();
+
+  std::atomic_bool cancelled_{false};
+};
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -8,6 +8,7 @@
 #include <openassetio/export.h>
 #include <openassetio/typedefs.hpp>
 
+OPENASSETIO_FWD_DECLARE(CancellationToken)
 OPENASSETIO_FWD_DECLARE(TraitsData)
 OPENASSETIO_FWD_DECLARE(managerApi, ManagerStateBase)
 
@@ -119,6 +120,17 @@ class OPENASSETIO_CORE_EXPORT Context final {
    */
   managerApi::ManagerStateBasePtr managerState;
 
+  /**
+   * Optional token used by the @ref host to request that operations
+   * using this context be abandoned.
+   *
+   * A @ref manager servicing a long-running request may poll this, if
+   * set, and stop early once it has been cancelled.
+   *
+   * @see @ref CancellationToken
+   */
+  CancellationTokenPtr cancellationToken;
+
   /**
    * Constructs a new context.
    *
@@ -6,7 +6,9 @@
  */
 #pragma once
 
+#include <functional>
 #include <memory>
+#include <unordered_map>
 #include <unordered_set>
 
 #include <openassetio/export.h>
@@ -64,6 +66,33 @@ OPENASSETIO_DECLARE_PTR(TraitsData)
  */
 class OPENASSETIO_CORE_EXPORT TraitsData final {
  public:
+  /**
+   * Mapping of property keys to values, for a single trait.
+   */
+  using TraitDict = std::unordered_map<trait::property::Key, trait::property::Value>;
+
+  /**
+   * Mapping of trait IDs to their property dictionaries.
+   */
+  using Dict = std::unordered_map<trait::TraitId, TraitDict>;
+
+  /**
+   * Callback signature used to visit the trait IDs of an instance.
+   */
+  using TraitVisitor = std::function<void(const trait::TraitId&)>;
+
+  /**
+   * Callback signature used to visit the properties of a trait.
+   */
+  using TraitPropertyVisitor =
+      std::function<void(const trait::property::Key&, const trait::property::Value&)>;
+
+  /**
+   * Callback signature used to visit all properties of all traits.
+   */
+  using PropertyVisitor = std::function<void(const trait::TraitId&, const trait::property::Key&,
+                                             const trait::property::Value&)>;
+
   /**
    * Construct an empty instance, with no traits.
    */
@@ -77,12 +106,28 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
   [[nodiscard]] static TraitsDataPtr make(const trait::TraitSet& traitSet);
 
   /**
-   * Construct such that this instance is a deep copy of the other.
+   * Construct such that this instance is a copy of the other.
+   *
+   * The copy is cheap, since the underlying data is shared between
+   * the two instances until either of them is modified, at which point
+   * the modified instance takes its own deep copy (copy-on-write).
+   * Modifications to one instance are therefore never visible in the
+   * other.
    *
    * @param other The instance to copy.
    */
   [[nodiscard]] static TraitsDataPtr make(const TraitsDataConstPtr& other);
 
+  /**
+   * Construct such that this instance has the traits and property
+   * values in the given dictionary.
+   *
+   * This is the inverse of @ref toDict.
+   *
+   * @param dict Mapping of trait IDs to their property dictionaries.
+   */
+  [[nodiscard]] static TraitsDataPtr fromDict(const Dict& dict);
+
   /**
    * Defaulted destructor.
    */
@@ -93,6 +138,30 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
    */
   [[nodiscard]] trait::TraitSet traitSet() const;
 
+  /**
+   * Call the given visitor for each trait ID held by the instance.
+   *
+   * Unlike @ref traitSet, this does not construct a temporary
+   * container, so is preferable when simply inspecting the traits.
+   *
+   * The order in which traits are visited is unspecified. The visitor
+   * must not modify this instance.
+   *
+   * @param visitor Callback to call for each trait ID.
+   */
+  void forEachTrait(const TraitVisitor& visitor) const;
+
+  /**
+   * Return whether this instance has exactly the same traits as
+   * another.
+   *
+   * This is equivalent to, but cheaper than, comparing the result of
+   * @ref traitSet for both instances.
+   *
+   * @param other The instance to compare to.
+   */
+  [[nodiscard]] bool hasSameTraitSet(const TraitsData& other) const;
+
   /**
    * Return whether this instance has the given trait.
    *
@@ -148,6 +217,55 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
   void setTraitProperty(const trait::TraitId& traitId, const trait::property::Key& propertyKey,
                         trait::property::Value propertyValue);
 
+  /**
+   * Get the values of all properties set for a given trait.
+   *
+   * This is equivalent to, but cheaper than, calling @ref
+   * getTraitProperty for each of @ref traitPropertyKeys.
+   *
+   * @param traitId ID of trait to query.
+   * @return Mapping of property keys to values.
+   * @exception `std::out_of_range` if this instance does not have
+   * this trait.
+   */
+  [[nodiscard]] TraitDict getTraitProperties(const trait::TraitId& traitId) const;
+
+  /**
+   * Set the values of many properties of a given trait.
+   *
+   * If the instance does not yet have this trait, it will be
+   * added by this call. Properties not in the given dictionary are
+   * left untouched.
+   *
+   * This is equivalent to, but cheaper than, calling @ref
+   * setTraitProperty for each property.
+   *
+   * @param traitId ID of trait to update.
+   * @param properties Mapping of property keys to values to set.
+   */
+  void setTraitProperties(const trait::TraitId& traitId, const TraitDict& properties);
+
+  /**
+   * Set the values of many properties of many traits.
+   *
+   * Any traits that the instance does not yet have will be added by
+   * this call, even if they have no properties in the given
+   * dictionary. Properties not in the given dictionary are left
+   * untouched.
+   *
+   * @param dict Mapping of trait IDs to their property dictionaries.
+   */
+  void setProperties(const Dict& dict);
+
+  /**
+   * Get all traits and their property values as a dictionary.
+   *
+   * Traits without any properties set map to an empty dictionary.
+   *
+   * @return Mapping of trait IDs to their property dictionaries.
+   */
+  [[nodiscard]] Dict toDict() const;
+
   /**
    * Returns the properties set for a given trait.
    *
@@ -156,6 +274,38 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
    */
   [[nodiscard]] trait::property::KeySet traitPropertyKeys(const trait::TraitId& traitId) const;
 
+  /**
+   * Call the given visitor for each property set for a given trait.
+   *
+   * Unlike @ref traitPropertyKeys, this does not construct a temporary
+   * container, and provides the value along with each key.
+   *
+   * If the trait has not been given to this instance, or the trait has
+   * no properties set, then the visitor is not called.
+   *
+   * The order in which properties are visited is unspecified. The
+   * visitor must not modify this instance.
+   *
+   * @param traitId ID of trait whose properties to visit.
+   * @param visitor Callback to call with each property key and value.
+   */
+  void forEachTraitProperty(const trait::TraitId& traitId,
+                            const TraitPropertyVisitor& visitor) const;
+
+  /**
+   * Call the given visitor for each property set for any trait.
+   *
+   * Traits without any properties set are not visited, see @ref
+   * forEachTrait.
+   *
+   * The order in which properties are visited is unspecified. The
+   * visitor must not modify this instance.
+   *
+   * @param visitor Callback to call with each trait ID, property key
+   * and value.
+   */
+  void forEachProperty(const PropertyVisitor& visitor) const;
+
   /**
    * Compares instances based on their trait and property values.
    *
@@ -167,9 +317,14 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
   TraitsData();
   explicit TraitsData(const trait::TraitSet& traitSet);
   TraitsData(const TraitsData& other);
+  TraitsData& operator=(const TraitsData& other) = delete;
 
   class Impl;
-  std::unique_ptr<Impl> impl_;
+  // Returns the implementation, first taking a private copy if it is
+  // shared with another instance.
+  Impl& mutableImpl();
+  // Shared between copies until modified.
+  std::shared_ptr<Impl> impl_;
 };
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
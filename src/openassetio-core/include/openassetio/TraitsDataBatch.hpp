@@ -0,0 +1,180 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+/**
+ * Provide a columnar container for the trait property values of many
+ * entities.
+ */
+#pragma once
+
+#include <cstddef>
+#include <map>
+#include <memory>
+#include <optional>
+#include <utility>
+#include <variant>
+#include <vector>
+
+#include <openassetio/export.h>
+#include <openassetio/BatchElementError.hpp>
+#include <openassetio/trait/collection.hpp>
+#include <openassetio/trait/property.hpp>
+#include <openassetio/typedefs.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+OPENASSETIO_DECLARE_PTR(TraitsDataBatch)
+
+/**
+ * A columnar container holding the results of a batch operation, such
+ * as @fqref{hostApi.Manager.resolveToBatch} "resolveToBatch".
+ *
+ * Whereas a list of @ref TraitsData holds a separate map of traits and
+ * properties for each element of a batch, a TraitsDataBatch holds a
+ * single typed array (column) for each trait property, with one entry
+ * per element. This avoids per-element allocations, and allows a host
+ * to read, for example, the location of every frame in a sequence
+ * without materialising a TraitsData for each.
+ *
+ * The type of a column is determined by the first value set in it.
+ * All subsequent values set in the same column must be of the same
+ * type.
+ *
+ * Each element may instead hold a @ref BatchElementError, indicating
+ * that the operation failed for that element.
+ *
+ * Instances are not thread-safe.
+ */
+class OPENASSETIO_CORE_EXPORT TraitsDataBatch final {
+ public:
+  /**
+   * Typed storage for the values of a column.
+   */
+  using ColumnValues =
+      std::variant<std::vector<Bool>, std::vector<Int>, std::vector<Float>, std::vector<Str>>;
+
+  /**
+   * The values of a single trait property for every element.
+   */
+  struct Column {
+    /// Value for each element. Only meaningful where `isSet` is true.
+    ColumnValues values;
+    /// Whether the value has been set, for each element.
+    std::vector<bool> isSet;
+  };
+
+  /**
+   * Construct an instance holding the given number of elements, each
+   * initially with no traits.
+   *
+   * @param size Number of elements.
+   */
+  [[nodiscard]] static TraitsDataBatchPtr make(std::size_t size);
+
+  /**
+   * Return the number of elements.
+   */
+  [[nodiscard]] std::size_t size() const;
+
+  /**
+   * Return the union of the traits held by any element.
+   */
+  [[nodiscard]] trait::TraitSet traitSet() const;
+
+  /**
+   * Return whether a given element has the given trait.
+   *
+   * @exception `std::out_of_range` if the index is out of range.
+   */
+  [[nodiscard]] bool hasTrait(std::size_t index, const trait::TraitId& traitId) const;
+
+  /**
+   * Add the specified trait to a given element.
+   *
+   * @exception `std::out_of_range` if the index is out of range.
+   */
+  void addTrait(std::size_t index, const trait::TraitId& traitId);
+
+  /**
+   * Set the value of a trait property for a given element.
+   *
+   * If the element does not yet have this trait, it will be added by
+   * this call.
+   *
+   * @exception `std::out_of_range` if the index is out of range.
+   * @exception `std::invalid_argument` if the value's type does not
+   * match the type of values already in the column.
+   */
+  void setTraitProperty(std::size_t index, const trait::TraitId& traitId,
+                        const trait::property::Key& propertyKey,
+                        trait::property::Value propertyValue);
+
+  /**
+   * Get the value of a trait property for a given element, if the
+   * property has been set.
+   *
+   * @param[out] out Storage for result, only written to if the property
+   * is set.
+   * @return `true` if value was found, `false` if it is unset.
+   * @exception `std::out_of_range` if the index is out of range.
+   */
+  bool getTraitProperty(trait::property::Value* out, std::size_t index,
+                        const trait::TraitId& traitId,
+                        const trait::property::Key& propertyKey) const;
+
+  /**
+   * Set the value of a trait property for every element at once.
+   *
+   * Any existing values in the column are replaced, and the trait is
+   * added to every element.
+   *
+   * @param values Values for each element.
+   * @exception `std::invalid_argument` if the number of values does
+   * not match the number of elements.
+   */
+  void setColumn(const trait::TraitId& traitId, const trait::property::Key& propertyKey,
+                 ColumnValues values);
+
+  /**
+   * Get the values of a trait property for every element.
+   *
+   * @return The column, or `nullptr` if no element has a value set
+   * for this property.
+   */
+  [[nodiscard]] const Column* column(const trait::TraitId& traitId,
+                                     const trait::property::Key& propertyKey) const;
+
+  /**
+   * Flag that the operation failed for a given element.
+   *
+   * @exception `std::out_of_range` if the index is out of range.
+   */
+  void setError(std::size_t index, BatchElementError error);
+
+  /**
+   * Get the error for a given element, if any.
+   *
+   * @exception `std::out_of_range` if the index is out of range.
+   */
+  [[nodiscard]] const std::optional<BatchElementError>& error(std::size_t index) const;
+
+  /**
+   * Materialise the traits and properties of a given element as a
+   * @ref TraitsData.
+   *
+   * @exception `std::out_of_range` if the index is out of range.
+   */
+  [[nodiscard]] TraitsDataPtr traitsData(std::size_t index) const;
+
+ private:
+  explicit TraitsDataBatch(std::size_t size);
+
+  void checkIndex(std::size_t index) const;
+
+  std::size_t size_;
+  // Whether each element has a given trait.
+  std::map<trait::TraitId, std::vector<bool>> traits_;
+  std::map<std::pair<trait::TraitId, trait::property::Key>, Column> columns_;
+  std::vector<std::optional<BatchElementError>> errors_;
+};
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
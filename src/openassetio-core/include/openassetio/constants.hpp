@@ -0,0 +1,47 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2022 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <openassetio/export.h>
+#include <openassetio/typedefs.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+/**
+ * Constants used throughout the OpenAssetIO API.
+ *
+ * These mirror the Python @ref openassetio.constants "constants"
+ * module, for those keys that are consumed by the C++ middleware.
+ */
+namespace constants {
+
+/**
+ * Key in a manager's @ref managerApi.ManagerInterface.info "info"
+ * dictionary, mapping to a string prefix that all valid @ref
+ * entity_reference "entity references" for that manager start with.
+ *
+ * If supplied, the @ref hostApi.Manager "Manager" uses it to
+ * short-circuit calls to @ref hostApi.Manager.isEntityReferenceString
+ * "isEntityReferenceString", avoiding the cost of calling through to
+ * the manager's implementation (particularly when bridging between
+ * languages).
+ */
+// Named to match the equivalent Python constant.
+// NOLINTNEXTLINE(readability-identifier-naming)
+inline const Str kField_EntityReferencesMatchPrefix = "entityReferencesMatchPrefix";
+
+/**
+ * Key in a manager's @ref managerApi.ManagerInterface.info "info"
+ * dictionary, mapping to a boolean that declares whether the manager's
+ * implementation is safe to call concurrently from multiple threads.
+ *
+ * If `true`, the @ref hostApi.Manager "Manager" may dispatch chunks of
+ * a large batch to the manager in parallel, see
+ * @ref hostApi.Manager.setResolveConcurrency "setResolveConcurrency".
+ */
+// NOLINTNEXTLINE(readability-identifier-naming)
+inline const Str kField_IsThreadSafe = "isThreadSafe";
+
+}  // namespace constants
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
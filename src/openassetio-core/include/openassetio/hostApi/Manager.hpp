@@ -2,22 +2,31 @@
 // Copyright 2013-2022 The Foundry Visionmongers Ltd
 #pragma once
 
+#include <cstddef>
+#include <exception>
 #include <functional>
+#include <future>
 #include <memory>
+#include <mutex>
 #include <optional>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include <openassetio/export.h>
 #include <openassetio/BatchElementError.hpp>
 #include <openassetio/EntityReference.hpp>
 #include <openassetio/InfoDictionary.hpp>
+#include <openassetio/hostApi/ManagerMetrics.hpp>
 #include <openassetio/trait/collection.hpp>
 #include <openassetio/typedefs.hpp>
 
 OPENASSETIO_FWD_DECLARE(managerApi, HostSession)
 OPENASSETIO_FWD_DECLARE(managerApi, ManagerInterface)
 OPENASSETIO_FWD_DECLARE(Context)
+OPENASSETIO_FWD_DECLARE(TraitsDataBatch)
+OPENASSETIO_FWD_DECLARE(hostApi, ResolveCache)
+OPENASSETIO_FWD_DECLARE(hostApi, ThreadPool)
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
@@ -55,7 +64,7 @@ OPENASSETIO_DECLARE_PTR(Manager)
  * The Manager API is threadsafe and can be called from multiple
  * threads concurrently.
  */
-class OPENASSETIO_CORE_EXPORT Manager {
+class OPENASSETIO_CORE_EXPORT Manager : public std::enable_shared_from_this<Manager> {
  public:
   /**
    * Constructs a new Manager wrapping the supplied manager interface
@@ -64,6 +73,11 @@ class OPENASSETIO_CORE_EXPORT Manager {
   [[nodiscard]] static ManagerPtr make(managerApi::ManagerInterfacePtr managerInterface,
                                        managerApi::HostSessionPtr hostSession);
 
+  /**
+   * Defaulted destructor.
+   */
+  ~Manager();
+
   /**
    * @name Asset Management System Information
    *
@@ -163,6 +177,11 @@ class OPENASSETIO_CORE_EXPORT Manager {
    *
    * @note This method may block for extended periods of time.
    *
+   * If the manager's @ref info dictionary contains
+   * openassetio.constants.kField_EntityReferencesMatchPrefix, it is
+   * queried and cached here, and subsequently used to short-circuit
+   * @ref isEntityReferenceString.
+   *
    * @protected
    */
   void initialize(InfoDictionary managerSettings);
@@ -286,7 +305,9 @@ class OPENASSETIO_CORE_EXPORT Manager {
    *  meaningful state etc... This can be useful when certain UI
    *  elements need to 'take a copy' of a context in its current state
    *  in order to parallelise actions that are part of the same logical
-   *  group, but have different locales, access or retention.
+   *  group, but have different locales, access or retention. The
+   *  child shares the parent's @fqref{Context.cancellationToken}
+   *  "cancellationToken", if any.
    *
    *  @see @ref createContext
    *  @see @fqref{Context} "Context"
@@ -394,12 +415,16 @@ class OPENASSETIO_CORE_EXPORT Manager {
    * format of the string is recognised. The call is notionally trivial
    * and does not involve back-end system queries.
    *
+   * If the manager advertised an
+   * openassetio.constants.kField_EntityReferencesMatchPrefix in its
+   * @ref info dictionary at the time of @ref initialize, then this
+   * check is performed as a simple string prefix comparison, without
+   * calling through to the manager's implementation. This avoids
+   * potentially expensive bridging between languages (e.g. acquiring
+   * the Python GIL).
+   *
    * @see @needsref entityExists
    * @see @ref resolve
-   *
-   * @todo Make use of
-   * openassetio.constants.kField_EntityReferencesMatchPrefix if
-   * supplied, especially when bridging between C/python.
    */
   [[nodiscard]] bool isEntityReferenceString(const Str& someString) const;
 
@@ -441,6 +466,43 @@ class OPENASSETIO_CORE_EXPORT Manager {
   [[nodiscard]] std::optional<EntityReference> createEntityReferenceIfValid(
       Str entityReferenceString) const;
 
+  /**
+   * Batch form of @ref isEntityReferenceString.
+   *
+   * Determines, for each supplied string, whether it matches the
+   * pattern of an @ref entity_reference for this manager.
+   *
+   * If a prefix was provided by the manager (see @ref
+   * isEntityReferenceString), it is used for all strings. Otherwise,
+   * the manager is queried once for the whole batch, rather than once
+   * per string.
+   *
+   * @param someStrings The strings to be inspected.
+   *
+   * @return A list of the same length as `someStrings`, where each
+   * element is `true` if the corresponding string is recognised as an
+   * @ref entity_reference, `false` otherwise.
+   */
+  [[nodiscard]] std::vector<bool> isEntityReferenceStrings(
+      const std::vector<Str>& someStrings) const;
+
+  /**
+   * Batch form of @ref createEntityReferenceIfValid.
+   *
+   * Validates the supplied strings using @ref isEntityReferenceStrings
+   * and wraps those that are valid in an @ref EntityReference object.
+   *
+   * @param entityReferenceStrings Raw string representations of the
+   * entity references. Taken by value to enable move semantics.
+   *
+   * @return A list of the same length as `entityReferenceStrings`,
+   * where each element is a `std::optional` containing an
+   * `EntityReference` if the corresponding string is valid, not
+   * containing a value otherwise.
+   */
+  [[nodiscard]] std::vector<std::optional<EntityReference>> createEntityReferencesIfValid(
+      std::vector<Str> entityReferenceStrings) const;
+
   /**
    * @}
    */
@@ -474,6 +536,23 @@ class OPENASSETIO_CORE_EXPORT Manager {
      * index order.
      */
     struct Exception {};
+    /**
+     * Collect policy overloads, when used in a batch context, will
+     * provide a result for every element of the batch, alongside a
+     * separate list of errors for only those elements that failed.
+     *
+     * Unlike the @ref Exception policy, results for successful
+     * elements are retained when other elements fail. Unlike the @ref
+     * Variant policy, no per-element variant is constructed, which is
+     * cheaper when failures are rare.
+     */
+    struct Collect {};
+    /**
+     * Skip policy overloads, when used in a batch context, will
+     * provide a result for every element of the batch, where elements
+     * that failed are left null and their errors discarded.
+     */
+    struct Skip {};
 
     /**
      * Static instantiation of the @ref Variant dispatch tag, to avoid
@@ -485,8 +564,24 @@ class OPENASSETIO_CORE_EXPORT Manager {
      * the need to construct a new object to resolve dispatch methods.
      */
     static constexpr Exception kException{};
+    /**
+     * Static instantiation of the @ref Collect dispatch tag, to avoid
+     * the need to construct a new object to resolve dispatch methods.
+     */
+    static constexpr Collect kCollect{};
+    /**
+     * Static instantiation of the @ref Skip dispatch tag, to avoid
+     * the need to construct a new object to resolve dispatch methods.
+     */
+    static constexpr Skip kSkip{};
   };
 
+  /**
+   * List of errors for a subset of the elements in a batch, each
+   * paired with the index of the element it applies to.
+   */
+  using IndexedBatchElementErrors = std::vector<std::pair<std::size_t, BatchElementError>>;
+
   /**
    * Callback signature used for an unsuccessful operation on an
    * element in a batch.
@@ -567,6 +662,10 @@ class OPENASSETIO_CORE_EXPORT Manager {
    * callbacks have been called. Callbacks will be called on the
    * same thread that called `resolve`
    *
+   * Large batches may be split and dispatched to the manager in
+   * parallel, see @ref setResolveConcurrency. Results may be served
+   * from a host-side cache, see @ref setResolveCacheCapacity.
+   *
    * @param entityReferences Entity references to query.
    *
    * @param context The calling context.
@@ -593,6 +692,131 @@ class OPENASSETIO_CORE_EXPORT Manager {
                const ContextConstPtr& context, const ResolveSuccessCallback& successCallback,
                const BatchElementErrorCallback& errorCallback);
 
+  /**
+   * Configure concurrent dispatch of large @ref resolve batches.
+   *
+   * By default, a batch is passed to the manager in a single call. If
+   * configured with more than one thread, and the manager declares
+   * itself thread-safe via
+   * openassetio.constants.kField_IsThreadSafe in its @ref info
+   * dictionary at the time of @ref initialize, then batches larger
+   * than `chunkSize` are split into chunks of (at most) `chunkSize`
+   * elements, which are dispatched to the manager in parallel from up
+   * to `maxThreads` threads. The calling thread resolves chunks
+   * itself, aided by a pool of worker threads owned by this Manager,
+   * which is shared with @ref resolveAsync.
+   *
+   * Results are always delivered to the callbacks on the thread that
+   * called @ref resolve, with indices relative to the original batch.
+   * The order in which callbacks are called is unspecified.
+   *
+   * If the manager throws an exception for any chunk, no further
+   * chunks are dispatched and the exception is rethrown from @ref
+   * resolve once all in-flight chunks are complete.
+   * Similarly, once the context's @fqref{Context.cancellationToken}
+   * "cancellationToken" is cancelled, no further chunks are
+   * dispatched.
+   *
+   * This applies to all @ref resolve overloads. `maxThreads` also
+   * bounds the number of worker threads used by @ref resolveAsync.
+   *
+   * @warning This should be configured before the Manager is used
+   * concurrently by multiple threads.
+   *
+   * @param maxThreads Maximum number of threads, including the
+   * calling thread, to use for a single @ref resolve call. A value of
+   * `1` disables concurrent dispatch.
+   *
+   * @param chunkSize Maximum number of entity references to include in
+   * each call to the manager.
+   *
+   * @throw std::invalid_argument If either parameter is zero.
+   */
+  void setResolveConcurrency(std::size_t maxThreads, std::size_t chunkSize);
+
+  /**
+   * Resolve a batch of entity references into a columnar
+   * @fqref{TraitsDataBatch} "TraitsDataBatch".
+   *
+   * This is an alternative to @ref resolve for large batches, where
+   * the host wishes to read a particular property for every entity,
+   * e.g. the location of every frame of an image sequence, without
+   * materialising a @fqref{TraitsData} "TraitsData" for each.
+   *
+   * The element at each index of the result corresponds to the entity
+   * reference at the same index of `entityReferences`. Elements that
+   * failed to resolve hold a @fqref{BatchElementError}
+   * "BatchElementError", see @fqref{TraitsDataBatch.error} "error".
+   *
+   * Results are always requested from the manager in a single call.
+   * They are not cached (see @ref setResolveCacheCapacity) and not
+   * split for concurrent dispatch (see @ref setResolveConcurrency).
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The trait IDs to resolve for the supplied list of
+   * entity references.
+   *
+   * @param context The calling context.
+   *
+   * @return Resolved data for every entity reference.
+   */
+  TraitsDataBatchPtr resolveToBatch(const EntityReferences& entityReferences,
+                                    const trait::TraitSet& traitSet,
+                                    const ContextConstPtr& context);
+
+  /**
+   * Configure caching of @ref resolve results.
+   *
+   * By default, every @ref resolve call is passed through to the
+   * manager. If configured with a non-zero capacity, successfully
+   * resolved data is cached, such that subsequent requests for the
+   * same entity reference and trait set are served without calling
+   * the manager. Errors are never cached.
+   *
+   * The @ref Context.retention "retention" of the Context given to
+   * @ref resolve determines the scope of cached entries:
+   *
+   * - `kIgnored`: results are not cached.
+   * - `kTransient`: results are only re-used for the same Context
+   *   instance.
+   * - `kSession` or `kPermanent`: results are re-used for any Context
+   *   with the same @ref Context.access "access" pattern, an equal
+   *   @ref Context.locale "locale", and the same
+   *   @ref Context.managerState "managerState" instance.
+   *
+   * Once `capacity` entries are cached, the least recently used entry
+   * is evicted to make room for a new one.
+   *
+   * Cached data is copied when stored and when retrieved, so
+   * modifying a `TraitsData` returned from @ref resolve does not
+   * affect the cache.
+   *
+   * Cached entries for an entity reference are discarded when it is
+   * published via @ref register_, as are those for the reference
+   * returned by the manager.
+   *
+   * Any existing cached entries are discarded. The cache can also be
+   * emptied using @ref flushResolveCache.
+   *
+   * This applies to all @ref resolve overloads.
+   *
+   * @warning This should be configured before the Manager is used
+   * concurrently by multiple threads.
+   *
+   * @param capacity Maximum number of results to cache. A value of
+   * `0` disables caching.
+   */
+  void setResolveCacheCapacity(std::size_t capacity);
+
+  /**
+   * Discard all results cached by @ref resolve.
+   *
+   * It is a no-op if caching has not been enabled via @ref
+   * setResolveCacheCapacity.
+   */
+  void flushResolveCache();
+
   /**
    * Provides a @fqref{TraitsData} "TraitsData" populated with the
    * available data for the requested set of traits for the given @ref
@@ -747,6 +971,314 @@ class OPENASSETIO_CORE_EXPORT Manager {
       const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
       const ContextConstPtr& context, const BatchElementErrorPolicyTag::Variant& errorPolicyTag);
 
+  /**
+   * Provides a @fqref{TraitsData} "TraitsData" for each given @ref
+   * entity_reference that was successfully resolved, along with a
+   * separate list of errors for those that were not.
+   *
+   * The first element of the result has an entry for each entity
+   * reference. Entries for references that failed to resolve are
+   * null. The second element of the result has an entry for each
+   * failed reference only, pairing its index with an error object
+   * detailing the reason for the failure. Errors are sorted by index.
+   *
+   * This is cheaper than the @ref BatchElementErrorPolicyTag::Variant
+   * "Variant" overload when most references resolve successfully,
+   * and unlike the @ref BatchElementErrorPolicyTag::Exception
+   * "Exception" overload, successful results are not discarded when
+   * a reference fails.
+   *
+   * Errors that are not specific to an entity will be thrown as an
+   * exception, failing the whole batch.
+   *
+   * See documentation for the <!--
+   * --> @ref resolve(const EntityReferences&, <!--
+   * --> const trait::TraitSet&, const ContextConstPtr&, <!--
+   * --> const ResolveSuccessCallback&, <!--
+   * --> const BatchElementErrorCallback& errorCallback)
+   * "callback variation" for more details on resolution behaviour.
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The trait IDs to resolve for the supplied list of
+   * entity references. Only traits applicable to the supplied entity
+   * references will be set in the resulting data.
+   *
+   * @param context The calling context.
+   *
+   * @param errorPolicyTag  Parameter for selecting the appropriate
+   * overload (tag dispatch idiom). See @ref
+   * BatchElementErrorPolicyTag::Collect.
+   *
+   * @return Pair of the list of populated data objects, with null
+   * entries for failures, and the list of indexed errors.
+   */
+  std::pair<std::vector<TraitsDataPtr>, IndexedBatchElementErrors> resolve(
+      const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+      const ContextConstPtr& context, const BatchElementErrorPolicyTag::Collect& errorPolicyTag);
+
+  /**
+   * Provides a @fqref{TraitsData} "TraitsData" for each given @ref
+   * entity_reference that was successfully resolved, ignoring any
+   * that were not.
+   *
+   * The result has an entry for each entity reference. Entries for
+   * references that failed to resolve are null, and the reasons for
+   * their failure are discarded.
+   *
+   * Errors that are not specific to an entity will be thrown as an
+   * exception, failing the whole batch.
+   *
+   * See documentation for the <!--
+   * --> @ref resolve(const EntityReferences&, <!--
+   * --> const trait::TraitSet&, const ContextConstPtr&, <!--
+   * --> const ResolveSuccessCallback&, <!--
+   * --> const BatchElementErrorCallback& errorCallback)
+   * "callback variation" for more details on resolution behaviour.
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The trait IDs to resolve for the supplied list of
+   * entity references. Only traits applicable to the supplied entity
+   * references will be set in the resulting data.
+   *
+   * @param context The calling context.
+   *
+   * @param errorPolicyTag  Parameter for selecting the appropriate
+   * overload (tag dispatch idiom). See @ref
+   * BatchElementErrorPolicyTag::Skip.
+   *
+   * @return List of populated data objects, with null entries for
+   * failures.
+   */
+  std::vector<TraitsDataPtr> resolve(const EntityReferences& entityReferences,
+                                     const trait::TraitSet& traitSet,
+                                     const ContextConstPtr& context,
+                                     const BatchElementErrorPolicyTag::Skip& errorPolicyTag);
+
+  /**
+   * Callback signature used to signal that an asynchronous operation
+   * has finished.
+   *
+   * It will be given a null `std::exception_ptr` if the operation
+   * completed, or the exception that failed the whole batch.
+   */
+  using AsyncCompletionCallback = std::function<void(std::exception_ptr)>;
+
+  /**
+   * Non-blocking form of the <!--
+   * --> @ref resolve(const EntityReferences&, <!--
+   * --> const trait::TraitSet&, const ContextConstPtr&, <!--
+   * --> const ResolveSuccessCallback&, <!--
+   * --> const BatchElementErrorCallback& errorCallback)
+   * "callback variation" of @ref resolve.
+   *
+   * Returns as soon as the request has been issued to the manager.
+   *
+   * If the manager supports non-blocking resolution (see
+   * @fqref{managerApi.ManagerInterface.resolveAsync}
+   * "ManagerInterface.resolveAsync"), the request is passed directly
+   * to the manager. Otherwise, the request is queued for a blocking
+   * @ref resolve on a pool of worker threads owned by this Manager.
+   * Many requests can be outstanding without requiring a thread for
+   * each. The pool uses at most the `maxThreads` configured by @ref
+   * setResolveConcurrency, and only a single thread if the manager
+   * is not thread-safe.
+   *
+   * In the latter case, the request is subject to the same caching
+   * (see @ref setResolveCacheCapacity), concurrent dispatch and
+   * cancellation as a blocking @ref resolve, and this Manager is kept
+   * alive until it completes. In the former case, these are the
+   * responsibility of the manager. In either case, the request is
+   * recorded in @ref metrics under
+   * @ref ManagerMetrics.Method.kResolveAsync.
+   *
+   * @warning Callbacks may be called from any thread, including
+   * before this function returns. Any exception thrown by the
+   * `completionCallback` is discarded.
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The trait IDs to resolve for the supplied list of
+   * entity references.
+   *
+   * @param context The calling context.
+   *
+   * @param successCallback Callback that will be called for each
+   * successful resolution of an entity reference.
+   *
+   * @param errorCallback Callback that will be called for each
+   * failed resolution of an entity reference.
+   *
+   * @param completionCallback Callback that will be called exactly
+   * once, after all other callbacks, with the exception that failed
+   * the batch, if any.
+   */
+  void resolveAsync(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+                    const ContextConstPtr& context, const ResolveSuccessCallback& successCallback,
+                    const BatchElementErrorCallback& errorCallback,
+                    const AsyncCompletionCallback& completionCallback);
+
+  /**
+   * Callback signature used for the aggregated results of a
+   * non-blocking throwing batch resolve.
+   *
+   * Called with the populated data objects, or with an exception and
+   * an empty list if the batch failed.
+   */
+  using AsyncResolveResultsCallback =
+      std::function<void(std::vector<TraitsDataPtr>, std::exception_ptr)>;
+
+  /**
+   * Callback signature used for the aggregated results of a
+   * non-blocking variant batch resolve.
+   *
+   * Called with the populated data object or error for each element,
+   * or with an exception and an empty list if the batch failed.
+   */
+  using AsyncResolveVariantResultsCallback = std::function<void(
+      std::vector<std::variant<TraitsDataPtr, BatchElementError>>, std::exception_ptr)>;
+
+  /**
+   * Non-blocking form of the throwing batch overload of @ref resolve,
+   * delivering the aggregated results to a callback.
+   *
+   * See <!--
+   * --> @ref resolveAsync(const EntityReferences&, <!--
+   * --> const trait::TraitSet&, const ContextConstPtr&, <!--
+   * --> const ResolveSuccessCallback&, <!--
+   * --> const BatchElementErrorCallback&, <!--
+   * --> const AsyncCompletionCallback&)
+   * "the callback variation" for details of how the request is
+   * dispatched.
+   *
+   * If any element fails, the callback is given a
+   * @fqref{BatchElementException} "BatchElementException"-derived
+   * exception for the first failure reported by the manager.
+   *
+   * @warning The callback may be called from any thread, including
+   * before this function returns. Any exception it throws is
+   * discarded.
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The trait IDs to resolve for the supplied list of
+   * entity references.
+   *
+   * @param context The calling context.
+   *
+   * @param errorPolicyTag  Parameter for selecting the appropriate
+   * overload (tagged dispatch idiom). See @ref
+   * BatchElementErrorPolicyTag::Exception.
+   *
+   * @param resultsCallback Callback that will be called exactly once,
+   * when the request completes.
+   */
+  void resolveAsync(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+                    const ContextConstPtr& context,
+                    const BatchElementErrorPolicyTag::Exception& errorPolicyTag,
+                    const AsyncResolveResultsCallback& resultsCallback);
+
+  /**
+   * Non-blocking form of the variant batch overload of @ref resolve,
+   * delivering the aggregated results to a callback.
+   *
+   * See <!--
+   * --> @ref resolveAsync(const EntityReferences&, <!--
+   * --> const trait::TraitSet&, const ContextConstPtr&, <!--
+   * --> const ResolveSuccessCallback&, <!--
+   * --> const BatchElementErrorCallback&, <!--
+   * --> const AsyncCompletionCallback&)
+   * "the callback variation" for details of how the request is
+   * dispatched.
+   *
+   * @warning The callback may be called from any thread, including
+   * before this function returns. Any exception it throws is
+   * discarded.
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The trait IDs to resolve for the supplied list of
+   * entity references.
+   *
+   * @param context The calling context.
+   *
+   * @param errorPolicyTag  Parameter for selecting the appropriate
+   * overload (tag dispatch idiom). See @ref
+   * BatchElementErrorPolicyTag::Variant.
+   *
+   * @param resultsCallback Callback that will be called exactly once,
+   * when the request completes.
+   */
+  void resolveAsync(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+                    const ContextConstPtr& context,
+                    const BatchElementErrorPolicyTag::Variant& errorPolicyTag,
+                    const AsyncResolveVariantResultsCallback& resultsCallback);
+
+  /**
+   * Non-blocking form of the throwing batch overload of @ref resolve.
+   *
+   * See <!--
+   * --> @ref resolveAsync(const EntityReferences&, <!--
+   * --> const trait::TraitSet&, const ContextConstPtr&, <!--
+   * --> const ResolveSuccessCallback&, <!--
+   * --> const BatchElementErrorCallback&, <!--
+   * --> const AsyncCompletionCallback&)
+   * "the callback variation" for details of how the request is
+   * dispatched.
+   *
+   * If any element fails, the future holds a
+   * @fqref{BatchElementException} "BatchElementException"-derived
+   * exception for the first failure reported by the manager.
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The trait IDs to resolve for the supplied list of
+   * entity references.
+   *
+   * @param context The calling context.
+   *
+   * @param errorPolicyTag  Parameter for selecting the appropriate
+   * overload (tagged dispatch idiom). See @ref
+   * BatchElementErrorPolicyTag::Exception.
+   *
+   * @return Future list of populated data objects.
+   */
+  std::future<std::vector<TraitsDataPtr>> resolveAsync(
+      const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+      const ContextConstPtr& context,
+      const BatchElementErrorPolicyTag::Exception& errorPolicyTag = {});
+
+  /**
+   * Non-blocking form of the variant batch overload of @ref resolve.
+   *
+   * See <!--
+   * --> @ref resolveAsync(const EntityReferences&, <!--
+   * --> const trait::TraitSet&, const ContextConstPtr&, <!--
+   * --> const ResolveSuccessCallback&, <!--
+   * --> const BatchElementErrorCallback&, <!--
+   * --> const AsyncCompletionCallback&)
+   * "the callback variation" for details of how the request is
+   * dispatched.
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The trait IDs to resolve for the supplied list of
+   * entity references.
+   *
+   * @param context The calling context.
+   *
+   * @param errorPolicyTag  Parameter for selecting the appropriate
+   * overload (tag dispatch idiom). See @ref
+   * BatchElementErrorPolicyTag::Variant.
+   *
+   * @return Future list of objects, each containing either the
+   * populated data or an error.
+   */
+  std::future<std::vector<std::variant<TraitsDataPtr, BatchElementError>>> resolveAsync(
+      const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+      const ContextConstPtr& context, const BatchElementErrorPolicyTag::Variant& errorPolicyTag);
+
   /**
    * @name Publishing
    *
@@ -1003,6 +1535,29 @@ class OPENASSETIO_CORE_EXPORT Manager {
 
   /// @}
 
+  /**
+   * @name Metrics
+   *
+   * @{
+   */
+
+  /**
+   * Statistics recorded about calls made through this Manager.
+   *
+   * Call counts, batch sizes, latencies and element errors are
+   * recorded for each of the methods listed in
+   * @ref ManagerMetrics.Method. Recording is always enabled unless
+   * explicitly disabled via @ref ManagerMetrics.setEnabled, and the
+   * statistics can be reset at any time, e.g. per host session, via
+   * @ref ManagerMetrics.reset.
+   *
+   * The returned object is owned by, and lives as long as, this
+   * Manager.
+   */
+  [[nodiscard]] ManagerMetrics& metrics() const;
+
+  /// @}
+
   /**
    * @private
    * Nothing to see here, this is working around an entertaining
@@ -1018,8 +1573,42 @@ class OPENASSETIO_CORE_EXPORT Manager {
   explicit Manager(managerApi::ManagerInterfacePtr managerInterface,
                    managerApi::HostSessionPtr hostSession);
 
+  /**
+   * Resolve a batch, serving what we can from the resolve cache, if
+   * enabled, and passing the remainder to @ref resolveUncached.
+   *
+   * Metrics are left to the caller.
+   */
+  void resolveCached(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+                     const ContextConstPtr& context, const ResolveSuccessCallback& successCallback,
+                     const BatchElementErrorCallback& errorCallback);
+
+  void resolveUncached(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+                       const ContextConstPtr& context,
+                       const ResolveSuccessCallback& successCallback,
+                       const BatchElementErrorCallback& errorCallback);
+
+  /**
+   * Pool of worker threads used for concurrent dispatch of @ref
+   * resolve batches and by @ref resolveAsync, created on first use.
+   *
+   * Has one fewer worker than the configured `maxThreads`, since the
+   * calling thread also resolves chunks, but always at least one.
+   */
+  std::shared_ptr<ThreadPool> threadPool();
+
   managerApi::ManagerInterfacePtr managerInterface_;
   managerApi::HostSessionPtr hostSession_;
+  std::optional<Str> entityReferencePrefix_;
+  bool isThreadSafe_{false};
+  std::size_t resolveMaxThreads_{1};
+  std::size_t resolveChunkSize_{1};
+  std::unique_ptr<ResolveCache> resolveCache_;
+  std::mutex threadPoolMutex_;
+  // Created on first use. Guarded by `threadPoolMutex_`.
+  std::shared_ptr<ThreadPool> threadPool_;
+  // Recorded to from const methods, and updated atomically.
+  mutable ManagerMetrics metrics_;
 };
 }  // namespace hostApi
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
@@ -76,6 +76,30 @@ class OPENASSETIO_CORE_EXPORT ManagerFactory final {
   /// Mapping of manager identifier to its configuration details.
   using ManagerDetails = std::unordered_map<Identifier, ManagerDetail>;
 
+  /**
+   * The manager configuration held in a default manager config TOML
+   * file.
+   *
+   * @see @ref loadDefaultManagerConfig
+   */
+  struct DefaultManagerConfig {
+    /// Identifier of the manager to instantiate.
+    Identifier identifier;
+    /// Settings with which to initialize the manager.
+    InfoDictionary settings;
+    /**
+     * Compare all fields in this instance and another for by-value
+     * equality.
+     *
+     * @param other Other instance to compare against.
+     *
+     * @return `true` if all fields compare equal, `false` otherwise.
+     */
+    bool operator==(const DefaultManagerConfig& other) const {
+      return identifier == other.identifier && settings == other.settings;
+    }
+  };
+
   /**
    * The name of the env var used to define the default manager config TOML file.
     @see @ref defaultManagerForInterface.
@@ -126,6 +150,11 @@ class OPENASSETIO_CORE_EXPORT ManagerFactory final {
    * For example, this may be presented as part of a manager picker UI
    * widget.
    *
+   * Where the manager implementation factory can supply a manager's
+   * details directly, via @fqref{hostApi.ManagerImplementationFactoryInterface.managerDetail}
+   * "managerDetail", the manager is not instantiated. Otherwise, a
+   * `ManagerInterface` is instantiated in order to query them.
+   *
    * @see @ref ManagerDetail
    *
    * @return A @ref ManagerDetail instance for each available @ref
@@ -208,6 +237,9 @@ class OPENASSETIO_CORE_EXPORT ManagerFactory final {
    * @ref default_config_var is set, otherwise a nullptr if
    * the var was not set.
    *
+   * If pooling has been enabled via @ref setDefaultManagerPooling,
+   * then an already initialized manager may be returned, see below.
+   *
    * @throws std::runtime_error if there are errors occur whilst
    * loading the TOML file referenced by the
    * @ref default_config_var env var.
@@ -217,6 +249,82 @@ class OPENASSETIO_CORE_EXPORT ManagerFactory final {
       const ManagerImplementationFactoryInterfacePtr& managerImplementationFactory,
       const log::LoggerInterfacePtr& logger);
 
+  /**
+   * Load and validate a default manager config TOML file, as used by
+   * @ref defaultManagerForInterface.
+   *
+   * Parsed configs are cached for the lifetime of the process, along
+   * with the modification time and size of the file they were parsed
+   * from. The file is only re-parsed if either of these change, so
+   * repeated calls are cheap. See @ref defaultManagerForInterface for
+   * the expected structure of the file.
+   *
+   * This function is thread-safe.
+   *
+   * @param path Path to the TOML file.
+   *
+   * @return The manager identifier and settings held in the file.
+   *
+   * @throws std::runtime_error if the file does not exist, cannot be
+   * parsed, does not specify a manager identifier, or contains
+   * settings of an unsupported type.
+   */
+  [[nodiscard]] static DefaultManagerConfig loadDefaultManagerConfig(const Str& path);
+
+  /**
+   * Discard all configs cached by @ref loadDefaultManagerConfig.
+   *
+   * This can be used to force configs to be re-read, e.g. where a file
+   * may have been modified within the resolution of its file system's
+   * modification timestamps.
+   */
+  static void clearDefaultManagerConfigCache();
+
+  /**
+   * Enable or disable process-wide pooling of the managers created by
+   * @ref defaultManagerForInterface.
+   *
+   * When enabled, the first call to @ref defaultManagerForInterface
+   * for a given manager identifier, settings and
+   * @ref HostInterface::identifier "host identifier" creates and
+   * initializes a manager as usual. Subsequent calls with the same
+   * combination return that same manager, avoiding the cost of
+   * instantiating and initializing it again (which may, for example,
+   * involve connecting to a remote service). This is regardless of
+   * whether the same `HostInterface` and implementation factory
+   * instances are supplied, so the pool holds at most one manager per
+   * combination.
+   *
+   * Pooled managers retain the `HostInterface`, implementation and
+   * logger supplied when they were first created, and are shared by
+   * all callers, so callers should not re-initialize them with
+   * different settings.
+   *
+   * Pooling is disabled by default. Disabling it does not discard
+   * previously pooled managers, see @ref clearDefaultManagerPool.
+   *
+   * This function is thread-safe.
+   *
+   * @param enabled Whether to pool managers.
+   */
+  static void setDefaultManagerPooling(bool enabled);
+
+  /**
+   * Query whether pooling of default managers is enabled.
+   *
+   * @see setDefaultManagerPooling
+   */
+  [[nodiscard]] static bool defaultManagerPooling();
+
+  /**
+   * Release all managers held by the default manager pool, such that
+   * subsequent calls to @ref defaultManagerForInterface create new
+   * managers.
+   *
+   * This function is thread-safe.
+   */
+  static void clearDefaultManagerPool();
+
  private:
   ManagerFactory(HostInterfacePtr hostInterface,
                  ManagerImplementationFactoryInterfacePtr managerImplementationFactory,
@@ -3,9 +3,11 @@
 #pragma once
 
 #include <memory>
+#include <optional>
 #include <vector>
 
 #include <openassetio/export.h>
+#include <openassetio/hostApi/ManagerFactory.hpp>
 #include <openassetio/typedefs.hpp>
 
 OPENASSETIO_FWD_DECLARE(log, LoggerInterface)
@@ -70,6 +72,27 @@ class OPENASSETIO_CORE_EXPORT ManagerImplementationFactoryInterface {
   [[nodiscard]] virtual managerApi::ManagerInterfacePtr instantiate(
       const Identifier& identifier) = 0;
 
+  /**
+   * Retrieve the details of the manager with the specified identifier,
+   * without instantiating its `ManagerInterface`.
+   *
+   * This is used by @ref ManagerFactory.availableManagers to avoid the
+   * cost of constructing every available manager. Factories that can
+   * obtain these details cheaply (e.g. from plugin metadata) should
+   * override this method.
+   *
+   * The default implementation returns an empty optional, in which
+   * case the caller should fall back to @ref instantiate and query the
+   * resulting `ManagerInterface`.
+   *
+   * @param identifier The identifier of the manager.
+   *
+   * @return The manager's details, or an empty optional if they are not
+   * available without instantiating the manager.
+   */
+  [[nodiscard]] virtual std::optional<ManagerFactory::ManagerDetail> managerDetail(
+      const Identifier& identifier);
+
  protected:
   /// Logger instance that should be used for all logging.
   // Allow violation of no protected members, since this is const and
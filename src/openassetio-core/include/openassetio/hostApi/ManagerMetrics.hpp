@@ -0,0 +1,197 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+
+#include <openassetio/export.h>
+#include <openassetio/BatchElementError.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+/**
+ * Records statistics about the API calls made through a @ref Manager.
+ *
+ * For each instrumented @ref Method, the number of calls, the
+ * distribution of batch sizes and call latencies, the number of calls
+ * that threw an exception, and the number of
+ * @fqref{BatchElementError} "BatchElementError"s of each
+ * @fqref{BatchElementError.ErrorCode} "ErrorCode" are recorded.
+ *
+ * Recording uses relaxed atomic counters only, so is cheap enough to
+ * be left enabled in production, and is safe to perform from multiple
+ * threads concurrently. Consequently, a @ref MethodMetrics snapshot
+ * taken whilst calls are in flight may not be self-consistent, e.g.
+ * the histogram totals may momentarily differ from the call count.
+ *
+ * Histograms use logarithmic buckets, see @ref histogramBucket.
+ *
+ * An instance is owned by each @ref Manager, see @ref Manager.metrics.
+ */
+class OPENASSETIO_CORE_EXPORT ManagerMetrics final {
+ public:
+  /**
+   * Instrumented @ref Manager methods.
+   *
+   * Each call is recorded once, regardless of which overload of the
+   * method was used.
+   */
+  enum class Method : std::size_t {
+    /// Blocking @ref Manager.resolve and @ref Manager.resolveToBatch
+    /// calls. Calls served entirely from the resolve cache are
+    /// included.
+    kResolve,
+    /// @ref Manager.preflight
+    kPreflight,
+    /// @ref Manager.register_
+    kRegister,
+    /// @ref Manager.managementPolicy
+    kManagementPolicy,
+    /// @ref Manager.isEntityReferenceString, including calls made
+    /// whilst creating entity references.
+    kIsEntityReferenceString,
+    /// @ref Manager.createContext
+    kCreateContext,
+    /// @ref Manager.createChildContext
+    kCreateChildContext,
+    /// @ref Manager.persistenceTokenForContext
+    kPersistenceTokenForContext,
+    /// @ref Manager.contextFromPersistenceToken
+    kContextFromPersistenceToken,
+    /// Non-blocking @ref Manager.resolveAsync calls. Latency is
+    /// measured from when the request is issued until its completion
+    /// callback is called, and a failure passed to the completion
+    /// callback is counted as an exception. Requests that outlive the
+    /// @ref Manager are not recorded.
+    kResolveAsync
+  };
+
+  /// Number of instrumented methods.
+  static constexpr std::size_t kNumMethods = 10;
+
+  /// Names of each @ref Method, indexed by the enum value.
+  static constexpr std::array<const char*, kNumMethods> kMethodNames{
+      "resolve",
+      "preflight",
+      "register",
+      "managementPolicy",
+      "isEntityReferenceString",
+      "createContext",
+      "createChildContext",
+      "persistenceTokenForContext",
+      "contextFromPersistenceToken",
+      "resolveAsync",
+  };
+
+  /// Number of buckets in each histogram.
+  static constexpr std::size_t kNumHistogramBuckets = 64;
+
+  /// Number of distinct @fqref{BatchElementError.ErrorCode} "ErrorCode"s.
+  static constexpr std::size_t kNumErrorCodes = 5;
+
+  /// Counts of values falling into each bucket.
+  using Histogram = std::array<std::uint64_t, kNumHistogramBuckets>;
+
+  /**
+   * Snapshot of the statistics recorded for a single @ref Method.
+   */
+  struct MethodMetrics {
+    /// Number of calls that have completed, successfully or otherwise.
+    std::uint64_t callCount{0};
+    /// Number of calls that threw an exception.
+    std::uint64_t exceptionCount{0};
+    /// Sum of the latency of all calls, in nanoseconds.
+    std::uint64_t totalLatencyNs{0};
+    /// Distribution of the number of elements in each call's batch.
+    Histogram batchSizeHistogram{};
+    /// Distribution of the latency of each call, in nanoseconds.
+    Histogram latencyNsHistogram{};
+    /**
+     * Number of element errors reported for each error code, see
+     * @ref errorCount.
+     */
+    std::array<std::uint64_t, kNumErrorCodes> errorCounts{};
+
+    /**
+     * Number of element errors reported with the given code.
+     */
+    [[nodiscard]] std::uint64_t errorCount(BatchElementError::ErrorCode code) const;
+  };
+
+  /**
+   * Index of the histogram bucket that a value is counted in.
+   *
+   * Bucket `0` counts values of zero, and bucket `n` counts values in
+   * the range `[2^(n-1), 2^n)`. Values too large for the final bucket
+   * are counted in the final bucket.
+   */
+  [[nodiscard]] static std::size_t histogramBucket(std::uint64_t value);
+
+  ManagerMetrics();
+  ~ManagerMetrics();
+
+  ManagerMetrics(const ManagerMetrics&) = delete;
+  ManagerMetrics& operator=(const ManagerMetrics&) = delete;
+  ManagerMetrics(ManagerMetrics&&) = delete;
+  ManagerMetrics& operator=(ManagerMetrics&&) = delete;
+
+  /**
+   * Enable or disable recording.
+   *
+   * Recording is enabled by default. When disabled, instrumented
+   * methods skip timing altogether. Previously recorded statistics are
+   * retained.
+   */
+  void setEnabled(bool enabled);
+
+  /**
+   * Whether recording is enabled.
+   */
+  [[nodiscard]] bool isEnabled() const;
+
+  /**
+   * Take a snapshot of the statistics recorded for a method.
+   */
+  [[nodiscard]] MethodMetrics methodMetrics(Method method) const;
+
+  /**
+   * Reset all statistics to zero, e.g. at the start of a new session.
+   *
+   * Calls that are in flight may or may not be recorded.
+   */
+  void reset();
+
+  /**
+   * Record a completed call.
+   *
+   * This is called by the @ref Manager, hosts need not call it.
+   *
+   * @param method Method that was called.
+   * @param batchSize Number of elements in the batch.
+   * @param latencyNs Duration of the call, in nanoseconds.
+   * @param threw Whether the call threw an exception.
+   */
+  void recordCall(Method method, std::size_t batchSize, std::uint64_t latencyNs, bool threw);
+
+  /**
+   * Record an element error reported by a call.
+   *
+   * This is called by the @ref Manager, hosts need not call it.
+   *
+   * Unrecognised codes are recorded as
+   * @fqref{BatchElementError.ErrorCode.kUnknown} "kUnknown".
+   */
+  void recordError(Method method, BatchElementError::ErrorCode code);
+
+ private:
+  struct State;
+
+  std::unique_ptr<State> state_;
+};
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -0,0 +1,150 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <cstddef>
+#include <memory>
+
+#include <openassetio/export.h>
+#include <openassetio/log/LoggerInterface.hpp>
+
+#pragma once
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace log {
+OPENASSETIO_DECLARE_PTR(AsyncLogger)
+/**
+ * The AsyncLogger is a wrapper for a logger that relays messages from
+ * a background thread, such that logging does not block the caller.
+ *
+ * Messages and @ref LogRecord "records" are queued in a
+ * fixed-capacity ring buffer, and delivered to the upstream logger in
+ * the order they were logged. If messages are logged faster than the
+ * upstream logger can consume them, the queue will fill, and messages
+ * are dropped according to the @ref OverflowPolicy. A warning is
+ * relayed to the upstream logger whenever messages have been dropped.
+ *
+ * Destroying the logger blocks until all queued messages have been
+ * delivered.
+ *
+ * This is useful where the upstream logger is slow, e.g. writes to a
+ * terminal or must acquire the Python GIL, particularly when verbose
+ * severities such as @ref Severity.kDebugApi "kDebugApi" are enabled.
+ * It can be combined with a @ref SeverityFilter, in either order.
+ *
+ * @note The upstream logger will be called from a different thread to
+ * the one that logged the message.
+ */
+class OPENASSETIO_CORE_EXPORT AsyncLogger final : public LoggerInterface {
+ public:
+  /**
+   * Policy for handling messages logged when the queue is full.
+   */
+  enum class OverflowPolicy {
+    /// Discard the message being logged.
+    kDropNewest,
+    /// Discard the oldest queued message to make room.
+    kDropOldest
+  };
+
+  /// Default maximum number of queued messages.
+  static constexpr std::size_t kDefaultCapacity = 4096;
+
+  /**
+   * Creates a new instance of the AsyncLogger.
+   *
+   * @param upstreamLogger A logger that will receive messages from a
+   * background thread.
+   *
+   * @param capacity Maximum number of messages that can be queued
+   * awaiting delivery.
+   *
+   * @param overflowPolicy How to handle messages logged when the queue
+   * is full.
+   *
+   * @throw std::invalid_argument If `capacity` is zero.
+   */
+  [[nodiscard]] static AsyncLoggerPtr make(
+      LoggerInterfacePtr upstreamLogger, std::size_t capacity = kDefaultCapacity,
+      OverflowPolicy overflowPolicy = OverflowPolicy::kDropNewest);
+
+  /**
+   * Blocks until all queued messages have been delivered, then stops
+   * the background thread.
+   */
+  ~AsyncLogger() override;
+
+  AsyncLogger(const AsyncLogger&) = delete;
+  AsyncLogger& operator=(const AsyncLogger&) = delete;
+  AsyncLogger(AsyncLogger&&) = delete;
+  AsyncLogger& operator=(AsyncLogger&&) = delete;
+
+  /**
+   * Returns the logger wrapped by this logger.
+   */
+  [[nodiscard]] LoggerInterfacePtr upstreamLogger() const;
+
+  /**
+   * Returns the maximum number of messages that can be queued.
+   */
+  [[nodiscard]] std::size_t capacity() const;
+
+  /**
+   * Returns the policy for handling messages logged when the queue is
+   * full.
+   */
+  [[nodiscard]] OverflowPolicy overflowPolicy() const;
+
+  /**
+   * Returns the total number of messages that have been dropped due
+   * to the queue being full.
+   */
+  [[nodiscard]] std::size_t droppedCount() const;
+
+  /**
+   * Blocks until all messages logged prior to this call have been
+   * delivered to the upstream logger (or dropped).
+   *
+   * This must not be called from the upstream logger.
+   */
+  void flush();
+
+  using LoggerInterface::log;
+
+  /**
+   * Queues the message for delivery to the upstream logger.
+   *
+   * This does not block waiting for the upstream logger.
+   */
+  void log(Severity severity, const Str& message) override;
+
+  /**
+   * Queues the record for delivery to the upstream logger.
+   *
+   * If the record has no timestamp, it is given the current time, such
+   * that the time reflects when the record was logged rather than
+   * when it was delivered.
+   *
+   * This does not block waiting for the upstream logger.
+   */
+  void logRecord(const LogRecord& record) override;
+
+  /**
+   * Returns whether the severity will be logged by the @ref
+   * upstreamLogger.
+   */
+  [[nodiscard]] bool isSeverityLogged(Severity severity) const override;
+
+ private:
+  struct State;
+
+  AsyncLogger(LoggerInterfacePtr upstreamLogger, std::size_t capacity,
+              OverflowPolicy overflowPolicy);
+
+  static void runDrain(State* state);
+
+  void enqueue(LogRecord record);
+
+  std::unique_ptr<State> state_;
+};
+}  // namespace log
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -22,6 +22,8 @@ class OPENASSETIO_CORE_EXPORT ConsoleLogger final : public LoggerInterface {
    */
   [[nodiscard]] ConsoleLoggerPtr static make(bool shouldColorOutput = true);
 
+  using LoggerInterface::log;
+
   /**
    */
   void log(Severity severity, const Str& message) override;
@@ -0,0 +1,84 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <memory>
+
+#include <openassetio/export.h>
+#include <openassetio/log/LoggerInterface.hpp>
+
+#pragma once
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace log {
+OPENASSETIO_DECLARE_PTR(JsonLinesLogger)
+/**
+ * The JsonLinesLogger writes messages to a file as machine-readable
+ * JSON Lines, i.e. one JSON object per line.
+ *
+ * Each object contains the keys:
+ *   - `timestampNs` Time of the message, in nanoseconds since the Unix
+ *     epoch.
+ *   - `severity` The name of the severity, as per @ref kSeverityNames.
+ *   - `message` The human-readable message.
+ *
+ * Additionally, when logging a @ref LogRecord, each of its populated
+ * optional fields is written using the same key as the field name,
+ * with `errorCode` written as the name of the
+ * @fqref{BatchElementError.ErrorCode} "ErrorCode" (e.g.
+ * `"kEntityResolutionError"`).
+ *
+ * Lines are flushed as they are written, so the file can be consumed
+ * whilst it is being written. The file is appended to, if it already
+ * exists.
+ *
+ * This logger does not filter messages. It can be wrapped in a @ref
+ * SeverityFilter, and writing can be moved off the logging thread by
+ * wrapping in an @ref AsyncLogger.
+ *
+ * All member functions are thread-safe.
+ */
+class OPENASSETIO_CORE_EXPORT JsonLinesLogger final : public LoggerInterface {
+ public:
+  /**
+   * Creates a new instance of the JsonLinesLogger, opening the given
+   * file for appending.
+   *
+   * @param path Path of the file to write to.
+   *
+   * @throw std::runtime_error If the file cannot be opened.
+   */
+  [[nodiscard]] static JsonLinesLoggerPtr make(const Str& path);
+
+  ~JsonLinesLogger() override;
+
+  JsonLinesLogger(const JsonLinesLogger&) = delete;
+  JsonLinesLogger& operator=(const JsonLinesLogger&) = delete;
+  JsonLinesLogger(JsonLinesLogger&&) = delete;
+  JsonLinesLogger& operator=(JsonLinesLogger&&) = delete;
+
+  /**
+   * Returns the path of the file being written to.
+   */
+  [[nodiscard]] const Str& path() const;
+
+  using LoggerInterface::log;
+
+  /**
+   * Writes a line containing the severity and message.
+   */
+  void log(Severity severity, const Str& message) override;
+
+  /**
+   * Writes a line containing all populated fields of the record.
+   */
+  void logRecord(const LogRecord& record) override;
+
+ private:
+  struct State;
+
+  explicit JsonLinesLogger(std::unique_ptr<State> state);
+
+  std::unique_ptr<State> state_;
+};
+}  // namespace log
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -1,8 +1,13 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2022 The Foundry Visionmongers Ltd
 #include <array>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <optional>
 
 #include <openassetio/export.h>
+#include <openassetio/BatchElementError.hpp>
 #include <openassetio/typedefs.hpp>
 
 #pragma once
@@ -19,6 +24,7 @@ inline namespace OPENASSETIO_CORE_ABI_VERSION {
 */
 namespace log {
 OPENASSETIO_DECLARE_PTR(LoggerInterface)
+struct LogRecord;
 /**
  * An abstract base class that defines the receiving interface for
  * log messages generated a @ref manager or the API middleware.
@@ -40,6 +46,13 @@ class OPENASSETIO_CORE_EXPORT LoggerInterface {
                                              "warning",  "error", "critical"};
   /// @}
 
+  /**
+   * Callable that constructs a message on demand.
+   *
+   * @see @ref log(Severity, const MessageFactory&)
+   */
+  using MessageFactory = std::function<Str()>;
+
   virtual ~LoggerInterface() = 0;
 
   /**
@@ -55,6 +68,54 @@ class OPENASSETIO_CORE_EXPORT LoggerInterface {
    */
   virtual void log(Severity severity, const Str& message) = 0;
 
+  /**
+   * Queries whether a message of the given severity would be
+   * presented to the user.
+   *
+   * This allows callers to avoid the cost of constructing messages
+   * that would be discarded. It is advisory only - messages of any
+   * severity may still be passed to @ref log.
+   *
+   * The default implementation returns `true`. Loggers that discard
+   * messages, e.g. @ref SeverityFilter, should override this.
+   *
+   * @param severity One of the severity constants defined in @ref
+   * Severity.
+   *
+   * @return Whether messages of the given severity will be logged.
+   */
+  [[nodiscard]] virtual bool isSeverityLogged(Severity severity) const;
+
+  /**
+   * Logs a message to the user, only constructing the message if it
+   * will be logged.
+   *
+   * The `messageFactory` is only called if @ref isSeverityLogged
+   * returns `true` for the given severity.
+   *
+   * @param severity One of the severity constants defined in @ref
+   * Severity.
+   *
+   * @param messageFactory Callable returning the message string to be
+   * logged.
+   */
+  void log(Severity severity, const MessageFactory& messageFactory);
+
+  /**
+   * Logs a structured record, carrying machine-readable fields in
+   * addition to a human-readable message.
+   *
+   * Loggers that produce machine-readable output, e.g. @ref
+   * JsonLinesLogger, should override this to make use of the
+   * additional fields.
+   *
+   * The default implementation calls @ref log with the record's
+   * severity and message, discarding the other fields.
+   *
+   * @param record The record to be logged.
+   */
+  virtual void logRecord(const LogRecord& record);
+
   /**
    * @name Conveniences
    * @{
@@ -75,6 +136,38 @@ class OPENASSETIO_CORE_EXPORT LoggerInterface {
    * @}
    */
 };
+
+/**
+ * A structured log message.
+ *
+ * In addition to the human-readable message, optional fields describe
+ * an API call, such that tools consuming the log can extract them
+ * without parsing the message.
+ *
+ * @see @ref LoggerInterface.logRecord
+ */
+struct OPENASSETIO_CORE_EXPORT LogRecord {
+  /// Severity of the message.
+  LoggerInterface::Severity severity{LoggerInterface::Severity::kInfo};
+  /// Human-readable message.
+  Str message;
+  /// Name of the API method the record relates to, if any.
+  Str method;
+  /// Identifier of the manager the record relates to, if any.
+  Str managerIdentifier;
+  /// Number of elements in the batch passed to the method.
+  std::optional<std::size_t> batchSize;
+  /// Wall-clock duration of the method call, in nanoseconds.
+  std::optional<std::int64_t> durationNs;
+  /// Error encountered by the method call.
+  std::optional<BatchElementError::ErrorCode> errorCode;
+  /**
+   * Time at which the record was created, in nanoseconds since the
+   * Unix epoch. If unset, loggers may use the time at which the record
+   * is logged.
+   */
+  std::optional<std::int64_t> timestampNs;
+};
 }  // namespace log
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
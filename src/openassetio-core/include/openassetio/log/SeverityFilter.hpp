@@ -64,8 +64,22 @@ class OPENASSETIO_CORE_EXPORT SeverityFilter final : public LoggerInterface {
    * @}
    */
 
+  using LoggerInterface::log;
+
   void log(Severity severity, const Str& message) override;
 
+  /**
+   * Relays the record to the @ref upstreamLogger if its severity is
+   * at or above the filter severity.
+   */
+  void logRecord(const LogRecord& record) override;
+
+  /**
+   * Returns whether the severity is at or above the filter severity,
+   * and will also be logged by the @ref upstreamLogger.
+   */
+  [[nodiscard]] bool isSeverityLogged(Severity severity) const override;
+
  private:
   explicit SeverityFilter(LoggerInterfacePtr upstreamLogger);
 
@@ -3,6 +3,7 @@
 
 #pragma once
 
+#include <exception>
 #include <functional>
 #include <memory>
 #include <string>
@@ -18,6 +19,7 @@
 OPENASSETIO_FWD_DECLARE(managerApi, ManagerStateBase)
 OPENASSETIO_FWD_DECLARE(managerApi, HostSession)
 OPENASSETIO_FWD_DECLARE(Context)
+OPENASSETIO_FWD_DECLARE(TraitsDataBatch)
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
@@ -570,6 +572,31 @@ class OPENASSETIO_CORE_EXPORT ManagerInterface {
   [[nodiscard]] virtual bool isEntityReferenceString(const Str& someString,
                                                      const HostSessionPtr& hostSession) const = 0;
 
+  /**
+   * Batch form of @ref isEntityReferenceString.
+   *
+   * Determines, for each of the supplied strings, whether it matches
+   * the pattern of an @ref entity_reference for this manager.
+   *
+   * This allows the host to check many candidate strings (e.g. when
+   * loading a scene description) with a single call into the manager,
+   * which can be considerably cheaper when bridging between languages.
+   *
+   * The default implementation calls @ref isEntityReferenceString for
+   * each element in turn. Managers may override this where a more
+   * efficient implementation is possible.
+   *
+   * @param someStrings The strings to be inspected.
+   *
+   * @param hostSession HostSession The API session.
+   *
+   * @return A list of the same length as `someStrings`, where each
+   * element is `true` if the corresponding string should be
+   * considered as an @ref entity_reference, `false` otherwise.
+   */
+  [[nodiscard]] virtual std::vector<bool> isEntityReferenceStrings(
+      const std::vector<Str>& someStrings, const HostSessionPtr& hostSession) const;
+
   /**
    * @}
    */
@@ -661,6 +688,13 @@ class OPENASSETIO_CORE_EXPORT ManagerInterface {
    * would correspond to an exception whereas a client error (4xx) would
    * correspond to a `BatchElementError`.
    *
+   * Hosts may deliver results incrementally as callbacks are called,
+   * so results should be passed to the callbacks as soon as they are
+   * available, rather than all at once at the end. For large batches,
+   * the context's @fqref{Context.cancellationToken}
+   * "cancellationToken", if set, should be polled periodically, and
+   * the remaining elements skipped once it is cancelled.
+   *
    * @param entityReferences Entity references to query.
    *
    * @param traitSet The traits to resolve for the supplied list of
@@ -693,6 +727,108 @@ class OPENASSETIO_CORE_EXPORT ManagerInterface {
                        const ContextConstPtr& context, const HostSessionPtr& hostSession,
                        const ResolveSuccessCallback& successCallback,
                        const BatchElementErrorCallback& errorCallback) = 0;
+
+  /**
+   * Columnar form of @ref resolve.
+   *
+   * Populates the supplied @fqref{TraitsDataBatch} "TraitsDataBatch"
+   * with the available property data for the requested set of traits
+   * for each given @ref entity_reference, rather than calling a
+   * callback with a separate @fqref{TraitsData} "TraitsData" for each.
+   *
+   * The element at each index of `results` corresponds to the entity
+   * reference at the same index of `entityReferences`. Errors specific
+   * to a particular entity should be flagged using
+   * @fqref{TraitsDataBatch.setError} "setError", with the same error
+   * codes as for @ref resolve.
+   *
+   * The default implementation calls @ref resolve and copies each
+   * result into the batch. Since each column holds values of a single
+   * type, a result with a property value whose type differs from that
+   * of earlier results (e.g. a `Float` where previous entities had an
+   * `Int`) is instead flagged with an
+   * @fqref{BatchElementError.ErrorCode.kEntityResolutionError}
+   * "kEntityResolutionError", leaving the rest of the batch intact.
+   * Managers that hold their data in bulk may override this to
+   * populate whole columns at once, see
+   * @fqref{TraitsDataBatch.setColumn} "setColumn".
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The traits to resolve for the supplied list of
+   * entity references.
+   *
+   * @param context The calling context.
+   *
+   * @param hostSession The API session.
+   *
+   * @param results Batch to populate, with the same number of elements
+   * as `entityReferences`.
+   */
+  virtual void resolveToBatch(const EntityReferences& entityReferences,
+                              const trait::TraitSet& traitSet, const ContextConstPtr& context,
+                              const HostSessionPtr& hostSession,
+                              const TraitsDataBatchPtr& results);
+
+  /**
+   * Callback signature used to signal that an asynchronous operation
+   * has finished.
+   *
+   * It should be given a null `std::exception_ptr` if the operation
+   * completed, or the exception that failed the whole batch.
+   */
+  using AsyncCompletionCallback = std::function<void(std::exception_ptr)>;
+
+  /**
+   * Non-blocking form of @ref resolve.
+   *
+   * Managers that are able to service requests without blocking the
+   * calling thread, e.g. by issuing a request to a remote server and
+   * processing the response on a thread of their own, may override
+   * this method to do so.
+   *
+   * Implementations should return as soon as the request has been
+   * issued. The `successCallback` and `errorCallback` should then be
+   * called, as for @ref resolve, but may be called from any thread.
+   * Once all elements have been reported, the `completionCallback`
+   * must be called exactly once, and no further callbacks may be
+   * called after it.
+   *
+   * Errors that fail the whole batch should be given to the
+   * `completionCallback`, rather than thrown, unless they are
+   * encountered before the request is issued.
+   *
+   * The default implementation returns `false`, in which case the
+   * host will instead call @ref resolve from a worker thread.
+   *
+   * @param entityReferences Entity references to query.
+   *
+   * @param traitSet The traits to resolve for the supplied list of
+   * entity references.
+   *
+   * @param context The calling context.
+   *
+   * @param hostSession The API session.
+   *
+   * @param successCallback Callback that must be called for each
+   * successful resolution of an entity reference.
+   *
+   * @param errorCallback Callback that must be called for each
+   * failed resolution of an entity reference.
+   *
+   * @param completionCallback Callback that must be called once all
+   * other callbacks have been called.
+   *
+   * @return `true` if the request was accepted, and so the
+   * `completionCallback` will be called, `false` if asynchronous
+   * resolution is not supported.
+   */
+  virtual bool resolveAsync(const EntityReferences& entityReferences,
+                            const trait::TraitSet& traitSet, const ContextConstPtr& context,
+                            const HostSessionPtr& hostSession,
+                            const ResolveSuccessCallback& successCallback,
+                            const BatchElementErrorCallback& errorCallback,
+                            const AsyncCompletionCallback& completionCallback);
   /// @}
 
   /**
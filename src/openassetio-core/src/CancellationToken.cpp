@@ -0,0 +1,17 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <openassetio/CancellationToken.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+CancellationTokenPtr CancellationToken::make() {
+  return std::shared_ptr<CancellationToken>(new CancellationToken);
+}
+
+CancellationToken::CancellationToken() = default;
+
+void CancellationToken::cancel() { cancelled_.store(true, std::memory_order_release); }
+
+bool CancellationToken::isCancelled() const { return cancelled_.load(std::memory_order_acquire); }
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -1,82 +1,487 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2022 The Foundry Visionmongers Ltd
 
-#include <unordered_map>
+#include <algorithm>
+#include <array>
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <iterator>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <stdexcept>
+#include <utility>
+#include <vector>
 
 #include <openassetio/TraitsData.hpp>
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace {
+/**
+ * Identifier of an interned string, see SymbolTable.
+ */
+using SymbolId = std::uint32_t;
+
+/**
+ * Process-wide table of interned trait IDs and property keys.
+ *
+ * The set of distinct trait IDs and property keys in use is small
+ * relative to the number of TraitsData instances, so storing each
+ * string once and referring to it by a small integer ID saves both
+ * memory and allocations.
+ *
+ * Lookups are lock-free, since they happen on every TraitsData
+ * access. Only interning a new string takes a lock.
+ *
+ * The table is append-only. It is made up of segments, each twice
+ * the size of the last, holding an open-addressed hash index and the
+ * strings for a contiguous range of IDs. Once a segment is full, a
+ * new one is published and the old one is never modified again, so
+ * readers never observe a rehash. Lookup of a string probes each
+ * segment in turn, so costs grow logarithmically with the number of
+ * distinct strings. Interned strings are never released, and
+ * interning more than ~33 million distinct strings throws, see
+ * kMaxSegments.
+ */
+class SymbolTable {
+ public:
+  static SymbolTable& instance() {
+    static SymbolTable table;
+    return table;
+  }
+
+  /// Get the ID of the given string, interning it if necessary.
+  SymbolId intern(const Str& str) {
+    const std::size_t hash = std::hash<Str>{}(str);
+    if (const std::optional<SymbolId> symbolId = findHashed(str, hash)) {
+      return *symbolId;
+    }
+    const std::lock_guard lock{mutex_};
+    // Another thread may have interned the string in the meantime.
+    if (const std::optional<SymbolId> symbolId = findHashed(str, hash)) {
+      return *symbolId;
+    }
+    std::size_t numSegments = numSegments_.load(std::memory_order_relaxed);
+    if (numSegments == 0 || segments_[numSegments - 1]->full()) {
+      if (numSegments == kMaxSegments) {
+        throw std::length_error{"Too many distinct trait IDs and property keys"};
+      }
+      const SymbolId firstId = numSegments == 0 ? 0 : segments_[numSegments - 1]->lastId();
+      segments_[numSegments] = std::make_unique<Segment>(numSegments, firstId);
+      // Publish the (empty) segment, see findHashed.
+      numSegments_.store(++numSegments, std::memory_order_release);
+    }
+    return segments_[numSegments - 1]->insert(str, hash);
+  }
+
+  /// Get the ID of the given string, if it has been interned.
+  [[nodiscard]] std::optional<SymbolId> find(const Str& str) const {
+    return findHashed(str, std::hash<Str>{}(str));
+  }
+
+  /// Get the string corresponding to the given ID.
+  [[nodiscard]] const Str& str(const SymbolId symbolId) const {
+    // The ID was returned by intern/find, which synchronised with its
+    // segment's publication.
+    std::size_t segmentIdx = 0;
+    while (symbolId >= segments_[segmentIdx]->lastId()) {
+      ++segmentIdx;
+    }
+    return segments_[segmentIdx]->str(symbolId);
+  }
+
+ private:
+  static constexpr std::size_t kFirstSegmentCapacity = 32;
+  // Bounds the table to 32 * (2^20 - 1) symbols.
+  static constexpr std::size_t kMaxSegments = 20;
+
+  /**
+   * Fixed-size portion of the table.
+   *
+   * Slots of the hash index hold a symbol ID plus one, so that zero
+   * can mean empty. Each slot is written once, under the table lock,
+   * after the corresponding string. Hence a reader that loads a
+   * non-zero slot can safely read the string.
+   */
+  class Segment {
+   public:
+    Segment(const std::size_t segmentIdx, const SymbolId firstId)
+        : firstId_{firstId},
+          capacity_{kFirstSegmentCapacity << segmentIdx},
+          // Keep the index at most half full, to keep probes short.
+          mask_{capacity_ * 2 - 1},
+          slots_{std::make_unique<std::atomic<SymbolId>[]>(capacity_ * 2)},
+          strings_{std::make_unique<Str[]>(capacity_)} {}
+
+    [[nodiscard]] bool full() const { return size_ == capacity_; }
+
+    [[nodiscard]] SymbolId lastId() const { return firstId_ + static_cast<SymbolId>(capacity_); }
+
+    [[nodiscard]] const Str& str(const SymbolId symbolId) const {
+      return strings_[symbolId - firstId_];
+    }
+
+    [[nodiscard]] std::optional<SymbolId> find(const Str& str, const std::size_t hash) const {
+      for (std::size_t slotIdx = hash & mask_;; slotIdx = (slotIdx + 1) & mask_) {
+        const SymbolId slot = slots_[slotIdx].load(std::memory_order_acquire);
+        if (slot == 0) {
+          return {};
+        }
+        if (strings_[slot - 1 - firstId_] == str) {
+          return slot - 1;
+        }
+      }
+    }
+
+    // Must be called under the table lock, and only if not full.
+    SymbolId insert(const Str& str, const std::size_t hash) {
+      std::size_t slotIdx = hash & mask_;
+      while (slots_[slotIdx].load(std::memory_order_relaxed) != 0) {
+        slotIdx = (slotIdx + 1) & mask_;
+      }
+      const auto symbolId = firstId_ + static_cast<SymbolId>(size_);
+      strings_[size_] = str;
+      ++size_;
+      slots_[slotIdx].store(symbolId + 1, std::memory_order_release);
+      return symbolId;
+    }
+
+   private:
+    const SymbolId firstId_;
+    const std::size_t capacity_;
+    const std::size_t mask_;
+    const std::unique_ptr<std::atomic<SymbolId>[]> slots_;
+    const std::unique_ptr<Str[]> strings_;
+    // Only accessed under the table lock.
+    std::size_t size_{0};
+  };
+
+  [[nodiscard]] std::optional<SymbolId> findHashed(const Str& str, const std::size_t hash) const {
+    // Segments are published once, after construction, so are safe
+    // to read up to the acquired count.
+    const std::size_t numSegments = numSegments_.load(std::memory_order_acquire);
+    // Newer segments are larger, so more likely to hold the string.
+    for (std::size_t segmentIdx = numSegments; segmentIdx-- > 0;) {
+      if (const std::optional<SymbolId> symbolId = segments_[segmentIdx]->find(str, hash)) {
+        return symbolId;
+      }
+    }
+    return {};
+  }
+
+  // Serialises interning. Lookups do not lock.
+  std::mutex mutex_;
+  std::array<std::unique_ptr<Segment>, kMaxSegments> segments_;
+  std::atomic<std::size_t> numSegments_{0};
+};
+}  // namespace
+
+/**
+ * Compact storage for trait and property data.
+ *
+ * Trait IDs and property keys are interned, and the data held in
+ * flat vectors sorted by symbol ID. Compared to nested hash maps this
+ * requires only two allocations, regardless of the number of traits
+ * and properties.
+ */
 class TraitsData::Impl {
  public:
   Impl() = default;
 
   explicit Impl(const trait::TraitSet& traitSet) { addTraits(traitSet); }
 
-  Impl(const Impl& other) = default;
+  // Copies the data, but not the sharing state.
+  Impl(const Impl& other) : traitIds_{other.traitIds_}, properties_{other.properties_} {}
 
   ~Impl() = default;
 
+  Impl& operator=(const Impl&) = delete;
+  Impl(Impl&&) = delete;
+  Impl& operator=(Impl&&) = delete;
+
+  // Record that another TraitsData instance shares this data. The
+  // caller must already be a sharer, so no ordering is required.
+  void addSharer() { numSharers_.fetch_add(1, std::memory_order_relaxed); }
+
+  // Record that a TraitsData instance no longer shares this data.
+  // Release ordering ensures the instance's prior reads of the data
+  // happen-before any subsequent in-place modification by the
+  // remaining sharer, see isShared.
+  void removeSharer() { numSharers_.fetch_sub(1, std::memory_order_release); }
+
+  // Whether any other TraitsData instance shares this data. If not,
+  // acquire ordering ensures all reads by previous sharers are
+  // complete, so the data can be safely modified in place.
+  [[nodiscard]] bool isShared() const { return numSharers_.load(std::memory_order_acquire) != 1; }
+
   [[nodiscard]] trait::TraitSet traitSet() const {
+    const SymbolTable& symbols = SymbolTable::instance();
     trait::TraitSet ids;
-    ids.reserve(data_.size());
-    for (const auto& item : data_) {
-      ids.insert(item.first);
+    ids.reserve(traitIds_.size());
+    for (const SymbolId traitId : traitIds_) {
+      ids.insert(symbols.str(traitId));
     }
     return ids;
   }
 
+  void forEachTrait(const TraitVisitor& visitor) const {
+    const SymbolTable& symbols = SymbolTable::instance();
+    for (const SymbolId traitId : traitIds_) {
+      visitor(symbols.str(traitId));
+    }
+  }
+
+  [[nodiscard]] bool hasSameTraitSet(const Impl& other) const {
+    return traitIds_ == other.traitIds_;
+  }
+
   [[nodiscard]] bool hasTrait(const trait::TraitId& traitId) const {
-    return static_cast<bool>(data_.count(traitId));
+    const std::optional<SymbolId> traitSymbol = SymbolTable::instance().find(traitId);
+    return traitSymbol && hasTrait(*traitSymbol);
   }
 
-  void addTrait(const trait::TraitId& traitId) { data_[traitId]; }
+  void addTrait(const trait::TraitId& traitId) {
+    addTrait(SymbolTable::instance().intern(traitId));
+  }
 
   void addTraits(const trait::TraitSet& traitSet) {
     for (const auto& traitId : traitSet) {
-      data_[traitId];
+      addTrait(traitId);
     }
   }
 
   // NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
   bool getTraitProperty(trait::property::Value* out, const trait::TraitId& traitId,
                         const trait::property::Key& propertyKey) const {
-    // Use `at` deliberately to trigger exception if trait doesn't exist
-    const auto& traitDict = data_.at(traitId);
+    const SymbolTable& symbols = SymbolTable::instance();
 
-    const auto& iter = traitDict.find(propertyKey);
-    if (iter == traitDict.end()) {
+    const std::optional<SymbolId> traitSymbol = symbols.find(traitId);
+    if (!traitSymbol || !hasTrait(*traitSymbol)) {
+      throw std::out_of_range{"Trait not found: " + traitId};
+    }
+
+    const std::optional<SymbolId> keySymbol = symbols.find(propertyKey);
+    if (!keySymbol) {
+      return false;
+    }
+    const auto iter = findProperty(*traitSymbol, *keySymbol);
+    if (iter == properties_.end() || !iter->hasIds(*traitSymbol, *keySymbol)) {
       return false;
     }
-    *out = iter->second;
+    *out = iter->value;
     return true;
   }
 
   void setTraitProperty(const trait::TraitId& traitId, const trait::property::Key& propertyKey,
                         trait::property::Value propertyValue) {
-    // Use subscript to ensure the trait is added if it is missing
-    data_[traitId][propertyKey] = std::move(propertyValue);
+    SymbolTable& symbols = SymbolTable::instance();
+    const SymbolId traitSymbol = symbols.intern(traitId);
+    const SymbolId keySymbol = symbols.intern(propertyKey);
+
+    // Ensure the trait is added if it is missing
+    addTrait(traitSymbol);
+
+    const auto iter = findProperty(traitSymbol, keySymbol);
+    if (iter != properties_.end() && iter->hasIds(traitSymbol, keySymbol)) {
+      iter->value = std::move(propertyValue);
+      return;
+    }
+    properties_.insert(iter, Property{traitSymbol, keySymbol, std::move(propertyValue)});
+  }
+
+  [[nodiscard]] TraitDict getTraitProperties(const trait::TraitId& traitId) const {
+    const SymbolTable& symbols = SymbolTable::instance();
+
+    const std::optional<SymbolId> traitSymbol = symbols.find(traitId);
+    if (!traitSymbol || !hasTrait(*traitSymbol)) {
+      throw std::out_of_range{"Trait not found: " + traitId};
+    }
+
+    TraitDict properties;
+    for (auto iter = findProperty(*traitSymbol, 0);
+         iter != properties_.end() && iter->traitId == *traitSymbol; ++iter) {
+      properties.emplace(symbols.str(iter->key), iter->value);
+    }
+    return properties;
+  }
+
+  void setTraitProperties(const trait::TraitId& traitId, const TraitDict& traitProperties) {
+    const SymbolId traitSymbol = SymbolTable::instance().intern(traitId);
+    Properties properties;
+    appendProperties(&properties, traitSymbol, traitProperties);
+
+    addTrait(traitSymbol);
+    mergeProperties(std::move(properties));
+  }
+
+  void setProperties(const Dict& dict) {
+    SymbolTable& symbols = SymbolTable::instance();
+
+    std::vector<SymbolId> traitIds;
+    traitIds.reserve(dict.size());
+    Properties properties;
+    for (const auto& [traitId, traitProperties] : dict) {
+      const SymbolId traitSymbol = symbols.intern(traitId);
+      traitIds.push_back(traitSymbol);
+      appendProperties(&properties, traitSymbol, traitProperties);
+    }
+    mergeTraits(std::move(traitIds));
+    mergeProperties(std::move(properties));
+  }
+
+  [[nodiscard]] Dict toDict() const {
+    const SymbolTable& symbols = SymbolTable::instance();
+    Dict dict;
+    dict.reserve(traitIds_.size());
+    for (const SymbolId traitId : traitIds_) {
+      dict.emplace(symbols.str(traitId), TraitDict{});
+    }
+    for (const Property& property : properties_) {
+      dict[symbols.str(property.traitId)].emplace(symbols.str(property.key), property.value);
+    }
+    return dict;
   }
 
   [[nodiscard]] trait::property::KeySet traitPropertyKeys(const trait::TraitId& traitId) const {
-    const auto& traitEntry = data_.find(traitId);
-    if (traitEntry == data_.end()) {
+    const SymbolTable& symbols = SymbolTable::instance();
+    const std::optional<SymbolId> traitSymbol = symbols.find(traitId);
+    if (!traitSymbol) {
       return {};
     }
     trait::property::KeySet propertyKeys;
-    propertyKeys.reserve(traitEntry->second.size());
-    for (const auto& propIter : traitEntry->second) {
-      propertyKeys.insert(propIter.first);
+    for (auto iter = findProperty(*traitSymbol, 0);
+         iter != properties_.end() && iter->traitId == *traitSymbol; ++iter) {
+      propertyKeys.insert(symbols.str(iter->key));
     }
     return propertyKeys;
   }
 
-  bool operator==(const Impl& other) const { return data_ == other.data_; }
+  void forEachTraitProperty(const trait::TraitId& traitId,
+                            const TraitPropertyVisitor& visitor) const {
+    const SymbolTable& symbols = SymbolTable::instance();
+    const std::optional<SymbolId> traitSymbol = symbols.find(traitId);
+    if (!traitSymbol) {
+      return;
+    }
+    for (auto iter = findProperty(*traitSymbol, 0);
+         iter != properties_.end() && iter->traitId == *traitSymbol; ++iter) {
+      visitor(symbols.str(iter->key), iter->value);
+    }
+  }
+
+  void forEachProperty(const PropertyVisitor& visitor) const {
+    const SymbolTable& symbols = SymbolTable::instance();
+    for (const Property& property : properties_) {
+      visitor(symbols.str(property.traitId), symbols.str(property.key), property.value);
+    }
+  }
+
+  bool operator==(const Impl& other) const {
+    // Symbol IDs are process-wide, so can be compared directly.
+    return traitIds_ == other.traitIds_ && properties_ == other.properties_;
+  }
 
  private:
-  using Properties = std::unordered_map<trait::property::Key, trait::property::Value>;
-  using PropertiesByTrait = std::unordered_map<trait::TraitId, Properties>;
-  PropertiesByTrait data_;
+  struct Property {
+    SymbolId traitId;
+    SymbolId key;
+    trait::property::Value value;
+
+    [[nodiscard]] bool hasIds(const SymbolId otherTraitId, const SymbolId otherKey) const {
+      return traitId == otherTraitId && key == otherKey;
+    }
+
+    bool operator==(const Property& other) const {
+      return hasIds(other.traitId, other.key) && value == other.value;
+    }
+  };
+  using Properties = std::vector<Property>;
+
+  [[nodiscard]] bool hasTrait(const SymbolId traitId) const {
+    return std::binary_search(traitIds_.begin(), traitIds_.end(), traitId);
+  }
+
+  void addTrait(const SymbolId traitId) {
+    const auto iter = std::lower_bound(traitIds_.begin(), traitIds_.end(), traitId);
+    if (iter == traitIds_.end() || *iter != traitId) {
+      traitIds_.insert(iter, traitId);
+    }
+  }
+
+  // Intern and append the given properties of a trait, unsorted.
+  static void appendProperties(Properties* properties, const SymbolId traitId,
+                               const TraitDict& traitProperties) {
+    SymbolTable& symbols = SymbolTable::instance();
+    properties->reserve(properties->size() + traitProperties.size());
+    for (const auto& [propertyKey, propertyValue] : traitProperties) {
+      properties->push_back(Property{traitId, symbols.intern(propertyKey), propertyValue});
+    }
+  }
+
+  // Add many traits at once, with a single pass over existing traits.
+  void mergeTraits(std::vector<SymbolId> traitIds) {
+    std::sort(traitIds.begin(), traitIds.end());
+    std::vector<SymbolId> merged;
+    merged.reserve(traitIds_.size() + traitIds.size());
+    std::set_union(traitIds_.begin(), traitIds_.end(), traitIds.begin(), traitIds.end(),
+                   std::back_inserter(merged));
+    traitIds_ = std::move(merged);
+  }
+
+  // Set many properties at once, with a single pass over existing
+  // properties. Incoming values take precedence. Assumes the traits
+  // of the properties have already been added.
+  void mergeProperties(Properties properties) {
+    const auto byIds = [](const Property& lhs, const Property& rhs) {
+      return std::pair{lhs.traitId, lhs.key} < std::pair{rhs.traitId, rhs.key};
+    };
+    std::sort(properties.begin(), properties.end(), byIds);
+
+    Properties merged;
+    merged.reserve(properties_.size() + properties.size());
+    auto existing = properties_.begin();
+    for (Property& property : properties) {
+      while (existing != properties_.end() && byIds(*existing, property)) {
+        merged.push_back(std::move(*existing++));
+      }
+      if (existing != properties_.end() && existing->hasIds(property.traitId, property.key)) {
+        ++existing;
+      }
+      merged.push_back(std::move(property));
+    }
+    std::move(existing, properties_.end(), std::back_inserter(merged));
+    properties_ = std::move(merged);
+  }
+
+  // Find the first property not ordered before the given IDs.
+  [[nodiscard]] Properties::const_iterator findProperty(const SymbolId traitId,
+                                                        const SymbolId key) const {
+    return std::lower_bound(
+        properties_.begin(), properties_.end(), std::pair{traitId, key},
+        [](const Property& property, const std::pair<SymbolId, SymbolId>& ids) {
+          return std::pair{property.traitId, property.key} < ids;
+        });
+  }
+
+  [[nodiscard]] Properties::iterator findProperty(const SymbolId traitId, const SymbolId key) {
+    // Re-use the const overload, converting the resulting iterator.
+    const auto constIter = std::as_const(*this).findProperty(traitId, key);
+    return properties_.begin() + (constIter - properties_.cbegin());
+  }
+
+  // Sorted by symbol ID.
+  std::vector<SymbolId> traitIds_;
+  // Sorted by (trait, key) symbol IDs.
+  Properties properties_;
+  // Number of TraitsData instances sharing this data. Tracked
+  // separately from the std::shared_ptr use count, since
+  // std::shared_ptr::use_count is a relaxed load, which does not
+  // order another thread's release of its copy before our in-place
+  // modification.
+  std::atomic<std::size_t> numSharers_{1};
 };
 
 TraitsDataPtr TraitsData::make() { return std::shared_ptr<TraitsData>(new TraitsData()); }
@@ -89,20 +494,46 @@ TraitsDataPtr TraitsData::make(const TraitsDataConstPtr& other) {
   return std::shared_ptr<TraitsData>(new TraitsData(*other));
 }
 
-TraitsData::TraitsData() : impl_{std::make_unique<Impl>()} {}
+TraitsDataPtr TraitsData::fromDict(const Dict& dict) {
+  TraitsDataPtr traitsData = make();
+  traitsData->setProperties(dict);
+  return traitsData;
+}
+
+TraitsData::TraitsData() : impl_{std::make_shared<Impl>()} {}
 
 TraitsData::TraitsData(const trait::TraitSet& traitSet)
-    : impl_{std::make_unique<Impl>(traitSet)} {}
+    : impl_{std::make_shared<Impl>(traitSet)} {}
 
-TraitsData::TraitsData(const TraitsData& other) : impl_{std::make_unique<Impl>(*other.impl_)} {}
+// Shallow copy - see mutableImpl.
+TraitsData::TraitsData(const TraitsData& other) : impl_{other.impl_} { impl_->addSharer(); }
 
-TraitsData::~TraitsData() = default;
+TraitsData::~TraitsData() { impl_->removeSharer(); }
 
 trait::TraitSet TraitsData::traitSet() const { return impl_->traitSet(); }
 
-void TraitsData::addTrait(const trait::TraitId& traitId) { impl_->addTrait(traitId); }
+void TraitsData::addTrait(const trait::TraitId& traitId) {
+  // Avoid detaching for a no-op.
+  if (impl_->hasTrait(traitId)) {
+    return;
+  }
+  mutableImpl().addTrait(traitId);
+}
 
-void TraitsData::addTraits(const trait::TraitSet& traitSet) { impl_->addTraits(traitSet); }
+void TraitsData::addTraits(const trait::TraitSet& traitSet) {
+  // Avoid detaching for a no-op.
+  if (std::all_of(traitSet.begin(), traitSet.end(),
+                  [this](const trait::TraitId& traitId) { return impl_->hasTrait(traitId); })) {
+    return;
+  }
+  mutableImpl().addTraits(traitSet);
+}
+
+void TraitsData::forEachTrait(const TraitVisitor& visitor) const { impl_->forEachTrait(visitor); }
+
+bool TraitsData::hasSameTraitSet(const TraitsData& other) const {
+  return impl_ == other.impl_ || impl_->hasSameTraitSet(*other.impl_);
+}
 
 bool TraitsData::hasTrait(const trait::TraitId& traitId) const { return impl_->hasTrait(traitId); }
 
@@ -114,13 +545,47 @@ bool TraitsData::getTraitProperty(trait::property::Value* out, const trait::Trai
 void TraitsData::setTraitProperty(const trait::TraitId& traitId,
                                   const trait::property::Key& propertyKey,
                                   trait::property::Value propertyValue) {
-  impl_->setTraitProperty(traitId, propertyKey, std::move(propertyValue));
+  mutableImpl().setTraitProperty(traitId, propertyKey, std::move(propertyValue));
 }
 
+TraitsData::TraitDict TraitsData::getTraitProperties(const trait::TraitId& traitId) const {
+  return impl_->getTraitProperties(traitId);
+}
+
+void TraitsData::setTraitProperties(const trait::TraitId& traitId, const TraitDict& properties) {
+  mutableImpl().setTraitProperties(traitId, properties);
+}
+
+void TraitsData::setProperties(const Dict& dict) { mutableImpl().setProperties(dict); }
+
+TraitsData::Dict TraitsData::toDict() const { return impl_->toDict(); }
+
 trait::property::KeySet TraitsData::traitPropertyKeys(const trait::TraitId& traitId) const {
   return impl_->traitPropertyKeys(traitId);
 }
 
-bool TraitsData::operator==(const TraitsData& other) const { return *impl_ == *other.impl_; }
+void TraitsData::forEachTraitProperty(const trait::TraitId& traitId,
+                                      const TraitPropertyVisitor& visitor) const {
+  impl_->forEachTraitProperty(traitId, visitor);
+}
+
+void TraitsData::forEachProperty(const PropertyVisitor& visitor) const {
+  impl_->forEachProperty(visitor);
+}
+
+bool TraitsData::operator==(const TraitsData& other) const {
+  return impl_ == other.impl_ || *impl_ == *other.impl_;
+}
+
+TraitsData::Impl& TraitsData::mutableImpl() {
+  // If unshared, no other instance can observe this data, since new
+  // sharers can only be created by copying this instance.
+  if (impl_->isShared()) {
+    auto impl = std::make_shared<Impl>(*impl_);
+    impl_->removeSharer();
+    impl_ = std::move(impl);
+  }
+  return *impl_;
+}
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
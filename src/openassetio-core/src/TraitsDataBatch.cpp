@@ -0,0 +1,164 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <variant>
+
+#include <openassetio/TraitsData.hpp>
+#include <openassetio/TraitsDataBatch.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+TraitsDataBatchPtr TraitsDataBatch::make(std::size_t size) {
+  return std::shared_ptr<TraitsDataBatch>(new TraitsDataBatch(size));
+}
+
+TraitsDataBatch::TraitsDataBatch(const std::size_t size) : size_{size}, errors_(size) {}
+
+std::size_t TraitsDataBatch::size() const { return size_; }
+
+trait::TraitSet TraitsDataBatch::traitSet() const {
+  trait::TraitSet traitSet;
+  for (const auto& [traitId, hasTrait] : traits_) {
+    if (std::find(hasTrait.begin(), hasTrait.end(), true) != hasTrait.end()) {
+      traitSet.insert(traitId);
+    }
+  }
+  return traitSet;
+}
+
+bool TraitsDataBatch::hasTrait(const std::size_t index, const trait::TraitId& traitId) const {
+  checkIndex(index);
+  const auto iter = traits_.find(traitId);
+  return iter != traits_.end() && iter->second[index];
+}
+
+void TraitsDataBatch::addTrait(const std::size_t index, const trait::TraitId& traitId) {
+  checkIndex(index);
+  auto& hasTrait = traits_[traitId];
+  hasTrait.resize(size_);
+  hasTrait[index] = true;
+}
+
+void TraitsDataBatch::setTraitProperty(const std::size_t index, const trait::TraitId& traitId,
+                                       const trait::property::Key& propertyKey,
+                                       trait::property::Value propertyValue) {
+  checkIndex(index);
+
+  Column* column = nullptr;
+  if (const auto iter = columns_.find({traitId, propertyKey}); iter != columns_.end()) {
+    column = &iter->second;
+    if (column->values.index() != propertyValue.index()) {
+      throw std::invalid_argument{"Mismatched value type for trait property '" + traitId + "." +
+                                  propertyKey + "' at index " + std::to_string(index)};
+    }
+  } else {
+    // First value in this column determines its type.
+    column = &columns_[{traitId, propertyKey}];
+    std::visit(
+        [column, this](const auto& value) {
+          using ValueType = std::decay_t<decltype(value)>;
+          column->values = std::vector<ValueType>(size_);
+        },
+        propertyValue);
+    column->isSet.resize(size_);
+  }
+
+  std::visit(
+      [column, index](auto&& value) {
+        using ValueType = std::decay_t<decltype(value)>;
+        std::get<std::vector<ValueType>>(column->values)[index] =
+            std::forward<decltype(value)>(value);
+      },
+      std::move(propertyValue));
+  column->isSet[index] = true;
+
+  addTrait(index, traitId);
+}
+
+bool TraitsDataBatch::getTraitProperty(trait::property::Value* out, const std::size_t index,
+                                       const trait::TraitId& traitId,
+                                       const trait::property::Key& propertyKey) const {
+  checkIndex(index);
+  const auto iter = columns_.find({traitId, propertyKey});
+  if (iter == columns_.end() || !iter->second.isSet[index]) {
+    return false;
+  }
+  std::visit(
+      [out, index](const auto& values) {
+        // Explicitly convert, since std::vector<bool> returns a proxy.
+        using ValueType = typename std::decay_t<decltype(values)>::value_type;
+        *out = static_cast<ValueType>(values[index]);
+      },
+      iter->second.values);
+  return true;
+}
+
+void TraitsDataBatch::setColumn(const trait::TraitId& traitId,
+                                const trait::property::Key& propertyKey, ColumnValues values) {
+  const std::size_t numValues =
+      std::visit([](const auto& typedValues) { return typedValues.size(); }, values);
+  if (numValues != size_) {
+    throw std::invalid_argument{"Column for trait property '" + traitId + "." + propertyKey +
+                                "' has " + std::to_string(numValues) + " values, expected " +
+                                std::to_string(size_)};
+  }
+
+  Column& column = columns_[{traitId, propertyKey}];
+  column.values = std::move(values);
+  column.isSet.assign(size_, true);
+  traits_[traitId].assign(size_, true);
+}
+
+const TraitsDataBatch::Column* TraitsDataBatch::column(
+    const trait::TraitId& traitId, const trait::property::Key& propertyKey) const {
+  const auto iter = columns_.find({traitId, propertyKey});
+  if (iter == columns_.end()) {
+    return nullptr;
+  }
+  return &iter->second;
+}
+
+void TraitsDataBatch::setError(const std::size_t index, BatchElementError error) {
+  checkIndex(index);
+  errors_[index] = std::move(error);
+}
+
+const std::optional<BatchElementError>& TraitsDataBatch::error(const std::size_t index) const {
+  checkIndex(index);
+  return errors_[index];
+}
+
+TraitsDataPtr TraitsDataBatch::traitsData(const std::size_t index) const {
+  checkIndex(index);
+  TraitsDataPtr traitsData = TraitsData::make();
+  for (const auto& [traitId, hasTrait] : traits_) {
+    if (hasTrait[index]) {
+      traitsData->addTrait(traitId);
+    }
+  }
+  for (const auto& [ids, column] : columns_) {
+    if (column.isSet[index]) {
+      std::visit(
+          [&traitsData, &ids = ids, index](const auto& values) {
+            using ValueType = typename std::decay_t<decltype(values)>::value_type;
+            traitsData->setTraitProperty(ids.first, ids.second,
+                                         static_cast<ValueType>(values[index]));
+          },
+          column.values);
+    }
+  }
+  return traitsData;
+}
+
+void TraitsDataBatch::checkIndex(const std::size_t index) const {
+  if (index >= size_) {
+    throw std::out_of_range{"Index " + std::to_string(index) + " out of range for batch of size " +
+                            std::to_string(size_)};
+  }
+}
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -1,14 +1,37 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <cstddef>
+#include <cstdint>
+#include <deque>
+#include <exception>
+#include <functional>
+#include <future>
+#include <memory>
+#include <mutex>
+#include <optional>
 #include <stdexcept>
+#include <utility>
+#include <variant>
+#include <vector>
 
+#include <openassetio/CancellationToken.hpp>
 #include <openassetio/Context.hpp>
 #include <openassetio/TraitsData.hpp>
+#include <openassetio/TraitsDataBatch.hpp>
+#include <openassetio/constants.hpp>
 #include <openassetio/hostApi/Manager.hpp>
+#include <openassetio/hostApi/ManagerMetrics.hpp>
+#include <openassetio/log/LoggerInterface.hpp>
 #include <openassetio/managerApi/HostSession.hpp>
 #include <openassetio/managerApi/ManagerInterface.hpp>
 #include <openassetio/typedefs.hpp>
 
+#include "ResolveCache.hpp"
+#include "ThreadPool.hpp"
+
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
 namespace {
@@ -34,6 +57,304 @@ void throwFromBatchElementError(std::size_t index, const BatchElementError &erro
   }
 }
 
+// Whether the host has requested that work using the given context be
+// abandoned.
+bool isCancellationRequested(const ContextConstPtr &context) {
+  return context->cancellationToken && context->cancellationToken->isCancelled();
+}
+
+/**
+ * Resolve a batch by splitting it into chunks and dispatching them to
+ * the manager in parallel.
+ *
+ * The calling thread resolves chunks itself, whilst up to
+ * `maxThreads - 1` helper tasks submitted to the given pool do the
+ * same. Hence the batch is always completed, even if no pool worker
+ * becomes available, e.g. when called from a pool worker that is
+ * servicing a resolveAsync request.
+ *
+ * Results are marshalled back to the calling thread, which invokes the
+ * callbacks with indices relative to the original batch. Hence, as
+ * with a serial resolve, callbacks are only ever called on the thread
+ * that initiated the resolve.
+ *
+ * If a chunk fails with an exception, including an exception from a
+ * callback, no further chunks are dispatched, and the first such
+ * exception is rethrown once all in-flight chunks have finished.
+ */
+void resolveConcurrently(hostApi::ThreadPool &threadPool,
+                         const managerApi::ManagerInterfacePtr &managerInterface,
+                         const managerApi::HostSessionPtr &hostSession,
+                         const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
+                         const ContextConstPtr &context, const std::size_t maxThreads,
+                         const std::size_t chunkSize,
+                         const hostApi::Manager::ResolveSuccessCallback &successCallback,
+                         const hostApi::Manager::BatchElementErrorCallback &errorCallback) {
+  using Result = std::pair<std::size_t, std::variant<TraitsDataPtr, BatchElementError>>;
+
+  // State shared with helper tasks. A task may not be picked up by a
+  // pool worker until after this function has returned, so must not
+  // reference anything else unless it has claimed a chunk.
+  struct State {
+    State(const std::size_t chunks, ContextConstPtr ctx)
+        : numChunks{chunks}, context{std::move(ctx)} {}
+
+    // Claim the next chunk to resolve, if any remain and the batch
+    // has not been stopped.
+    std::optional<std::size_t> claimChunk() {
+      const std::lock_guard lock{mutex};
+      if (stopped || nextChunk == numChunks || isCancellationRequested(context)) {
+        return {};
+      }
+      ++numChunksInFlight;
+      return nextChunk++;
+    }
+
+    // Signal that a claimed chunk has finished, stopping the batch if
+    // it failed.
+    void finishChunk(std::exception_ptr chunkException) {
+      {
+        const std::lock_guard lock{mutex};
+        --numChunksInFlight;
+        if (chunkException) {
+          stopped = true;
+          if (!exception) {
+            exception = std::move(chunkException);
+          }
+        }
+      }
+      resultsAvailable.notify_one();
+    }
+
+    void pushResult(Result result) {
+      {
+        const std::lock_guard lock{mutex};
+        pendingResults.push_back(std::move(result));
+      }
+      resultsAvailable.notify_one();
+    }
+
+    const std::size_t numChunks;
+    const ContextConstPtr context;
+    std::mutex mutex;
+    std::condition_variable resultsAvailable;
+    // Guarded by `mutex`.
+    std::deque<Result> pendingResults;
+    std::size_t nextChunk{0};
+    std::size_t numChunksInFlight{0};
+    bool stopped{false};
+    std::exception_ptr exception;
+  };
+
+  const std::size_t numChunks = (entityReferences.size() + chunkSize - 1) / chunkSize;
+  const auto state = std::make_shared<State>(numChunks, context);
+
+  const auto resolveChunk = [&](const std::size_t chunk,
+                                const hostApi::Manager::ResolveSuccessCallback &chunkSuccess,
+                                const hostApi::Manager::BatchElementErrorCallback &chunkError) {
+    const std::size_t begin = chunk * chunkSize;
+    const std::size_t end = std::min(begin + chunkSize, entityReferences.size());
+    const EntityReferences chunkReferences(
+        entityReferences.begin() + static_cast<std::ptrdiff_t>(begin),
+        entityReferences.begin() + static_cast<std::ptrdiff_t>(end));
+    managerInterface->resolve(chunkReferences, traitSet, context, hostSession, chunkSuccess,
+                              chunkError);
+  };
+
+  // Resolve a chunk on a helper thread, queuing its results for the
+  // calling thread.
+  const std::function<void(std::size_t)> resolveChunkOnHelper = [&](const std::size_t chunk) {
+    const std::size_t begin = chunk * chunkSize;
+    resolveChunk(
+        chunk,
+        [&state, begin](std::size_t index, const TraitsDataPtr &data) {
+          state->pushResult({begin + index, data});
+        },
+        [&state, begin](std::size_t index, const BatchElementError &error) {
+          state->pushResult({begin + index, error});
+        });
+  };
+
+  // Deliver any results queued by helpers. Must be called without the
+  // lock held.
+  const auto deliverResults = [&](std::deque<Result> results) {
+    for (const auto &[index, result] : results) {
+      if (const auto *data = std::get_if<TraitsDataPtr>(&result)) {
+        successCallback(index, *data);
+      } else {
+        errorCallback(index, std::get<BatchElementError>(result));
+      }
+    }
+  };
+
+  // Ensure no helper is using this stack frame however we leave this
+  // scope.
+  struct Stopper {
+    State &state;
+    ~Stopper() {
+      std::unique_lock lock{state.mutex};
+      state.stopped = true;
+      state.resultsAvailable.wait(lock, [this] { return state.numChunksInFlight == 0; });
+    }
+  } stopper{*state};
+
+  const std::size_t numHelpers = std::min(maxThreads, numChunks) - 1;
+  for (std::size_t helperIdx = 0; helperIdx < numHelpers; ++helperIdx) {
+    threadPool.submit([state, resolveChunkOnHelper = &resolveChunkOnHelper] {
+      while (const std::optional<std::size_t> chunk = state->claimChunk()) {
+        std::exception_ptr exception;
+        try {
+          (*resolveChunkOnHelper)(*chunk);
+        } catch (...) {
+          exception = std::current_exception();
+        }
+        state->finishChunk(std::move(exception));
+      }
+    });
+  }
+
+  // Resolve chunks on this thread too, delivering results directly.
+  while (const std::optional<std::size_t> chunk = state->claimChunk()) {
+    const std::size_t begin = *chunk * chunkSize;
+    std::exception_ptr exception;
+    try {
+      resolveChunk(
+          *chunk,
+          [&successCallback, begin](std::size_t index, const TraitsDataPtr &data) {
+            successCallback(begin + index, data);
+          },
+          [&errorCallback, begin](std::size_t index, const BatchElementError &error) {
+            errorCallback(begin + index, error);
+          });
+    } catch (...) {
+      exception = std::current_exception();
+    }
+    state->finishChunk(std::move(exception));
+
+    std::deque<Result> results;
+    {
+      const std::lock_guard lock{state->mutex};
+      results.swap(state->pendingResults);
+    }
+    deliverResults(std::move(results));
+  }
+
+  // Deliver the remaining results from helpers as they become
+  // available.
+  std::unique_lock lock{state->mutex};
+  while (true) {
+    state->resultsAvailable.wait(
+        lock, [&] { return !state->pendingResults.empty() || state->numChunksInFlight == 0; });
+    if (state->pendingResults.empty()) {
+      break;
+    }
+    std::deque<Result> results;
+    results.swap(state->pendingResults);
+    lock.unlock();
+    deliverResults(std::move(results));
+    lock.lock();
+  }
+
+  if (state->exception) {
+    std::rethrow_exception(state->exception);
+  }
+}
+
+/**
+ * Records a call in a Manager's metrics when it goes out of scope,
+ * including when leaving via an exception.
+ *
+ * If recording is disabled on construction, nothing is recorded and
+ * the clock is not read.
+ */
+class CallMetricsRecorder {
+ public:
+  CallMetricsRecorder(hostApi::ManagerMetrics &metrics,
+                      const hostApi::ManagerMetrics::Method method, const std::size_t batchSize)
+      : metrics_{metrics.isEnabled() ? &metrics : nullptr},
+        method_{method},
+        batchSize_{batchSize},
+        numUncaughtExceptions_{std::uncaught_exceptions()} {
+    if (metrics_) {
+      start_ = std::chrono::steady_clock::now();
+    }
+  }
+
+  ~CallMetricsRecorder() {
+    if (!metrics_) {
+      return;
+    }
+    const auto latency = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start_);
+    metrics_->recordCall(method_, batchSize_, static_cast<std::uint64_t>(latency.count()),
+                         std::uncaught_exceptions() > numUncaughtExceptions_);
+  }
+
+  CallMetricsRecorder(const CallMetricsRecorder &) = delete;
+  CallMetricsRecorder &operator=(const CallMetricsRecorder &) = delete;
+  CallMetricsRecorder(CallMetricsRecorder &&) = delete;
+  CallMetricsRecorder &operator=(CallMetricsRecorder &&) = delete;
+
+  void recordError(const BatchElementError::ErrorCode code) const {
+    if (metrics_) {
+      metrics_->recordError(method_, code);
+    }
+  }
+
+ private:
+  hostApi::ManagerMetrics *metrics_;
+  hostApi::ManagerMetrics::Method method_;
+  std::size_t batchSize_;
+  int numUncaughtExceptions_;
+  std::chrono::steady_clock::time_point start_;
+};
+
+/**
+ * Records the metrics for a non-blocking call, from when it is issued
+ * until it completes, potentially on another thread.
+ *
+ * Only a weak reference to the Manager is held, so a request that
+ * outlives the Manager is not recorded.
+ */
+class AsyncCallMetricsRecorder {
+ public:
+  AsyncCallMetricsRecorder(const std::shared_ptr<const hostApi::Manager> &manager,
+                           const hostApi::ManagerMetrics::Method method,
+                           const std::size_t batchSize)
+      : method_{method}, batchSize_{batchSize} {
+    if (manager->metrics().isEnabled()) {
+      manager_ = manager;
+      start_ = std::chrono::steady_clock::now();
+    }
+  }
+
+  void recordError(const BatchElementError::ErrorCode code) const {
+    if (const auto manager = manager_.lock()) {
+      manager->metrics().recordError(method_, code);
+    }
+  }
+
+  void recordCompletion(const bool threw) const {
+    if (const auto manager = manager_.lock()) {
+      const auto latency = std::chrono::duration_cast<std::chrono::nanoseconds>(
+          std::chrono::steady_clock::now() - start_);
+      manager->metrics().recordCall(method_, batchSize_,
+                                    static_cast<std::uint64_t>(latency.count()), threw);
+    }
+  }
+
+ private:
+  // Empty if recording was disabled when the call was issued.
+  std::weak_ptr<const hostApi::Manager> manager_;
+  hostApi::ManagerMetrics::Method method_;
+  std::size_t batchSize_;
+  std::chrono::steady_clock::time_point start_;
+};
+
+// Checks whether the given string starts with the given prefix.
+bool startsWith(const Str &str, const Str &prefix) {
+  return str.compare(0, prefix.size(), prefix) == 0;
+}
 }  // namespace
 namespace hostApi {
 
@@ -47,6 +368,8 @@ Manager::Manager(managerApi::ManagerInterfacePtr managerInterface,
                  managerApi::HostSessionPtr hostSession)
     : managerInterface_{std::move(managerInterface)}, hostSession_{std::move(hostSession)} {}
 
+Manager::~Manager() = default;
+
 Identifier Manager::identifier() const { return managerInterface_->identifier(); }
 
 Str Manager::displayName() const { return managerInterface_->displayName(); }
@@ -57,22 +380,58 @@ InfoDictionary Manager::settings() const { return managerInterface_->settings(ho
 
 void Manager::initialize(InfoDictionary managerSettings) {
   managerInterface_->initialize(std::move(managerSettings), hostSession_);
+
+  // Cache capabilities advertised by the manager's info dictionary,
+  // so that subsequent calls can avoid querying the interface.
+  entityReferencePrefix_.reset();
+  isThreadSafe_ = false;
+  const InfoDictionary infoDict = managerInterface_->info();
+
+  if (const auto prefixIter = infoDict.find(constants::kField_EntityReferencesMatchPrefix);
+      prefixIter != infoDict.end()) {
+    if (const auto *prefix = std::get_if<Str>(&prefixIter->second)) {
+      entityReferencePrefix_ = *prefix;
+      hostSession_->logger()->debugApi(
+          "Entity reference prefix '" + *prefix +
+          "' provided by manager's info() dict. Subsequent calls to isEntityReferenceString will"
+          " use this prefix rather than call the manager's implementation.");
+    } else {
+      hostSession_->logger()->warning(
+          "Entity reference prefix given but is an invalid type: should be a string.");
+    }
+  }
+
+  if (const auto threadSafeIter = infoDict.find(constants::kField_IsThreadSafe);
+      threadSafeIter != infoDict.end()) {
+    if (const auto *isThreadSafe = std::get_if<Bool>(&threadSafeIter->second)) {
+      isThreadSafe_ = *isThreadSafe;
+    } else {
+      hostSession_->logger()->warning(
+          "Thread safety flag given but is an invalid type: should be a bool.");
+    }
+  }
 }
 
 trait::TraitsDatas Manager::managementPolicy(const trait::TraitSets &traitSets,
                                              const ContextConstPtr &context) const {
+  const CallMetricsRecorder metricsRecorder{metrics_, ManagerMetrics::Method::kManagementPolicy,
+                                            traitSets.size()};
   return managerInterface_->managementPolicy(traitSets, context, hostSession_);
 }
 
 ContextPtr Manager::createContext() {
+  const CallMetricsRecorder metricsRecorder{metrics_, ManagerMetrics::Method::kCreateContext, 1};
   ContextPtr context = Context::make();
   context->managerState = managerInterface_->createState(hostSession_);
   return context;
 }
 
 ContextPtr Manager::createChildContext(const ContextPtr &parentContext) {
+  const CallMetricsRecorder metricsRecorder{metrics_, ManagerMetrics::Method::kCreateChildContext,
+                                            1};
   ContextPtr context =
       Context::make(parentContext->access, parentContext->retention, parentContext->locale);
+  context->cancellationToken = parentContext->cancellationToken;
   if (parentContext->managerState) {
     context->managerState =
         managerInterface_->createChildState(parentContext->managerState, hostSession_);
@@ -81,6 +440,8 @@ ContextPtr Manager::createChildContext(const ContextPtr &parentContext) {
 }
 
 Str Manager::persistenceTokenForContext(const ContextPtr &context) {
+  const CallMetricsRecorder metricsRecorder{
+      metrics_, ManagerMetrics::Method::kPersistenceTokenForContext, 1};
   if (context->managerState) {
     return managerInterface_->persistenceTokenForState(context->managerState, hostSession_);
   }
@@ -88,6 +449,8 @@ Str Manager::persistenceTokenForContext(const ContextPtr &context) {
 }
 
 ContextPtr Manager::contextFromPersistenceToken(const Str &token) {
+  const CallMetricsRecorder metricsRecorder{
+      metrics_, ManagerMetrics::Method::kContextFromPersistenceToken, 1};
   ContextPtr context = Context::make();
   if (!token.empty()) {
     context->managerState = managerInterface_->stateFromPersistenceToken(token, hostSession_);
@@ -96,6 +459,11 @@ ContextPtr Manager::contextFromPersistenceToken(const Str &token) {
 }
 
 bool Manager::isEntityReferenceString(const Str &someString) const {
+  const CallMetricsRecorder metricsRecorder{metrics_,
+                                            ManagerMetrics::Method::kIsEntityReferenceString, 1};
+  if (entityReferencePrefix_) {
+    return startsWith(someString, *entityReferencePrefix_);
+  }
   return managerInterface_->isEntityReferenceString(someString, hostSession_);
 }
 
@@ -116,12 +484,347 @@ std::optional<EntityReference> Manager::createEntityReferenceIfValid(
   return EntityReference{std::move(entityReferenceString)};
 }
 
+std::vector<bool> Manager::isEntityReferenceStrings(const std::vector<Str> &someStrings) const {
+  if (entityReferencePrefix_) {
+    std::vector<bool> result;
+    result.reserve(someStrings.size());
+    for (const Str &someString : someStrings) {
+      result.push_back(startsWith(someString, *entityReferencePrefix_));
+    }
+    return result;
+  }
+  std::vector<bool> result =
+      managerInterface_->isEntityReferenceStrings(someStrings, hostSession_);
+  if (result.size() != someStrings.size()) {
+    throw std::out_of_range{
+        "isEntityReferenceStrings returned a list of unexpected length: expected " +
+        std::to_string(someStrings.size()) + " got " + std::to_string(result.size())};
+  }
+  return result;
+}
+
+std::vector<std::optional<EntityReference>> Manager::createEntityReferencesIfValid(
+    std::vector<Str> entityReferenceStrings) const {
+  const std::vector<bool> validity = isEntityReferenceStrings(entityReferenceStrings);
+
+  std::vector<std::optional<EntityReference>> result;
+  result.reserve(entityReferenceStrings.size());
+  for (std::size_t idx = 0; idx < entityReferenceStrings.size(); ++idx) {
+    if (validity[idx]) {
+      result.emplace_back(EntityReference{std::move(entityReferenceStrings[idx])});
+    } else {
+      result.emplace_back(std::nullopt);
+    }
+  }
+  return result;
+}
+
+void Manager::setResolveConcurrency(std::size_t maxThreads, std::size_t chunkSize) {
+  if (maxThreads == 0) {
+    throw std::invalid_argument{"maxThreads must be greater than zero"};
+  }
+  if (chunkSize == 0) {
+    throw std::invalid_argument{"chunkSize must be greater than zero"};
+  }
+  resolveMaxThreads_ = maxThreads;
+  resolveChunkSize_ = chunkSize;
+
+  // Recreate the thread pool on next use, with the new limit.
+  const std::lock_guard lock{threadPoolMutex_};
+  threadPool_.reset();
+}
+
+void Manager::setResolveCacheCapacity(std::size_t capacity) {
+  if (capacity == 0) {
+    resolveCache_.reset();
+    return;
+  }
+  resolveCache_ = std::make_unique<ResolveCache>(capacity);
+}
+
+void Manager::flushResolveCache() {
+  if (resolveCache_) {
+    resolveCache_->clear();
+  }
+}
+
 void Manager::resolve(const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
                       const ContextConstPtr &context,
                       const ResolveSuccessCallback &successCallback,
                       const BatchElementErrorCallback &errorCallback) {
-  managerInterface_->resolve(entityReferences, traitSet, context, hostSession_, successCallback,
-                             errorCallback);
+  const CallMetricsRecorder metricsRecorder{metrics_, ManagerMetrics::Method::kResolve,
+                                            entityReferences.size()};
+  const BatchElementErrorCallback recordingErrorCallback =
+      [&metricsRecorder, &errorCallback](std::size_t index, const BatchElementError &error) {
+        metricsRecorder.recordError(error.code);
+        errorCallback(index, error);
+      };
+
+  resolveCached(entityReferences, traitSet, context, successCallback, recordingErrorCallback);
+}
+
+void Manager::resolveCached(const EntityReferences &entityReferences,
+                            const trait::TraitSet &traitSet, const ContextConstPtr &context,
+                            const ResolveSuccessCallback &successCallback,
+                            const BatchElementErrorCallback &errorCallback) {
+  std::optional<Str> batchKey;
+  if (resolveCache_) {
+    batchKey = ResolveCache::batchKey(traitSet, context);
+  }
+  if (!batchKey) {
+    resolveUncached(entityReferences, traitSet, context, successCallback, errorCallback);
+    return;
+  }
+
+  // Serve what we can from the cache, collecting the remainder to
+  // pass on to the manager.
+  EntityReferences missedReferences;
+  std::vector<std::size_t> missedIndices;
+  std::vector<Str> missedKeys;
+
+  for (std::size_t idx = 0; idx < entityReferences.size(); ++idx) {
+    Str key = ResolveCache::key(entityReferences[idx], *batchKey);
+    if (TraitsDataPtr data = resolveCache_->get(key, context)) {
+      successCallback(idx, data);
+      continue;
+    }
+    missedReferences.push_back(entityReferences[idx]);
+    missedIndices.push_back(idx);
+    missedKeys.push_back(std::move(key));
+  }
+
+  if (missedReferences.empty()) {
+    return;
+  }
+
+  resolveUncached(
+      missedReferences, traitSet, context,
+      [&](std::size_t index, const TraitsDataPtr &data) {
+        resolveCache_->put(missedReferences[index], missedKeys[index], context, data);
+        successCallback(missedIndices[index], data);
+      },
+      [&](std::size_t index, const BatchElementError &error) {
+        errorCallback(missedIndices[index], error);
+      });
+}
+
+void Manager::resolveUncached(const EntityReferences &entityReferences,
+                              const trait::TraitSet &traitSet, const ContextConstPtr &context,
+                              const ResolveSuccessCallback &successCallback,
+                              const BatchElementErrorCallback &errorCallback) {
+  if (!isThreadSafe_ || resolveMaxThreads_ < 2 || entityReferences.size() <= resolveChunkSize_) {
+    managerInterface_->resolve(entityReferences, traitSet, context, hostSession_, successCallback,
+                               errorCallback);
+    return;
+  }
+  resolveConcurrently(*threadPool(), managerInterface_, hostSession_, entityReferences, traitSet,
+                      context, resolveMaxThreads_, resolveChunkSize_, successCallback,
+                      errorCallback);
+}
+
+std::shared_ptr<ThreadPool> Manager::threadPool() {
+  const std::lock_guard lock{threadPoolMutex_};
+  if (!threadPool_) {
+    // The calling thread also resolves chunks, so counts towards
+    // `resolveMaxThreads_`. Always have at least one worker, for
+    // resolveAsync.
+    threadPool_ = std::make_shared<ThreadPool>(
+        isThreadSafe_ ? std::max<std::size_t>(1, resolveMaxThreads_ - 1) : 1);
+  }
+  return threadPool_;
+}
+
+TraitsDataBatchPtr Manager::resolveToBatch(const EntityReferences &entityReferences,
+                                           const trait::TraitSet &traitSet,
+                                           const ContextConstPtr &context) {
+  const CallMetricsRecorder metricsRecorder{metrics_, ManagerMetrics::Method::kResolve,
+                                            entityReferences.size()};
+  TraitsDataBatchPtr results = TraitsDataBatch::make(entityReferences.size());
+  managerInterface_->resolveToBatch(entityReferences, traitSet, context, hostSession_, results);
+  if (metrics_.isEnabled()) {
+    for (std::size_t idx = 0; idx < results->size(); ++idx) {
+      if (const std::optional<BatchElementError> &error = results->error(idx)) {
+        metricsRecorder.recordError(error->code);
+      }
+    }
+  }
+  return results;
+}
+
+void Manager::resolveAsync(const EntityReferences &entityReferences,
+                           const trait::TraitSet &traitSet, const ContextConstPtr &context,
+                           const ResolveSuccessCallback &successCallback,
+                           const BatchElementErrorCallback &errorCallback,
+                           const AsyncCompletionCallback &completionCallback) {
+  auto metricsRecorder = std::make_shared<const AsyncCallMetricsRecorder>(
+      shared_from_this(), ManagerMetrics::Method::kResolveAsync, entityReferences.size());
+  BatchElementErrorCallback recordingErrorCallback =
+      [metricsRecorder, errorCallback](std::size_t index, const BatchElementError &error) {
+        metricsRecorder->recordError(error.code);
+        errorCallback(index, error);
+      };
+  // Recorded before the host is notified, so that metrics are up to
+  // date by the time it sees the result.
+  AsyncCompletionCallback recordingCompletionCallback =
+      [metricsRecorder, completionCallback](std::exception_ptr exception) {
+        metricsRecorder->recordCompletion(exception != nullptr);
+        completionCallback(std::move(exception));
+      };
+
+  bool isHandled = false;
+  try {
+    isHandled = managerInterface_->resolveAsync(entityReferences, traitSet, context, hostSession_,
+                                                successCallback, recordingErrorCallback,
+                                                recordingCompletionCallback);
+  } catch (...) {
+    metricsRecorder->recordCompletion(true);
+    throw;
+  }
+  if (isHandled) {
+    return;
+  }
+
+  // Manager doesn't support non-blocking resolution, so fall back to
+  // a blocking resolve on a worker thread. This goes through the same
+  // cache and chunked dispatch as resolve, so that caching and
+  // cancellation apply.
+  std::function<void()> task = [self = shared_from_this(), entityReferences, traitSet, context,
+                                successCallback, recordingErrorCallback,
+                                recordingCompletionCallback] {
+    std::exception_ptr exception;
+    try {
+      self->resolveCached(entityReferences, traitSet, context, successCallback,
+                          recordingErrorCallback);
+    } catch (...) {
+      exception = std::current_exception();
+    }
+    recordingCompletionCallback(exception);
+  };
+
+  threadPool()->submit(std::move(task));
+}
+
+namespace {
+/**
+ * Accumulate the results of an asynchronous batch resolve, to be
+ * delivered to a callback once complete.
+ *
+ * Callbacks may be called from any thread, so access is serialised.
+ */
+template <class Result>
+struct AsyncResolveState {
+  explicit AsyncResolveState(const std::size_t size) : results(size) {}
+
+  std::mutex mutex;
+  std::vector<Result> results;
+  // First element error reported, for the throwing policy.
+  std::optional<std::pair<std::size_t, BatchElementError>> error;
+};
+
+/**
+ * Create a callback that fulfils the given promise with the
+ * aggregated results of an asynchronous batch resolve.
+ */
+template <class Result>
+auto makePromiseCallback(std::shared_ptr<std::promise<std::vector<Result>>> promise) {
+  return
+      [promise = std::move(promise)](std::vector<Result> results, std::exception_ptr exception) {
+        if (exception) {
+          promise->set_exception(std::move(exception));
+        } else {
+          promise->set_value(std::move(results));
+        }
+      };
+}
+}  // namespace
+
+void Manager::resolveAsync(
+    const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
+    const ContextConstPtr &context,
+    [[maybe_unused]] const BatchElementErrorPolicyTag::Exception &errorPolicyTag,
+    const AsyncResolveResultsCallback &resultsCallback) {
+  auto state = std::make_shared<AsyncResolveState<TraitsDataPtr>>(entityReferences.size());
+
+  resolveAsync(
+      entityReferences, traitSet, context,
+      [state](std::size_t index, const TraitsDataPtr &data) {
+        const std::lock_guard lock{state->mutex};
+        state->results[index] = data;
+      },
+      [state](std::size_t index, const BatchElementError &error) {
+        const std::lock_guard lock{state->mutex};
+        if (!state->error) {
+          state->error.emplace(index, error);
+        }
+      },
+      [state, resultsCallback](std::exception_ptr exception) {
+        std::vector<TraitsDataPtr> results;
+        {
+          const std::lock_guard lock{state->mutex};
+          if (!exception && state->error) {
+            try {
+              throwFromBatchElementError(state->error->first, state->error->second);
+            } catch (...) {
+              exception = std::current_exception();
+            }
+          }
+          if (!exception) {
+            results = std::move(state->results);
+          }
+        }
+        // Called outside of the lock, since the callback may block,
+        // e.g. to acquire the Python GIL.
+        resultsCallback(std::move(results), std::move(exception));
+      });
+}
+
+void Manager::resolveAsync(
+    const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
+    const ContextConstPtr &context,
+    [[maybe_unused]] const BatchElementErrorPolicyTag::Variant &errorPolicyTag,
+    const AsyncResolveVariantResultsCallback &resultsCallback) {
+  using Result = std::variant<TraitsDataPtr, BatchElementError>;
+  auto state = std::make_shared<AsyncResolveState<Result>>(entityReferences.size());
+
+  resolveAsync(
+      entityReferences, traitSet, context,
+      [state](std::size_t index, const TraitsDataPtr &data) {
+        const std::lock_guard lock{state->mutex};
+        state->results[index] = data;
+      },
+      [state](std::size_t index, const BatchElementError &error) {
+        const std::lock_guard lock{state->mutex};
+        state->results[index] = error;
+      },
+      [state, resultsCallback](std::exception_ptr exception) {
+        std::vector<Result> results;
+        if (!exception) {
+          const std::lock_guard lock{state->mutex};
+          results = std::move(state->results);
+        }
+        resultsCallback(std::move(results), std::move(exception));
+      });
+}
+
+std::future<std::vector<TraitsDataPtr>> Manager::resolveAsync(
+    const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
+    const ContextConstPtr &context, const BatchElementErrorPolicyTag::Exception &errorPolicyTag) {
+  auto promise = std::make_shared<std::promise<std::vector<TraitsDataPtr>>>();
+  std::future<std::vector<TraitsDataPtr>> future = promise->get_future();
+  resolveAsync(entityReferences, traitSet, context, errorPolicyTag,
+               makePromiseCallback(std::move(promise)));
+  return future;
+}
+
+std::future<std::vector<std::variant<TraitsDataPtr, BatchElementError>>> Manager::resolveAsync(
+    const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
+    const ContextConstPtr &context, const BatchElementErrorPolicyTag::Variant &errorPolicyTag) {
+  using Result = std::variant<TraitsDataPtr, BatchElementError>;
+  auto promise = std::make_shared<std::promise<std::vector<Result>>>();
+  std::future<std::vector<Result>> future = promise->get_future();
+  resolveAsync(entityReferences, traitSet, context, errorPolicyTag,
+               makePromiseCallback(std::move(promise)));
+  return future;
 }
 
 // Singular Except
@@ -200,12 +903,58 @@ std::vector<std::variant<TraitsDataPtr, BatchElementError>> hostApi::Manager::re
   return resolveResult;
 }
 
+// Multi collect
+std::pair<std::vector<TraitsDataPtr>, hostApi::Manager::IndexedBatchElementErrors>
+hostApi::Manager::resolve(
+    const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
+    const ContextConstPtr &context,
+    [[maybe_unused]] const BatchElementErrorPolicyTag::Collect &errorPolicyTag) {
+  std::pair<std::vector<TraitsDataPtr>, IndexedBatchElementErrors> resolveResult;
+  auto &[datas, errors] = resolveResult;
+  datas.resize(entityReferences.size());
+  resolve(
+      entityReferences, traitSet, context,
+      [&datas](std::size_t index, const TraitsDataPtr &data) { datas[index] = data; },
+      [&errors](std::size_t index, const BatchElementError &error) {
+        errors.emplace_back(index, error);
+      });
+
+  // Errors may be reported in any order.
+  std::sort(errors.begin(), errors.end(),
+            [](const auto &lhs, const auto &rhs) { return lhs.first < rhs.first; });
+
+  return resolveResult;
+}
+
+// Multi skip
+std::vector<TraitsDataPtr> hostApi::Manager::resolve(
+    const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
+    const ContextConstPtr &context,
+    [[maybe_unused]] const BatchElementErrorPolicyTag::Skip &errorPolicyTag) {
+  std::vector<TraitsDataPtr> resolveResult;
+  resolveResult.resize(entityReferences.size());
+  resolve(
+      entityReferences, traitSet, context,
+      [&resolveResult](std::size_t index, const TraitsDataPtr &data) {
+        resolveResult[index] = data;
+      },
+      []([[maybe_unused]] std::size_t index, [[maybe_unused]] const BatchElementError &error) {});
+
+  return resolveResult;
+}
+
 void Manager::preflight(const EntityReferences &entityReferences, const trait::TraitSet &traitSet,
                         const ContextConstPtr &context,
                         const PreflightSuccessCallback &successCallback,
                         const BatchElementErrorCallback &errorCallback) {
-  managerInterface_->preflight(entityReferences, traitSet, context, hostSession_, successCallback,
-                               errorCallback);
+  const CallMetricsRecorder metricsRecorder{metrics_, ManagerMetrics::Method::kPreflight,
+                                            entityReferences.size()};
+  managerInterface_->preflight(
+      entityReferences, traitSet, context, hostSession_, successCallback,
+      [&metricsRecorder, &errorCallback](std::size_t index, const BatchElementError &error) {
+        metricsRecorder.recordError(error.code);
+        errorCallback(index, error);
+      });
 }
 
 void Manager::register_(const EntityReferences &entityReferences,
@@ -213,15 +962,16 @@ void Manager::register_(const EntityReferences &entityReferences,
                         const ContextConstPtr &context,
                         const RegisterSuccessCallback &successCallback,
                         const BatchElementErrorCallback &errorCallback) {
+  const CallMetricsRecorder metricsRecorder{metrics_, ManagerMetrics::Method::kRegister,
+                                            entityReferences.size()};
   if (entityReferences.size() != entityTraitsDatas.size()) {
     throw std::out_of_range{"Parameter lists must be of the same length"};
   }
 
   if (!entityTraitsDatas.empty()) {
-    const trait::TraitSet firstTraitSet = entityTraitsDatas[0]->traitSet();
+    const TraitsData &firstTraitsData = *entityTraitsDatas[0];
     for (std::size_t idx = 1; idx < entityTraitsDatas.size(); ++idx) {
-      const trait::TraitSet currentTraitSet = entityTraitsDatas[idx]->traitSet();
-      if (currentTraitSet != firstTraitSet) {
+      if (!entityTraitsDatas[idx]->hasSameTraitSet(firstTraitsData)) {
         Str msg = "Mismatched traits at index ";
         msg += std::to_string(idx);
         // TODO(DF): expand on error message to include actual trait
@@ -231,10 +981,44 @@ void Manager::register_(const EntityReferences &entityReferences,
     }
   }
 
-  return managerInterface_->register_(entityReferences, entityTraitsDatas, context, hostSession_,
-                                      successCallback, errorCallback);
+  const BatchElementErrorCallback recordingErrorCallback =
+      [&metricsRecorder, &errorCallback](std::size_t index, const BatchElementError &error) {
+        metricsRecorder.recordError(error.code);
+        errorCallback(index, error);
+      };
+
+  if (!resolveCache_) {
+    managerInterface_->register_(entityReferences, entityTraitsDatas, context, hostSession_,
+                                 successCallback, recordingErrorCallback);
+    return;
+  }
+
+  // Ensure cached resolve results don't outlive the data they were
+  // resolved from, whether or not the publish succeeded. The
+  // published reference may differ from the target reference, e.g. if
+  // the manager versions entities, so invalidate both.
+  const auto invalidateTargets = [&] {
+    for (const EntityReference &entityReference : entityReferences) {
+      resolveCache_->invalidate(entityReference);
+    }
+  };
+  try {
+    managerInterface_->register_(
+        entityReferences, entityTraitsDatas, context, hostSession_,
+        [this, &successCallback](std::size_t index, EntityReference entityReference) {
+          resolveCache_->invalidate(entityReference);
+          successCallback(index, std::move(entityReference));
+        },
+        recordingErrorCallback);
+  } catch (...) {
+    invalidateTargets();
+    throw;
+  }
+  invalidateTargets();
 }
 
+ManagerMetrics &Manager::metrics() const { return metrics_; }
+
 managerApi::ManagerInterfacePtr Manager::_interface() const { return managerInterface_; }
 managerApi::HostSessionPtr Manager::_hostSession() const { return hostSession_; }
 }  // namespace hostApi
@@ -1,7 +1,16 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2022 The Foundry Visionmongers Ltd
+#include <atomic>
+#include <cstdint>
 #include <cstdlib>
 #include <filesystem>
+#include <mutex>
+#include <stdexcept>
+#include <string_view>
+#include <system_error>
+#include <unordered_map>
+#include <utility>
+#include <vector>
 
 #include <toml++/toml.h>
 
@@ -20,6 +29,189 @@ namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
 namespace hostApi {
 
+namespace {
+/**
+ * Process-wide pool of managers created by
+ * ManagerFactory::defaultManagerForInterface.
+ *
+ * Managers are keyed on their identifier and settings, and the
+ * identifier of the host, rather than the identity of the
+ * HostInterface and implementation factory instances, which hosts may
+ * construct afresh for each call. The pool therefore holds at most one
+ * manager per distinct default manager config and host, and so is
+ * expected to hold very few entries. As such a linear search is used
+ * rather than attempting to hash settings.
+ */
+class DefaultManagerPool {
+ public:
+  static DefaultManagerPool& instance() {
+    // Deliberately leaked, so that pooled managers are not destroyed
+    // during static destruction, by which time the runtime of their
+    // implementation (e.g. a Python interpreter) may have gone.
+    // NOLINTNEXTLINE(cppcoreguidelines-owning-memory)
+    static auto* pool = new DefaultManagerPool;
+    return *pool;
+  }
+
+  /**
+   * Find a manager matching the given parameters, or return nullptr if
+   * there is none.
+   */
+  ManagerPtr find(const Identifier& identifier, const InfoDictionary& settings,
+                  const Identifier& hostIdentifier) {
+    const std::lock_guard lock{mutex_};
+    const Entry* entry = findEntry(identifier, settings, hostIdentifier);
+    return entry ? entry->manager : nullptr;
+  }
+
+  /**
+   * Add a manager to the pool, unless a matching manager has been
+   * added in the meantime by another thread, in which case that
+   * manager is returned instead.
+   */
+  ManagerPtr insert(const Identifier& identifier, const InfoDictionary& settings,
+                    const Identifier& hostIdentifier, ManagerPtr manager) {
+    const std::lock_guard lock{mutex_};
+    if (const Entry* entry = findEntry(identifier, settings, hostIdentifier)) {
+      return entry->manager;
+    }
+    entries_.push_back(Entry{identifier, settings, hostIdentifier, manager});
+    return manager;
+  }
+
+  void clear() {
+    // Release managers outside of the lock, since their destruction
+    // may call back into arbitrary (e.g. Python) code.
+    std::vector<Entry> entries;
+    {
+      const std::lock_guard lock{mutex_};
+      entries.swap(entries_);
+    }
+  }
+
+  std::atomic_bool enabled{false};
+
+ private:
+  struct Entry {
+    Identifier identifier;
+    InfoDictionary settings;
+    Identifier hostIdentifier;
+    ManagerPtr manager;
+  };
+
+  const Entry* findEntry(const Identifier& identifier, const InfoDictionary& settings,
+                         const Identifier& hostIdentifier) const {
+    for (const Entry& entry : entries_) {
+      if (entry.identifier == identifier && entry.hostIdentifier == hostIdentifier &&
+          entry.settings == settings) {
+        return &entry;
+      }
+    }
+    return nullptr;
+  }
+
+  std::mutex mutex_;
+  // Guarded by `mutex_`.
+  std::vector<Entry> entries_;
+};
+
+/**
+ * Process-wide cache of parsed default manager config files.
+ */
+class DefaultManagerConfigCache {
+ public:
+  static DefaultManagerConfigCache& instance() {
+    static DefaultManagerConfigCache cache;
+    return cache;
+  }
+
+  ManagerFactory::DefaultManagerConfig load(const Str& path) {
+    std::error_code errorCode;
+    const std::filesystem::file_time_type mtime =
+        std::filesystem::last_write_time(path, errorCode);
+    if (errorCode) {
+      throw std::runtime_error("Could not load default manager config from '" + path +
+                               "', file does not exist.");
+    }
+    // Treated as an error, rather than caching against the
+    // static_cast<uintmax_t>(-1) returned on failure.
+    const std::uintmax_t size = std::filesystem::file_size(path, errorCode);
+    if (errorCode) {
+      throw std::runtime_error("Could not load default manager config from '" + path + "', " +
+                               errorCode.message() + ".");
+    }
+
+    {
+      const std::lock_guard lock{mutex_};
+      if (const auto iter = entries_.find(path);
+          iter != entries_.end() && iter->second.mtime == mtime && iter->second.size == size) {
+        return iter->second.config;
+      }
+    }
+
+    // Parse outside of the lock, as this may be slow on network file
+    // systems.
+    ManagerFactory::DefaultManagerConfig config = parse(path);
+
+    const std::lock_guard lock{mutex_};
+    entries_.insert_or_assign(path, Entry{mtime, size, config});
+    return config;
+  }
+
+  void clear() {
+    const std::lock_guard lock{mutex_};
+    entries_.clear();
+  }
+
+ private:
+  struct Entry {
+    std::filesystem::file_time_type mtime;
+    std::uintmax_t size;
+    ManagerFactory::DefaultManagerConfig config;
+  };
+
+  static ManagerFactory::DefaultManagerConfig parse(const Str& path) {
+    auto config = toml::parse_file(path);
+
+    const std::string_view identifier = config["manager"]["identifier"].value_or("");
+    if (identifier.empty()) {
+      throw std::runtime_error("Could not load default manager config from '" + path +
+                               "', no manager identifier specified.");
+    }
+
+    InfoDictionary settings;
+    if (toml::table* settingsTable = config["manager"]["settings"].as_table()) {
+      // It'd be nice to use settingsTable::for_each, a lambda and
+      // w/constexpr to filter supported types, filter, but it ends up
+      // being somewhat verbose due to the number of types supported by
+      // the variant.
+      for (const auto& [key, val] : *settingsTable) {
+        if (val.is_integer()) {
+          settings.insert({Str{key}, val.as_integer()->get()});
+        } else if (val.is_floating_point()) {
+          settings.insert({Str{key}, val.as_floating_point()->get()});
+        } else if (val.is_string()) {
+          settings.insert({Str{key}, val.as_string()->get()});
+        } else if (val.is_boolean()) {
+          settings.insert({Str{key}, val.as_boolean()->get()});
+        } else {
+          Str msg = "Unsupported value type for '";
+          msg += key.str();
+          msg += "'.";
+          throw std::runtime_error(msg);
+        }
+      }
+    }
+
+    return {Identifier{identifier}, std::move(settings)};
+  }
+
+  std::mutex mutex_;
+  // Guarded by `mutex_`.
+  std::unordered_map<Str, Entry> entries_;
+};
+}  // namespace
+
 const Str ManagerFactory::kDefaultManagerConfigEnvVarName = "OPENASSETIO_DEFAULT_CONFIG";
 
 ManagerFactoryPtr ManagerFactory::make(
@@ -51,6 +243,11 @@ ManagerFactory::ManagerDetails ManagerFactory::availableManagers() const {
   ManagerDetails managerDetails;
 
   for (const Identifier& identifier : ids) {
+    if (auto managerDetail = managerImplementationFactory_->managerDetail(identifier)) {
+      managerDetails.insert({identifier, std::move(*managerDetail)});
+      continue;
+    }
+
     const managerApi::ManagerInterfacePtr managerInterface =
         managerImplementationFactory_->instantiate(identifier);
 
@@ -82,66 +279,69 @@ ManagerPtr ManagerFactory::defaultManagerForInterface(
   const char* configPath = std::getenv(kDefaultManagerConfigEnvVarName.c_str());
 
   if (!configPath) {
-    const Str msg =
-        kDefaultManagerConfigEnvVarName + " not set, unable to instantiate default manager.";
     // We leave this as a debug message, as it is expected may hosts
     // will call this by default, and handle a null return manager, vs
     // it being a warning/error.
-    logger->log(log::LoggerInterface::Severity::kDebug, msg);
+    logger->log(log::LoggerInterface::Severity::kDebug, [] {
+      return kDefaultManagerConfigEnvVarName + " not set, unable to instantiate default manager.";
+    });
     return nullptr;
   }
 
-  {
+  logger->log(log::LoggerInterface::Severity::kDebug, [configPath] {
     Str msg = "Loading default manager config from '";
     msg += configPath;
     msg += "' [" + kDefaultManagerConfigEnvVarName + "]";
-    logger->log(log::LoggerInterface::Severity::kDebug, msg);
-  }
+    return msg;
+  });
 
-  if (!std::filesystem::exists(configPath)) {
-    Str msg = "Could not load default manager config from '";
-    msg += configPath;
-    msg += "', file does not exist.";
-    throw std::runtime_error(msg);
-  }
+  const auto [identifier, settings] = loadDefaultManagerConfig(configPath);
 
-  auto config = toml::parse_file(configPath);
-
-  const std::string_view identifier = config["manager"]["identifier"].value_or("");
-
-  InfoDictionary settings;
-  if (toml::table* settingsTable = config["manager"]["settings"].as_table()) {
-    // It'd be nice to use settingsTable::for_each, a lambda and
-    // w/constexpr to filter supported types, filter, but it ends up
-    // being somewhat verbose due to the number of types supported by
-    // the variant.
-    for (const auto& [key, val] : *settingsTable) {
-      if (val.is_integer()) {
-        settings.insert({Str{key}, val.as_integer()->get()});
-      } else if (val.is_floating_point()) {
-        settings.insert({Str{key}, val.as_floating_point()->get()});
-      } else if (val.is_string()) {
-        settings.insert({Str{key}, val.as_string()->get()});
-      } else if (val.is_boolean()) {
-        settings.insert({Str{key}, val.as_boolean()->get()});
-      } else {
-        Str msg = "Unsupported value type for '";
-        msg += key.str();
-        msg += "'.";
-        throw std::runtime_error(msg);
-      }
+  DefaultManagerPool& pool = DefaultManagerPool::instance();
+  const bool pooling = pool.enabled;
+  Identifier hostIdentifier;
+
+  if (pooling) {
+    hostIdentifier = hostInterface->identifier();
+    if (ManagerPtr manager = pool.find(identifier, settings, hostIdentifier)) {
+      logger->log(log::LoggerInterface::Severity::kDebug, [&identifier = identifier] {
+        return "Using pooled default manager '" + identifier + "'";
+      });
+      return manager;
     }
   }
 
   const managerApi::HostSessionPtr hostSession =
       managerApi::HostSession::make(managerApi::Host::make(hostInterface), logger);
 
-  ManagerPtr manager = Manager::make(
-      managerImplementationFactory->instantiate(Identifier(identifier)), hostSession);
+  ManagerPtr manager =
+      Manager::make(managerImplementationFactory->instantiate(identifier), hostSession);
 
   manager->initialize(settings);
+
+  if (pooling) {
+    // Pool is not locked during creation, since initialization may be
+    // slow, and may call into Python.
+    return pool.insert(identifier, settings, hostIdentifier, std::move(manager));
+  }
   return manager;
 }
+
+ManagerFactory::DefaultManagerConfig ManagerFactory::loadDefaultManagerConfig(const Str& path) {
+  return DefaultManagerConfigCache::instance().load(path);
+}
+
+void ManagerFactory::clearDefaultManagerConfigCache() {
+  DefaultManagerConfigCache::instance().clear();
+}
+
+void ManagerFactory::setDefaultManagerPooling(const bool enabled) {
+  DefaultManagerPool::instance().enabled = enabled;
+}
+
+bool ManagerFactory::defaultManagerPooling() { return DefaultManagerPool::instance().enabled; }
+
+void ManagerFactory::clearDefaultManagerPool() { DefaultManagerPool::instance().clear(); }
 }  // namespace hostApi
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
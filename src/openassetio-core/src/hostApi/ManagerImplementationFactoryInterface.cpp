@@ -11,6 +11,11 @@ ManagerImplementationFactoryInterface::~ManagerImplementationFactoryInterface()
 ManagerImplementationFactoryInterface::ManagerImplementationFactoryInterface(
     log::LoggerInterfacePtr logger)
     : logger_{std::move(logger)} {}
+
+std::optional<ManagerFactory::ManagerDetail> ManagerImplementationFactoryInterface::managerDetail(
+    [[maybe_unused]] const Identifier& identifier) {
+  return {};
+}
 }  // namespace hostApi
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
@@ -0,0 +1,124 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <array>
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+
+#include <openassetio/hostApi/ManagerMetrics.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+namespace {
+using Counter = std::atomic<std::uint64_t>;
+
+// Index into the error counts for the given code.
+std::size_t errorCodeIndex(const BatchElementError::ErrorCode code) {
+  const auto index = static_cast<std::size_t>(
+      static_cast<int>(code) - static_cast<int>(BatchElementError::ErrorCode::kUnknown));
+  // Unrecognised codes, including those below kUnknown (which wrap),
+  // are counted as kUnknown.
+  return index < ManagerMetrics::kNumErrorCodes ? index : 0;
+}
+
+void increment(Counter& counter, const std::uint64_t amount = 1) {
+  counter.fetch_add(amount, std::memory_order_relaxed);
+}
+
+std::uint64_t load(const Counter& counter) { return counter.load(std::memory_order_relaxed); }
+
+void clear(Counter& counter) { counter.store(0, std::memory_order_relaxed); }
+}  // namespace
+
+struct ManagerMetrics::State {
+  // Counters for a single method.
+  struct Counters {
+    Counter callCount{0};
+    Counter exceptionCount{0};
+    Counter totalLatencyNs{0};
+    std::array<Counter, kNumHistogramBuckets> batchSizeHistogram{};
+    std::array<Counter, kNumHistogramBuckets> latencyNsHistogram{};
+    std::array<Counter, kNumErrorCodes> errorCounts{};
+  };
+
+  std::atomic<bool> enabled{true};
+  std::array<Counters, kNumMethods> methods{};
+};
+
+std::uint64_t ManagerMetrics::MethodMetrics::errorCount(
+    const BatchElementError::ErrorCode code) const {
+  return errorCounts[errorCodeIndex(code)];
+}
+
+std::size_t ManagerMetrics::histogramBucket(std::uint64_t value) {
+  // Number of significant bits, i.e. floor(log2(value)) + 1.
+  std::size_t bucket = 0;
+  while (value != 0) {
+    value >>= 1U;
+    ++bucket;
+  }
+  return bucket < kNumHistogramBuckets ? bucket : kNumHistogramBuckets - 1;
+}
+
+ManagerMetrics::ManagerMetrics() : state_{std::make_unique<State>()} {}
+
+ManagerMetrics::~ManagerMetrics() = default;
+
+void ManagerMetrics::setEnabled(const bool enabled) {
+  state_->enabled.store(enabled, std::memory_order_relaxed);
+}
+
+bool ManagerMetrics::isEnabled() const { return state_->enabled.load(std::memory_order_relaxed); }
+
+ManagerMetrics::MethodMetrics ManagerMetrics::methodMetrics(const Method method) const {
+  const State::Counters& counters = state_->methods[static_cast<std::size_t>(method)];
+
+  MethodMetrics snapshot;
+  snapshot.callCount = load(counters.callCount);
+  snapshot.exceptionCount = load(counters.exceptionCount);
+  snapshot.totalLatencyNs = load(counters.totalLatencyNs);
+  for (std::size_t bucket = 0; bucket < kNumHistogramBuckets; ++bucket) {
+    snapshot.batchSizeHistogram[bucket] = load(counters.batchSizeHistogram[bucket]);
+    snapshot.latencyNsHistogram[bucket] = load(counters.latencyNsHistogram[bucket]);
+  }
+  for (std::size_t code = 0; code < kNumErrorCodes; ++code) {
+    snapshot.errorCounts[code] = load(counters.errorCounts[code]);
+  }
+  return snapshot;
+}
+
+void ManagerMetrics::reset() {
+  for (State::Counters& counters : state_->methods) {
+    clear(counters.callCount);
+    clear(counters.exceptionCount);
+    clear(counters.totalLatencyNs);
+    for (std::size_t bucket = 0; bucket < kNumHistogramBuckets; ++bucket) {
+      clear(counters.batchSizeHistogram[bucket]);
+      clear(counters.latencyNsHistogram[bucket]);
+    }
+    for (Counter& errorCount : counters.errorCounts) {
+      clear(errorCount);
+    }
+  }
+}
+
+void ManagerMetrics::recordCall(const Method method, const std::size_t batchSize,
+                                const std::uint64_t latencyNs, const bool threw) {
+  State::Counters& counters = state_->methods[static_cast<std::size_t>(method)];
+  increment(counters.callCount);
+  if (threw) {
+    increment(counters.exceptionCount);
+  }
+  increment(counters.totalLatencyNs, latencyNs);
+  increment(counters.batchSizeHistogram[histogramBucket(batchSize)]);
+  increment(counters.latencyNsHistogram[histogramBucket(latencyNs)]);
+}
+
+void ManagerMetrics::recordError(const Method method, const BatchElementError::ErrorCode code) {
+  increment(state_->methods[static_cast<std::size_t>(method)].errorCounts[errorCodeIndex(code)]);
+}
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -0,0 +1,238 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <iterator>
+#include <memory>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <variant>
+#include <vector>
+
+#include <openassetio/Context.hpp>
+#include <openassetio/TraitsData.hpp>
+#include <openassetio/managerApi/ManagerStateBase.hpp>
+
+#include "ResolveCache.hpp"
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+namespace {
+// Appends a length-prefixed string to a key, so that the boundaries
+// between components are unambiguous whatever characters they
+// contain.
+void appendComponent(Str& key, const Str& component) {
+  key += std::to_string(component.size());
+  key += ':';
+  key += component;
+}
+
+// Appends a serialized trait property value to a key, including its
+// type, so that e.g. `Int{1}` and `Str{"1"}` produce different keys.
+void appendValue(Str& key, const trait::property::Value& value) {
+  key += std::to_string(value.index());
+  key += ':';
+  std::visit(
+      [&key](const auto& val) {
+        using T = std::decay_t<decltype(val)>;
+        if constexpr (std::is_same_v<T, Str>) {
+          appendComponent(key, val);
+        } else if constexpr (std::is_same_v<T, Float>) {
+          // Use the bit pattern, since a decimal representation may
+          // lose precision.
+          std::uint64_t bits{};
+          static_assert(sizeof(bits) == sizeof(val));
+          std::memcpy(&bits, &val, sizeof(bits));
+          key += std::to_string(bits);
+        } else {
+          key += std::to_string(val);
+        }
+      },
+      value);
+  key += ';';
+}
+
+// Serializes a locale such that equal locales produce equal keys,
+// regardless of the order in which their traits and properties were
+// set.
+Str localeKey(const TraitsData& locale) {
+  std::vector<Str> components;
+  locale.forEachTrait([&components](const trait::TraitId& traitId) {
+    Str component = "t";
+    appendComponent(component, traitId);
+    components.push_back(std::move(component));
+  });
+  locale.forEachProperty([&components](const trait::TraitId& traitId,
+                                       const trait::property::Key& propertyKey,
+                                       const trait::property::Value& value) {
+    Str component = "p";
+    appendComponent(component, traitId);
+    appendComponent(component, propertyKey);
+    appendValue(component, value);
+    components.push_back(std::move(component));
+  });
+  std::sort(components.begin(), components.end());
+
+  Str key;
+  for (const Str& component : components) {
+    appendComponent(key, component);
+  }
+  return key;
+}
+
+// Address of an object, used to scope a key to a specific instance.
+template <class T>
+Str addressKey(const std::shared_ptr<T>& ptr) {
+  // NOLINTNEXTLINE(cppcoreguidelines-pro-type-reinterpret-cast)
+  return std::to_string(reinterpret_cast<std::uintptr_t>(ptr.get()));
+}
+}  // namespace
+
+ResolveCache::ResolveCache(const std::size_t capacity) : capacity_{capacity} {}
+
+std::optional<Str> ResolveCache::batchKey(const trait::TraitSet& traitSet,
+                                          const ContextConstPtr& context) {
+  if (!context || context->retention == Context::Retention::kIgnored) {
+    return {};
+  }
+
+  // Trait sets are unordered, so sort to ensure equal sets produce
+  // equal keys.
+  std::vector<trait::TraitId> traitIds{traitSet.begin(), traitSet.end()};
+  std::sort(traitIds.begin(), traitIds.end());
+
+  Str key;
+  for (const trait::TraitId& traitId : traitIds) {
+    appendComponent(key, traitId);
+  }
+
+  key += "|a";
+  key += std::to_string(static_cast<int>(context->access));
+
+  key += "|l";
+  if (context->locale) {
+    appendComponent(key, localeKey(*context->locale));
+  }
+
+  // Manager state is opaque, so scope the entry to this specific
+  // state instance.
+  key += "|s";
+  if (context->managerState) {
+    key += addressKey(context->managerState);
+  }
+
+  if (context->retention == Context::Retention::kTransient) {
+    // Scope the entry to this specific context.
+    key += "|c";
+    key += addressKey(context);
+  }
+  return key;
+}
+
+Str ResolveCache::key(const EntityReference& entityReference, const Str& batchKey) {
+  Str key;
+  appendComponent(key, entityReference.toString());
+  key += batchKey;
+  return key;
+}
+
+TraitsDataPtr ResolveCache::get(const Str& key, const ContextConstPtr& context) {
+  TraitsDataConstPtr data;
+  {
+    const std::lock_guard lock{mutex_};
+    const auto indexIter = index_.find(key);
+    if (indexIter == index_.end()) {
+      return nullptr;
+    }
+    const Entries::iterator entryIter = indexIter->second;
+
+    if ((context->retention == Context::Retention::kTransient &&
+         entryIter->context.lock() != context) ||
+        (context->managerState && entryIter->managerState.lock() != context->managerState)) {
+      // The context or manager state this entry was scoped to has
+      // been destroyed, and its address reused.
+      erase(entryIter);
+      return nullptr;
+    }
+
+    entries_.splice(entries_.begin(), entries_, entryIter);
+    data = entryIter->data;
+  }
+  return TraitsData::make(data);
+}
+
+void ResolveCache::put(const EntityReference& entityReference, const Str& key,
+                       const ContextConstPtr& context, const TraitsDataConstPtr& data) {
+  if (capacity_ == 0) {
+    return;
+  }
+
+  std::weak_ptr<const Context> scopedContext;
+  if (context->retention == Context::Retention::kTransient) {
+    scopedContext = context;
+  }
+  std::weak_ptr<managerApi::ManagerStateBase> scopedManagerState = context->managerState;
+  TraitsDataConstPtr dataCopy = TraitsData::make(data);
+
+  const std::lock_guard lock{mutex_};
+  if (const auto indexIter = index_.find(key); indexIter != index_.end()) {
+    const Entries::iterator entryIter = indexIter->second;
+    entryIter->context = std::move(scopedContext);
+    entryIter->managerState = std::move(scopedManagerState);
+    entryIter->data = std::move(dataCopy);
+    entries_.splice(entries_.begin(), entries_, entryIter);
+    return;
+  }
+
+  if (entries_.size() >= capacity_) {
+    erase(std::prev(entries_.end()));
+  }
+  entries_.push_front(Entry{key, entityReference.toString(), std::move(scopedContext),
+                            std::move(scopedManagerState), std::move(dataCopy)});
+  index_.emplace(key, entries_.begin());
+  referenceIndex_.emplace(entries_.front().entityReference, entries_.begin());
+}
+
+void ResolveCache::invalidate(const EntityReference& entityReference) {
+  const std::lock_guard lock{mutex_};
+  auto [rangeBegin, rangeEnd] = referenceIndex_.equal_range(entityReference.toString());
+  std::vector<Entries::iterator> entryIters;
+  for (; rangeBegin != rangeEnd; ++rangeBegin) {
+    entryIters.push_back(rangeBegin->second);
+  }
+  for (const Entries::iterator& entryIter : entryIters) {
+    erase(entryIter);
+  }
+}
+
+void ResolveCache::clear() {
+  const std::lock_guard lock{mutex_};
+  referenceIndex_.clear();
+  index_.clear();
+  entries_.clear();
+}
+
+std::size_t ResolveCache::capacity() const { return capacity_; }
+
+std::size_t ResolveCache::size() const {
+  const std::lock_guard lock{mutex_};
+  return entries_.size();
+}
+
+void ResolveCache::erase(const Entries::iterator entryIter) {
+  auto [rangeBegin, rangeEnd] = referenceIndex_.equal_range(entryIter->entityReference);
+  for (; rangeBegin != rangeEnd; ++rangeBegin) {
+    if (rangeBegin->second == entryIter) {
+      referenceIndex_.erase(rangeBegin);
+      break;
+    }
+  }
+  index_.erase(entryIter->key);
+  entries_.erase(entryIter);
+}
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -0,0 +1,142 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <cstddef>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <unordered_map>
+
+#include <openassetio/export.h>
+#include <openassetio/EntityReference.hpp>
+#include <openassetio/trait/collection.hpp>
+#include <openassetio/typedefs.hpp>
+
+OPENASSETIO_FWD_DECLARE(Context)
+OPENASSETIO_FWD_DECLARE(TraitsData)
+OPENASSETIO_FWD_DECLARE(managerApi, ManagerStateBase)
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+/**
+ * Bounded, least-recently-used cache of resolve results.
+ *
+ * Entries are keyed on the entity reference, trait set and the
+ * relevant properties of the Context used to resolve them, i.e. its
+ * access pattern, locale and manager state. The Context's retention
+ * determines the scope of an entry:
+ *
+ * - `kIgnored`: never cached.
+ * - `kTransient`: cached only for the specific Context instance used
+ *   to resolve the entity.
+ * - `kSession`/`kPermanent`: cached for any Context with the same
+ *   access pattern, an equal locale, and the same manager state
+ *   instance.
+ *
+ * Stored data is copied on insertion and on retrieval, so that
+ * callers are free to mutate the data they are given.
+ *
+ * All member functions are thread-safe.
+ */
+class ResolveCache final {
+ public:
+  /**
+   * Construct a cache holding at most `capacity` entries.
+   */
+  explicit ResolveCache(std::size_t capacity);
+
+  /**
+   * Create the portion of a cache key common to all elements of a
+   * batch resolved for the given trait set and context.
+   *
+   * @return Key, or an empty optional if results resolved with the
+   * given context should not be cached.
+   */
+  [[nodiscard]] static std::optional<Str> batchKey(const trait::TraitSet& traitSet,
+                                                   const ContextConstPtr& context);
+
+  /**
+   * Create a cache key for an entity reference resolved as part of a
+   * batch.
+   *
+   * @param entityReference Entity reference being resolved.
+   * @param batchKey Key previously created by @ref batchKey.
+   */
+  [[nodiscard]] static Str key(const EntityReference& entityReference, const Str& batchKey);
+
+  /**
+   * Retrieve a copy of the data cached under the given key, if any.
+   *
+   * @param key Key created by @ref key.
+   * @param context The context used to create the key.
+   *
+   * @return Cached data or `nullptr` if there is no (valid) entry.
+   */
+  [[nodiscard]] TraitsDataPtr get(const Str& key, const ContextConstPtr& context);
+
+  /**
+   * Store a copy of the given data under the given key, evicting the
+   * least recently used entry if the cache is full.
+   *
+   * @param entityReference The entity reference used to create the
+   * key.
+   * @param key Key created by @ref key.
+   * @param context The context used to create the key.
+   * @param data Data to cache.
+   */
+  void put(const EntityReference& entityReference, const Str& key, const ContextConstPtr& context,
+           const TraitsDataConstPtr& data);
+
+  /**
+   * Remove all entries for the given entity reference, regardless of
+   * the trait set or context they were resolved with.
+   */
+  void invalidate(const EntityReference& entityReference);
+
+  /**
+   * Remove all entries.
+   */
+  void clear();
+
+  /**
+   * Maximum number of entries held by the cache.
+   */
+  [[nodiscard]] std::size_t capacity() const;
+
+  /**
+   * Current number of entries held by the cache.
+   */
+  [[nodiscard]] std::size_t size() const;
+
+ private:
+  struct Entry {
+    Str key;
+    Str entityReference;
+    // Only set for entries scoped to a specific context, in order to
+    // detect a stale entry whose context address has been reused.
+    std::weak_ptr<const Context> context;
+    // Only set for entries resolved with a manager state, in order to
+    // detect a stale entry whose state address has been reused.
+    std::weak_ptr<managerApi::ManagerStateBase> managerState;
+    TraitsDataConstPtr data;
+  };
+  using Entries = std::list<Entry>;
+
+  // Remove an entry from the list and indices. Requires `mutex_`.
+  void erase(Entries::iterator entryIter);
+
+  const std::size_t capacity_;
+  mutable std::mutex mutex_;
+  // Most recently used first. Guarded by `mutex_`.
+  Entries entries_;
+  // Guarded by `mutex_`.
+  std::unordered_map<Str, Entries::iterator> index_;
+  // Entries for each entity reference. Guarded by `mutex_`.
+  std::unordered_multimap<Str, Entries::iterator> referenceIndex_;
+};
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
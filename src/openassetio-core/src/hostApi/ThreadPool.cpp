@@ -0,0 +1,93 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <condition_variable>
+#include <deque>
+#include <mutex>
+#include <thread>
+#include <utility>
+
+#include "ThreadPool.hpp"
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+struct ThreadPool::State {
+  explicit State(const std::size_t threadLimit) : maxThreads{threadLimit} {}
+
+  const std::size_t maxThreads;
+  std::mutex mutex;
+  std::condition_variable tasksAvailable;
+  // Guarded by `mutex`.
+  std::deque<std::function<void()>> tasks;
+  std::size_t numThreads{0};
+  std::size_t numIdleThreads{0};
+  bool stopping{false};
+};
+
+ThreadPool::ThreadPool(const std::size_t maxThreads)
+    : state_{std::make_shared<State>(maxThreads)} {}
+
+ThreadPool::~ThreadPool() {
+  {
+    const std::lock_guard lock{state_->mutex};
+    state_->stopping = true;
+  }
+  state_->tasksAvailable.notify_all();
+}
+
+void ThreadPool::submit(std::function<void()> task) {
+  bool startThread = false;
+  {
+    const std::lock_guard lock{state_->mutex};
+    state_->tasks.push_back(std::move(task));
+    if (state_->numIdleThreads < state_->tasks.size() && state_->numThreads < state_->maxThreads) {
+      ++state_->numThreads;
+      startThread = true;
+    }
+  }
+  if (startThread) {
+    try {
+      std::thread{[state = state_] { runWorker(state); }}.detach();
+    } catch (...) {
+      const std::lock_guard lock{state_->mutex};
+      --state_->numThreads;
+      throw;
+    }
+  } else {
+    state_->tasksAvailable.notify_one();
+  }
+}
+
+std::size_t ThreadPool::maxThreads() const { return state_->maxThreads; }
+
+void ThreadPool::runWorker(const std::shared_ptr<State>& state) {
+  std::unique_lock lock{state->mutex};
+  while (true) {
+    ++state->numIdleThreads;
+    state->tasksAvailable.wait(lock, [&] { return state->stopping || !state->tasks.empty(); });
+    --state->numIdleThreads;
+
+    if (state->tasks.empty()) {
+      // Stopping, and no outstanding work.
+      --state->numThreads;
+      return;
+    }
+
+    std::function<void()> task = std::move(state->tasks.front());
+    state->tasks.pop_front();
+
+    lock.unlock();
+    try {
+      task();
+    } catch (...) {  // NOLINT(bugprone-empty-catch)
+      // Nowhere to report to.
+    }
+    // Destroy the task (and anything it captured) before re-locking.
+    task = nullptr;
+    lock.lock();
+  }
+}
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
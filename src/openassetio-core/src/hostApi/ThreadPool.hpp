@@ -0,0 +1,63 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <cstddef>
+#include <functional>
+#include <memory>
+
+#include <openassetio/export.h>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+/**
+ * Minimal pool of worker threads that execute queued tasks in FIFO
+ * order.
+ *
+ * Worker threads are started on demand, up to a maximum, as tasks are
+ * submitted.
+ *
+ * Workers are detached rather than joined, and share ownership of the
+ * task queue. Destroying the pool does not block, but signals workers
+ * to exit once all outstanding tasks have completed. This avoids
+ * deadlock where the pool is destroyed whilst holding a lock (e.g.
+ * the Python GIL) that a running task is waiting on.
+ *
+ * Exceptions thrown from tasks are discarded.
+ *
+ * All member functions are thread-safe.
+ */
+class ThreadPool final {
+ public:
+  /**
+   * Construct a pool that will start at most `maxThreads` workers.
+   */
+  explicit ThreadPool(std::size_t maxThreads);
+
+  ~ThreadPool();
+
+  ThreadPool(const ThreadPool&) = delete;
+  ThreadPool& operator=(const ThreadPool&) = delete;
+  ThreadPool(ThreadPool&&) = delete;
+  ThreadPool& operator=(ThreadPool&&) = delete;
+
+  /**
+   * Queue a task to be executed by a worker thread.
+   */
+  void submit(std::function<void()> task);
+
+  /**
+   * Maximum number of worker threads.
+   */
+  [[nodiscard]] std::size_t maxThreads() const;
+
+ private:
+  struct State;
+  static void runWorker(const std::shared_ptr<State>& state);
+
+  std::shared_ptr<State> state_;
+};
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
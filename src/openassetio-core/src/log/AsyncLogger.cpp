@@ -0,0 +1,185 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <chrono>
+#include <condition_variable>
+#include <cstddef>
+#include <cstdint>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <utility>
+#include <vector>
+
+#include <openassetio/log/AsyncLogger.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace log {
+
+namespace {
+std::int64_t nowNs() {
+  return std::chrono::duration_cast<std::chrono::nanoseconds>(
+             std::chrono::system_clock::now().time_since_epoch())
+      .count();
+}
+}  // namespace
+
+struct AsyncLogger::State {
+  State(LoggerInterfacePtr upstream, const std::size_t maxMessages, const OverflowPolicy policy)
+      : upstreamLogger{std::move(upstream)}, overflowPolicy{policy}, ringBuffer(maxMessages) {}
+
+  const LoggerInterfacePtr upstreamLogger;
+  const OverflowPolicy overflowPolicy;
+
+  std::mutex mutex;
+  std::condition_variable messagesAvailable;
+  std::condition_variable messagesRetired;
+  // Guarded by `mutex`.
+  std::vector<LogRecord> ringBuffer;
+  std::size_t head{0};
+  std::size_t size{0};
+  // Total messages queued, and total delivered or overwritten, used to
+  // determine when a flush is complete.
+  std::size_t numQueued{0};
+  std::size_t numRetired{0};
+  std::size_t numDropped{0};
+  std::size_t numDroppedUnreported{0};
+  bool stopping{false};
+
+  std::thread drainThread;
+};
+
+AsyncLoggerPtr AsyncLogger::make(LoggerInterfacePtr upstreamLogger, const std::size_t capacity,
+                                 const OverflowPolicy overflowPolicy) {
+  if (capacity == 0) {
+    throw std::invalid_argument{"capacity must be greater than zero"};
+  }
+  return std::shared_ptr<AsyncLogger>(
+      new AsyncLogger(std::move(upstreamLogger), capacity, overflowPolicy));
+}
+
+AsyncLogger::AsyncLogger(LoggerInterfacePtr upstreamLogger, const std::size_t capacity,
+                         const OverflowPolicy overflowPolicy)
+    : state_{std::make_unique<State>(std::move(upstreamLogger), capacity, overflowPolicy)} {
+  state_->drainThread = std::thread{[state = state_.get()] { runDrain(state); }};
+}
+
+AsyncLogger::~AsyncLogger() {
+  {
+    const std::lock_guard lock{state_->mutex};
+    state_->stopping = true;
+  }
+  state_->messagesAvailable.notify_one();
+  state_->drainThread.join();
+}
+
+LoggerInterfacePtr AsyncLogger::upstreamLogger() const { return state_->upstreamLogger; }
+
+std::size_t AsyncLogger::capacity() const { return state_->ringBuffer.size(); }
+
+AsyncLogger::OverflowPolicy AsyncLogger::overflowPolicy() const { return state_->overflowPolicy; }
+
+std::size_t AsyncLogger::droppedCount() const {
+  const std::lock_guard lock{state_->mutex};
+  return state_->numDropped;
+}
+
+void AsyncLogger::flush() {
+  std::unique_lock lock{state_->mutex};
+  const std::size_t target = state_->numQueued;
+  state_->messagesRetired.wait(lock, [&] { return state_->numRetired >= target; });
+}
+
+void AsyncLogger::log(Severity severity, const Str& message) {
+  LogRecord record;
+  record.severity = severity;
+  record.message = message;
+  record.timestampNs = nowNs();
+  enqueue(std::move(record));
+}
+
+void AsyncLogger::logRecord(const LogRecord& record) {
+  LogRecord queuedRecord = record;
+  if (!queuedRecord.timestampNs) {
+    queuedRecord.timestampNs = nowNs();
+  }
+  enqueue(std::move(queuedRecord));
+}
+
+void AsyncLogger::enqueue(LogRecord record) {
+  State& state = *state_;
+  {
+    const std::lock_guard lock{state.mutex};
+    const std::size_t capacity = state.ringBuffer.size();
+    if (state.size == capacity) {
+      ++state.numDropped;
+      ++state.numDroppedUnreported;
+      if (state.overflowPolicy == OverflowPolicy::kDropNewest) {
+        return;
+      }
+      // Overwrite the oldest message.
+      state.head = (state.head + 1) % capacity;
+      --state.size;
+      ++state.numRetired;
+    }
+    state.ringBuffer[(state.head + state.size) % capacity] = std::move(record);
+    ++state.size;
+    ++state.numQueued;
+  }
+  state.messagesAvailable.notify_one();
+}
+
+bool AsyncLogger::isSeverityLogged(Severity severity) const {
+  return state_->upstreamLogger->isSeverityLogged(severity);
+}
+
+void AsyncLogger::runDrain(State* state) {
+  // Messages are moved out of the ring buffer in batches, so the lock
+  // is not held whilst calling the upstream logger.
+  std::vector<LogRecord> batch;
+  std::unique_lock lock{state->mutex};
+  while (true) {
+    state->messagesAvailable.wait(lock, [&] { return state->stopping || state->size != 0; });
+    if (state->size == 0) {
+      // Stopping, and all messages delivered.
+      return;
+    }
+
+    const std::size_t capacity = state->ringBuffer.size();
+    batch.reserve(state->size);
+    for (; state->size != 0; --state->size) {
+      batch.push_back(std::move(state->ringBuffer[state->head]));
+      state->head = (state->head + 1) % capacity;
+    }
+    const std::size_t numDroppedUnreported = std::exchange(state->numDroppedUnreported, 0);
+    lock.unlock();
+
+    for (const LogRecord& record : batch) {
+      try {
+        state->upstreamLogger->logRecord(record);
+      } catch (...) {  // NOLINT(bugprone-empty-catch)
+        // Nowhere to report to.
+      }
+    }
+    if (numDroppedUnreported != 0) {
+      try {
+        state->upstreamLogger->log(Severity::kWarning,
+                                   "AsyncLogger: " + std::to_string(numDroppedUnreported) +
+                                       " message(s) dropped due to a full queue");
+      } catch (...) {  // NOLINT(bugprone-empty-catch)
+        // Nowhere to report to.
+      }
+    }
+
+    const std::size_t numDelivered = batch.size();
+    batch.clear();
+
+    lock.lock();
+    state->numRetired += numDelivered;
+    state->messagesRetired.notify_all();
+  }
+}
+}  // namespace log
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -0,0 +1,151 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <fstream>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <utility>
+
+#include <openassetio/log/JsonLinesLogger.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace log {
+namespace {
+const char* errorCodeName(const BatchElementError::ErrorCode code) {
+  switch (code) {
+    case BatchElementError::ErrorCode::kUnknown:
+      return "kUnknown";
+    case BatchElementError::ErrorCode::kInvalidEntityReference:
+      return "kInvalidEntityReference";
+    case BatchElementError::ErrorCode::kMalformedEntityReference:
+      return "kMalformedEntityReference";
+    case BatchElementError::ErrorCode::kEntityAccessError:
+      return "kEntityAccessError";
+    case BatchElementError::ErrorCode::kEntityResolutionError:
+      return "kEntityResolutionError";
+  }
+  return "kUnknown";
+}
+
+// Appends the given string as a quoted JSON string.
+void appendJsonString(Str* out, const Str& value) {
+  static constexpr char kHexDigits[] = "0123456789abcdef";
+  out->push_back('"');
+  for (const char chr : value) {
+    switch (chr) {
+      case '"':
+        out->append("\\\"");
+        break;
+      case '\\':
+        out->append("\\\\");
+        break;
+      case '\n':
+        out->append("\\n");
+        break;
+      case '\r':
+        out->append("\\r");
+        break;
+      case '\t':
+        out->append("\\t");
+        break;
+      default:
+        if (static_cast<unsigned char>(chr) < 0x20) {  // NOLINT(readability-magic-numbers)
+          // Remaining control characters. Other bytes, including
+          // UTF-8 multibyte sequences, are valid as-is.
+          const auto byte = static_cast<unsigned char>(chr);
+          out->append("\\u00");
+          out->push_back(kHexDigits[byte >> 4U]);
+          out->push_back(kHexDigits[byte & 0xFU]);  // NOLINT(readability-magic-numbers)
+        } else {
+          out->push_back(chr);
+        }
+    }
+  }
+  out->push_back('"');
+}
+
+void appendKey(Str* out, const char* key) {
+  out->append(",\"");
+  out->append(key);
+  out->append("\":");
+}
+}  // namespace
+
+struct JsonLinesLogger::State {
+  Str path;
+  std::mutex mutex;
+  // Guarded by `mutex`.
+  std::ofstream stream;
+};
+
+JsonLinesLoggerPtr JsonLinesLogger::make(const Str& path) {
+  auto state = std::make_unique<State>();
+  state->path = path;
+  state->stream.open(path, std::ios::out | std::ios::app | std::ios::binary);
+  if (!state->stream) {
+    throw std::runtime_error{"JsonLinesLogger: Unable to open '" + path + "' for writing"};
+  }
+  return std::shared_ptr<JsonLinesLogger>(new JsonLinesLogger(std::move(state)));
+}
+
+JsonLinesLogger::JsonLinesLogger(std::unique_ptr<State> state) : state_{std::move(state)} {}
+
+JsonLinesLogger::~JsonLinesLogger() = default;
+
+const Str& JsonLinesLogger::path() const { return state_->path; }
+
+void JsonLinesLogger::log(Severity severity, const Str& message) {
+  LogRecord record;
+  record.severity = severity;
+  record.message = message;
+  logRecord(record);
+}
+
+void JsonLinesLogger::logRecord(const LogRecord& record) {
+  const std::int64_t timestampNs = record.timestampNs
+                                       ? *record.timestampNs
+                                       : std::chrono::duration_cast<std::chrono::nanoseconds>(
+                                             std::chrono::system_clock::now().time_since_epoch())
+                                             .count();
+
+  // Build the line before taking the lock.
+  Str line = "{\"timestampNs\":";
+  line += std::to_string(timestampNs);
+  appendKey(&line, "severity");
+  appendJsonString(&line, kSeverityNames[static_cast<std::size_t>(record.severity)]);
+  appendKey(&line, "message");
+  appendJsonString(&line, record.message);
+  if (!record.method.empty()) {
+    appendKey(&line, "method");
+    appendJsonString(&line, record.method);
+  }
+  if (!record.managerIdentifier.empty()) {
+    appendKey(&line, "managerIdentifier");
+    appendJsonString(&line, record.managerIdentifier);
+  }
+  if (record.batchSize) {
+    appendKey(&line, "batchSize");
+    line += std::to_string(*record.batchSize);
+  }
+  if (record.durationNs) {
+    appendKey(&line, "durationNs");
+    line += std::to_string(*record.durationNs);
+  }
+  if (record.errorCode) {
+    appendKey(&line, "errorCode");
+    line += '"';
+    line += errorCodeName(*record.errorCode);
+    line += '"';
+  }
+  line += "}\n";
+
+  const std::lock_guard lock{state_->mutex};
+  state_->stream << line << std::flush;
+}
+}  // namespace log
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
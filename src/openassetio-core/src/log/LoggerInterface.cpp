@@ -10,6 +10,16 @@ inline namespace OPENASSETIO_CORE_ABI_VERSION {
 namespace log {
 LoggerInterface::~LoggerInterface() = default;
 
+bool LoggerInterface::isSeverityLogged([[maybe_unused]] Severity severity) const { return true; }
+
+void LoggerInterface::log(Severity severity, const MessageFactory &messageFactory) {
+  if (isSeverityLogged(severity)) {
+    log(severity, messageFactory());
+  }
+}
+
+void LoggerInterface::logRecord(const LogRecord &record) { log(record.severity, record.message); }
+
 void LoggerInterface::debugApi(const Str &message) { log(Severity::kDebugApi, message); }
 
 void LoggerInterface::debug(const Str &message) { log(Severity::kDebug, message); }
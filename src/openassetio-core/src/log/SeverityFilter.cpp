@@ -40,6 +40,17 @@ void SeverityFilter::log(Severity severity, const Str& message) {
   upstreamLogger_->log(severity, message);
 }
 
+void SeverityFilter::logRecord(const LogRecord& record) {
+  if (record.severity < minSeverity_) {
+    return;
+  }
+  upstreamLogger_->logRecord(record);
+}
+
+bool SeverityFilter::isSeverityLogged(Severity severity) const {
+  return severity >= minSeverity_ && upstreamLogger_->isSeverityLogged(severity);
+}
+
 void SeverityFilter::setSeverity(LoggerInterface::Severity severity) { minSeverity_ = severity; }
 
 LoggerInterface::Severity SeverityFilter::getSeverity() const { return minSeverity_; }
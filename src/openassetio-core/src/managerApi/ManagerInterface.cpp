@@ -1,7 +1,11 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <optional>
 #include <stdexcept>
+#include <string>
 
+#include <openassetio/TraitsData.hpp>
+#include <openassetio/TraitsDataBatch.hpp>
 #include <openassetio/managerApi/ManagerInterface.hpp>
 
 namespace openassetio {
@@ -42,6 +46,69 @@ ManagerStateBasePtr ManagerInterface::stateFromPersistenceToken(
       "stateFromPersistenceToken called on a manager that does not implement a custom state.");
 }
 
+std::vector<bool> ManagerInterface::isEntityReferenceStrings(
+    const std::vector<Str>& someStrings, const HostSessionPtr& hostSession) const {
+  std::vector<bool> result;
+  result.reserve(someStrings.size());
+  for (const Str& someString : someStrings) {
+    result.push_back(isEntityReferenceString(someString, hostSession));
+  }
+  return result;
+}
+
+void ManagerInterface::resolveToBatch(const EntityReferences& entityReferences,
+                                      const trait::TraitSet& traitSet,
+                                      const ContextConstPtr& context,
+                                      const HostSessionPtr& hostSession,
+                                      const TraitsDataBatchPtr& results) {
+  resolve(
+      entityReferences, traitSet, context, hostSession,
+      [&results](std::size_t index, const TraitsDataPtr& data) {
+        // Columns are homogeneous, so check that every value fits
+        // before copying any, to avoid a partially populated element.
+        std::optional<Str> mismatchedProperty;
+        data->forEachProperty([&results, &mismatchedProperty](
+                                  const trait::TraitId& traitId,
+                                  const trait::property::Key& propertyKey,
+                                  const trait::property::Value& propertyValue) {
+          const TraitsDataBatch::Column* column = results->column(traitId, propertyKey);
+          if (!mismatchedProperty && column && column->values.index() != propertyValue.index()) {
+            mismatchedProperty = traitId + "." + propertyKey;
+          }
+        });
+        if (mismatchedProperty) {
+          results->setError(index,
+                            BatchElementError{BatchElementError::ErrorCode::kEntityResolutionError,
+                                              "Mismatched value type for trait property '" +
+                                                  *mismatchedProperty + "'"});
+          return;
+        }
+
+        data->forEachTrait([&results, index](const trait::TraitId& traitId) {
+          results->addTrait(index, traitId);
+        });
+        data->forEachProperty([&results, index](const trait::TraitId& traitId,
+                                                const trait::property::Key& propertyKey,
+                                                const trait::property::Value& propertyValue) {
+          results->setTraitProperty(index, traitId, propertyKey, propertyValue);
+        });
+      },
+      [&results](std::size_t index, const BatchElementError& error) {
+        results->setError(index, error);
+      });
+}
+
+bool ManagerInterface::resolveAsync(
+    [[maybe_unused]] const EntityReferences& entityReferences,
+    [[maybe_unused]] const trait::TraitSet& traitSet,
+    [[maybe_unused]] const ContextConstPtr& context,
+    [[maybe_unused]] const HostSessionPtr& hostSession,
+    [[maybe_unused]] const ResolveSuccessCallback& successCallback,
+    [[maybe_unused]] const BatchElementErrorCallback& errorCallback,
+    [[maybe_unused]] const AsyncCompletionCallback& completionCallback) {
+  return false;
+}
+
 // To avoid changing this to non-static in the not too distant, when we
 // add manager validation (see https://github.com/OpenAssetIO/OpenAssetIO/issues/553).
 // NOLINTNEXTLINE(readability-convert-member-functions-to-static)
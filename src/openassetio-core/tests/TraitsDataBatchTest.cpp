@@ -0,0 +1,109 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2022 The Foundry Visionmongers Ltd
+#include <stdexcept>
+#include <type_traits>
+#include <variant>
+#include <vector>
+
+#include <catch2/catch.hpp>
+
+#include <openassetio/BatchElementError.hpp>
+#include <openassetio/TraitsData.hpp>
+#include <openassetio/TraitsDataBatch.hpp>
+
+using openassetio::BatchElementError;
+using openassetio::Int;
+using openassetio::Str;
+using openassetio::TraitsDataBatch;
+using openassetio::TraitsDataBatchPtr;
+using openassetio::trait::property::Value;
+
+SCENARIO("TraitsDataBatch constructor is private") {
+  STATIC_REQUIRE_FALSE(std::is_constructible_v<TraitsDataBatch, std::size_t>);
+}
+
+SCENARIO("TraitsDataBatch stores property values in typed columns") {
+  GIVEN("an empty batch") {
+    const TraitsDataBatchPtr batch = TraitsDataBatch::make(3);
+
+    THEN("it has the given size and no columns") {
+      CHECK(batch->size() == 3);
+      CHECK(batch->column("a", "x") == nullptr);
+    }
+
+    WHEN("property values are set for some elements") {
+      batch->setTraitProperty(0, "a", "x", Int{1});
+      batch->setTraitProperty(2, "a", "x", Int{3});
+
+      THEN("the values are stored in a typed column") {
+        const TraitsDataBatch::Column* column = batch->column("a", "x");
+        REQUIRE(column != nullptr);
+        CHECK(std::get<std::vector<Int>>(column->values)[0] == Int{1});
+        CHECK(std::get<std::vector<Int>>(column->values)[2] == Int{3});
+        CHECK(column->isSet == std::vector<bool>{true, false, true});
+      }
+
+      THEN("only those elements have the trait") {
+        CHECK(batch->hasTrait(0, "a"));
+        CHECK_FALSE(batch->hasTrait(1, "a"));
+        CHECK(batch->hasTrait(2, "a"));
+      }
+
+      THEN("values can be retrieved individually") {
+        Value value;
+        REQUIRE(batch->getTraitProperty(&value, 2, "a", "x"));
+        CHECK(value == Value{Int{3}});
+        CHECK_FALSE(batch->getTraitProperty(&value, 1, "a", "x"));
+      }
+
+      AND_WHEN("a value of a different type is set in the same column") {
+        THEN("an exception is thrown") {
+          CHECK_THROWS_AS(batch->setTraitProperty(1, "a", "x", Str{"b"}), std::invalid_argument);
+        }
+      }
+
+      AND_WHEN("an element is materialised") {
+        const auto traitsData = batch->traitsData(2);
+
+        THEN("it holds the element's traits and properties") {
+          CHECK(traitsData->toDict() == openassetio::TraitsData::Dict{{"a", {{"x", Int{3}}}}});
+        }
+      }
+    }
+
+    WHEN("a whole column is set") {
+      batch->setColumn("a", "x", std::vector<Str>{"p", "q", "r"});
+
+      THEN("every element has the trait and value") {
+        const TraitsDataBatch::Column* column = batch->column("a", "x");
+        REQUIRE(column != nullptr);
+        CHECK(std::get<std::vector<Str>>(column->values) == std::vector<Str>{"p", "q", "r"});
+        CHECK(column->isSet == std::vector<bool>{true, true, true});
+        CHECK(batch->traitSet() == openassetio::trait::TraitSet{"a"});
+      }
+    }
+
+    WHEN("a column of the wrong length is set") {
+      THEN("an exception is thrown") {
+        CHECK_THROWS_AS(batch->setColumn("a", "x", std::vector<Int>{1, 2}), std::invalid_argument);
+      }
+    }
+
+    WHEN("an error is set for an element") {
+      batch->setError(1, BatchElementError{BatchElementError::ErrorCode::kUnknown, "oops"});
+
+      THEN("only that element has an error") {
+        CHECK_FALSE(batch->error(0).has_value());
+        REQUIRE(batch->error(1).has_value());
+        CHECK(batch->error(1)->code == BatchElementError::ErrorCode::kUnknown);
+        CHECK(batch->error(1)->message == "oops");
+      }
+    }
+
+    WHEN("an out of range index is used") {
+      THEN("an exception is thrown") {
+        CHECK_THROWS_AS(batch->addTrait(3, "a"), std::out_of_range);
+      }
+    }
+  }
+}
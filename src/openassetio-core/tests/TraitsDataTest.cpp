@@ -1,5 +1,9 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2022 The Foundry Visionmongers Ltd
+#include <map>
+#include <set>
+#include <stdexcept>
+#include <tuple>
 #include <type_traits>
 
 #include <catch2/catch.hpp>
@@ -26,7 +30,7 @@ SCENARIO("TraitsData copy constructor is private") {
   STATIC_REQUIRE_FALSE(std::is_constructible_v<TraitsData, const openassetio::TraitsData&>);
 }
 
-SCENARIO("TraitsData make from other creates a deep copy") {
+SCENARIO("TraitsData make from other creates an independent copy") {
   GIVEN("an instance with existing data") {
     const TraitsDataPtr data = TraitsData::make();
     data->setTraitProperty("a", "a", Int{1});
@@ -54,3 +58,134 @@ SCENARIO("TraitsData make from other creates a deep copy") {
     }
   }
 }
+
+SCENARIO("TraitsData make from other is decoupled from the original") {
+  GIVEN("an instance with existing data and a copy of it") {
+    const TraitsDataPtr data = TraitsData::make();
+    data->setTraitProperty("a", "a", Int{1});
+    const TraitsDataPtr copy = TraitsData::make(data);
+
+    WHEN("the copy is modified") {
+      copy->setTraitProperty("a", "a", Int{3});
+      copy->addTrait("b");
+
+      THEN("the original is unchanged") {
+        Value someValue;
+        REQUIRE(data->getTraitProperty(&someValue, "a", "a"));
+        CHECK(*std::get_if<Int>(&someValue) == Int{1});
+        CHECK_FALSE(data->hasTrait("b"));
+      }
+    }
+
+    AND_GIVEN("a copy of the copy") {
+      const TraitsDataPtr copyOfCopy = TraitsData::make(copy);
+
+      WHEN("the original is modified") {
+        data->addTraits({"b", "c"});
+
+        THEN("neither copy is changed") {
+          const openassetio::trait::TraitSet expected{"a"};
+          CHECK(copy->traitSet() == expected);
+          CHECK(copyOfCopy->traitSet() == expected);
+        }
+      }
+    }
+  }
+}
+
+SCENARIO("TraitsData traits and properties can be visited in place") {
+  GIVEN("an instance with traits and properties") {
+    const TraitsDataPtr data = TraitsData::make({"a", "b", "c"});
+    data->setTraitProperty("a", "x", Int{1});
+    data->setTraitProperty("a", "y", Int{2});
+    data->setTraitProperty("b", "x", Int{3});
+
+    WHEN("traits are visited") {
+      openassetio::trait::TraitSet visited;
+      data->forEachTrait(
+          [&visited](const openassetio::trait::TraitId& traitId) { visited.insert(traitId); });
+
+      THEN("each trait is visited") { CHECK(visited == data->traitSet()); }
+    }
+
+    WHEN("the properties of a trait are visited") {
+      std::map<Key, Value> visited;
+      data->forEachTraitProperty(
+          "a", [&visited](const Key& key, const Value& value) { visited.emplace(key, value); });
+
+      THEN("each property of the trait is visited") {
+        CHECK(visited == std::map<Key, Value>{{"x", Int{1}}, {"y", Int{2}}});
+      }
+    }
+
+    WHEN("the properties of a trait without properties are visited") {
+      bool wasVisited = false;
+      data->forEachTraitProperty("c",
+                                 [&wasVisited](const Key&, const Value&) { wasVisited = true; });
+
+      THEN("the visitor is not called") { CHECK_FALSE(wasVisited); }
+    }
+
+    WHEN("all properties are visited") {
+      std::set<std::tuple<openassetio::trait::TraitId, Key, Value>> visited;
+      data->forEachProperty(
+          [&visited](const openassetio::trait::TraitId& traitId, const Key& key,
+                     const Value& value) { visited.emplace(traitId, key, value); });
+
+      THEN("each property of each trait is visited") {
+        CHECK(visited == std::set<std::tuple<openassetio::trait::TraitId, Key, Value>>{
+                             {"a", "x", Int{1}}, {"a", "y", Int{2}}, {"b", "x", Int{3}}});
+      }
+    }
+
+    WHEN("trait sets are compared") {
+      THEN("an instance with the same traits has the same trait set") {
+        CHECK(data->hasSameTraitSet(*TraitsData::make({"c", "b", "a"})));
+      }
+      THEN("an instance with different traits does not have the same trait set") {
+        CHECK_FALSE(data->hasSameTraitSet(*TraitsData::make({"a", "b"})));
+        CHECK_FALSE(data->hasSameTraitSet(*TraitsData::make({"a", "b", "d"})));
+      }
+    }
+  }
+}
+
+SCENARIO("TraitsData properties can be set and retrieved in bulk") {
+  GIVEN("an instance with existing data") {
+    const TraitsDataPtr data = TraitsData::make({"c"});
+    data->setTraitProperty("a", "x", Int{1});
+    data->setTraitProperty("a", "y", Int{2});
+
+    WHEN("properties of a trait are set in bulk") {
+      data->setTraitProperties("a", {{"y", Int{3}}, {"z", Int{4}}});
+
+      THEN("new properties are added and existing properties updated") {
+        CHECK(data->getTraitProperties("a") ==
+              TraitsData::TraitDict{{"x", Int{1}}, {"y", Int{3}}, {"z", Int{4}}});
+      }
+    }
+
+    WHEN("properties of many traits are set in bulk") {
+      data->setProperties({{"a", {{"x", Int{5}}}}, {"b", {{"x", Int{6}}}}, {"d", {}}});
+
+      THEN("traits are added and properties merged") {
+        CHECK(data->toDict() == TraitsData::Dict{{"a", {{"x", Int{5}}, {"y", Int{2}}}},
+                                                 {"b", {{"x", Int{6}}}},
+                                                 {"c", {}},
+                                                 {"d", {}}});
+      }
+    }
+
+    WHEN("properties of a missing trait are retrieved") {
+      THEN("an exception is thrown") {
+        CHECK_THROWS_AS(data->getTraitProperties("b"), std::out_of_range);
+      }
+    }
+
+    WHEN("a new instance is created from its dictionary") {
+      const TraitsDataPtr copy = TraitsData::fromDict(data->toDict());
+
+      THEN("the new instance is equal") { CHECK(*copy == *data); }
+    }
+  }
+}
@@ -0,0 +1,76 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2022 The Foundry Visionmongers Ltd
+#include <cstdint>
+#include <limits>
+#include <numeric>
+
+#include <catch2/catch.hpp>
+
+#include <openassetio/BatchElementError.hpp>
+#include <openassetio/hostApi/ManagerMetrics.hpp>
+
+namespace {
+using openassetio::BatchElementError;
+using openassetio::hostApi::ManagerMetrics;
+
+std::uint64_t total(const ManagerMetrics::Histogram& histogram) {
+  return std::accumulate(histogram.begin(), histogram.end(), std::uint64_t{0});
+}
+}  // namespace
+
+TEST_CASE("ManagerMetrics histogram buckets are logarithmic") {
+  CHECK(ManagerMetrics::histogramBucket(0) == 0);
+  CHECK(ManagerMetrics::histogramBucket(1) == 1);
+  CHECK(ManagerMetrics::histogramBucket(3) == 2);
+  CHECK(ManagerMetrics::histogramBucket(4) == 3);
+  CHECK(ManagerMetrics::histogramBucket(std::numeric_limits<std::uint64_t>::max()) ==
+        ManagerMetrics::kNumHistogramBuckets - 1);
+}
+
+SCENARIO("Recording Manager call metrics") {
+  GIVEN("a ManagerMetrics instance") {
+    ManagerMetrics metrics;
+
+    THEN("recording is enabled and no calls are recorded") {
+      CHECK(metrics.isEnabled());
+      CHECK(metrics.methodMetrics(ManagerMetrics::Method::kResolve).callCount == 0);
+    }
+
+    WHEN("calls and errors are recorded") {
+      metrics.recordCall(ManagerMetrics::Method::kResolve, 3, 1000, false);
+      metrics.recordCall(ManagerMetrics::Method::kResolve, 1, 10, true);
+      metrics.recordError(ManagerMetrics::Method::kResolve,
+                          BatchElementError::ErrorCode::kEntityAccessError);
+
+      THEN("they are reflected in the method's snapshot") {
+        const ManagerMetrics::MethodMetrics snapshot =
+            metrics.methodMetrics(ManagerMetrics::Method::kResolve);
+        CHECK(snapshot.callCount == 2);
+        CHECK(snapshot.exceptionCount == 1);
+        CHECK(snapshot.totalLatencyNs == 1010);
+        CHECK(snapshot.batchSizeHistogram[ManagerMetrics::histogramBucket(3)] == 1);
+        CHECK(snapshot.batchSizeHistogram[ManagerMetrics::histogramBucket(1)] == 1);
+        CHECK(total(snapshot.latencyNsHistogram) == 2);
+        CHECK(snapshot.errorCount(BatchElementError::ErrorCode::kEntityAccessError) == 1);
+        CHECK(snapshot.errorCount(BatchElementError::ErrorCode::kUnknown) == 0);
+      }
+
+      AND_THEN("other methods are unaffected") {
+        CHECK(metrics.methodMetrics(ManagerMetrics::Method::kPreflight).callCount == 0);
+      }
+
+      AND_WHEN("the metrics are reset") {
+        metrics.reset();
+
+        THEN("all statistics are zeroed") {
+          const ManagerMetrics::MethodMetrics snapshot =
+              metrics.methodMetrics(ManagerMetrics::Method::kResolve);
+          CHECK(snapshot.callCount == 0);
+          CHECK(snapshot.totalLatencyNs == 0);
+          CHECK(total(snapshot.batchSizeHistogram) == 0);
+          CHECK(snapshot.errorCount(BatchElementError::ErrorCode::kEntityAccessError) == 0);
+        }
+      }
+    }
+  }
+}
@@ -10,6 +10,7 @@
 
 #include <openassetio/Context.hpp>
 #include <openassetio/TraitsData.hpp>
+#include <openassetio/constants.hpp>
 #include <openassetio/hostApi/HostInterface.hpp>
 #include <openassetio/hostApi/Manager.hpp>
 #include <openassetio/log/LoggerInterface.hpp>
@@ -309,6 +310,33 @@ SCENARIO("Resolving entities") {
           CHECK(std::get<openassetio::TraitsDataPtr>(actualVec[2]) == expectedValue2);
         }
       }
+      WHEN("batch resolve is called with kCollect errorPolicyTag") {
+        const auto [actualDatas, actualErrors] = manager->resolve(
+            refs, traits, context, hostApi::Manager::BatchElementErrorPolicyTag::kCollect);
+        THEN("returned list of data contains successful results, with null for failures") {
+          CHECK(actualDatas.size() == 3);
+          CHECK(actualDatas[0] == nullptr);
+          CHECK(actualDatas[1] == nullptr);
+          CHECK(actualDatas[2] == expectedValue2);
+        }
+        AND_THEN("returned list of errors contains only the failures") {
+          REQUIRE(actualErrors.size() == 2);
+          CHECK(actualErrors[0].first == 0);
+          CHECK(actualErrors[0].second == expectedError0);
+          CHECK(actualErrors[1].first == 1);
+          CHECK(actualErrors[1].second == expectedError1);
+        }
+      }
+      WHEN("batch resolve is called with kSkip errorPolicyTag") {
+        const std::vector<openassetio::TraitsDataPtr> actualVec = manager->resolve(
+            refs, traits, context, hostApi::Manager::BatchElementErrorPolicyTag::kSkip);
+        THEN("returned list of data contains successful results, with null for failures") {
+          CHECK(actualVec.size() == 3);
+          CHECK(actualVec[0] == nullptr);
+          CHECK(actualVec[1] == nullptr);
+          CHECK(actualVec[2] == expectedValue2);
+        }
+      }
     }
   }
 }
@@ -413,3 +441,60 @@ TEMPLATE_TEST_CASE(
     }
   }
 }
+
+SCENARIO("Checking entity reference strings using a manager-provided prefix") {
+  namespace managerApi = openassetio::managerApi;
+  namespace hostApi = openassetio::hostApi;
+  using trompeloeil::_;
+
+  GIVEN("a Manager whose interface provides an entity reference prefix") {
+    const auto mockManagerInterfacePtr = std::make_shared<openassetio::MockManagerInterface>();
+    const auto mockLoggerPtr = std::make_shared<openassetio::MockLoggerInterface>();
+
+    const managerApi::HostSessionPtr hostSessionPtr = managerApi::HostSession::make(
+        managerApi::Host::make(std::make_shared<openassetio::MockHostInterface>()), mockLoggerPtr);
+
+    const hostApi::ManagerPtr manager =
+        hostApi::Manager::make(mockManagerInterfacePtr, hostSessionPtr);
+
+    const openassetio::InfoDictionary info{
+        {openassetio::constants::kField_EntityReferencesMatchPrefix,
+         openassetio::Str{"asset://"}}};
+    ALLOW_CALL(*mockManagerInterfacePtr, info()).RETURN(info);
+    ALLOW_CALL(*mockLoggerPtr, log(_, _));
+
+    AND_GIVEN("the Manager has been initialized") {
+      REQUIRE_CALL(*mockManagerInterfacePtr, initialize(_, hostSessionPtr));
+      manager->initialize({});
+
+      WHEN("strings are checked") {
+        FORBID_CALL(*mockManagerInterfacePtr, isEntityReferenceString(_, _));
+
+        THEN("strings starting with the prefix are entity references") {
+          CHECK(manager->isEntityReferenceString("asset://a"));
+          CHECK(manager->createEntityReferenceIfValid("asset://a").has_value());
+          CHECK(manager->createEntityReference("asset://a").toString() == "asset://a");
+        }
+
+        AND_THEN("other strings are not entity references") {
+          CHECK_FALSE(manager->isEntityReferenceString("asset:/"));
+          CHECK_FALSE(manager->isEntityReferenceString("other://a"));
+          CHECK_FALSE(manager->createEntityReferenceIfValid("other://a").has_value());
+          CHECK_THROWS_AS(manager->createEntityReference("other://a"), std::domain_error);
+        }
+      }
+    }
+
+    AND_GIVEN("the Manager has not been initialized") {
+      WHEN("a string is checked") {
+        REQUIRE_CALL(*mockManagerInterfacePtr,
+                     isEntityReferenceString("other://a", hostSessionPtr))
+            .RETURN(true);
+
+        THEN("the interface is consulted") {
+          CHECK(manager->isEntityReferenceString("other://a"));
+        }
+      }
+    }
+  }
+}
@@ -0,0 +1,17 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <pybind11/pybind11.h>
+
+#include <openassetio/CancellationToken.hpp>
+
+#include "_openassetio.hpp"
+
+void registerCancellationToken(const py::module& mod) {
+  using openassetio::CancellationToken;
+  using openassetio::CancellationTokenPtr;
+
+  py::class_<CancellationToken, CancellationTokenPtr>{mod, "CancellationToken", py::is_final()}
+      .def(py::init(&CancellationToken::make))
+      .def("cancel", &CancellationToken::cancel)
+      .def("isCancelled", &CancellationToken::isCancelled);
+}
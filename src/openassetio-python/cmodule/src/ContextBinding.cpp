@@ -3,6 +3,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include <openassetio/CancellationToken.hpp>
 #include <openassetio/Context.hpp>
 #include <openassetio/TraitsData.hpp>
 #include <openassetio/managerApi/ManagerStateBase.hpp>
@@ -50,6 +51,7 @@ void registerContext(const py::module& mod) {
           [](Context& self, PyRetainingManagerStateBasePtr managerState) {
             self.managerState = std::move(managerState);
           })
+      .def_readwrite("cancellationToken", &Context::cancellationToken)
       .def("isForRead", &Context::isForRead)
       .def("isForWrite", &Context::isForWrite)
       .def("isForMultiple", &Context::isForMultiple);
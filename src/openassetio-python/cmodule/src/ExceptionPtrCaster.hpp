@@ -0,0 +1,64 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#pragma once
+/**
+ * Defines a type caster for `std::exception_ptr`, allowing exceptions
+ * to be passed as values between C++ and Python, e.g. to an
+ * asynchronous completion callback.
+ */
+#include <exception>
+
+#include <pybind11/pybind11.h>
+
+namespace pybind11::detail {
+/**
+ * Custom type caster for `std::exception_ptr`.
+ *
+ * A null `exception_ptr` corresponds to `None`.
+ *
+ * C++ exceptions are converted to Python exceptions using the same
+ * translators as for exceptions thrown through a bound function, such
+ * that, e.g., a `std::invalid_argument` becomes a `ValueError`. A
+ * Python exception is captured in a `pybind11::error_already_set`, such
+ * that the original Python exception is restored if it propagates
+ * back to Python.
+ */
+template <>
+class type_caster<std::exception_ptr> {
+ public:
+  // NOLINTNEXTLINE
+  PYBIND11_TYPE_CASTER(std::exception_ptr, const_name("Optional[BaseException]"));
+
+  bool load(handle src, [[maybe_unused]] bool convert) {
+    if (src.is_none()) {
+      value = nullptr;
+      return true;
+    }
+    if (!PyExceptionInstance_Check(src.ptr())) {
+      return false;
+    }
+    PyErr_SetObject(PyExceptionInstance_Class(src.ptr()), src.ptr());
+    try {
+      throw error_already_set{};
+    } catch (...) {
+      value = std::current_exception();
+    }
+    return true;
+  }
+
+  static handle cast(const std::exception_ptr& src, [[maybe_unused]] return_value_policy policy,
+                     [[maybe_unused]] handle parent) {
+    if (!src) {
+      return none().release();
+    }
+    // Rethrow from within a bound function, so that the exception
+    // passes through the registered exception translators.
+    try {
+      cpp_function{[src] { std::rethrow_exception(src); }}();
+    } catch (error_already_set& exc) {
+      return exc.value().inc_ref();
+    }
+    return none().release();
+  }
+};
+}  // namespace pybind11::detail
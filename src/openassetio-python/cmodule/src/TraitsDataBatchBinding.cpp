@@ -0,0 +1,125 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <cstddef>
+#include <optional>
+#include <type_traits>
+#include <utility>
+#include <variant>
+#include <vector>
+
+#include <pybind11/stl.h>
+
+#include <openassetio/TraitsData.hpp>
+#include <openassetio/TraitsDataBatch.hpp>
+#include <openassetio/trait/collection.hpp>
+
+#include "_openassetio.hpp"
+
+namespace {
+using openassetio::TraitsDataBatch;
+
+/**
+ * Attempt to load a Python object as the given type, without implicit
+ * conversions.
+ */
+template <class T>
+std::optional<T> loadStrict(const py::handle& src) {
+  py::detail::make_caster<T> caster;
+  if (!caster.load(src, /*convert=*/false)) {
+    return {};
+  }
+  return py::detail::cast_op<T&&>(std::move(caster));
+}
+
+/**
+ * Convert a Python sequence of values to a typed column.
+ *
+ * Implicit conversions are disallowed so that, for example, a list of
+ * ints is not coerced to a column of bools.
+ */
+TraitsDataBatch::ColumnValues toColumnValues(const py::handle& values) {
+  if (auto bools = loadStrict<std::vector<openassetio::Bool>>(values)) {
+    return std::move(*bools);
+  }
+  if (auto ints = loadStrict<std::vector<openassetio::Int>>(values)) {
+    return std::move(*ints);
+  }
+  if (auto floats = loadStrict<std::vector<openassetio::Float>>(values)) {
+    return std::move(*floats);
+  }
+  if (auto strs = loadStrict<std::vector<openassetio::Str>>(values)) {
+    return std::move(*strs);
+  }
+  throw py::type_error{"Column values must all be of the same type: bool, int, float or str"};
+}
+
+/**
+ * Convert a typed column to a Python list, with `None` for unset
+ * values.
+ */
+py::list toList(const TraitsDataBatch::Column& column) {
+  return std::visit(
+      [&column](const auto& values) {
+        using ValueType = typename std::decay_t<decltype(values)>::value_type;
+        py::list list(values.size());
+        for (std::size_t idx = 0; idx < values.size(); ++idx) {
+          if (column.isSet[idx]) {
+            // Explicitly convert, since std::vector<bool> returns a
+            // proxy.
+            list[idx] = py::cast(static_cast<ValueType>(values[idx]));
+          } else {
+            list[idx] = py::none();
+          }
+        }
+        return list;
+      },
+      column.values);
+}
+}  // namespace
+
+void registerTraitsDataBatch(const py::module& mod) {
+  using openassetio::TraitsDataBatchPtr;
+  namespace trait = openassetio::trait;
+  namespace property = openassetio::trait::property;
+  using MaybeValue = std::optional<property::Value>;
+
+  py::class_<TraitsDataBatch, TraitsDataBatchPtr>(mod, "TraitsDataBatch", py::is_final())
+      .def(py::init(&TraitsDataBatch::make), py::arg("size"))
+      .def("size", &TraitsDataBatch::size)
+      .def("__len__", &TraitsDataBatch::size)
+      .def("traitSet", &TraitsDataBatch::traitSet)
+      .def("hasTrait", &TraitsDataBatch::hasTrait, py::arg("index"), py::arg("traitId"))
+      .def("addTrait", &TraitsDataBatch::addTrait, py::arg("index"), py::arg("traitId"))
+      .def("setTraitProperty", &TraitsDataBatch::setTraitProperty, py::arg("index"),
+           py::arg("traitId"), py::arg("propertyKey"), py::arg("propertyValue").none(false))
+      .def(
+          "getTraitProperty",
+          [](const TraitsDataBatch& self, const std::size_t index, const trait::TraitId& traitId,
+             const property::Key& propertyKey) -> MaybeValue {
+            if (property::Value out; self.getTraitProperty(&out, index, traitId, propertyKey)) {
+              return out;
+            }
+            return {};
+          },
+          py::arg("index"), py::arg("traitId"), py::arg("propertyKey"))
+      .def(
+          "setColumn",
+          [](TraitsDataBatch& self, const trait::TraitId& traitId,
+             const property::Key& propertyKey, const py::handle& values) {
+            self.setColumn(traitId, propertyKey, toColumnValues(values));
+          },
+          py::arg("traitId"), py::arg("propertyKey"), py::arg("values"))
+      .def(
+          "column",
+          [](const TraitsDataBatch& self, const trait::TraitId& traitId,
+             const property::Key& propertyKey) -> std::optional<py::list> {
+            if (const TraitsDataBatch::Column* column = self.column(traitId, propertyKey)) {
+              return toList(*column);
+            }
+            return {};
+          },
+          py::arg("traitId"), py::arg("propertyKey"))
+      .def("setError", &TraitsDataBatch::setError, py::arg("index"), py::arg("error"))
+      .def("error", &TraitsDataBatch::error, py::arg("index"))
+      .def("traitsData", &TraitsDataBatch::traitsData, py::arg("index"));
+}
@@ -10,6 +10,43 @@
 
 #include "_openassetio.hpp"
 
+namespace {
+/**
+ * Convert a Python dict of property keys to values.
+ *
+ * pybind11 will happily convert `None` to `false` when converting to a
+ * property value, so explicitly disallow it, in the same way as
+ * `.none(false)` for single property values.
+ */
+openassetio::TraitsData::TraitDict toTraitDict(const py::dict& properties) {
+  for (const auto& item : properties) {
+    if (item.second.is_none()) {
+      throw py::type_error{"Property values cannot be None"};
+    }
+  }
+  try {
+    return properties.cast<openassetio::TraitsData::TraitDict>();
+  } catch (const py::cast_error&) {
+    throw py::type_error{"Property values must be bool, int, float or str"};
+  }
+}
+
+/**
+ * Convert a Python dict of trait IDs to property dicts.
+ *
+ * See toTraitDict.
+ */
+openassetio::TraitsData::Dict toDict(const py::dict& dict) {
+  openassetio::TraitsData::Dict result;
+  result.reserve(dict.size());
+  for (const auto& item : dict) {
+    result.emplace(item.first.cast<openassetio::trait::TraitId>(),
+                   toTraitDict(item.second.cast<py::dict>()));
+  }
+  return result;
+}
+}  // namespace
+
 void registerTraitsData(const py::module& mod) {
   using openassetio::TraitsData;
   using openassetio::TraitsDataConstPtr;
@@ -24,6 +61,9 @@ void registerTraitsData(const py::module& mod) {
            py::arg("traitSet"))
       .def(py::init(static_cast<TraitsDataPtr (*)(const TraitsDataConstPtr&)>(&TraitsData::make)),
            py::arg("other"))
+      .def_static(
+          "fromDict", [](const py::dict& dict) { return TraitsData::fromDict(toDict(dict)); },
+          py::arg("dict"))
       .def("traitSet", &TraitsData::traitSet)
       .def("hasTrait", &TraitsData::hasTrait, py::arg("traitId"))
       .def("addTrait", &TraitsData::addTrait, py::arg("traitId"))
@@ -40,6 +80,30 @@ void registerTraitsData(const py::module& mod) {
             return {};
           },
           py::arg("traitId"), py::arg("propertyKey"))
+      .def("getTraitProperties", &TraitsData::getTraitProperties, py::arg("traitId"))
+      .def(
+          "setTraitProperties",
+          [](TraitsData& self, const trait::TraitId& traitId, const py::dict& properties) {
+            self.setTraitProperties(traitId, toTraitDict(properties));
+          },
+          py::arg("traitId"), py::arg("properties"))
+      .def(
+          "setProperties",
+          [](TraitsData& self, const py::dict& dict) { self.setProperties(toDict(dict)); },
+          py::arg("dict"))
+      .def("toDict", &TraitsData::toDict)
       .def("traitPropertyKeys", &TraitsData::traitPropertyKeys, py::arg("traitId"))
+      .def("traitProperties",
+           [](const TraitsData& self) {
+             // Gather in a single pass, rather than requiring a round
+             // trip through the bindings for each trait and property.
+             py::list triples;
+             self.forEachProperty([&triples](const trait::TraitId& traitId,
+                                             const property::Key& propertyKey,
+                                             const property::Value& propertyValue) {
+               triples.append(py::make_tuple(traitId, propertyKey, propertyValue));
+             });
+             return py::iter(triples);
+           })
       .def(py::self == py::self);  // NOLINT(misc-redundant-expression)
 }
@@ -18,17 +18,22 @@ PYBIND11_MODULE(_openassetio, mod) {
 
   registerLoggerInterface(log);
   registerConsoleLogger(log);
+  registerJsonLinesLogger(log);
   registerSeverityFilter(log);
+  registerAsyncLogger(log);
   registerTraitsData(mod);
   registerManagerStateBase(managerApi);
+  registerCancellationToken(mod);
   registerContext(mod);
   registerBatchElementError(mod);
+  registerTraitsDataBatch(mod);
   registerEntityReference(mod);
   registerHostInterface(hostApi);
   registerHost(managerApi);
   registerHostSession(managerApi);
   registerManagerInterface(managerApi);
   registerManagerImplementationFactoryInterface(hostApi);
+  registerManagerMetrics(hostApi);
   registerManager(hostApi);
   registerManagerFactory(hostApi);
 }
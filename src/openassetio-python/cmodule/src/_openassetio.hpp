@@ -47,9 +47,18 @@ void registerLoggerInterface(const py::module& mod);
 /// Register the ConsoleLogger class with Python.
 void registerConsoleLogger(const py::module& mod);
 
+/// Register the JsonLinesLogger class with Python.
+void registerJsonLinesLogger(const py::module& mod);
+
 /// Register the SeverityFilter class with Python.
 void registerSeverityFilter(const py::module& mod);
 
+/// Register the AsyncLogger class with Python.
+void registerAsyncLogger(const py::module& mod);
+
+/// Register the CancellationToken class with Python.
+void registerCancellationToken(const py::module& mod);
+
 /// Register the Context class with Python.
 void registerContext(const py::module& mod);
 
@@ -68,6 +77,9 @@ void registerManagerInterface(const py::module& mod);
 /// Register the ManagerImplementationFactoryInterface class with Python.
 void registerManagerImplementationFactoryInterface(const py::module& mod);
 
+/// Register the ManagerMetrics class with Python.
+void registerManagerMetrics(const py::module& mod);
+
 /// Register the Manager class with Python.
 void registerManager(const py::module& mod);
 
@@ -77,6 +89,9 @@ void registerManagerFactory(const py::module& mod);
 /// Register the TraitsData class with Python.
 void registerTraitsData(const py::module& mod);
 
+/// Register the TraitsDataBatch class with Python.
+void registerTraitsDataBatch(const py::module& mod);
+
 /// Register the ManagerStateBase class with Python.
 void registerManagerStateBase(const py::module& mod);
 
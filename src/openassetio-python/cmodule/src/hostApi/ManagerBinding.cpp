@@ -1,6 +1,11 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2022 The Foundry Visionmongers Ltd
 #include <algorithm>
+#include <exception>
+#include <memory>
+#include <utility>
+#include <variant>
+#include <vector>
 
 #include <pybind11/functional.h>
 #include <pybind11/stl.h>
@@ -8,13 +13,62 @@
 #include <openassetio/BatchElementError.hpp>
 #include <openassetio/Context.hpp>
 #include <openassetio/TraitsData.hpp>
+#include <openassetio/TraitsDataBatch.hpp>
 #include <openassetio/hostApi/Manager.hpp>
 #include <openassetio/managerApi/HostSession.hpp>
 #include <openassetio/managerApi/ManagerInterface.hpp>
 #include <openassetio/trait/collection.hpp>
 
+#include "../ExceptionPtrCaster.hpp"
 #include "../_openassetio.hpp"
 
+namespace {
+using openassetio::BatchElementError;
+using openassetio::ContextConstPtr;
+using openassetio::EntityReferences;
+using openassetio::TraitsDataPtr;
+using openassetio::hostApi::Manager;
+
+/**
+ * Issue a non-blocking resolve, returning a Python
+ * `concurrent.futures.Future` that will hold the result.
+ *
+ * The result is as for the equivalent blocking `resolve` overload,
+ * depending on the supplied error policy tag.
+ */
+template <class ErrorPolicyTag>
+py::object resolveAsyncToPyFuture(Manager& self, const EntityReferences& entityReferences,
+                                  const openassetio::trait::TraitSet& traitSet,
+                                  const ContextConstPtr& context,
+                                  const ErrorPolicyTag& errorPolicyTag) {
+  // The future is resolved from whichever thread completes the
+  // request, so must only be released with the GIL held.
+  const std::shared_ptr<py::object> future{
+      new py::object{py::module_::import("concurrent.futures").attr("Future")()},
+      [](py::object* obj) {
+        const py::gil_scoped_acquire gil{};
+        // NOLINTNEXTLINE(cppcoreguidelines-owning-memory)
+        delete obj;
+      }};
+  // Mark as running, so the host cannot cancel it.
+  future->attr("set_running_or_notify_cancel")();
+
+  {
+    const py::gil_scoped_release release{};
+    self.resolveAsync(entityReferences, traitSet, context, errorPolicyTag,
+                      [future](auto results, std::exception_ptr exception) {
+                        const py::gil_scoped_acquire gil{};
+                        if (exception) {
+                          future->attr("set_exception")(exception);
+                        } else {
+                          future->attr("set_result")(std::move(results));
+                        }
+                      });
+  }
+  return *future;
+}
+}  // namespace
+
 void registerManager(const py::module& mod) {
   namespace trait = openassetio::trait;
   using openassetio::ContextConstPtr;
@@ -26,6 +80,14 @@ void registerManager(const py::module& mod) {
   using openassetio::managerApi::HostSessionPtr;
   using openassetio::managerApi::ManagerInterfacePtr;
 
+  // Release the GIL for the duration of calls through to the manager.
+  // Trampolines for Python-implemented ManagerInterface (and logger,
+  // etc) methods, as well as Python callbacks wrapped in
+  // `std::function`, re-acquire the GIL only when entering Python.
+  // This allows other Python threads to make progress whilst a C++
+  // manager is busy, e.g. waiting on a remote asset database.
+  using ReleaseGil = py::call_guard<py::gil_scoped_release>;
+
   py::class_<Manager, ManagerPtr> pyManager{mod, "Manager"};
 
   // BatchElementErrorPolicy tags for tag dispatch overload resolution
@@ -38,51 +100,64 @@ void registerManager(const py::module& mod) {
   // NOLINTNEXTLINE(bugprone-unused-raii)
   py::class_<Manager::BatchElementErrorPolicyTag::Variant>{pyBatchElementErrorPolicyTag,
                                                            "Variant"};
+  // NOLINTNEXTLINE(bugprone-unused-raii)
+  py::class_<Manager::BatchElementErrorPolicyTag::Collect>{pyBatchElementErrorPolicyTag,
+                                                           "Collect"};
+  // NOLINTNEXTLINE(bugprone-unused-raii)
+  py::class_<Manager::BatchElementErrorPolicyTag::Skip>{pyBatchElementErrorPolicyTag, "Skip"};
 
   pyBatchElementErrorPolicyTag
       .def_readonly_static("kException", &Manager::BatchElementErrorPolicyTag::kException)
-      .def_readonly_static("kVariant", &Manager::BatchElementErrorPolicyTag::kVariant);
+      .def_readonly_static("kVariant", &Manager::BatchElementErrorPolicyTag::kVariant)
+      .def_readonly_static("kCollect", &Manager::BatchElementErrorPolicyTag::kCollect)
+      .def_readonly_static("kSkip", &Manager::BatchElementErrorPolicyTag::kSkip);
 
   pyManager
       .def(py::init(RetainCommonPyArgs::forFn<&Manager::make>()),
            py::arg("managerInterface").none(false), py::arg("hostSession").none(false))
-      .def("identifier", &Manager::identifier)
-      .def("displayName", &Manager::displayName)
-      .def("info", &Manager::info)
-      .def("settings", &Manager::settings)
-      .def("initialize", &Manager::initialize, py::arg("managerSettings"))
+      .def("identifier", &Manager::identifier, ReleaseGil{})
+      .def("displayName", &Manager::displayName, ReleaseGil{})
+      .def("info", &Manager::info, ReleaseGil{})
+      .def("settings", &Manager::settings, ReleaseGil{})
+      .def("initialize", &Manager::initialize, py::arg("managerSettings"), ReleaseGil{})
       .def("managementPolicy", &Manager::managementPolicy, py::arg("traitSets"),
-           py::arg("context").none(false))
-      .def("createContext", &Manager::createContext)
+           py::arg("context").none(false), ReleaseGil{})
+      .def("createContext", &Manager::createContext, ReleaseGil{})
       .def("createChildContext", &Manager::createChildContext,
-           py::arg("parentContext").none(false))
+           py::arg("parentContext").none(false), ReleaseGil{})
       .def("persistenceTokenForContext", &Manager::persistenceTokenForContext,
-           py::arg("context").none(false))
-      .def("contextFromPersistenceToken", &Manager::contextFromPersistenceToken, py::arg("token"))
-      .def("isEntityReferenceString", &Manager::isEntityReferenceString, py::arg("someString"))
+           py::arg("context").none(false), ReleaseGil{})
+      .def("contextFromPersistenceToken", &Manager::contextFromPersistenceToken, py::arg("token"),
+           ReleaseGil{})
+      .def("isEntityReferenceString", &Manager::isEntityReferenceString, py::arg("someString"),
+           ReleaseGil{})
       .def("createEntityReference", &Manager::createEntityReference,
-           py::arg("entityReferenceString"))
+           py::arg("entityReferenceString"), ReleaseGil{})
       .def("createEntityReferenceIfValid", &Manager::createEntityReferenceIfValid,
-           py::arg("entityReferenceString"))
+           py::arg("entityReferenceString"), ReleaseGil{})
+      .def("isEntityReferenceStrings", &Manager::isEntityReferenceStrings, py::arg("someStrings"),
+           ReleaseGil{})
+      .def("createEntityReferencesIfValid", &Manager::createEntityReferencesIfValid,
+           py::arg("entityReferenceStrings"), ReleaseGil{})
       .def("resolve",
            static_cast<void (Manager::*)(
                const EntityReferences&, const trait::TraitSet&, const ContextConstPtr&,
                const Manager::ResolveSuccessCallback&, const Manager::BatchElementErrorCallback&)>(
                &Manager::resolve),
            py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
-           py::arg("successCallback"), py::arg("errorCallback"))
+           py::arg("successCallback"), py::arg("errorCallback"), ReleaseGil{})
       .def("resolve",
            static_cast<TraitsDataPtr (Manager::*)(
                const EntityReference&, const trait::TraitSet&, const ContextConstPtr&,
                const Manager::BatchElementErrorPolicyTag::Exception&)>(&Manager::resolve),
            py::arg("entityReference"), py::arg("traitSet"), py::arg("context").none(false),
-           py::arg("errorPolicyTag"))
+           py::arg("errorPolicyTag"), ReleaseGil{})
       .def("resolve",
            static_cast<std::variant<TraitsDataPtr, openassetio::BatchElementError> (Manager::*)(
                const EntityReference&, const trait::TraitSet&, const ContextConstPtr&,
                const Manager::BatchElementErrorPolicyTag::Variant&)>(&Manager::resolve),
            py::arg("entityReference"), py::arg("traitSet"), py::arg("context").none(false),
-           py::arg("errorPolicyTag"))
+           py::arg("errorPolicyTag"), ReleaseGil{})
       .def(
           "resolve",
           // TODO(DF): Technically we shouldn't need this overload,
@@ -94,20 +169,34 @@ void registerManager(const py::module& mod) {
              const trait::TraitSet& traitSet, const ContextConstPtr& context) {
             return self.resolve(entityReference, traitSet, context);
           },
-          py::arg("entityReference"), py::arg("traitSet"), py::arg("context").none(false))
+          py::arg("entityReference"), py::arg("traitSet"), py::arg("context").none(false),
+          ReleaseGil{})
       .def("resolve",
            static_cast<std::vector<TraitsDataPtr> (Manager::*)(
                const EntityReferences&, const trait::TraitSet&, const ContextConstPtr&,
                const Manager::BatchElementErrorPolicyTag::Exception&)>(&Manager::resolve),
            py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
-           py::arg("errorPolicyTag"))
+           py::arg("errorPolicyTag"), ReleaseGil{})
       .def(
           "resolve",
           static_cast<std::vector<std::variant<TraitsDataPtr, openassetio::BatchElementError>> (
               Manager::*)(const EntityReferences&, const trait::TraitSet&, const ContextConstPtr&,
                           const Manager::BatchElementErrorPolicyTag::Variant&)>(&Manager::resolve),
           py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
-          py::arg("errorPolicyTag"))
+          py::arg("errorPolicyTag"), ReleaseGil{})
+      .def(
+          "resolve",
+          static_cast<std::pair<std::vector<TraitsDataPtr>, Manager::IndexedBatchElementErrors> (
+              Manager::*)(const EntityReferences&, const trait::TraitSet&, const ContextConstPtr&,
+                          const Manager::BatchElementErrorPolicyTag::Collect&)>(&Manager::resolve),
+          py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
+          py::arg("errorPolicyTag"), ReleaseGil{})
+      .def("resolve",
+           static_cast<std::vector<TraitsDataPtr> (Manager::*)(
+               const EntityReferences&, const trait::TraitSet&, const ContextConstPtr&,
+               const Manager::BatchElementErrorPolicyTag::Skip&)>(&Manager::resolve),
+           py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
+           py::arg("errorPolicyTag"), ReleaseGil{})
       .def(
           "resolve",
           // TODO(DF): Technically we shouldn't need this overload,
@@ -119,9 +208,54 @@ void registerManager(const py::module& mod) {
              const trait::TraitSet& traitSet, const ContextConstPtr& context) {
             return self.resolve(entityReferences, traitSet, context);
           },
+          py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
+          ReleaseGil{})
+      .def("resolveToBatch", &Manager::resolveToBatch, py::arg("entityReferences"),
+           py::arg("traitSet"), py::arg("context").none(false), ReleaseGil{})
+      .def("resolveAsync",
+           static_cast<void (Manager::*)(
+               const EntityReferences&, const trait::TraitSet&, const ContextConstPtr&,
+               const Manager::ResolveSuccessCallback&, const Manager::BatchElementErrorCallback&,
+               const Manager::AsyncCompletionCallback&)>(&Manager::resolveAsync),
+           py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
+           py::arg("successCallback"), py::arg("errorCallback"), py::arg("completionCallback"),
+           ReleaseGil{})
+      .def(
+          "resolveAsync",
+          [](Manager& self, const EntityReferences& entityReferences,
+             const trait::TraitSet& traitSet, const ContextConstPtr& context,
+             const Manager::BatchElementErrorPolicyTag::Exception& errorPolicyTag) {
+            return resolveAsyncToPyFuture(self, entityReferences, traitSet, context,
+                                          errorPolicyTag);
+          },
+          py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
+          py::arg("errorPolicyTag"))
+      .def(
+          "resolveAsync",
+          [](Manager& self, const EntityReferences& entityReferences,
+             const trait::TraitSet& traitSet, const ContextConstPtr& context,
+             const Manager::BatchElementErrorPolicyTag::Variant& errorPolicyTag) {
+            return resolveAsyncToPyFuture(self, entityReferences, traitSet, context,
+                                          errorPolicyTag);
+          },
+          py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false),
+          py::arg("errorPolicyTag"))
+      .def(
+          "resolveAsync",
+          [](Manager& self, const EntityReferences& entityReferences,
+             const trait::TraitSet& traitSet, const ContextConstPtr& context) {
+            return resolveAsyncToPyFuture(self, entityReferences, traitSet, context,
+                                          Manager::BatchElementErrorPolicyTag::kException);
+          },
           py::arg("entityReferences"), py::arg("traitSet"), py::arg("context").none(false))
+      .def("setResolveConcurrency", &Manager::setResolveConcurrency, py::arg("maxThreads"),
+           py::arg("chunkSize"))
+      .def("setResolveCacheCapacity", &Manager::setResolveCacheCapacity, py::arg("capacity"))
+      .def("flushResolveCache", &Manager::flushResolveCache)
+      .def("metrics", &Manager::metrics, py::return_value_policy::reference_internal)
       .def("preflight", &Manager::preflight, py::arg("entityReferences"), py::arg("traitSet"),
-           py::arg("context").none(false), py::arg("successCallback"), py::arg("errorCallback"))
+           py::arg("context").none(false), py::arg("successCallback"), py::arg("errorCallback"),
+           ReleaseGil{})
       .def(
           "register",
           [](Manager& self, const EntityReferences& entityReferences,
@@ -139,7 +273,8 @@ void registerManager(const py::module& mod) {
                            errorCallback);
           },
           py::arg("entityReferences"), py::arg("entityTraitsDatas"),
-          py::arg("context").none(false), py::arg("successCallback"), py::arg("errorCallback"))
+          py::arg("context").none(false), py::arg("successCallback"), py::arg("errorCallback"),
+          ReleaseGil{})
       // @todo Remove one C++ API matches Python, and we remove ManagerFactory.py
       .def("_interface", &Manager::_interface)
       .def("_hostSession", &Manager::_hostSession);
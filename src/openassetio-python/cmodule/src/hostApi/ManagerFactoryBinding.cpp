@@ -31,6 +31,13 @@ void registerManagerFactory(const py::module& mod) {
       .def_readwrite("info", &ManagerFactory::ManagerDetail::info)
       .def(py::self == py::self);  // NOLINT(misc-redundant-expression)
 
+  py::class_<ManagerFactory::DefaultManagerConfig>(managerFactory, "DefaultManagerConfig")
+      .def(py::init<openassetio::Identifier, openassetio::InfoDictionary>(), py::arg("identifier"),
+           py::arg("settings"))
+      .def_readwrite("identifier", &ManagerFactory::DefaultManagerConfig::identifier)
+      .def_readwrite("settings", &ManagerFactory::DefaultManagerConfig::settings)
+      .def(py::self == py::self);  // NOLINT(misc-redundant-expression)
+
   managerFactory.def("availableManagers", &ManagerFactory::availableManagers)
       .def_readonly_static("kDefaultManagerConfigEnvVarName",
                            &ManagerFactory::kDefaultManagerConfigEnvVarName)
@@ -44,5 +51,14 @@ void registerManagerFactory(const py::module& mod) {
                   RetainCommonPyArgs::forFn<&ManagerFactory::defaultManagerForInterface>(),
                   py::arg("hostInterface").none(false),
                   py::arg("managerImplementationFactory").none(false),
-                  py::arg("logger").none(false));
+                  py::arg("logger").none(false))
+      .def_static("loadDefaultManagerConfig", &ManagerFactory::loadDefaultManagerConfig,
+                  py::arg("path"), py::call_guard<py::gil_scoped_release>{})
+      .def_static("clearDefaultManagerConfigCache",
+                  &ManagerFactory::clearDefaultManagerConfigCache)
+      .def_static("setDefaultManagerPooling", &ManagerFactory::setDefaultManagerPooling,
+                  py::arg("enabled"))
+      .def_static("defaultManagerPooling", &ManagerFactory::defaultManagerPooling)
+      .def_static("clearDefaultManagerPool", &ManagerFactory::clearDefaultManagerPool,
+                  py::call_guard<py::gil_scoped_release>{});
 }
@@ -1,7 +1,10 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <optional>
+
 #include <pybind11/stl.h>
 
+#include <openassetio/hostApi/ManagerFactory.hpp>
 #include <openassetio/hostApi/ManagerImplementationFactoryInterface.hpp>
 #include <openassetio/log/LoggerInterface.hpp>
 #include <openassetio/managerApi/ManagerInterface.hpp>
@@ -32,6 +35,12 @@ struct PyManagerImplementationFactoryInterface : ManagerImplementationFactoryInt
                            ManagerImplementationFactoryInterface, instantiate, identifier);
   }
 
+  [[nodiscard]] std::optional<ManagerFactory::ManagerDetail> managerDetail(
+      const Identifier& identifier) override {
+    PYBIND11_OVERRIDE(std::optional<ManagerFactory::ManagerDetail>,
+                      ManagerImplementationFactoryInterface, managerDetail, identifier);
+  }
+
   using ManagerImplementationFactoryInterface::logger_;
 };
 
@@ -53,5 +62,7 @@ void registerManagerImplementationFactoryInterface(const py::module& mod) {
       .def("identifiers", &ManagerImplementationFactoryInterface::identifiers)
       .def("instantiate", &ManagerImplementationFactoryInterface::instantiate,
            py::arg("identifier"))
+      .def("managerDetail", &ManagerImplementationFactoryInterface::managerDetail,
+           py::arg("identifier"))
       .def_readonly("_logger", &PyManagerImplementationFactoryInterface::logger_);
 }
@@ -0,0 +1,42 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include <openassetio/hostApi/ManagerMetrics.hpp>
+
+#include "../_openassetio.hpp"
+
+void registerManagerMetrics(const py::module& mod) {
+  using openassetio::hostApi::ManagerMetrics;
+
+  py::class_<ManagerMetrics> managerMetrics{mod, "ManagerMetrics", py::is_final()};
+
+  py::enum_<ManagerMetrics::Method>{managerMetrics, "Method"}
+      .value("kResolve", ManagerMetrics::Method::kResolve)
+      .value("kPreflight", ManagerMetrics::Method::kPreflight)
+      .value("kRegister", ManagerMetrics::Method::kRegister)
+      .value("kManagementPolicy", ManagerMetrics::Method::kManagementPolicy)
+      .value("kIsEntityReferenceString", ManagerMetrics::Method::kIsEntityReferenceString)
+      .value("kCreateContext", ManagerMetrics::Method::kCreateContext)
+      .value("kCreateChildContext", ManagerMetrics::Method::kCreateChildContext)
+      .value("kPersistenceTokenForContext", ManagerMetrics::Method::kPersistenceTokenForContext)
+      .value("kContextFromPersistenceToken", ManagerMetrics::Method::kContextFromPersistenceToken)
+      .value("kResolveAsync", ManagerMetrics::Method::kResolveAsync);
+
+  py::class_<ManagerMetrics::MethodMetrics>{managerMetrics, "MethodMetrics"}
+      .def_readonly("callCount", &ManagerMetrics::MethodMetrics::callCount)
+      .def_readonly("exceptionCount", &ManagerMetrics::MethodMetrics::exceptionCount)
+      .def_readonly("totalLatencyNs", &ManagerMetrics::MethodMetrics::totalLatencyNs)
+      .def_readonly("batchSizeHistogram", &ManagerMetrics::MethodMetrics::batchSizeHistogram)
+      .def_readonly("latencyNsHistogram", &ManagerMetrics::MethodMetrics::latencyNsHistogram)
+      .def("errorCount", &ManagerMetrics::MethodMetrics::errorCount, py::arg("code"));
+
+  managerMetrics.def_readonly_static("kMethodNames", &ManagerMetrics::kMethodNames)
+      .def_readonly_static("kNumHistogramBuckets", &ManagerMetrics::kNumHistogramBuckets)
+      .def_static("histogramBucket", &ManagerMetrics::histogramBucket, py::arg("value"))
+      .def("setEnabled", &ManagerMetrics::setEnabled, py::arg("enabled"))
+      .def("isEnabled", &ManagerMetrics::isEnabled)
+      .def("methodMetrics", &ManagerMetrics::methodMetrics, py::arg("method"))
+      .def("reset", &ManagerMetrics::reset);
+}
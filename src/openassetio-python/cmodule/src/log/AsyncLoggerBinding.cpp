@@ -0,0 +1,57 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <cstddef>
+#include <memory>
+#include <utility>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include <openassetio/log/AsyncLogger.hpp>
+
+#include "../PyRetainingSharedPtr.hpp"
+#include "../_openassetio.hpp"
+
+void registerAsyncLogger(const py::module& mod) {
+  using openassetio::PyRetainingSharedPtr;
+  using openassetio::log::AsyncLogger;
+  using openassetio::log::AsyncLoggerPtr;
+  using openassetio::log::LoggerInterface;
+
+  // Flushing blocks on the background thread, which may itself be
+  // waiting on the GIL in order to call a Python upstream logger.
+  using ReleaseGil = py::call_guard<py::gil_scoped_release>;
+
+  py::class_<AsyncLogger, LoggerInterface, AsyncLoggerPtr> asyncLogger{mod, "AsyncLogger",
+                                                                       py::is_final()};
+
+  py::enum_<AsyncLogger::OverflowPolicy>{asyncLogger, "OverflowPolicy"}
+      .value("kDropNewest", AsyncLogger::OverflowPolicy::kDropNewest)
+      .value("kDropOldest", AsyncLogger::OverflowPolicy::kDropOldest);
+
+  asyncLogger.def_readonly_static("kDefaultCapacity", &AsyncLogger::kDefaultCapacity)
+      .def(py::init([](PyRetainingSharedPtr<LoggerInterface> upstreamLogger,
+                       const std::size_t capacity,
+                       const AsyncLogger::OverflowPolicy overflowPolicy) {
+             AsyncLoggerPtr logger =
+                 AsyncLogger::make(std::move(upstreamLogger), capacity, overflowPolicy);
+             // Destruction blocks until the background thread has
+             // drained the queue, so must not hold the GIL.
+             return AsyncLoggerPtr{logger.get(), [logger](AsyncLogger*) mutable {
+                                     if (PyGILState_Check()) {
+                                       const py::gil_scoped_release gilRelease{};
+                                       logger.reset();
+                                     } else {
+                                       logger.reset();
+                                     }
+                                   }};
+           }),
+           py::arg("upstreamLogger").none(false),
+           py::arg("capacity") = AsyncLogger::kDefaultCapacity,
+           py::arg("overflowPolicy") = AsyncLogger::OverflowPolicy::kDropNewest)
+      .def("upstreamLogger", &AsyncLogger::upstreamLogger)
+      .def("capacity", &AsyncLogger::capacity)
+      .def("overflowPolicy", &AsyncLogger::overflowPolicy)
+      .def("droppedCount", &AsyncLogger::droppedCount)
+      .def("flush", &AsyncLogger::flush, ReleaseGil{});
+}
@@ -0,0 +1,19 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include <openassetio/log/JsonLinesLogger.hpp>
+
+#include "../_openassetio.hpp"
+
+void registerJsonLinesLogger(const py::module& mod) {
+  using openassetio::log::JsonLinesLogger;
+  using openassetio::log::JsonLinesLoggerPtr;
+  using openassetio::log::LoggerInterface;
+
+  py::class_<JsonLinesLogger, LoggerInterface, JsonLinesLoggerPtr>(mod, "JsonLinesLogger",
+                                                                   py::is_final())
+      .def(py::init(&JsonLinesLogger::make), py::arg("path"))
+      .def("path", &JsonLinesLogger::path);
+}
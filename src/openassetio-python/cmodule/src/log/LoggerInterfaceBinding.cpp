@@ -1,5 +1,10 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2022 The Foundry Visionmongers Ltd
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <utility>
+
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
@@ -19,16 +24,26 @@ struct PyLoggerInterface : LoggerInterface {
   void log(Severity severity, const Str& message) override {
     PYBIND11_OVERRIDE_PURE(void, LoggerInterface, log, severity, message);
   }
+
+  [[nodiscard]] bool isSeverityLogged(Severity severity) const override {
+    PYBIND11_OVERRIDE(bool, LoggerInterface, isSeverityLogged, severity);
+  }
+
+  void logRecord(const LogRecord& record) override {
+    PYBIND11_OVERRIDE(void, LoggerInterface, logRecord, record);
+  }
 };
 }  // namespace log
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
 
 void registerLoggerInterface(const py::module& mod) {
+  using openassetio::BatchElementError;
   using openassetio::Float;
   using openassetio::Str;
   using openassetio::log::LoggerInterface;
   using openassetio::log::LoggerInterfacePtr;
+  using openassetio::log::LogRecord;
   using openassetio::log::PyLoggerInterface;
 
   py::class_<LoggerInterface, PyLoggerInterface, LoggerInterfacePtr> loggerInterface{
@@ -46,7 +61,12 @@ void registerLoggerInterface(const py::module& mod) {
   loggerInterface.def_readonly_static("kSeverityNames", &LoggerInterface::kSeverityNames);
 
   loggerInterface.def(py::init())
-      .def("log", &LoggerInterface::log, py::arg("severity"), py::arg("message"))
+      .def("log",
+           static_cast<void (LoggerInterface::*)(LoggerInterface::Severity, const Str&)>(
+               &LoggerInterface::log),
+           py::arg("severity"), py::arg("message"))
+      .def("isSeverityLogged", &LoggerInterface::isSeverityLogged, py::arg("severity"))
+      .def("logRecord", &LoggerInterface::logRecord, py::arg("record"))
       .def("debugApi", &LoggerInterface::debugApi, py::arg("message"))
       .def("debug", &LoggerInterface::debug, py::arg("message"))
       .def("info", &LoggerInterface::info, py::arg("message"))
@@ -54,4 +74,27 @@ void registerLoggerInterface(const py::module& mod) {
       .def("warning", &LoggerInterface::warning, py::arg("message"))
       .def("error", &LoggerInterface::error, py::arg("message"))
       .def("critical", &LoggerInterface::critical, py::arg("message"));
+
+  py::class_<LogRecord>{mod, "LogRecord"}
+      .def(py::init([](LoggerInterface::Severity severity, Str message, Str method,
+                       Str managerIdentifier, std::optional<std::size_t> batchSize,
+                       std::optional<std::int64_t> durationNs,
+                       std::optional<BatchElementError::ErrorCode> errorCode,
+                       std::optional<std::int64_t> timestampNs) {
+             return LogRecord{
+                 severity,  std::move(message), std::move(method), std::move(managerIdentifier),
+                 batchSize, durationNs,         errorCode,         timestampNs};
+           }),
+           py::arg("severity") = LoggerInterface::Severity::kInfo, py::arg("message") = Str{},
+           py::arg("method") = Str{}, py::arg("managerIdentifier") = Str{},
+           py::arg("batchSize") = std::nullopt, py::arg("durationNs") = std::nullopt,
+           py::arg("errorCode") = std::nullopt, py::arg("timestampNs") = std::nullopt)
+      .def_readwrite("severity", &LogRecord::severity)
+      .def_readwrite("message", &LogRecord::message)
+      .def_readwrite("method", &LogRecord::method)
+      .def_readwrite("managerIdentifier", &LogRecord::managerIdentifier)
+      .def_readwrite("batchSize", &LogRecord::batchSize)
+      .def_readwrite("durationNs", &LogRecord::durationNs)
+      .def_readwrite("errorCode", &LogRecord::errorCode)
+      .def_readwrite("timestampNs", &LogRecord::timestampNs);
 }
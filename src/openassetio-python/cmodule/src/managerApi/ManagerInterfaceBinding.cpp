@@ -6,12 +6,14 @@
 #include <openassetio/Context.hpp>
 #include <openassetio/InfoDictionary.hpp>
 #include <openassetio/TraitsData.hpp>
+#include <openassetio/TraitsDataBatch.hpp>
 #include <openassetio/managerApi/HostSession.hpp>
 #include <openassetio/managerApi/ManagerInterface.hpp>
 #include <openassetio/managerApi/ManagerStateBase.hpp>
 #include <openassetio/trait/collection.hpp>
 #include <openassetio/typedefs.hpp>
 
+#include "../ExceptionPtrCaster.hpp"
 #include "../_openassetio.hpp"
 
 namespace openassetio {
@@ -82,6 +84,12 @@ struct PyManagerInterface : ManagerInterface {
                            hostSession);
   }
 
+  [[nodiscard]] std::vector<bool> isEntityReferenceStrings(
+      const std::vector<Str>& someStrings, const HostSessionPtr& hostSession) const override {
+    PYBIND11_OVERRIDE(std::vector<bool>, ManagerInterface, isEntityReferenceStrings, someStrings,
+                      hostSession);
+  }
+
   void resolve(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
                const ContextConstPtr& context, const HostSessionPtr& hostSession,
                const ResolveSuccessCallback& successCallback,
@@ -90,6 +98,22 @@ struct PyManagerInterface : ManagerInterface {
                            hostSession, successCallback, errorCallback);
   }
 
+  void resolveToBatch(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+                      const ContextConstPtr& context, const HostSessionPtr& hostSession,
+                      const TraitsDataBatchPtr& results) override {
+    PYBIND11_OVERRIDE(void, ManagerInterface, resolveToBatch, entityReferences, traitSet, context,
+                      hostSession, results);
+  }
+
+  bool resolveAsync(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
+                    const ContextConstPtr& context, const HostSessionPtr& hostSession,
+                    const ResolveSuccessCallback& successCallback,
+                    const BatchElementErrorCallback& errorCallback,
+                    const AsyncCompletionCallback& completionCallback) override {
+    PYBIND11_OVERRIDE(bool, ManagerInterface, resolveAsync, entityReferences, traitSet, context,
+                      hostSession, successCallback, errorCallback, completionCallback);
+  }
+
   void preflight(const EntityReferences& entityReferences, const trait::TraitSet& traitSet,
                  const ContextConstPtr& context, const HostSessionPtr& hostSession,
                  const PreflightSuccessCallback& successCallback,
@@ -140,9 +164,17 @@ void registerManagerInterface(const py::module& mod) {
            py::arg("token"), py::arg("hostSession").none(false))
       .def("isEntityReferenceString", &ManagerInterface::isEntityReferenceString,
            py::arg("someString"), py::arg("hostSession").none(false))
+      .def("isEntityReferenceStrings", &ManagerInterface::isEntityReferenceStrings,
+           py::arg("someStrings"), py::arg("hostSession").none(false))
       .def("resolve", &ManagerInterface::resolve, py::arg("entityReferences"), py::arg("traitSet"),
            py::arg("context").none(false), py::arg("hostSession").none(false),
            py::arg("successCallback"), py::arg("errorCallback"))
+      .def("resolveToBatch", &ManagerInterface::resolveToBatch, py::arg("entityReferences"),
+           py::arg("traitSet"), py::arg("context").none(false), py::arg("hostSession").none(false),
+           py::arg("results").none(false))
+      .def("resolveAsync", &ManagerInterface::resolveAsync, py::arg("entityReferences"),
+           py::arg("traitSet"), py::arg("context").none(false), py::arg("hostSession").none(false),
+           py::arg("successCallback"), py::arg("errorCallback"), py::arg("completionCallback"))
       .def("preflight", &ManagerInterface::preflight, py::arg("entityReferences"),
            py::arg("traitSet"), py::arg("context").none(false), py::arg("hostSession").none(false),
            py::arg("successCallback"), py::arg("errorCallback"))
@@ -73,6 +73,8 @@ The documentation for OpenAssetIO can be found here:
 # TODO(DF): @pylint
 from ._openassetio import (  # pylint: disable=import-error
     TraitsData,
+    TraitsDataBatch,
+    CancellationToken,
     Context,
     EntityReference,
     BatchElementError,
@@ -35,6 +35,7 @@ __all__ = [
     "auditApiCall",
     "auditCalls",
     "captureArgs",
+    "recordApiCall",
     "reprArgs",
     "Auditor",
 ]
@@ -44,16 +45,18 @@ __all__ = [
 # This module permits auditing of the use of the various API calls during a
 # series of operations.
 # @envvar **OPENASSETIO_AUDIT** *int* [0] If non-zero API calls will be
-# audited by default
+# audited by default. Auditing can also be enabled at runtime for a
+# specific object, see @ref openassetio._core.debug.Debuggable.setAuditCallsEnabled
 # @envvar **OPENASSETIO_AUDIT_ARGS** *int* [0] If non-zero args will be
 # captured during audit, if auditing is disabled, this has no effect.
 
 ## Will hold the singleton Auditor object
 __auditor = None
 
-## When set to True, decorated calls will be audited. When False, minimal
-## additional code is run, to minimize performance impact. This should always
-## be False by default.
+## When set to True, auditing is enabled for new Debuggable instances,
+## and static functions decorated thereafter are audited. When False, no
+## additional code is run, to minimize performance impact. This should
+## always be False by default.
 auditCalls = os.environ.get("OPENASSETIO_AUDIT", "0") != "0"
 
 ## If True, the args for each invocation of a function will be recorded, to
@@ -104,17 +107,23 @@ def auditCall(function):
 
 def auditApiCall(group=None, static=False):
     """
-    A decorator to log a method as long as auditCalls is True, parsing
-    the methods args and kwargs with an understanding of the various
-    objects used in the openassetio. This of this as being analogous to
-    'stateful packet inspection'.
-
-    If auditCalls is False, functions will not be wrapped so docstrings
-    are not obfuscated and the call stack isn't bloated. Because
-    wrapping happens when the Class is parsed, for auditing to ever be
-    enabled, it has to be set by the environment variable so that it's
-    true before other classes are loaded from their modules. Otherwise,
-    its too late to turn it on once the import has completed.
+    A decorator to log a method, parsing the methods args and kwargs
+    with an understanding of the various objects used in the
+    openassetio. This of this as being analogous to 'stateful packet
+    inspection'.
+
+    Methods are not wrapped, so docstrings are not obfuscated, the call
+    stack isn't bloated, and there is no overhead when auditing is
+    disabled. Instead, they are marked such that calls are audited on
+    any instance of a @ref openassetio._core.debug.Debuggable
+    "Debuggable" class that has auditing enabled, which can be done at
+    runtime via @ref openassetio._core.debug.Debuggable.setAuditCallsEnabled
+    "setAuditCallsEnabled". If auditCalls is True when an instance is
+    constructed, auditing is enabled for it by default.
+
+    Static functions have no instance to enable auditing on, so are
+    instead wrapped when decorated, as long as auditCalls is True at
+    that time.
 
     @param group str, an optional group name to log the call under @ref
     Auditor.addMethod
@@ -125,6 +134,10 @@ def auditApiCall(group=None, static=False):
 
     def _wrapAuditApiCall(function):
 
+        if not static:
+            function.auditApiCallGroup = group
+            return function
+
         # We deliberately don't wrap the function if its disabled as it
         # a) obfuscates docstrings
         # b) adds unnecessarily to the call stack
@@ -133,22 +146,8 @@ def auditApiCall(group=None, static=False):
 
         @functools.wraps(function)
         def _auditApiCall(*args, **kwargs):
-
             if auditCalls:
-                sharedAuditor = auditor()
-
-                instance = None
-                if not static and args:
-                    instance = args[0]
-
-                arg = __prepareArgs(args if static else args[1:], kwargs)
-                sharedAuditor.addMethod(function, obj=instance, group=group, arg=arg)
-
-                for arg in args:
-                    __auditObj(sharedAuditor, arg)
-                for arg in kwargs.values():
-                    __auditObj(sharedAuditor, arg)
-
+                recordApiCall(function, None, group, args, kwargs)
             return function(*args, **kwargs)
 
         # Store the original function on the method for other decorators
@@ -199,6 +198,34 @@ def __auditObj(aud, obj):
             aud.addClass(obj.locale, group="Locales")
 
 
+def recordApiCall(function, instance, group, args, kwargs):
+    """
+    Records a call to a function decorated with @ref auditApiCall in
+    the shared Auditor.
+
+    @param function The decorated function.
+
+    @param instance The instance the function was called on, or None
+    for static functions.
+
+    @param group str, The group given to @ref auditApiCall.
+
+    @param args tuple, The positional args of the call, excluding the
+    instance.
+
+    @param kwargs dict, The keyword args of the call.
+    """
+    sharedAuditor = auditor()
+
+    arg = __prepareArgs(args, kwargs)
+    sharedAuditor.addMethod(function, obj=instance, group=group, arg=arg)
+
+    for arg in args:
+        __auditObj(sharedAuditor, arg)
+    for arg in kwargs.values():
+        __auditObj(sharedAuditor, arg)
+
+
 def __prepareArgs(args, kwargs):
     arg = None
 
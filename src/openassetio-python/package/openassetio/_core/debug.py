@@ -14,101 +14,238 @@
 #   limitations under the License.
 #
 """@namespace openassetio._core.debug
-Assorted decorators to help with API development. For the sake of
-optimisation, and help(fn) still making sense, then they may be disabled
-by default.
+Assorted decorators to help with API development.
 
-@envvar **OPENASSETIO_DEBUG** *int* [1] when non-zero, debug decorators
-will be enabled, allowing API calls to be monitored and timed using the
-kDebug and kDebugApi logging severity displays
+@envvar **OPENASSETIO_DEBUG** *int* [0] when non-zero, debug tracing
+of decorated calls is enabled by default for new Debuggable instances,
+allowing API calls to be monitored and timed using the kDebug and
+kDebugApi logging severity displays.
 
 In order to use these decorators the target class must derive from
-Debuggable, and have its `_debugLogFn` set to an callable that matches
-the @fqref{log.LoggerInterface.log} "LoggerInterface.log" signature. This
+Debuggable. The decorators do not wrap the decorated methods, so have
+no cost when tracing is disabled. Instead, debug tracing and auditing
+(see @ref openassetio._core.audit.auditApiCall "auditApiCall") can be
+enabled at runtime for a specific instance, using
+@ref Debuggable.setDebugCallsEnabled and
+@ref Debuggable.setAuditCallsEnabled. Only then is that instance
+switched to a subclass whose decorated methods are wrapped.
+
+When debug tracing is enabled, the target class should have its
+`_debugLogFn` set to an callable that matches the
+@fqref{log.LoggerInterface.log} "LoggerInterface.log" signature. This
 callback will be used to output debug information. If no callback is
 set, no debug output will be produced.
 
-@todo The current logging implementation doesn't have any global
-'display severity' concept (for good reasons), this has precluded any of
-the optimisations we used to make earlying-out when we're at kInfo or
-less. Once we port this implementation to cpp, then we may wish to
-adjust how we enable/disable this functionality to avoid any unwanted
-overhead per-call.
+The target class may also set `_debugIsSeverityLoggedFn` to a callable
+that matches the @fqref{log.LoggerInterface.isSeverityLogged}
+"LoggerInterface.isSeverityLogged" signature. If set, calls are only
+traced if it returns `True` for the tracing severity, avoiding the cost
+of formatting arguments and results that would be discarded.
+
+Alternatively, or additionally, the target class may set `_debugLogger`
+to a @fqref{log.LoggerInterface} "LoggerInterface". Trace messages are
+then logged to it, along with a @fqref{log.LogRecord} "LogRecord" as
+each call returns, carrying the method name, manager identifier, batch
+size, call duration and any batch element error code as
+machine-readable fields. When no `_debugIsSeverityLoggedFn` is set, the
+logger's `isSeverityLogged` is consulted instead.
 """
 
 # For private decorator implementation methods
 # pylint: disable=invalid-name
 
 import functools
+import inspect
 import os
 import time
+import types
 
-from ..log import LoggerInterface
+from .._openassetio import BatchElementException  # pylint: disable=no-name-in-module
+from ..log import LoggerInterface, LogRecord
+from . import audit
 
 
 __all__ = ["debugCall", "debugApiCall", "Debuggable"]
 
-enableDebugDecorators = os.environ.get("OPENASSETIO_DEBUG", "1") != "0"
+## When set to True, debug tracing is enabled for new Debuggable
+## instances.
+debugCalls = os.environ.get("OPENASSETIO_DEBUG", "0") != "0"
 
 
 class Debuggable:
     """
-    A base class for any objects that you with to make use of the debug
-    decorators with.
+    A base class for any objects that you wish to make use of the debug
+    and audit decorators with.
+
+    Tracing is enabled per instance. When enabled, the instance's
+    class is switched to a subclass that wraps each decorated method.
+    The subclass is created on first use and shared by all instances
+    with the same tracing enabled. When disabled, the original class is
+    restored, such that calls go directly to the undecorated method.
+    Unlike wrappers stored on the instance, this doesn't create a
+    reference cycle, so instances are still freed as soon as they are
+    no longer referenced.
     """
 
-    ## If enabled, decorated calls on the object will be logged
+    ## If enabled, traced calls on the object will be logged
     _debugCalls = True
     ## Set to a callable that matches @ref openassetio.log.LoggerInterface.log
     _debugLogFn = None
+    ## Set to a callable that matches
+    ## @ref openassetio.log.LoggerInterface.isSeverityLogged
+    _debugIsSeverityLoggedFn = None
+    ## Set to an @ref openassetio.log.LoggerInterface to receive trace
+    ## messages and a structured @ref openassetio.log.LogRecord for
+    ## each call
+    _debugLogger = None
+
+    __debugCallsEnabled = False
+    __auditCallsEnabled = False
+
+    def __init__(self):
+        if debugCalls or audit.auditCalls:
+            self.__debugCallsEnabled = debugCalls
+            self.__auditCallsEnabled = audit.auditCalls
+            self.__updateDispatch()
+
+    def setDebugCallsEnabled(self, enabled):
+        """
+        Enables or disables debug tracing of this object's decorated
+        methods.
+
+        @param enabled `bool` The new enabled state.
+        """
+        self.__debugCallsEnabled = bool(enabled)
+        self.__updateDispatch()
+
+    def debugCallsEnabled(self):
+        """
+        @return `bool` Whether debug tracing is enabled.
+        """
+        return self.__debugCallsEnabled
+
+    def setAuditCallsEnabled(self, enabled):
+        """
+        Enables or disables auditing of this object's decorated methods,
+        using the shared @ref openassetio._core.audit.Auditor "Auditor".
+
+        @param enabled `bool` The new enabled state.
+        """
+        self.__auditCallsEnabled = bool(enabled)
+        self.__updateDispatch()
+
+    def auditCallsEnabled(self):
+        """
+        @return `bool` Whether auditing is enabled.
+        """
+        return self.__auditCallsEnabled
+
+    def __updateDispatch(self):
+        cls = _untracedClasses.get(type(self), type(self))
+        cls = _tracedClass(cls, self.__debugCallsEnabled, self.__auditCallsEnabled)
+        if self.__class__ is not cls:
+            self.__class__ = cls
 
 
 def debugCall(function):
     """
     Use as a decorator to trace usage of the decorated function though
-    the kDebug logging severity. This should only be used on bound
-    methods.
+    the kDebug logging severity. This should only be used on methods of
+    a Debuggable class.
     """
+    function.debugCallSeverity = LoggerInterface.Severity.kDebug
+    return function
 
-    # Early out if we're not enabled
-    if not enableDebugDecorators:
-        return function
 
-    # Because some of our decorators get chained, let see if we have the
-    # original function, otherwise we just log the decorator, which is
-    # useful to neither man nor beast (only our decorators bother to set this).
-    debugFn = function
-    if hasattr(function, "func_wrapped"):
-        debugFn = function.func_wrapped
+def debugApiCall(function):
+    """
+    Use as a decorator to trace usage of the decorated API functions
+    through the kDebugApi logging severity. This should only be used on
+    methods of a Debuggable class.
+    """
+    function.debugCallSeverity = LoggerInterface.Severity.kDebugApi
+    return function
 
-    @functools.wraps(function)
-    def _debugCall(*args, **kwargs):
-        return __debugCall(function, debugFn, LoggerInterface.Severity.kDebug, *args, **kwargs)
 
-    return _debugCall
+## Decorated methods of each Debuggable class, found on first use.
+_tracedMethodsByClass = {}
 
 
-def debugApiCall(function):
+def _tracedMethods(cls):
     """
-    Use as a decorator to trace usage of the decorated API functions
-    through the kDebugApi logging severity. This should only be used on
-    bound methods.
+    Returns a list of `(name, function)` pairs for the methods of the
+    given class that are decorated for debugging or auditing.
     """
-    # See notes in debugCall
+    methods = _tracedMethodsByClass.get(cls)
+    if methods is None:
+        methods = []
+        for name in dir(cls):
+            attr = inspect.getattr_static(cls, name, None)
+            if isinstance(attr, types.FunctionType) and (
+                hasattr(attr, "debugCallSeverity") or hasattr(attr, "auditApiCallGroup")
+            ):
+                methods.append((name, attr))
+        _tracedMethodsByClass[cls] = methods
+    return methods
+
 
-    # Early out if we're not enabled
-    if not enableDebugDecorators:
-        return function
+## Traced subclasses, keyed on the original class and the enabled
+## tracing, created on first use.
+_tracedClasses = {}
 
-    debugFn = function
-    if hasattr(function, "func_wrapped"):
-        debugFn = function.func_wrapped
+## The original class of each traced subclass.
+_untracedClasses = {}
+
+
+def _tracedClass(cls, debugEnabled, auditEnabled):
+    """
+    Returns the subclass of the given class that wraps its decorated
+    methods for the given tracing, or the class itself if none of its
+    methods are traced.
+    """
+    key = (cls, debugEnabled, auditEnabled)
+    tracedCls = _tracedClasses.get(key)
+    if tracedCls is None:
+        namespace = {}
+        for name, function in _tracedMethods(cls):
+            dispatch = _makeDispatch(cls, function, debugEnabled, auditEnabled)
+            if dispatch is not None:
+                namespace[name] = dispatch
+        if namespace:
+            namespace["__module__"] = cls.__module__
+            namespace["__qualname__"] = cls.__qualname__
+            tracedCls = type(cls)(cls.__name__, (cls,), namespace)
+            _untracedClasses[tracedCls] = cls
+        else:
+            tracedCls = cls
+        _tracedClasses[key] = tracedCls
+    return tracedCls
+
+
+def _makeDispatch(cls, function, debugEnabled, auditEnabled):
+    """
+    Returns a method that traces calls to the given method of the given
+    class, or None if no tracing is enabled for the method.
+    """
+    severity = getattr(function, "debugCallSeverity", None) if debugEnabled else None
+    auditing = auditEnabled and hasattr(function, "auditApiCallGroup")
+
+    if severity is None and not auditing:
+        return None
+
+    group = getattr(function, "auditApiCallGroup", None)
 
     @functools.wraps(function)
-    def _debugApiCall(*args, **kwargs):
-        return __debugCall(function, debugFn, LoggerInterface.Severity.kDebugApi, *args, **kwargs)
+    def _dispatch(self, *args, **kwargs):
+        if auditing:
+            # Record against the original class, rather than the
+            # traced subclass.
+            audit.recordApiCall(function, cls, group, args, kwargs)
+        if severity is not None:
+            return __debugCall(function, function, severity, self, *args, **kwargs)
+        return function(self, *args, **kwargs)
 
-    return _debugApiCall
+    return _dispatch
 
 
 def __debugCall(function, traceFn, severity, self, *args, **kwargs):
@@ -126,28 +263,84 @@ def __debugCall(function, traceFn, severity, self, *args, **kwargs):
 
     # Debugging can be disabled on-the-fly if the object has a _debugCalls
     # attribute who's value casts to False
-    enabled = self._debugCalls and self._debugLogFn is not None
-    if not enabled:
+    if not __isTraceEnabled(self, severity):
         return function(self, *args, **kwargs)
 
+    logFn = self._debugLogFn
+    logger = self._debugLogger
+
     allArgs = [repr(a) for a in args]
     allArgs.extend(["%s=%r" % (k, v) for k, v in kwargs.items()])
 
     msg = "-> %x %r.%s( %s )" % (id(self), self, traceFn.__name__, ", ".join(allArgs))
-    self._debugLogFn(msg, severity)
+    if logFn is not None:
+        logFn(msg, severity)
+    if logger is not None:
+        logger.log(severity, msg)
 
     result = "<exception>"
+    errorCode = None
     timer = _Timer()
     try:
         with timer:
             result = function(self, *args, **kwargs)
+    except BatchElementException as exc:
+        errorCode = exc.error.code
+        raise
     finally:
         msg = "<- %x %r.%s [%s] %r" % (id(self), self, traceFn.__name__, timer, result)
-        self._debugLogFn(msg, severity)
+        if logFn is not None:
+            logFn(msg, severity)
+        if logger is not None:
+            __logRecord(logger, self, traceFn, severity, args, timer, errorCode, msg)
 
     return result
 
 
+def __isTraceEnabled(obj, severity):
+    """
+    Determines whether calls to the given Debuggable should be traced at
+    the given severity.
+    """
+    # pylint: disable=protected-access
+    logger = obj._debugLogger
+    if not obj._debugCalls or (obj._debugLogFn is None and logger is None):
+        return False
+    isSeverityLoggedFn = obj._debugIsSeverityLoggedFn
+    if isSeverityLoggedFn is None and logger is not None:
+        isSeverityLoggedFn = logger.isSeverityLogged
+    if isSeverityLoggedFn is not None:
+        return isSeverityLoggedFn(severity)
+    return True
+
+
+def __logRecord(logger, obj, traceFn, severity, args, timer, errorCode, msg):
+    """
+    Emits a structured LogRecord for a traced call to the given logger.
+    """
+    logger.logRecord(
+        LogRecord(
+            severity=severity,
+            message=msg,
+            method=traceFn.__name__,
+            managerIdentifier=__managerIdentifier(obj),
+            batchSize=len(args[0]) if args and isinstance(args[0], list) else None,
+            durationNs=timer.intervalNs(),
+            errorCode=errorCode,
+        )
+    )
+
+
+def __managerIdentifier(obj):
+    identifierFn = getattr(obj, "identifier", None)
+    if identifierFn is None:
+        return ""
+    try:
+        return identifierFn()
+    except Exception:  # pylint: disable=broad-except
+        return ""
+
+
 class _Timer(object):
     """
     A simple timer object that can be used, for, er, timing things from
@@ -160,11 +353,22 @@ class _Timer(object):
         self.end = None
 
     def __enter__(self):
-        self.start = time.time()
+        self.start = time.perf_counter_ns()
         return self
 
     def __exit__(self, *args):
-        self.end = time.time()
+        self.end = time.perf_counter_ns()
+
+    def intervalNs(self):
+        """
+        Returns the interval of time the timer ran for, in nanoseconds.
+        If the timer is still running, then it will report the interval
+        to the time the method was called.
+
+        @return `int` The time interval in nanoseconds.
+        """
+        end = self.end if self.end is not None else time.perf_counter_ns()
+        return end - self.start
 
     def interval(self):
         """
@@ -172,10 +376,9 @@ class _Timer(object):
         is still running, then it will report the interval to the
         time the method was called.
 
-        @return `float` The time interval as per `time.time()`
+        @return `float` The time interval in seconds.
         """
-        end = self.end if self.end is not None else time.time()
-        return end - self.start
+        return self.intervalNs() / 1e9
 
     def __str__(self):
         return "%.05fs" % self.interval()
@@ -49,6 +49,15 @@ kField_Icon = "icon"
 ## called from multi-threaded C++).
 kField_EntityReferencesMatchPrefix = "entityReferencesMatchPrefix"
 
+# Threading
+
+## This field may be set to `True` by a manager to declare that its
+## implementation is safe to call concurrently from multiple threads.
+## This allows the API to dispatch large batches to the manager in
+## parallel. See @fqref{hostApi.Manager.setResolveConcurrency}
+## "Manager.setResolveConcurrency".
+kField_IsThreadSafe = "isThreadSafe"
+
 # Files
 
 kField_FilePath = "path"
@@ -24,6 +24,8 @@ A single-class module, providing the Manager class.
 # implementations more complicated.
 # pylint: disable=too-many-public-methods
 
+import queue
+
 from openassetio import _openassetio  # pylint: disable=no-name-in-module
 
 from .._core.debug import debugApiCall, Debuggable
@@ -57,6 +59,14 @@ class Manager(_openassetio.hostApi.Manager, Debuggable):
 
     The Manager API is threadsafe and can be called from multiple
     threads concurrently.
+
+    Calls to the Python API methods of a specific Manager can be
+    traced at runtime, e.g. whilst diagnosing an issue in a running
+    session. `setDebugCallsEnabled(True)` logs each call, and its
+    result and duration, to the host session's logger at the
+    `kDebugApi` severity. `setAuditCallsEnabled(True)` counts calls in
+    the shared @ref openassetio._core.audit.Auditor "Auditor". Tracing
+    is disabled by default, and has no overhead when disabled.
     """
 
     def __init__(self, interfaceInstance, hostSession):
@@ -75,13 +85,16 @@ class Manager(_openassetio.hostApi.Manager, Debuggable):
         """
 
         _openassetio.hostApi.Manager.__init__(self, interfaceInstance, hostSession)
-        Debuggable.__init__(self)
 
         self.__impl = interfaceInstance
         self.__hostSession = hostSession
 
         # This can be set to false, to disable API debugging at the per-class level
         self._debugCalls = True
+        # Debug tracing, when enabled, is logged to the host's logger
+        self._debugLogger = hostSession.logger()
+
+        Debuggable.__init__(self)
 
     def __str__(self):
         return self.__impl.identifier()
@@ -147,8 +160,12 @@ class Manager(_openassetio.hostApi.Manager, Debuggable):
         interfaces, this should cause any retained data to be discarded
         to ensure future queries are fresh.
 
+        This also discards any results cached by the host-side resolve
+        cache, see @ref setResolveCacheCapacity.
+
         @unstable
         """
+        self.flushResolveCache()
         return self.__impl.flushCaches(self.__hostSession)
 
     ## @}
@@ -199,6 +216,120 @@ class Manager(_openassetio.hostApi.Manager, Debuggable):
 
     ## @}
 
+    ##
+    # @name Entity Resolution
+    #
+    # @{
+
+    @debugApiCall
+    @auditApiCall("Manager methods")
+    def iterResolve(self, entityReferences, traitSet, context):
+        """
+        Resolves a batch of @ref entity_reference "entity references",
+        returning an iterator that yields each result as soon as the
+        manager provides it.
+
+        This allows a host to start processing the first results of a
+        large batch, e.g. loading the first frames of an image
+        sequence, whilst the remainder are still being resolved.
+
+        The request is issued immediately, using @ref resolveAsync, so
+        the manager works on it in the background whether or not the
+        iterator is being consumed.
+
+        Results are yielded in the order the manager provides them,
+        which is not necessarily the order of `entityReferences`.
+        Exceptions that fail the whole batch are raised from the
+        iterator.
+
+        Iteration can be stopped early by cancelling the context's
+        @fqref{Context.cancellationToken} "cancellationToken". If the
+        context doesn't have a token, a copy of the context is given
+        one, which is cancelled if the iterator is closed (e.g. by
+        breaking out of a `for` loop, or garbage collection) before the
+        manager has finished. A token supplied by the host is never
+        cancelled on its behalf, since it may be shared with other
+        requests.
+
+        The copy shares the context's `managerState`, so results cached
+        by the resolve cache (see @ref setResolveCacheCapacity) with
+        `kSession` or `kPermanent` retention are still re-used. However,
+        `kTransient` results are only cached against a specific Context
+        instance, so results previously cached using the host's context
+        are not re-used, and results resolved by this call are cached
+        against the copy. Supply a context with a token to share
+        `kTransient` results with other requests using that context.
+
+        Cancellation is cooperative. Managers that poll the token can
+        skip the remaining elements. If the manager doesn't support
+        non-blocking resolution, and concurrent resolution has been
+        enabled using @ref setResolveConcurrency, then no further
+        chunks are dispatched once the token is cancelled. Otherwise,
+        the manager resolves the whole batch in the background, and
+        the remaining results are discarded.
+
+        @param entityReferences `List[` @fqref{EntityReference}
+        "EntityReference" `]` Entity references to query.
+
+        @param traitSet `Set[str]` The trait IDs to resolve for the
+        supplied list of entity references.
+
+        @param context Context The calling context.
+
+        @return `Iterator[Tuple[int, Union[` @fqref{TraitsData}
+        "TraitsData", @fqref{BatchElementError} "BatchElementError"
+        `]]]` The index of each entity reference in `entityReferences`,
+        along with either its resolved data, or the error that
+        prevented it from being resolved.
+
+        @unstable
+        """
+        ownsToken = context.cancellationToken is None
+        if ownsToken:
+            context = _openassetio.Context(
+                context.access, context.retention, context.locale, context.managerState
+            )
+            context.cancellationToken = _openassetio.CancellationToken()
+
+        results = queue.SimpleQueue()
+
+        def onSuccess(index, traitsData):
+            results.put((index, traitsData))
+
+        def onError(index, batchElementError):
+            results.put((index, batchElementError))
+
+        def onCompletion(exception):
+            results.put((None, exception))
+
+        self.resolveAsync(entityReferences, traitSet, context, onSuccess, onError, onCompletion)
+        return self.__yieldResults(results, context.cancellationToken, ownsToken)
+
+    @staticmethod
+    def __yieldResults(results, cancellationToken, ownsToken):
+        """
+        Yield resolve results from the given queue until the request is
+        complete or cancelled.
+
+        If `ownsToken` is set, the token is cancelled if the request is
+        abandoned before completion.
+        """
+        completed = False
+        try:
+            while not cancellationToken.isCancelled():
+                index, result = results.get()
+                if index is None:
+                    completed = True
+                    if result is not None:
+                        raise result
+                    return
+                yield index, result
+        finally:
+            if ownsToken and not completed:
+                cancellationToken.cancel()
+
+    ## @}
+
     ##
     # @name Entity Retrieval
     #
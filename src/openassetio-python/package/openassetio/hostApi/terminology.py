@@ -21,6 +21,7 @@ user-facing components.
 """
 
 from .._core.audit import auditApiCall
+from .._core.debug import Debuggable
 
 
 ## @namespace openassetio.hostApi.terminology
@@ -63,7 +64,7 @@ defaultTerminology = {
 }
 
 
-class Mapper:
+class Mapper(Debuggable):
     """
     The Mapper class provides string substitution methods and lookups to
     determine the correct terminology for the supplied @ref manager.
@@ -92,6 +93,7 @@ class Mapper:
         # As we take a copy, the default of the shared
         # dict isn't dangerous.
         # pylint: disable=dangerous-default-value
+        Debuggable.__init__(self)
         self.__terminology = dict(terminology)
         self.__updateTerminology(manager)
 
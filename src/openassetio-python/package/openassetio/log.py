@@ -22,5 +22,8 @@ from . import _openassetio  # pylint: disable=no-name-in-module
 
 
 LoggerInterface = _openassetio.log.LoggerInterface
+LogRecord = _openassetio.log.LogRecord
 ConsoleLogger = _openassetio.log.ConsoleLogger
+JsonLinesLogger = _openassetio.log.JsonLinesLogger
 SeverityFilter = _openassetio.log.SeverityFilter
+AsyncLogger = _openassetio.log.AsyncLogger
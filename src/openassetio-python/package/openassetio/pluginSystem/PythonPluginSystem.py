@@ -18,13 +18,18 @@
 A single-class module, providing the PythonPluginSystem class.
 """
 
+import concurrent.futures
+import functools
 import os.path
 import importlib.util
 import hashlib
+import json
 import sys
+import threading
 import traceback
 
 from .. import exceptions
+from ..log import LoggerInterface
 
 
 __all__ = ["PythonPluginSystem"]
@@ -38,22 +43,68 @@ class PythonPluginSystem(object):
     registered with its identifier. Once a plug-in has registered an
     identifier, any subsequent registrations with that id will be
     skipped.
+
+    Optionally, a persistent index of the plugins found under each
+    search path can be maintained on disk. Module files whose
+    modification time and size match those recorded in the index are
+    not imported during @ref scan. Instead their plugin is registered
+    using the identifier recorded in the index, and the module is only
+    imported when that plugin is first requested through @ref plugin.
+    If a `metadataFn` is supplied, the metadata it returns for each
+    plugin is recorded in the index too, along with that of deferred
+    entry point plugins once loaded, so that it can be retrieved via
+    @ref metadata without importing the plugin.
+
+    @note The index is keyed on the file that defines the plugin (the
+    module itself, or a package's `__init__.py`). Changes to other
+    files within a package that affect the plugin's identifier will not
+    be detected.
+
+    @note Once scanned, @ref plugin and @ref metadata may be called
+    concurrently. Deferred plugins are imported without holding any
+    lock other than one specific to that plugin.
     """
 
     __validModuleExtensions = (".py", ".pyc")
 
-    def __init__(self, logger):
+    ## Version of the on-disk index format. Indexes with any other
+    ## version are discarded.
+    kIndexVersion = 1
+
+    def __init__(self, logger, indexPath=None, metadataFn=None):
+        """
+        @param logger @fqref{log.LoggerInterface} "LoggerInterface"
+        used to output information about plugin loading.
+
+        @param indexPath `str` Optional path to a file used to persist
+        the plugin index between sessions. If not set, all candidate
+        modules are imported during @ref scan.
+
+        @param metadataFn `Callable[[type], dict]` Optional function
+        returning JSON-serializable metadata for a plugin class, see
+        @ref metadata.
+        """
         self.__logger = logger
+        self.__index = _PluginIndex(indexPath, logger) if indexPath is not None else None
+        self.__metadataFn = metadataFn
+        # Guards state modified when loading deferred plugins. Never
+        # held whilst importing.
+        self.__lock = threading.Lock()
         self.reset()
 
     def reset(self):
         """
         Clears any previously loaded plugins.
+
+        The on-disk index, if any, is not affected.
         """
+        # Maps identifier to plugin class, or to a _DeferredPlugin if
+        # it has not yet been imported.
         self.__map = {}
         self.__paths = {}
+        self.__metadata = {}
 
-    def scan(self, paths):
+    def scan(self, paths, parallel=False):
         """
         Searches the supplied paths for modules that define a
         PythonPluginSystemPlugin through a top-level `plugin` variable.
@@ -63,52 +114,54 @@ class PythonPluginSystem(object):
         registrations ignored. This means entries to the left of the
         paths list take precedence over ones to the right.
 
+        If an index path was provided on construction, modules that are
+        unchanged since they were last indexed are not imported, and
+        the index is updated with any new or modified modules.
+
         @note Precedence order is undefined for plugins sharing the
         same identifier within the same directory.
 
         @param paths `str` A list of paths to search, delimited by
         `os.pathsep`.
-        """
-        self.__logger.debug(f"PythonPluginSystem: Searching {paths}")
-
-        for path in paths.split(os.pathsep):
-
-            if not os.path.isdir(path):
-                self.__logger.debug(f"PythonPluginSystem: Skipping as not a directory {path}")
 
-            for item in os.listdir(path):
-
-                itemPath = os.path.join(path, item)
-
-                if os.path.isdir(itemPath):
-                    # The directory could be a package, check for __init__.py
-                    initFile = os.path.join(itemPath, "__init__.py")
-                    if os.path.exists(initFile):
-                        itemPath = initFile
-                    else:
-                        self.__logger.debug(
-                            "PythonPluginSystem: Ignoring as it is not a python package "
-                            f"contianing __init__.py {itemPath}"
-                        )
-                        continue
-                else:
-                    # Its a file, check if it is a .py/.pyc module
-                    _, ext = os.path.splitext(itemPath)
-                    if ext not in self.__validModuleExtensions:
-                        self.__logger.debug(
-                            f"PythonPluginSystem: Ignoring as its not a python module {itemPath}"
-                        )
-                        continue
+        @param parallel `bool` If True, the directories are listed, and
+        candidate modules are stat'd and their code loaded (from cached
+        bytecode where valid), concurrently using a pool of threads.
+        This can be significantly faster when the paths are on a
+        network file system. Modules are still executed and registered
+        serially, in precedence order.
+        """
+        self.__debug("PythonPluginSystem: Searching %s", paths)
 
-                self.__logger.debug(f"PythonPluginSystem: Attempting to load {itemPath}")
+        searchPaths = paths.split(os.pathsep)
 
-                self.__load(itemPath)
+        if parallel:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                self.__scanPaths(searchPaths, executor.map, precompile=True)
+        else:
+            self.__scanPaths(searchPaths, map, precompile=False)
 
     def scan_entry_points(self, entryPointName):
         """
         Searches packages for entry points that define a
         PythonPluginSystemPlugin through a top-level `plugin` variable.
 
+        Entry points that reference a module are imported immediately,
+        in order to query the identifier of its plugin.
+
+        Alternatively, an entry point can declare the plugin's
+        identifier as its name, and reference the plugin class itself
+        using the `module:attribute` form, e.g.
+
+        @code{.toml}
+        [project.entry-points."openassetio.manager_plugin"]
+        "org.my.manager" = "my_manager_plugin:plugin"
+        @endcode
+
+        Such plugins are registered without importing their package.
+        The package is imported when the plugin is first requested via
+        @ref plugin.
+
         @note The order of discovery is determined by `importlib`, only
         the first plugin with any given identifier will be registered.
 
@@ -133,13 +186,23 @@ class PythonPluginSystem(object):
             )
             return False
 
-        self.__logger.debug(
-            f"PythonPluginSystem: Searching packages for '{entryPointName}' entry points."
+        self.__debug(
+            "PythonPluginSystem: Searching packages for '%s' entry points.", entryPointName
         )
 
         for entryPoint in importlib_metadata.entry_points(group=entryPointName):
 
-            self.__logger.debug(f"PythonPluginSystem: Found entry point in {entryPoint.name}")
+            self.__debug("PythonPluginSystem: Found entry point in %s", entryPoint.name)
+
+            if entryPoint.attr:
+                self.__registerDeferred(
+                    entryPoint.name,
+                    entryPoint.value,
+                    functools.partial(self.__loadEntryPoint, entryPoint),
+                    self.__indexedEntryPointMetadata(entryPoint),
+                )
+                continue
+
             try:
                 module = entryPoint.load()
             except Exception:  # pylint: disable=broad-except
@@ -167,7 +230,8 @@ class PythonPluginSystem(object):
 
         @return `List[str]`
         """
-        return list(self.__map.keys())
+        with self.__lock:
+            return list(self.__map.keys())
 
     def plugin(self, identifier):
         """
@@ -177,14 +241,45 @@ class PythonPluginSystem(object):
         "PythonPluginSystemPlugin"
 
         @exception openassetio.exceptions.PluginError Raised if no
-        plugin provides the specified identifier.
+        plugin provides the specified identifier, or a plugin registered
+        without being imported fails to load.
         """
 
-        if identifier not in self.__map:
-            msg = "PythonPluginSystem: No plug-in registered with the identifier '%s'" % identifier
-            raise exceptions.PluginError(msg)
+        with self.__lock:
+            cls = self.__registered(identifier)
 
-        return self.__map[identifier]
+        if isinstance(cls, _DeferredPlugin):
+            cls = self.__loadDeferred(identifier, cls)
+
+        return cls
+
+    def metadata(self, identifier):
+        """
+        Retrieves the metadata for the plugin that provides the given
+        identifier, as returned by the `metadataFn` supplied on
+        construction.
+
+        If the plugin has not yet been imported, metadata recorded in
+        the index is used if available, otherwise the plugin is loaded
+        as per @ref plugin.
+
+        @return `dict` or None if no `metadataFn` was supplied.
+
+        @exception openassetio.exceptions.PluginError Raised as per
+        @ref plugin.
+        """
+        with self.__lock:
+            self.__registered(identifier)
+            metadata = self.__metadata.get(identifier)
+
+        if self.__metadataFn is None:
+            return None
+
+        if metadata is None:
+            metadata = self.__metadataFn(self.plugin(identifier))
+            with self.__lock:
+                self.__metadata[identifier] = metadata
+        return metadata
 
     def register(self, cls, path="<unknown>"):
         """
@@ -203,57 +298,654 @@ class PythonPluginSystem(object):
         """
         identifier = cls.identifier()
         if identifier in self.__map:
-            self.__logger.debug(
-                f"PythonPluginSystem: Skipping class '{cls}' defined in '{path}'. "
-                f"Already registered by '{self.__paths[identifier]}'"
+            self.__debug(
+                "PythonPluginSystem: Skipping class '%s' defined in '%s'. "
+                "Already registered by '%s'",
+                cls,
+                path,
+                self.__paths[identifier],
             )
             return
 
-        self.__logger.debug(f"PythonPluginSystem: Registered plug-in '{cls}' from '{path}'")
+        self.__debug("PythonPluginSystem: Registered plug-in '%s' from '%s'", cls, path)
 
         self.__map[identifier] = cls
         self.__paths[identifier] = path
 
-    def __load(self, path):
+    def __debug(self, message, *args):
+        """
+        Logs a debug message, only formatting it with `args` (as per
+        the `%` operator) if debug messages will be logged.
+        """
+        if self.__logger.isSeverityLogged(LoggerInterface.Severity.kDebug):
+            self.__logger.debug(message % args if args else message)
+
+    def __scanPaths(self, searchPaths, mapFn, precompile):
+        """
+        Loads or registers the plugins found in the supplied paths.
+
+        @param searchPaths `List[str]` Directories to search, in
+        precedence order.
+
+        @param mapFn `Callable` A `map`-like function used to dispatch
+        filesystem access, which may do so concurrently. Results are
+        consumed in order, so precedence is unaffected.
+
+        @param precompile `bool` Whether to load the code of candidate
+        modules as part of the filesystem access.
+        """
+        indexChanged = False
+
+        previousPathIndexes = [
+            self.__index.pathEntries(path) if self.__index is not None else {}
+            for path in searchPaths
+        ]
+        scanned = self.__prepareCandidates(searchPaths, previousPathIndexes, mapFn, precompile)
+
+        for path, (candidates, messages, prepared), previousPathIndex in zip(
+            searchPaths, scanned, previousPathIndexes
+        ):
+            for message in messages:
+                self.__debug(message)
+
+            pathIndex = self.__registerCandidates(path, candidates, prepared, previousPathIndex)
+
+            # Entries are rebuilt for each directory as it is scanned,
+            # so that those for removed modules are discarded.
+            if self.__index is not None:
+                self.__index.setPathEntries(path, pathIndex)
+                if pathIndex != previousPathIndex:
+                    indexChanged = True
+
+        if indexChanged:
+            self.__index.write()
+
+    def __prepareCandidates(self, searchPaths, previousPathIndexes, mapFn, precompile):
+        """
+        Lists the candidate modules in each of the supplied paths, and
+        performs the filesystem access required to load them, using
+        `mapFn` to dispatch the work.
+
+        @param previousPathIndexes `List[Dict[str, dict]]` The index
+        entries for each path.
+
+        @return `List[Tuple[List[str], List[str], Iterable[tuple]]]`
+        For each path, the candidate module paths, debug messages to
+        log, and the result of @ref __prepareCandidate for each
+        candidate. The latter are produced by `mapFn`, so may still be
+        in progress.
+        """
+        listings = list(mapFn(self.__listCandidates, searchPaths))
+        # Dispatch the work for every path before any is consumed.
+        return [
+            (
+                candidates,
+                messages,
+                mapFn(
+                    functools.partial(
+                        self.__prepareCandidate,
+                        indexEntries=previousPathIndex,
+                        precompile=precompile,
+                    ),
+                    candidates,
+                ),
+            )
+            for (candidates, messages), previousPathIndex in zip(listings, previousPathIndexes)
+        ]
+
+    def __registerCandidates(self, path, candidates, prepared, previousPathIndex):
+        """
+        Loads or registers the plugins defined by the candidate modules
+        of a single search path.
+
+        @return `Dict[str, dict]` The index entries for the path, empty
+        if no index is in use.
+        """
+        pathIndex = {}
+
+        for itemPath, (stat, code) in zip(candidates, prepared):
+
+            if self.__index is None:
+                self.__debug("PythonPluginSystem: Attempting to load %s", itemPath)
+                self.__load(itemPath, code)
+                continue
+
+            entry = previousPathIndex.get(itemPath)
+            if self.__isIndexEntryValid(entry, stat):
+                self.__debug("PythonPluginSystem: Using indexed identifier for %s", itemPath)
+                self.__registerDeferred(
+                    entry["identifier"],
+                    itemPath,
+                    functools.partial(self.__importIndexed, path, itemPath, entry["identifier"]),
+                    entry.get("metadata"),
+                )
+                pathIndex[itemPath] = entry
+                continue
+
+            self.__debug("PythonPluginSystem: Attempting to load %s", itemPath)
+            cls = self.__load(itemPath, code)
+            if cls is not None:
+                pathIndex[itemPath] = {
+                    "mtime": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "identifier": cls.identifier(),
+                }
+                metadata = self.__metadataFor(cls)
+                if metadata is not None:
+                    pathIndex[itemPath]["metadata"] = metadata
+
+        return pathIndex
+
+    def __listCandidates(self, path):
+        """
+        Lists the candidate plugin modules in a directory.
+
+        As this may be called concurrently, messages are returned to be
+        logged by the caller, rather than logged directly.
+
+        @return `Tuple[List[str], List[str]]` The paths of the candidate
+        modules (either a module file or a package's `__init__.py`),
+        and debug messages for any ignored entries.
+        """
+        candidates = []
+        messages = []
+
+        if not os.path.isdir(path):
+            messages.append(f"PythonPluginSystem: Skipping as not a directory {path}")
+            return candidates, messages
+
+        for item in os.listdir(path):
+
+            itemPath = os.path.join(path, item)
+
+            if os.path.isdir(itemPath):
+                # The directory could be a package, check for __init__.py
+                initFile = os.path.join(itemPath, "__init__.py")
+                if os.path.exists(initFile):
+                    itemPath = initFile
+                else:
+                    messages.append(
+                        "PythonPluginSystem: Ignoring as it is not a python package "
+                        f"contianing __init__.py {itemPath}"
+                    )
+                    continue
+            else:
+                # Its a file, check if it is a .py/.pyc module
+                _, ext = os.path.splitext(itemPath)
+                if ext not in self.__validModuleExtensions:
+                    messages.append(
+                        f"PythonPluginSystem: Ignoring as its not a python module {itemPath}"
+                    )
+                    continue
+
+            candidates.append(itemPath)
+
+        return candidates, messages
+
+    def __prepareCandidate(self, itemPath, indexEntries, precompile):
+        """
+        Performs the filesystem access required to load a candidate
+        module. This may be called concurrently.
+
+        @param indexEntries `Dict[str, dict]` The index entries for the
+        directory containing the module.
+
+        @return `Tuple[os.stat_result, code]` The module's stat, if an
+        index is in use, and its code, if requested and the module needs
+        to be loaded. Either may be None.
+        """
+        stat = None
+        if self.__index is not None:
+            stat = os.stat(itemPath)
+            if self.__isIndexEntryValid(indexEntries.get(itemPath), stat):
+                return stat, None
+
+        code = None
+        if precompile:
+            try:
+                # Use the module's loader, so that bytecode cached in
+                # __pycache__ is used (and written) as for an import.
+                spec = self.__moduleSpec(itemPath)
+                code = spec.loader.get_code(spec.name)
+            except Exception:  # pylint: disable=broad-except
+                # Fall back to a regular import when loading, which will
+                # report the error.
+                code = None
+
+        return stat, code
+
+    @staticmethod
+    def __isIndexEntryValid(entry, stat):
+        """
+        Determines whether an index entry is up to date with respect to
+        the stat of its module.
+        """
+        return (
+            entry is not None
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        )
+
+    def __registerDeferred(self, identifier, path, loader, metadata=None):
+        """
+        Registers a plugin identifier without importing the module that
+        defines it. The module is imported when the plugin is first
+        requested via @ref plugin.
+
+        @param loader `Callable[[], type]` Called to load the plugin
+        class, returning None on failure.
+
+        @param metadata `dict` The plugin's previously recorded
+        metadata, if any, see @ref metadata.
+        """
+        if identifier in self.__map:
+            self.__debug(
+                "PythonPluginSystem: Skipping deferred plug-in '%s' defined in "
+                "'%s'. Already registered by '%s'",
+                identifier,
+                path,
+                self.__paths[identifier],
+            )
+            return
+
+        self.__debug(
+            "PythonPluginSystem: Registered deferred plug-in '%s' from '%s'", identifier, path
+        )
+
+        self.__map[identifier] = _DeferredPlugin(loader)
+        self.__paths[identifier] = path
+        if metadata is not None:
+            self.__metadata[identifier] = metadata
+
+    def __registered(self, identifier):
+        """
+        Retrieves the registered plugin for an identifier. Must be
+        called whilst holding the lock.
+
+        @return The plugin class, or a _DeferredPlugin if it has been
+        registered without being imported.
+
+        @exception openassetio.exceptions.PluginError Raised if no
+        plugin provides the specified identifier.
+        """
+        if identifier not in self.__map:
+            msg = "PythonPluginSystem: No plug-in registered with the identifier '%s'" % identifier
+            raise exceptions.PluginError(msg)
+        return self.__map[identifier]
+
+    def __loadDeferred(self, identifier, deferred):
+        """
+        Loads a plugin registered by @ref __registerDeferred.
+
+        The import is performed without holding the lock, so it does not
+        block access to other plugins. Concurrent requests for the same
+        plugin wait for the first to load it.
+
+        @param deferred `_DeferredPlugin` The registration to load.
+
+        @exception openassetio.exceptions.PluginError Raised if the
+        plugin fails to load, or no longer has the expected identifier.
+        """
+        with deferred.lock:
+            with self.__lock:
+                cls = self.__registered(identifier)
+                if not isinstance(cls, _DeferredPlugin):
+                    # Loaded whilst we were waiting.
+                    return cls
+                path = self.__paths[identifier]
+
+            self.__debug("PythonPluginSystem: Loading deferred plug-in from %s", path)
+            cls = deferred.loader()
+
+            with self.__lock:
+                if cls is None or cls.identifier() != identifier:
+                    del self.__map[identifier]
+                    del self.__paths[identifier]
+                    self.__metadata.pop(identifier, None)
+                    raise exceptions.PluginError(
+                        f"PythonPluginSystem: Deferred plug-in '{identifier}' is not provided "
+                        f"by '{path}'"
+                    )
+                self.__map[identifier] = cls
+
+        return cls
+
+    def __importIndexed(self, searchPath, path, identifier):
+        """
+        Imports a module registered from the index, discarding its
+        index entry if the module no longer provides the indexed
+        identifier.
+
+        @param searchPath `str` The search path under which the module
+        is indexed.
+        """
+        cls = self.__import(path)
+        if self.__index is None:
+            return cls
+
+        with self.__lock:
+            pathIndex = self.__index.pathEntries(searchPath)
+            if cls is None or cls.identifier() != identifier:
+                # The entry is out of date, discard it so the next scan
+                # imports the module afresh.
+                if pathIndex.pop(path, None):
+                    self.__index.write()
+            elif path in pathIndex and "metadata" not in pathIndex[path]:
+                # Written without metadata, e.g. by a session without a
+                # metadataFn.
+                metadata = self.__metadataFor(cls)
+                if metadata is not None:
+                    pathIndex[path]["metadata"] = metadata
+                    self.__index.write()
+        return cls
+
+    def __loadEntryPoint(self, entryPoint):
+        """
+        Loads the plugin class referenced by an entry point.
+
+        @return The plugin class, or None if it could not be loaded.
+        """
+        try:
+            cls = entryPoint.load()
+        except Exception:  # pylint: disable=broad-except
+            self.__logger.error(
+                f"PythonPluginSystem: Caught exception loading {entryPoint.name}:\n"
+                + traceback.format_exc()
+            )
+            return None
+
+        if not hasattr(cls, "identifier"):
+            self.__logger.error(
+                f"PythonPluginSystem: Entry point {entryPoint.name} does not reference a plugin "
+                f"class: {entryPoint.value}"
+            )
+            return None
+
+        # Store where this plugin was loaded from, for consistency with
+        # path-based plugins.
+        module = sys.modules.get(entryPoint.module)
+        with self.__lock:
+            if module is not None and getattr(module, "__file__", None):
+                self.__paths[entryPoint.name] = module.__file__
+                cls.__file__ = module.__file__
+
+            self.__indexEntryPointMetadata(entryPoint, cls)
+
+        return cls
+
+    def __indexedEntryPointMetadata(self, entryPoint):
+        """
+        Retrieves the metadata recorded in the index for a deferred
+        entry point plugin, if it is still valid.
+
+        Entries are only valid for the same entry point value and
+        distribution version as when they were recorded.
+
+        @return `dict` or None.
+        """
+        if self.__index is None:
+            return None
+        entry = self.__index.entryPoint(entryPoint.name)
+        if entry is None or entry != self.__entryPointIndexEntry(
+            entryPoint, entry.get("metadata")
+        ):
+            return None
+        return entry["metadata"]
+
+    def __indexEntryPointMetadata(self, entryPoint, cls):
+        """
+        Records the metadata for a deferred entry point plugin in the
+        index, if in use, so that subsequent sessions need not import
+        it to query its metadata. Must be called whilst holding the
+        lock.
+        """
+        if self.__index is None:
+            return
+        metadata = self.__metadataFor(cls)
+        if metadata is None:
+            return
+        entry = self.__entryPointIndexEntry(entryPoint, metadata)
+        if self.__index.entryPoint(entryPoint.name) != entry:
+            self.__index.setEntryPoint(entryPoint.name, entry)
+            self.__index.write()
+
+    @staticmethod
+    def __entryPointIndexEntry(entryPoint, metadata):
+        """
+        Constructs the index entry for a deferred entry point plugin.
+        """
+        dist = getattr(entryPoint, "dist", None)
+        return {
+            "value": entryPoint.value,
+            "version": dist.version if dist is not None else None,
+            "metadata": metadata,
+        }
+
+    def __metadataFor(self, cls):
+        """
+        Determines the metadata to record in the index for a plugin.
+
+        @return `dict` or None if there is no `metadataFn`, or the
+        metadata is not JSON-serializable.
+        """
+        if self.__metadataFn is None:
+            return None
+        try:
+            metadata = self.__metadataFn(cls)
+            json.dumps(metadata)
+        except Exception:  # pylint: disable=broad-except
+            self.__debug(
+                "PythonPluginSystem: Not indexing metadata for '%s':\n%s",
+                cls,
+                traceback.format_exc(),
+            )
+            return None
+        return metadata
+
+    def __load(self, path, code=None):
         """
         Loads the specified python file and registers it's plugin.
         The file must expose a top-level 'plugin' variable.
 
         @param path `str` This can be either a single-file module,
         or the __init__.py at the root of a package.
+
+        @param code Optional pre-loaded code for the module.
+
+        @return The plugin class, or None if it could not be loaded.
         """
+        cls = self.__import(path, code)
+        if cls is not None:
+            self.register(cls, path)
+        return cls
 
+    @staticmethod
+    def __moduleSpec(path):
+        """
+        Determines the spec used to import the specified python file.
+
+        @exception RuntimeError Raised if no spec can be determined.
+        """
         # Make a unique namespace to ensure the plugin identifier is
         # all that really matters
         moduleName = hashlib.md5(path.encode("utf-8")).hexdigest()
+        spec = importlib.util.spec_from_file_location(moduleName, path)
+        if spec is None:
+            raise RuntimeError("Unable to determine module spec")
+        return spec
 
-        try:
+    def __import(self, path, code=None):
+        """
+        Imports the specified python file and returns its plugin.
+
+        @param path `str` This can be either a single-file module,
+        or the __init__.py at the root of a package.
 
-            spec = importlib.util.spec_from_file_location(moduleName, path)
-            if spec is None:
-                raise RuntimeError("Unable to determine module spec")
+        @param code Optional pre-loaded code for the module, executed
+        in place of that read by the module's loader.
 
+        @return The plugin class, or None if the module failed to import
+        or has no top-level 'plugin' variable.
+        """
+        try:
+
+            spec = self.__moduleSpec(path)
             module = importlib.util.module_from_spec(spec)
 
             # Without this, for package imports we get:
             #   'No module named '<moduleName>'
             sys.modules[spec.name] = module
 
-            spec.loader.exec_module(module)
+            if code is not None:
+                exec(code, module.__dict__)  # pylint: disable=exec-used
+            else:
+                spec.loader.exec_module(module)
 
         except Exception:  # pylint: disable=broad-except
             self.__logger.error(
                 f"PythonPluginSystem: Caught exception loading {path}:\n" + traceback.format_exc()
             )
-            return
+            return None
 
         if not hasattr(module, "plugin"):
             self.__logger.error(f"PythonPluginSystem: No top-level 'plugin' variable {path}")
-            return
+            return None
 
         # Store where this plugin was loaded from. Not entirely
         # accurate, but more useful for debugging than it not being
         # there.
         module.plugin.__file__ = path
 
-        self.register(module.plugin, path)
+        return module.plugin
+
+
+class _DeferredPlugin(object):
+    """
+    A plugin that has been registered without importing the module
+    that defines it.
+    """
+
+    def __init__(self, loader):
+        ## `Callable[[], type]` Loads the plugin class, returning None
+        ## on failure.
+        self.loader = loader
+        ## Held whilst loading, so that concurrent requests for the
+        ## plugin wait for the first to load it.
+        self.lock = threading.Lock()
+
+
+class _PluginIndex(object):
+    """
+    Persistent index of the plugins found under each search path, and
+    of the metadata of deferred entry point plugins.
+
+    The index is read from disk on first use. Access must be
+    serialised by the caller.
+    """
+
+    def __init__(self, path, logger):
+        """
+        @param path `str` Path to the file used to persist the index.
+
+        @param logger @fqref{log.LoggerInterface} "LoggerInterface"
+        used to report problems reading or writing the index.
+        """
+        self.__path = path
+        self.__logger = logger
+        self.__paths = None
+        self.__entryPoints = None
+
+    def pathEntries(self, searchPath):
+        """
+        Retrieves the entries for the modules under a search path.
+
+        @return `Dict[str, dict]` Mapping of module path to its index
+        entry. Modifications are reflected in the index if the path
+        has been indexed.
+        """
+        self.__ensureRead()
+        return self.__paths.get(searchPath, {})
+
+    def setPathEntries(self, searchPath, entries):
+        """
+        Replaces the entries for the modules under a search path.
+        """
+        self.__ensureRead()
+        self.__paths[searchPath] = entries
+
+    def entryPoint(self, name):
+        """
+        Retrieves the entry for a deferred entry point plugin.
+
+        @return `dict` or None.
+        """
+        self.__ensureRead()
+        return self.__entryPoints.get(name)
+
+    def setEntryPoint(self, name, entry):
+        """
+        Replaces the entry for a deferred entry point plugin.
+        """
+        self.__ensureRead()
+        self.__entryPoints[name] = entry
+
+    def write(self):
+        """
+        Writes the index to disk.
+
+        The index is written to a temporary file, then moved into place,
+        so that concurrent sessions never read a partial index.
+        """
+        self.__ensureRead()
+        tmpPath = f"{self.__path}.{os.getpid()}.tmp"
+        try:
+            with open(tmpPath, "w", encoding="utf-8") as indexFile:
+                json.dump(
+                    {
+                        "version": PythonPluginSystem.kIndexVersion,
+                        "paths": self.__paths,
+                        "entryPoints": self.__entryPoints,
+                    },
+                    indexFile,
+                )
+            os.replace(tmpPath, self.__path)
+        except OSError as exc:
+            self.__logger.warning(
+                f"PythonPluginSystem: Unable to write plugin index {self.__path}: {exc}"
+            )
+
+    def __ensureRead(self):
+        """
+        Reads the index from disk, if it has not already been read.
+        """
+        if self.__paths is None:
+            self.__paths, self.__entryPoints = self.__read()
+
+    def __read(self):
+        """
+        Reads the index from disk.
+
+        @return `Tuple[Dict[str, Dict[str, dict]], Dict[str, dict]]`
+        Mapping of search path to a mapping of module path to its index
+        entry, and mapping of deferred entry point name to its index
+        entry. Empty if the index does not exist or is unusable.
+        """
+        try:
+            with open(self.__path, "r", encoding="utf-8") as indexFile:
+                data = json.load(indexFile)
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, ValueError) as exc:
+            self.__logger.warning(
+                f"PythonPluginSystem: Ignoring unreadable plugin index {self.__path}: {exc}"
+            )
+            return {}, {}
+
+        if not isinstance(data, dict) or data.get("version") != PythonPluginSystem.kIndexVersion:
+            if self.__logger.isSeverityLogged(LoggerInterface.Severity.kDebug):
+                self.__logger.debug(
+                    f"PythonPluginSystem: Ignoring incompatible plugin index {self.__path}"
+                )
+            return {}, {}
+
+        return data.get("paths", {}), data.get("entryPoints", {})
@@ -20,8 +20,9 @@ PythonPluginSystemManagerImplementationFactory class.
 """
 
 import os
+import threading
 
-from ..hostApi import ManagerImplementationFactoryInterface
+from ..hostApi import ManagerFactory, ManagerImplementationFactoryInterface
 
 from .PythonPluginSystem import PythonPluginSystem
 
@@ -58,18 +59,59 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
     it is not in use, to avoid unnecessary filesystem access during
     library initialization. **OPENASSETIO_PLUGIN_PATH** plugins take
     precedence over any entry point based ones.
+
+    @envvar **OPENASSETIO_PLUGIN_INDEX_PATH** *str* Path to a file used
+    to persist an index of the plugins found under
+    **OPENASSETIO_PLUGIN_PATH** between sessions. When set, modules
+    that are unchanged since they were last indexed are not imported
+    when listing @ref identifiers, only when a plugin is requested via
+    @ref instantiate. The file is created if it does not exist.
+
+    @envvar **OPENASSETIO_PLUGIN_PARALLEL_SCAN** when set, the
+    directories in **OPENASSETIO_PLUGIN_PATH** are scanned using a pool
+    of threads. This can reduce startup time when plugins are located
+    on a network file system.
+
+    @envvar **OPENASSETIO_PLUGIN_SHARED_REGISTRY** when set, factories
+    share the results of scanning for plugins with any other factory in
+    the process that uses the same search paths and entry point
+    setting, rather than each scanning independently. See @ref
+    invalidateSharedRegistry.
     """
 
     ## The Environment Variable to read the plug-in search path from
     kPluginEnvVar = "OPENASSETIO_PLUGIN_PATH"
     ## The Environment Variable to control the discovery of entry point based plugins
     kDisableEntryPointsEnvVar = "OPENASSETIO_DISABLE_ENTRYPOINTS_PLUGINS"
+    ## The Environment Variable to read the plug-in index path from
+    kPluginIndexEnvVar = "OPENASSETIO_PLUGIN_INDEX_PATH"
+    ## The Environment Variable to enable parallel scanning of plug-in paths
+    kParallelScanEnvVar = "OPENASSETIO_PLUGIN_PARALLEL_SCAN"
+    ## The Environment Variable to opt in to the process-wide plug-in registry
+    kSharedRegistryEnvVar = "OPENASSETIO_PLUGIN_SHARED_REGISTRY"
 
     ## The name of the ManagerPlugin entry point for entry point
     ## discovered plugins.
     kPackageEntryPointGroup = "openassetio.manager_plugin"
 
-    def __init__(self, logger, paths=None, disableEntryPointsPlugins=None):
+    # Process-wide plugin systems, keyed on the search paths and entry
+    # point setting used to populate them. The lock only guards access
+    # to the dicts. Scanning is guarded by a lock specific to the key,
+    # which is reentrant in case a plugin module constructs a factory.
+    # Once published, plugin systems synchronise their own access.
+    __sharedRegistry = {}
+    __sharedRegistryScanLocks = {}
+    __sharedRegistryLock = threading.Lock()
+
+    def __init__(
+        self,
+        logger,
+        paths=None,
+        disableEntryPointsPlugins=None,
+        indexPath=None,
+        parallelScan=None,
+        useSharedRegistry=None,
+    ):
         """
         Creates a new factory. The factory scans for plugins lazily on
         the first invocation of @ref identifiers or @ref instantiate.
@@ -85,6 +127,22 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
         package entry point based plugin discovery is allowed. Defaults
         to False unless the @ref kDisableEntryPointsEnvVar environment
         variable is set.
+
+        @param indexPath `str` Path to a file used to persist the index
+        of path-based plugins between sessions. Defaults to the value of
+        the @ref kPluginIndexEnvVar environment variable. If neither is
+        set, no index is used.
+
+        @param parallelScan `bool` Controls whether plugin paths are
+        scanned concurrently. Defaults to False unless the @ref
+        kParallelScanEnvVar environment variable is set.
+
+        @param useSharedRegistry `bool` Controls whether the results of
+        scanning for plugins are shared with other factories in the
+        process. Defaults to False unless the @ref
+        kSharedRegistryEnvVar environment variable is set. Note that
+        messages from shared plugin loading are output to the logger of
+        the factory that first triggered the scan.
         """
 
         super(PythonPluginSystemManagerImplementationFactory, self).__init__(logger)
@@ -99,13 +157,68 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
             disableEntryPointsPlugins = os.environ.get(self.kDisableEntryPointsEnvVar, False)
         self.__disableEntryPointsPlugins = disableEntryPointsPlugins
 
+        if indexPath is None:
+            indexPath = os.environ.get(self.kPluginIndexEnvVar) or None
+        self.__indexPath = indexPath
+
+        if parallelScan is None:
+            parallelScan = bool(os.environ.get(self.kParallelScanEnvVar, False))
+        self.__parallelScan = parallelScan
+
+        if useSharedRegistry is None:
+            useSharedRegistry = bool(os.environ.get(self.kSharedRegistryEnvVar, False))
+        self.__useSharedRegistry = useSharedRegistry
+
+    @classmethod
+    def invalidateSharedRegistry(cls):
+        """
+        Discards all plugins held in the process-wide registry, such
+        that factories using the registry rescan on next use.
+
+        This should be called if plugins have been added or removed
+        since they were last scanned.
+        """
+        with cls.__sharedRegistryLock:
+            cls.__sharedRegistry.clear()
+
+    def __getPluginManager(self):
+        """
+        Retrieves the plugin system for this factory, scanning for
+        plugins if required.
+        """
+        if not self.__useSharedRegistry:
+            if not self.__pluginManager:
+                self.__pluginManager = self.__scan()
+            return self.__pluginManager
+
+        key = (self.__paths, bool(self.__disableEntryPointsPlugins))
+        with self.__sharedRegistryLock:
+            pluginManager = self.__sharedRegistry.get(key)
+            if pluginManager is not None:
+                return pluginManager
+            scanLock = self.__sharedRegistryScanLocks.setdefault(key, threading.RLock())
+
+        with scanLock:
+            with self.__sharedRegistryLock:
+                # Another factory may have scanned whilst we waited.
+                pluginManager = self.__sharedRegistry.get(key)
+            if pluginManager is None:
+                pluginManager = self.__scan()
+                with self.__sharedRegistryLock:
+                    self.__sharedRegistry[key] = pluginManager
+        return pluginManager
+
     def __scan(self):
         """
         Scans for PythonPluginSystemManagerPlugins, and registers them
-        with the factory instance.
+        with a new plugin system.
+
+        @return PythonPluginSystem
         """
         # Construct this here, so we have this even if we early out
-        self.__pluginManager = PythonPluginSystem(self._logger)
+        pluginManager = PythonPluginSystem(
+            self._logger, indexPath=self.__indexPath, metadataFn=self.__pluginDetail
+        )
 
         if not self.__paths and self.__disableEntryPointsPlugins:
             self._logger.log(
@@ -113,18 +226,20 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
                 "No search paths specified and entry point plugins are disabled, no plugins "
                 f"will load - check ${self.kPluginEnvVar} is set.",
             )
-            return
+            return pluginManager
 
         # We scan custom paths first, so they take precedence over entry
         # point plugins
 
         if self.__paths:
-            self.__pluginManager.scan(self.__paths)
+            pluginManager.scan(self.__paths, parallel=self.__parallelScan)
 
         if self.__disableEntryPointsPlugins:
             self._logger.debug("Entry point based plugins are disabled")
         else:
-            self.__pluginManager.scan_entry_points(self.kPackageEntryPointGroup)
+            pluginManager.scan_entry_points(self.kPackageEntryPointGroup)
+
+        return pluginManager
 
     def identifiers(self):
         """
@@ -132,10 +247,7 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
         @see @ref openassetio.pluginSystem.PythonPluginSystemManagerPlugin
         "PythonPluginSystemManagerPlugin"
         """
-        if not self.__pluginManager:
-            self.__scan()
-
-        return self.__pluginManager.identifiers()
+        return self.__getPluginManager().identifiers()
 
     def instantiate(self, identifier):
         """
@@ -155,11 +267,52 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
         no `interface` method.
         """
 
-        if not self.__pluginManager:
-            self.__scan()
-
         self._logger.log(self._logger.Severity.kDebug, f"Instantiating {identifier}")
-        plugin = self.__pluginManager.plugin(identifier)
+        plugin = self.__getPluginManager().plugin(identifier)
         interface = plugin.interface()
 
         return interface
+
+    def managerDetail(self, identifier):
+        """
+        Retrieves the details of the manager with the specified
+        identifier from its plugin's class attributes, if the plugin
+        provides them, without instantiating its interface.
+
+        If a plugin index is in use, the details are recorded in it, so
+        that they can be retrieved in subsequent sessions without
+        importing the plugin.
+
+        @param identifier `str` The identifier of the manager.
+
+        @returns @fqref{hostApi.ManagerFactory.ManagerDetail}
+        "ManagerDetail" or None if the plugin does not provide a
+        display name.
+
+        @throws PluginError if the requested identifier has not been
+        registered.
+
+        @see @ref openassetio.pluginSystem.PythonPluginSystemManagerPlugin.displayName
+        "PythonPluginSystemManagerPlugin.displayName"
+        """
+
+        detail = self.__getPluginManager().metadata(identifier)
+
+        if detail["displayName"] is None:
+            return None
+
+        return ManagerFactory.ManagerDetail(identifier, detail["displayName"], detail["info"])
+
+    @staticmethod
+    def __pluginDetail(plugin):
+        """
+        Queries the details of a manager from its plugin class, as
+        recorded by the plugin system, see @ref managerDetail.
+
+        @return `dict` with the `displayName` and `info` of the manager.
+        """
+        displayNameFn = getattr(plugin, "displayName", None)
+        displayName = displayNameFn() if displayNameFn is not None else None
+        if displayName is None:
+            return {"displayName": None, "info": {}}
+        return {"displayName": displayName, "info": plugin.info()}
@@ -69,6 +69,37 @@ class PythonPluginSystemManagerPlugin(PythonPluginSystemPlugin):
         """
         raise NotImplementedError
 
+    @classmethod
+    def displayName(cls):
+        """
+        Returns a human readable name for the manager, suitable for
+        presenting in a UI.
+
+        Plugins that override this allow hosts to list the manager via
+        @fqref{hostApi.ManagerFactory.availableManagers}
+        "ManagerFactory.availableManagers" without the cost of
+        constructing its @ref openassetio.managerApi.ManagerInterface
+        "ManagerInterface". If so, it must return the same value as the
+        interface's `displayName`, and @ref info must be overridden
+        too.
+
+        @return str or None, the default, if the display name can only
+        be determined by instantiating the interface.
+        """
+        return None
+
+    @classmethod
+    def info(cls):
+        """
+        Returns the arbitrary key-value information supplied by the
+        manager, as per the interface's `info`.
+
+        This is only used if @ref displayName is overridden.
+
+        @return dict
+        """
+        return {}
+
     @classmethod
     def interface(cls):
         """
@@ -74,6 +74,19 @@ def mock_host_interface():
     return MockHostInterface()
 
 
+@pytest.fixture
+def create_mock_host_interface():
+    """
+    Fixture providing a factory function for creating new
+    `MockHostInterface` instances.
+    """
+
+    def creator():
+        return MockHostInterface()
+
+    return creator
+
+
 @pytest.fixture
 def a_host(mock_host_interface):
     """
@@ -134,6 +147,9 @@ class ValidatingMockManagerInterface(ManagerInterface):
     def __init__(self):
         super().__init__()
         self.mock = mock.create_autospec(ManagerInterface, spec_set=True, instance=True)
+        # `info` is queried by the middleware during `initialize`, so
+        # must return something convertible to an InfoDictionary.
+        self.mock.info.return_value = {}
 
     def info(self):
         return self.mock.info()
@@ -233,6 +249,11 @@ class ValidatingMockManagerInterface(ManagerInterface):
         assert isinstance(hostSession, HostSession)
         return self.mock.isEntityReferenceString(someString, hostSession)
 
+    def isEntityReferenceStrings(self, someStrings, hostSession):
+        self.__assertIsIterableOf(someStrings, str)
+        assert isinstance(hostSession, HostSession)
+        return self.mock.isEntityReferenceStrings(someStrings, hostSession)
+
     def entityExists(self, entityRefs, context, hostSession):
         self.__assertIsIterableOf(entityRefs, EntityReference)
         self.__assertCallingContext(context, hostSession)
@@ -332,10 +353,14 @@ class MockLogger(LoggerInterface):
     def __init__(self):
         LoggerInterface.__init__(self)
         self.mock = mock.create_autospec(LoggerInterface, spec_set=True, instance=True)
+        self.mock.isSeverityLogged.return_value = True
 
     def log(self, severity, message):
         self.mock.log(severity, message)
 
+    def isSeverityLogged(self, severity):
+        return self.mock.isSeverityLogged(severity)
+
 
 #
 # Python to C++ migration helpers
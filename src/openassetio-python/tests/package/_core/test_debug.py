@@ -0,0 +1,291 @@
+#
+#   Copyright 2013-2022 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests of the runtime dispatch of the debug and audit decorators, and
+the structured records emitted when debugging.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import gc
+import weakref
+
+import pytest
+
+from openassetio import BatchElementError, EntityResolutionErrorBatchElementException
+from openassetio.log import LoggerInterface
+from openassetio._core import audit
+from openassetio._core.audit import auditApiCall
+from openassetio._core.debug import debugApiCall, Debuggable
+
+
+class RecordingLogger(LoggerInterface):
+    def __init__(self):
+        LoggerInterface.__init__(self)
+        self.records = []
+        self.loggedSeverities = set(LoggerInterface.Severity.__members__.values())
+
+    def log(self, severity, message):
+        pass
+
+    def isSeverityLogged(self, severity):
+        return severity in self.loggedSeverities
+
+    def logRecord(self, record):
+        self.records.append(record)
+
+
+class Traced(Debuggable):
+    @debugApiCall
+    @auditApiCall("Traced methods")
+    def batched(self, refs):
+        return list(refs)
+
+    @debugApiCall
+    def debugged(self):
+        return "debugged"
+
+    @auditApiCall("Traced methods")
+    def audited(self):
+        return "audited"
+
+    def untraced(self):
+        return "untraced"
+
+    @debugApiCall
+    def failing(self, refs):
+        raise EntityResolutionErrorBatchElementException(
+            0, BatchElementError(BatchElementError.ErrorCode.kEntityResolutionError, "oops")
+        )
+
+    def identifier(self):
+        return "org.openassetio.test.traced"
+
+
+@pytest.fixture
+def recording_logger():
+    return RecordingLogger()
+
+
+@pytest.fixture
+def traced(recording_logger):
+    obj = Traced()
+    # pylint: disable=protected-access,attribute-defined-outside-init
+    obj._debugLogger = recording_logger
+    obj.setDebugCallsEnabled(True)
+    return obj
+
+
+class Test_debugApiCall_with_debugLogger:
+    def test_when_call_returns_then_record_logged(self, traced, recording_logger):
+        assert traced.batched(["a", "b", "c"]) == ["a", "b", "c"]
+
+        assert len(recording_logger.records) == 1
+        record = recording_logger.records[0]
+        assert record.severity == LoggerInterface.Severity.kDebugApi
+        assert record.method == "batched"
+        assert record.managerIdentifier == "org.openassetio.test.traced"
+        assert record.batchSize == 3
+        assert record.durationNs >= 0
+        assert record.errorCode is None
+        assert record.message.startswith("<- ")
+
+    def test_when_call_raises_batch_element_exception_then_error_code_logged(
+        self, traced, recording_logger
+    ):
+        with pytest.raises(EntityResolutionErrorBatchElementException):
+            traced.failing(["a"])
+
+        assert len(recording_logger.records) == 1
+        assert (
+            recording_logger.records[0].errorCode
+            == BatchElementError.ErrorCode.kEntityResolutionError
+        )
+
+    def test_when_severity_not_logged_then_no_record_logged(self, traced, recording_logger):
+        recording_logger.loggedSeverities = set()
+
+        traced.batched(["a"])
+
+        assert recording_logger.records == []
+
+    def test_when_debug_calls_disabled_then_no_record_logged(self, traced, recording_logger):
+        traced._debugCalls = False  # pylint: disable=protected-access
+
+        traced.batched(["a"])
+
+        assert recording_logger.records == []
+
+
+def shadowed(obj):
+    """
+    Names of the methods of obj that are replaced by tracing wrappers.
+    """
+    if obj.__class__ is Traced:
+        return set()
+    return {name for name, value in vars(type(obj)).items() if callable(value)}
+
+
+@pytest.fixture
+def shared_auditor():
+    the_auditor = audit.auditor()
+    the_auditor.reset()
+    yield the_auditor
+    the_auditor.reset()
+
+
+class Test_Debuggable_dispatch:
+    def test_when_decorated_then_methods_are_not_wrapped(self):
+        assert not hasattr(Traced.batched, "__wrapped__")
+        assert not hasattr(Traced.debugged, "__wrapped__")
+        assert not hasattr(Traced.audited, "__wrapped__")
+
+    def test_when_constructed_then_tracing_is_disabled_and_methods_are_not_shadowed(self):
+        obj = Traced()
+
+        assert obj.debugCallsEnabled() is False
+        assert obj.auditCallsEnabled() is False
+        assert shadowed(obj) == set()
+        assert obj.batched.__func__ is Traced.batched
+
+    def test_when_debug_enabled_then_only_debugged_methods_are_shadowed(self):
+        obj = Traced()
+
+        obj.setDebugCallsEnabled(True)
+
+        assert obj.debugCallsEnabled() is True
+        assert shadowed(obj) == {"batched", "debugged", "failing"}
+        assert obj.debugged() == "debugged"
+        assert obj.debugged.__wrapped__ is Traced.debugged
+
+    def test_when_audit_enabled_then_only_audited_methods_are_shadowed(self):
+        obj = Traced()
+
+        obj.setAuditCallsEnabled(True)
+
+        assert obj.auditCallsEnabled() is True
+        assert shadowed(obj) == {"batched", "audited"}
+
+    def test_when_disabled_then_shadowing_methods_are_removed(self):
+        obj = Traced()
+        obj.setDebugCallsEnabled(True)
+        obj.setAuditCallsEnabled(True)
+
+        obj.setDebugCallsEnabled(False)
+
+        assert shadowed(obj) == {"batched", "audited"}
+
+        obj.setAuditCallsEnabled(False)
+
+        assert shadowed(obj) == set()
+
+    def test_when_enabled_on_one_instance_then_other_instances_unaffected(self):
+        obj = Traced()
+        other = Traced()
+
+        obj.setDebugCallsEnabled(True)
+
+        assert shadowed(other) == set()
+
+    def test_when_audit_enabled_then_calls_recorded_in_shared_auditor(self, shared_auditor):
+        obj = Traced()
+        obj.audited()
+
+        assert shared_auditor.coverage() == {}
+
+        obj.setAuditCallsEnabled(True)
+        assert obj.audited() == "audited"
+        obj.batched(["a"])
+
+        traced_coverage = shared_auditor.coverage()[Traced]
+        assert traced_coverage[Traced.audited][audit.Auditor.kKey_Count] == 1
+        assert traced_coverage[Traced.batched][audit.Auditor.kKey_Count] == 1
+        assert Traced.untraced not in traced_coverage
+
+    def test_when_enabled_then_instance_freed_without_garbage_collection(self):
+        obj = Traced()
+        obj.setDebugCallsEnabled(True)
+        obj.setAuditCallsEnabled(True)
+        obj_ref = weakref.ref(obj)
+
+        gc.disable()
+        try:
+            del obj
+            assert obj_ref() is None
+        finally:
+            gc.enable()
+
+    def test_when_enabled_then_instance_is_still_instance_of_class(self):
+        obj = Traced()
+
+        obj.setDebugCallsEnabled(True)
+
+        assert isinstance(obj, Traced)
+        assert type(obj).__name__ == "Traced"
+        assert type(obj).__qualname__ == Traced.__qualname__
+
+    def test_when_disabled_then_original_class_restored(self):
+        obj = Traced()
+        obj.setDebugCallsEnabled(True)
+        obj.setAuditCallsEnabled(True)
+
+        obj.setDebugCallsEnabled(False)
+        obj.setAuditCallsEnabled(False)
+
+        assert obj.__class__ is Traced
+
+    def test_when_enabled_on_many_instances_then_traced_class_shared(self):
+        obj = Traced()
+        other = Traced()
+
+        obj.setDebugCallsEnabled(True)
+        other.setDebugCallsEnabled(True)
+
+        assert type(obj) is type(other)
+
+
+class Test_Debuggable_env:
+    @pytest.fixture(autouse=True)
+    def always_unload_openassetio_modules(
+        self, unload_openassetio_modules  # pylint: disable=unused-argument
+    ):
+        pass
+
+    def test_when_debug_env_var_set_then_debug_enabled_by_default(self, monkeypatch):
+        monkeypatch.setenv("OPENASSETIO_DEBUG", "1")
+        # pylint: disable=import-outside-toplevel
+        from openassetio._core import debug
+
+        assert debug.Debuggable().debugCallsEnabled() is True
+
+    def test_when_audit_env_var_set_then_audit_enabled_by_default(self, monkeypatch):
+        monkeypatch.setenv("OPENASSETIO_AUDIT", "1")
+        # pylint: disable=import-outside-toplevel
+        from openassetio._core import debug
+
+        assert debug.Debuggable().auditCallsEnabled() is True
+
+    def test_when_env_vars_not_set_then_tracing_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("OPENASSETIO_DEBUG", raising=False)
+        monkeypatch.delenv("OPENASSETIO_AUDIT", raising=False)
+        # pylint: disable=import-outside-toplevel
+        from openassetio._core import debug
+
+        obj = debug.Debuggable()
+        assert obj.debugCallsEnabled() is False
+        assert obj.auditCallsEnabled() is False
@@ -20,11 +20,15 @@ Tests that cover the openassetio.hostApi.Manager wrapper class.
 # pylint: disable=no-self-use
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
+import asyncio
+import concurrent.futures
+import threading
 from unittest import mock
 
 import pytest
 
 from openassetio import (
+    CancellationToken,
     UnknownBatchElementException,
     InvalidEntityReferenceBatchElementException,
     MalformedEntityReferenceBatchElementException,
@@ -34,9 +38,12 @@ from openassetio import (
     Context,
     EntityReference,
     TraitsData,
+    TraitsDataBatch,
+    constants,
     managerApi,
 )
-from openassetio.hostApi import Manager
+from openassetio.hostApi import Manager, ManagerMetrics
+from openassetio.log import LoggerInterface
 
 
 ## @todo Remove comments regarding Entity methods when splitting them from core API
@@ -293,6 +300,50 @@ class Test_Manager_isEntityReferenceString:
         assert manager.isEntityReferenceString(a_ref_string) == expected
         method.assert_called_once_with(a_ref_string, a_host_session)
 
+    @pytest.mark.parametrize(
+        "ref_string,expected",
+        (("asset://a", True), ("asset://", True), ("asset:/", False), ("other://a", False)),
+    )
+    def test_when_prefix_in_info_then_interface_not_called(
+        self, manager, mock_manager_interface, ref_string, expected
+    ):
+        mock_manager_interface.mock.info.return_value = {
+            constants.kField_EntityReferencesMatchPrefix: "asset://"
+        }
+        manager.initialize({})
+
+        assert manager.isEntityReferenceString(ref_string) == expected
+        mock_manager_interface.mock.isEntityReferenceString.assert_not_called()
+
+    def test_when_prefix_in_info_but_not_initialized_then_interface_called(
+        self, manager, mock_manager_interface, a_ref_string, a_host_session
+    ):
+        mock_manager_interface.mock.info.return_value = {
+            constants.kField_EntityReferencesMatchPrefix: "asset://"
+        }
+
+        assert manager.isEntityReferenceString(a_ref_string) is True
+        mock_manager_interface.mock.isEntityReferenceString.assert_called_once_with(
+            a_ref_string, a_host_session
+        )
+
+    def test_when_prefix_in_info_is_not_a_string_then_interface_called_and_warning_logged(
+        self, manager, mock_manager_interface, a_ref_string, a_host_session, mock_logger
+    ):
+        mock_manager_interface.mock.info.return_value = {
+            constants.kField_EntityReferencesMatchPrefix: 123
+        }
+        manager.initialize({})
+
+        assert manager.isEntityReferenceString(a_ref_string) is True
+        mock_manager_interface.mock.isEntityReferenceString.assert_called_once_with(
+            a_ref_string, a_host_session
+        )
+        mock_logger.mock.log.assert_called_once_with(
+            mock_logger.Severity.kWarning,
+            "Entity reference prefix given but is an invalid type: should be a string.",
+        )
+
 
 class Test_Manager_createEntityReference:
     def test_method_defined_in_cpp(self, method_introspector):
@@ -356,6 +407,77 @@ class Test_Manager_createEntityReferenceIfValid:
         assert isinstance(entity_reference, EntityReference)
         assert entity_reference.toString() == a_ref_string
 
+    def test_when_prefix_in_info_then_interface_not_called(self, manager, mock_manager_interface):
+        mock_manager_interface.mock.info.return_value = {
+            constants.kField_EntityReferencesMatchPrefix: "asset://"
+        }
+        manager.initialize({})
+
+        assert manager.createEntityReferenceIfValid("asset://a").toString() == "asset://a"
+        assert manager.createEntityReferenceIfValid("other://a") is None
+        mock_manager_interface.mock.isEntityReferenceString.assert_not_called()
+
+
+class Test_Manager_isEntityReferenceStrings:
+    def test_method_defined_in_cpp(self, method_introspector):
+        assert not method_introspector.is_defined_in_python(Manager.isEntityReferenceStrings)
+        assert method_introspector.is_implemented_once(Manager, "isEntityReferenceStrings")
+
+    def test_wraps_the_corresponding_method_of_the_held_interface(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        some_strings = ["asset://a", "not a ref", "asset://b"]
+        method = mock_manager_interface.mock.isEntityReferenceStrings
+        method.return_value = [True, False, True]
+
+        assert manager.isEntityReferenceStrings(some_strings) == [True, False, True]
+        method.assert_called_once_with(some_strings, a_host_session)
+
+    def test_when_interface_returns_wrong_length_then_raises_IndexError(
+        self, manager, mock_manager_interface
+    ):
+        mock_manager_interface.mock.isEntityReferenceStrings.return_value = [True]
+
+        with pytest.raises(IndexError):
+            manager.isEntityReferenceStrings(["asset://a", "asset://b"])
+
+    def test_when_prefix_in_info_then_interface_not_called(self, manager, mock_manager_interface):
+        mock_manager_interface.mock.info.return_value = {
+            constants.kField_EntityReferencesMatchPrefix: "asset://"
+        }
+        manager.initialize({})
+
+        assert manager.isEntityReferenceStrings(["asset://a", "other://a", ""]) == [
+            True,
+            False,
+            False,
+        ]
+        mock_manager_interface.mock.isEntityReferenceStrings.assert_not_called()
+        mock_manager_interface.mock.isEntityReferenceString.assert_not_called()
+
+
+class Test_Manager_createEntityReferencesIfValid:
+    def test_method_defined_in_cpp(self, method_introspector):
+        assert not method_introspector.is_defined_in_python(Manager.createEntityReferencesIfValid)
+        assert method_introspector.is_implemented_once(Manager, "createEntityReferencesIfValid")
+
+    def test_returns_entity_references_for_valid_strings_and_None_otherwise(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        some_strings = ["asset://a", "not a ref", "asset://b"]
+        method = mock_manager_interface.mock.isEntityReferenceStrings
+        method.return_value = [True, False, True]
+
+        entity_references = manager.createEntityReferencesIfValid(some_strings)
+
+        method.assert_called_once_with(some_strings, a_host_session)
+        assert len(entity_references) == 3
+        assert isinstance(entity_references[0], EntityReference)
+        assert entity_references[0].toString() == "asset://a"
+        assert entity_references[1] is None
+        assert isinstance(entity_references[2], EntityReference)
+        assert entity_references[2].toString() == "asset://b"
+
 
 class Test_Manager_entityExists:
     def test_method_defined_in_python(self, method_introspector):
@@ -539,10 +661,13 @@ class Test_Manager_getRelatedReferences:
 
 class Test_Manager_BatchElementErrorPolicyTag:
     def test_unique(self):
-        assert (
-            Manager.BatchElementErrorPolicyTag.kVariant
-            is not Manager.BatchElementErrorPolicyTag.kException
+        tags = (
+            Manager.BatchElementErrorPolicyTag.kVariant,
+            Manager.BatchElementErrorPolicyTag.kException,
+            Manager.BatchElementErrorPolicyTag.kCollect,
+            Manager.BatchElementErrorPolicyTag.kSkip,
         )
+        assert len({id(tag) for tag in tags}) == len(tags)
 
 
 class Test_Manager_resolve_with_callback_signature:
@@ -587,6 +712,876 @@ class Test_Manager_resolve_with_callback_signature:
         success_callback.assert_called_once_with(123, a_traitsdata)
         error_callback.assert_called_once_with(456, a_batch_element_error)
 
+    def test_when_callbacks_called_from_another_thread_then_callbacks_called(
+        self,
+        manager,
+        mock_manager_interface,
+        some_refs,
+        an_entity_trait_set,
+        a_context,
+        a_traitsdata,
+    ):
+        # The GIL is released whilst in the C++ Manager, so callbacks
+        # invoked on a thread other than the calling thread must
+        # re-acquire it.
+        success_callback = mock.Mock()
+
+        def call_callbacks_in_thread(_refs, _traitSet, _context, _hostSession, callback, _err):
+            thread = threading.Thread(target=callback, args=(0, a_traitsdata))
+            thread.start()
+            thread.join()
+
+        mock_manager_interface.mock.resolve.side_effect = call_callbacks_in_thread
+
+        manager.resolve(some_refs, an_entity_trait_set, a_context, success_callback, mock.Mock())
+
+        success_callback.assert_called_once_with(0, a_traitsdata)
+
+    def test_when_called_concurrently_then_all_results_returned(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        def resolve_all(refs, _traitSet, _context, _hostSession, success_callback, _err):
+            for idx, ref in enumerate(refs):
+                traits_data = TraitsData()
+                traits_data.setTraitProperty("trait", "ref", ref.toString())
+                success_callback(idx, traits_data)
+
+        mock_manager_interface.mock.resolve.side_effect = resolve_all
+
+        num_threads = 8
+        results = [None] * num_threads
+
+        def worker(thread_idx):
+            results[thread_idx] = manager.resolve(some_refs, an_entity_trait_set, a_context)
+
+        threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for result in results:
+            assert [data.getTraitProperty("trait", "ref") for data in result] == [
+                ref.toString() for ref in some_refs
+            ]
+
+    def test_when_interface_raises_then_exception_propagated(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = RuntimeError("Resolve failed")
+
+        with pytest.raises(RuntimeError, match="Resolve failed"):
+            manager.resolve(some_refs, an_entity_trait_set, a_context, mock.Mock(), mock.Mock())
+
+
+class Test_Manager_setResolveConcurrency:
+    @pytest.fixture
+    def thread_safe_manager(self, manager, mock_manager_interface):
+        mock_manager_interface.mock.info.return_value = {constants.kField_IsThreadSafe: True}
+        manager.initialize({})
+        return manager
+
+    @pytest.fixture
+    def many_refs(self, manager):
+        return [manager.createEntityReference(f"asset://{idx}") for idx in range(10)]
+
+    @staticmethod
+    def resolve_refs_to_their_string(refs, _traitSet, _context, _hostSession, success, error):
+        for idx, ref in enumerate(refs):
+            if ref.toString().endswith("3"):
+                error(idx, BatchElementError(BatchElementError.ErrorCode.kUnknown, "bad"))
+                continue
+            traits_data = TraitsData()
+            traits_data.setTraitProperty("trait", "ref", ref.toString())
+            success(idx, traits_data)
+
+    @pytest.mark.parametrize("max_threads,chunk_size", ((0, 1), (1, 0)))
+    def test_when_zero_then_raises_ValueError(self, manager, max_threads, chunk_size):
+        with pytest.raises(ValueError):
+            manager.setResolveConcurrency(max_threads, chunk_size)
+
+    def test_when_thread_safe_then_batch_split_into_chunks_and_results_reindexed(
+        self,
+        thread_safe_manager,
+        mock_manager_interface,
+        many_refs,
+        an_entity_trait_set,
+        a_context,
+    ):
+        mock_manager_interface.mock.resolve.side_effect = self.resolve_refs_to_their_string
+        thread_safe_manager.setResolveConcurrency(4, 3)
+
+        results = thread_safe_manager.resolve(
+            many_refs,
+            an_entity_trait_set,
+            a_context,
+            Manager.BatchElementErrorPolicyTag.kVariant,
+        )
+
+        chunks = [call.args[0] for call in mock_manager_interface.mock.resolve.call_args_list]
+        assert sorted(chunks, key=lambda chunk: chunk[0].toString()) == [
+            many_refs[0:3],
+            many_refs[3:6],
+            many_refs[6:9],
+            many_refs[9:10],
+        ]
+        for ref, result in zip(many_refs, results):
+            if ref.toString().endswith("3"):
+                assert isinstance(result, BatchElementError)
+                assert result.code == BatchElementError.ErrorCode.kUnknown
+            else:
+                assert result.getTraitProperty("trait", "ref") == ref.toString()
+
+    def test_when_thread_safe_then_callbacks_called_on_calling_thread(
+        self,
+        thread_safe_manager,
+        mock_manager_interface,
+        many_refs,
+        an_entity_trait_set,
+        a_context,
+    ):
+        mock_manager_interface.mock.resolve.side_effect = self.resolve_refs_to_their_string
+        thread_safe_manager.setResolveConcurrency(4, 2)
+        calling_thread = threading.current_thread()
+        callback_threads = set()
+
+        def callback(*_args):
+            callback_threads.add(threading.current_thread())
+
+        thread_safe_manager.resolve(many_refs, an_entity_trait_set, a_context, callback, callback)
+
+        assert callback_threads == {calling_thread}
+
+    def test_when_thread_safe_then_chunks_resolved_on_calling_thread_and_pooled_threads(
+        self,
+        thread_safe_manager,
+        mock_manager_interface,
+        many_refs,
+        an_entity_trait_set,
+        a_context,
+    ):
+        calling_thread = threading.get_ident()
+        calling_thread_resolved = threading.Event()
+        resolving_threads = set()
+
+        def record_thread_then_resolve(*args):
+            thread = threading.get_ident()
+            resolving_threads.add(thread)
+            if thread == calling_thread:
+                calling_thread_resolved.set()
+            else:
+                # Leave chunks for the calling thread to claim.
+                assert calling_thread_resolved.wait(timeout=10)
+            self.resolve_refs_to_their_string(*args)
+
+        mock_manager_interface.mock.resolve.side_effect = record_thread_then_resolve
+        thread_safe_manager.setResolveConcurrency(2, 1)
+
+        for _ in range(5):
+            thread_safe_manager.resolve(
+                many_refs, an_entity_trait_set, a_context, mock.Mock(), mock.Mock()
+            )
+
+        assert mock_manager_interface.mock.resolve.call_count == 5 * len(many_refs)
+        assert calling_thread in resolving_threads
+        assert len(resolving_threads) <= 2
+
+    def test_when_not_thread_safe_then_batch_not_split(
+        self, manager, mock_manager_interface, many_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = self.resolve_refs_to_their_string
+        manager.initialize({})
+        manager.setResolveConcurrency(4, 3)
+
+        manager.resolve(
+            many_refs, an_entity_trait_set, a_context, Manager.BatchElementErrorPolicyTag.kVariant
+        )
+
+        mock_manager_interface.mock.resolve.assert_called_once()
+        assert mock_manager_interface.mock.resolve.call_args.args[0] == many_refs
+
+    def test_when_interface_raises_then_exception_propagated(
+        self,
+        thread_safe_manager,
+        mock_manager_interface,
+        many_refs,
+        an_entity_trait_set,
+        a_context,
+    ):
+        mock_manager_interface.mock.resolve.side_effect = RuntimeError("Resolve failed")
+        thread_safe_manager.setResolveConcurrency(4, 2)
+
+        with pytest.raises(RuntimeError, match="Resolve failed"):
+            thread_safe_manager.resolve(many_refs, an_entity_trait_set, a_context)
+
+    def test_when_batch_element_error_with_exception_policy_then_exception_raised(
+        self,
+        thread_safe_manager,
+        mock_manager_interface,
+        many_refs,
+        an_entity_trait_set,
+        a_context,
+    ):
+        mock_manager_interface.mock.resolve.side_effect = self.resolve_refs_to_their_string
+        thread_safe_manager.setResolveConcurrency(4, 2)
+
+        with pytest.raises(UnknownBatchElementException) as exc:
+            thread_safe_manager.resolve(many_refs, an_entity_trait_set, a_context)
+
+        assert exc.value.index == 3
+
+    def test_when_cancelled_then_no_further_chunks_dispatched(
+        self,
+        thread_safe_manager,
+        mock_manager_interface,
+        many_refs,
+        an_entity_trait_set,
+        a_context,
+    ):
+        a_context.cancellationToken = CancellationToken()
+
+        def resolve_then_cancel(refs, traitSet, context, hostSession, success, error):
+            self.resolve_refs_to_their_string(refs, traitSet, context, hostSession, success, error)
+            context.cancellationToken.cancel()
+
+        mock_manager_interface.mock.resolve.side_effect = resolve_then_cancel
+        thread_safe_manager.setResolveConcurrency(2, 2)
+
+        thread_safe_manager.resolve(
+            many_refs, an_entity_trait_set, a_context, mock.Mock(), mock.Mock()
+        )
+
+        # Each worker may have claimed a chunk before cancellation.
+        assert mock_manager_interface.mock.resolve.call_count <= 2
+
+
+class Test_Manager_resolveToBatch:
+    def test_method_defined_in_cpp(self, method_introspector):
+        assert not method_introspector.is_defined_in_python(Manager.resolveToBatch)
+        assert method_introspector.is_implemented_once(Manager, "resolveToBatch")
+
+    def test_when_resolved_then_batch_populated_from_interface(
+        self, manager, mock_manager_interface, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+        refs = [manager.createEntityReference(f"asset://{idx}") for idx in range(5)]
+
+        results = manager.resolveToBatch(refs, an_entity_trait_set, a_context)
+
+        assert isinstance(results, TraitsDataBatch)
+        assert results.size() == 5
+        assert results.column("trait", "ref") == [
+            "asset://0",
+            "asset://1",
+            "asset://2",
+            None,
+            "asset://4",
+        ]
+        assert results.error(3).code == BatchElementError.ErrorCode.kUnknown
+
+
+class Test_Manager_resolveAsync:
+    @pytest.fixture
+    def some_refs(self, manager):
+        return [manager.createEntityReference(f"asset://{idx}") for idx in range(5)]
+
+    @pytest.fixture
+    def resolving_manager(self, manager, mock_manager_interface):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+        return manager
+
+    def test_method_defined_in_cpp(self, method_introspector):
+        assert not method_introspector.is_defined_in_python(Manager.resolveAsync)
+        assert method_introspector.is_implemented_once(Manager, "resolveAsync")
+
+    def test_when_interface_not_async_then_resolved_on_worker_thread(
+        self, resolving_manager, some_refs, an_entity_trait_set, a_context
+    ):
+        done = threading.Event()
+        callback_threads = set()
+        results = {}
+        errors = {}
+        completion_errors = []
+
+        def success(idx, data):
+            callback_threads.add(threading.current_thread())
+            results[idx] = data
+
+        def error(idx, batch_element_error):
+            callback_threads.add(threading.current_thread())
+            errors[idx] = batch_element_error
+
+        def completion(exception):
+            completion_errors.append(exception)
+            done.set()
+
+        resolving_manager.resolveAsync(
+            some_refs, an_entity_trait_set, a_context, success, error, completion
+        )
+
+        assert done.wait(timeout=10)
+        assert completion_errors == [None]
+        assert threading.current_thread() not in callback_threads
+        assert sorted(results) == [0, 1, 2, 4]
+        assert results[4].getTraitProperty("trait", "ref") == "asset://4"
+        assert list(errors) == [3]
+
+    def test_when_interface_not_async_and_cancelled_then_no_chunks_dispatched(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.info.return_value = {constants.kField_IsThreadSafe: True}
+        manager.initialize({})
+        manager.setResolveConcurrency(2, 1)
+        a_context.cancellationToken = CancellationToken()
+        a_context.cancellationToken.cancel()
+        done = threading.Event()
+        completion_errors = []
+
+        def completion(exception):
+            completion_errors.append(exception)
+            done.set()
+
+        manager.resolveAsync(
+            some_refs, an_entity_trait_set, a_context, mock.Mock(), mock.Mock(), completion
+        )
+
+        assert done.wait(timeout=10)
+        assert completion_errors == [None]
+        mock_manager_interface.mock.resolve.assert_not_called()
+
+    def test_when_interface_raises_then_exception_given_to_completion_callback(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = ValueError("server unavailable")
+        done = threading.Event()
+        completion_errors = []
+
+        def completion(exception):
+            completion_errors.append(exception)
+            done.set()
+
+        manager.resolveAsync(
+            some_refs, an_entity_trait_set, a_context, mock.Mock(), mock.Mock(), completion
+        )
+
+        assert done.wait(timeout=10)
+        assert isinstance(completion_errors[0], ValueError)
+        assert str(completion_errors[0]) == "server unavailable"
+
+    def test_when_no_errors_then_future_holds_list_of_traits_data(
+        self, resolving_manager, some_refs, an_entity_trait_set, a_context
+    ):
+        del some_refs[3]
+
+        future = resolving_manager.resolveAsync(some_refs, an_entity_trait_set, a_context)
+
+        assert isinstance(future, concurrent.futures.Future)
+        results = future.result(timeout=10)
+        assert [result.getTraitProperty("trait", "ref") for result in results] == [
+            ref.toString() for ref in some_refs
+        ]
+
+    @pytest.mark.parametrize("tag", ((), (Manager.BatchElementErrorPolicyTag.kException,)))
+    def test_when_element_error_with_exception_policy_then_future_raises(
+        self, resolving_manager, some_refs, an_entity_trait_set, a_context, tag
+    ):
+        future = resolving_manager.resolveAsync(some_refs, an_entity_trait_set, a_context, *tag)
+
+        with pytest.raises(UnknownBatchElementException) as exc:
+            future.result(timeout=10)
+
+        assert exc.value.index == 3
+        assert exc.value.error.message == "bad"
+
+    def test_when_element_error_with_variant_policy_then_future_holds_error(
+        self, resolving_manager, some_refs, an_entity_trait_set, a_context
+    ):
+        future = resolving_manager.resolveAsync(
+            some_refs, an_entity_trait_set, a_context, Manager.BatchElementErrorPolicyTag.kVariant
+        )
+
+        results = future.result(timeout=10)
+        assert isinstance(results[3], BatchElementError)
+        assert results[3].code == BatchElementError.ErrorCode.kUnknown
+        assert results[4].getTraitProperty("trait", "ref") == "asset://4"
+
+    def test_when_interface_raises_then_future_raises(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = ValueError("server unavailable")
+
+        future = manager.resolveAsync(some_refs, an_entity_trait_set, a_context)
+
+        with pytest.raises(ValueError, match="server unavailable"):
+            future.result(timeout=10)
+
+    def test_future_can_be_awaited_with_asyncio(
+        self, resolving_manager, some_refs, an_entity_trait_set, a_context
+    ):
+        async def resolve_all():
+            futures = [
+                resolving_manager.resolveAsync(
+                    [ref],
+                    an_entity_trait_set,
+                    a_context,
+                    Manager.BatchElementErrorPolicyTag.kVariant,
+                )
+                for ref in some_refs
+            ]
+            return await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+
+        results = asyncio.run(resolve_all())
+
+        assert [type(result) for (result,) in results] == [
+            TraitsData,
+            TraitsData,
+            TraitsData,
+            BatchElementError,
+            TraitsData,
+        ]
+
+    def test_when_interface_is_async_then_completed_by_interface(
+        self, a_host_session, an_entity_trait_set, a_context
+    ):
+        class AsyncManagerInterface(managerApi.ManagerInterface):
+            def __init__(self):
+                super().__init__()
+                self.requests = []
+
+            def resolveAsync(self, refs, _traitSet, _context, _hostSession, *callbacks):
+                self.requests.append((refs, callbacks))
+                return True
+
+        manager_interface = AsyncManagerInterface()
+        manager = Manager(manager_interface, a_host_session)
+        refs = [EntityReference("asset://a"), EntityReference("asset://b")]
+
+        future = manager.resolveAsync(refs, an_entity_trait_set, a_context)
+
+        assert not future.done()
+        ((requested_refs, (success, _error, completion)),) = manager_interface.requests
+        assert requested_refs == refs
+
+        def respond():
+            for idx, ref in enumerate(requested_refs):
+                traits_data = TraitsData()
+                traits_data.setTraitProperty("trait", "ref", ref.toString())
+                success(idx, traits_data)
+            completion(None)
+
+        responder = threading.Thread(target=respond)
+        responder.start()
+        responder.join()
+
+        results = future.result(timeout=10)
+        assert [result.getTraitProperty("trait", "ref") for result in results] == [
+            "asset://a",
+            "asset://b",
+        ]
+
+    def test_when_interface_is_async_and_fails_then_future_raises(
+        self, a_host_session, an_entity_trait_set, a_context
+    ):
+        class FailingManagerInterface(managerApi.ManagerInterface):
+            def resolveAsync(self, _refs, _traitSet, _context, _hostSession, *callbacks):
+                _success, _error, completion = callbacks
+                completion(RuntimeError("connection lost"))
+                return True
+
+        manager = Manager(FailingManagerInterface(), a_host_session)
+
+        future = manager.resolveAsync(
+            [EntityReference("asset://a")], an_entity_trait_set, a_context
+        )
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            future.result(timeout=10)
+
+
+class Test_Manager_iterResolve:
+    @pytest.fixture
+    def some_refs(self, manager):
+        return [manager.createEntityReference(f"asset://{idx}") for idx in range(5)]
+
+    def test_method_defined_in_python(self, method_introspector):
+        assert method_introspector.is_defined_in_python(Manager.iterResolve)
+        assert method_introspector.is_implemented_once(Manager, "iterResolve")
+
+    def test_yields_index_and_result_for_each_entity(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+
+        results = dict(manager.iterResolve(some_refs, an_entity_trait_set, a_context))
+
+        assert sorted(results) == [0, 1, 2, 3, 4]
+        assert isinstance(results[3], BatchElementError)
+        assert results[4].getTraitProperty("trait", "ref") == "asset://4"
+
+    def test_results_yielded_before_manager_has_finished(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        first_consumed = threading.Event()
+
+        def resolve_waiting_for_consumer(refs, _traitSet, _context, _hostSession, success, _error):
+            for idx, _ref in enumerate(refs):
+                success(idx, TraitsData())
+                if idx == 0:
+                    assert first_consumed.wait(timeout=10)
+
+        mock_manager_interface.mock.resolve.side_effect = resolve_waiting_for_consumer
+
+        results = manager.iterResolve(some_refs, an_entity_trait_set, a_context)
+        first_index, _ = next(results)
+        first_consumed.set()
+
+        assert first_index == 0
+        assert [idx for idx, _ in results] == [1, 2, 3, 4]
+
+    def test_when_interface_raises_then_iterator_raises(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = ValueError("server unavailable")
+
+        with pytest.raises(ValueError, match="server unavailable"):
+            list(manager.iterResolve(some_refs, an_entity_trait_set, a_context))
+
+    def test_when_context_has_no_token_then_interface_given_copy_with_token(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        a_state = managerApi.ManagerStateBase()
+        context = Context(access=Context.Access.kRead, managerState=a_state)
+
+        list(manager.iterResolve(some_refs, an_entity_trait_set, context))
+
+        resolve_context = mock_manager_interface.mock.resolve.call_args.args[2]
+        assert context.cancellationToken is None
+        assert isinstance(resolve_context.cancellationToken, CancellationToken)
+        assert resolve_context.access == Context.Access.kRead
+        # Shared, so session and permanent cached results are re-used.
+        assert resolve_context.managerState is a_state
+        assert not resolve_context.cancellationToken.isCancelled()
+
+    def test_when_closed_early_then_own_token_cancelled_and_visible_to_interface(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        first_consumed = threading.Event()
+        resolved = []
+
+        def resolve_until_cancelled(refs, _traitSet, context, _hostSession, success, _error):
+            for idx, _ref in enumerate(refs):
+                if context.cancellationToken.isCancelled():
+                    return
+                success(idx, TraitsData())
+                resolved.append(idx)
+                if idx == 0:
+                    assert first_consumed.wait(timeout=10)
+
+        done = threading.Event()
+        mock_manager_interface.mock.resolve.side_effect = lambda *args: (
+            resolve_until_cancelled(*args),
+            done.set(),
+        )
+
+        results = manager.iterResolve(some_refs, an_entity_trait_set, Context())
+        next(results)
+        results.close()
+        first_consumed.set()
+
+        assert done.wait(timeout=10)
+        resolve_context = mock_manager_interface.mock.resolve.call_args.args[2]
+        assert resolve_context.cancellationToken.isCancelled()
+        assert resolved == [0]
+
+    def test_when_closed_early_then_host_token_not_cancelled(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        a_context.cancellationToken = CancellationToken()
+        first_consumed = threading.Event()
+        done = threading.Event()
+
+        def resolve_waiting_for_consumer(refs, _traitSet, _context, _hostSession, success, _error):
+            for idx, _ref in enumerate(refs):
+                success(idx, TraitsData())
+                if idx == 0:
+                    assert first_consumed.wait(timeout=10)
+            done.set()
+
+        mock_manager_interface.mock.resolve.side_effect = resolve_waiting_for_consumer
+
+        results = manager.iterResolve(some_refs, an_entity_trait_set, a_context)
+        next(results)
+        results.close()
+        first_consumed.set()
+
+        assert done.wait(timeout=10)
+        assert not a_context.cancellationToken.isCancelled()
+
+    def test_when_cancelled_by_host_then_iteration_stops(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+        a_context.cancellationToken = CancellationToken()
+
+        results = []
+        for idx, _ in manager.iterResolve(some_refs, an_entity_trait_set, a_context):
+            results.append(idx)
+            a_context.cancellationToken.cancel()
+
+        assert len(results) == 1
+
+    def test_when_completed_then_token_not_cancelled(
+        self, manager, some_refs, an_entity_trait_set, a_context
+    ):
+        a_context.cancellationToken = CancellationToken()
+
+        list(manager.iterResolve(some_refs, an_entity_trait_set, a_context))
+
+        assert not a_context.cancellationToken.isCancelled()
+
+
+class Test_Manager_setResolveCacheCapacity:
+    @pytest.fixture
+    def caching_manager(self, manager, mock_manager_interface):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+        manager.setResolveCacheCapacity(2)
+        return manager
+
+    @pytest.fixture
+    def some_refs(self, manager):
+        return [manager.createEntityReference(f"asset://{idx}") for idx in range(3)]
+
+    def test_when_not_configured_then_every_resolve_calls_interface(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+        context = Context(retention=Context.Retention.kSession)
+
+        manager.resolve(some_refs[:1], an_entity_trait_set, context)
+        manager.resolve(some_refs[:1], an_entity_trait_set, context)
+
+        assert mock_manager_interface.mock.resolve.call_count == 2
+
+    @pytest.mark.parametrize(
+        "retention", (Context.Retention.kSession, Context.Retention.kPermanent)
+    )
+    def test_when_session_retention_then_cached_across_contexts(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set, retention
+    ):
+        first = caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=retention)
+        )
+        second = caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=retention)
+        )
+
+        mock_manager_interface.mock.resolve.assert_called_once()
+        assert second == first
+        assert second is not first
+
+    def test_when_transient_retention_then_cached_only_for_same_context(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        context = Context(retention=Context.Retention.kTransient)
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+
+        assert mock_manager_interface.mock.resolve.call_count == 1
+
+        caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=Context.Retention.kTransient)
+        )
+
+        assert mock_manager_interface.mock.resolve.call_count == 2
+
+    def test_when_ignored_retention_then_not_cached(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        context = Context(retention=Context.Retention.kIgnored)
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+
+        assert mock_manager_interface.mock.resolve.call_count == 2
+
+    def test_when_different_trait_set_or_access_then_not_served_from_cache(
+        self, caching_manager, mock_manager_interface, some_refs
+    ):
+        session = Context.Retention.kSession
+        caching_manager.resolve(some_refs[0], {"a", "b"}, Context(retention=session))
+        caching_manager.resolve(some_refs[0], {"b", "a"}, Context(retention=session))
+        caching_manager.resolve(some_refs[0], {"a"}, Context(retention=session))
+        caching_manager.resolve(
+            some_refs[0],
+            {"a"},
+            Context(access=Context.Access.kWrite, retention=session),
+        )
+
+        assert mock_manager_interface.mock.resolve.call_count == 3
+
+    def test_when_different_locale_then_not_served_from_cache(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        session = Context.Retention.kSession
+        a_locale = TraitsData({"locale"})
+        a_locale.setTraitProperty("locale", "name", "a")
+        another_locale = TraitsData({"locale"})
+        another_locale.setTraitProperty("locale", "name", "b")
+
+        caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=session, locale=a_locale)
+        )
+        caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=session, locale=another_locale)
+        )
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, Context(retention=session))
+
+        assert mock_manager_interface.mock.resolve.call_count == 3
+
+    def test_when_equal_locale_then_served_from_cache(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        session = Context.Retention.kSession
+        a_locale = TraitsData()
+        a_locale.setTraitProperty("locale", "name", "a")
+        a_locale.setTraitProperty("other", "value", 1)
+        an_equal_locale = TraitsData()
+        an_equal_locale.setTraitProperty("other", "value", 1)
+        an_equal_locale.setTraitProperty("locale", "name", "a")
+
+        caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=session, locale=a_locale)
+        )
+        caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=session, locale=an_equal_locale)
+        )
+
+        assert mock_manager_interface.mock.resolve.call_count == 1
+
+    def test_when_different_manager_state_then_not_served_from_cache(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        caching_manager.setResolveCacheCapacity(4)
+        session = Context.Retention.kSession
+        a_state = managerApi.ManagerStateBase()
+        another_state = managerApi.ManagerStateBase()
+
+        caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=session, managerState=a_state)
+        )
+        caching_manager.resolve(
+            some_refs[0],
+            an_entity_trait_set,
+            Context(retention=session, managerState=another_state),
+        )
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, Context(retention=session))
+
+        assert mock_manager_interface.mock.resolve.call_count == 3
+
+        caching_manager.resolve(
+            some_refs[0], an_entity_trait_set, Context(retention=session, managerState=a_state)
+        )
+
+        assert mock_manager_interface.mock.resolve.call_count == 3
+
+    def test_when_registered_then_target_and_published_refs_not_served_from_cache(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        caching_manager.setResolveCacheCapacity(len(some_refs))
+        context = Context(retention=Context.Retention.kSession)
+        caching_manager.resolve(some_refs, an_entity_trait_set, context)
+
+        def publish_as_next_ref(_refs, _datas, _context, _hostSession, success, _error):
+            success(0, some_refs[1])
+
+        mock_manager_interface.mock.register.side_effect = publish_as_next_ref
+        caching_manager.register(
+            some_refs[:1], [TraitsData(an_entity_trait_set)], context, mock.Mock(), mock.Mock()
+        )
+        mock_manager_interface.mock.resolve.reset_mock()
+
+        caching_manager.resolve(some_refs, an_entity_trait_set, context)
+
+        assert mock_manager_interface.mock.resolve.call_args.args[0] == some_refs[:2]
+
+    def test_when_batch_partially_cached_then_only_misses_passed_to_interface(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        context = Context(retention=Context.Retention.kSession)
+        caching_manager.resolve(some_refs[1:2], an_entity_trait_set, context)
+
+        results = caching_manager.resolve(some_refs, an_entity_trait_set, context)
+
+        assert mock_manager_interface.mock.resolve.call_args.args[0] == [
+            some_refs[0],
+            some_refs[2],
+        ]
+        for ref, result in zip(some_refs, results):
+            assert result.getTraitProperty("trait", "ref") == ref.toString()
+
+    def test_when_capacity_exceeded_then_least_recently_used_evicted(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set
+    ):
+        context = Context(retention=Context.Retention.kSession)
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+        caching_manager.resolve(some_refs[1], an_entity_trait_set, context)
+        # Touch the first, so the second becomes least recently used.
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+        caching_manager.resolve(some_refs[2], an_entity_trait_set, context)
+        mock_manager_interface.mock.resolve.reset_mock()
+
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+        mock_manager_interface.mock.resolve.assert_not_called()
+
+        caching_manager.resolve(some_refs[1], an_entity_trait_set, context)
+        mock_manager_interface.mock.resolve.assert_called_once()
+
+    def test_when_batch_element_error_then_not_cached(
+        self, caching_manager, mock_manager_interface, an_entity_trait_set
+    ):
+        context = Context(retention=Context.Retention.kSession)
+        bad_ref = caching_manager.createEntityReference("asset://3")
+
+        for _ in range(2):
+            with pytest.raises(UnknownBatchElementException):
+                caching_manager.resolve(bad_ref, an_entity_trait_set, context)
+
+        assert mock_manager_interface.mock.resolve.call_count == 2
+
+    def test_when_result_mutated_then_cache_unaffected(
+        self, caching_manager, some_refs, an_entity_trait_set
+    ):
+        context = Context(retention=Context.Retention.kSession)
+        first = caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+        first.setTraitProperty("trait", "ref", "mutated")
+
+        second = caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+
+        assert second.getTraitProperty("trait", "ref") == some_refs[0].toString()
+
+    @pytest.mark.parametrize("flush", ("flushResolveCache", "flushCaches"))
+    def test_when_flushed_then_interface_called_again(
+        self, caching_manager, mock_manager_interface, some_refs, an_entity_trait_set, flush
+    ):
+        context = Context(retention=Context.Retention.kSession)
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+
+        getattr(caching_manager, flush)()
+        caching_manager.resolve(some_refs[0], an_entity_trait_set, context)
+
+        assert mock_manager_interface.mock.resolve.call_count == 2
+
 
 batch_element_error_codes = [
     BatchElementError.ErrorCode.kUnknown,
@@ -1189,6 +2184,140 @@ class Test_Manager_resolve_with_batch_variant_overload:
         assert actual_traitsdata_and_error[3] is traitsdata3
 
 
+class Test_Manager_resolve_with_batch_collect_overload:
+    def test_when_mixed_output_out_of_order_then_datas_and_sorted_errors_returned(
+        self,
+        manager,
+        mock_manager_interface,
+        a_host_session,
+        a_ref,
+        an_entity_trait_set,
+        a_context,
+    ):
+        method = mock_manager_interface.mock.resolve
+
+        entity_refs = [a_ref] * 4
+
+        batch_element_error0 = BatchElementError(
+            BatchElementError.ErrorCode.kEntityResolutionError, "0 some string ✨"
+        )
+        traitsdata1 = TraitsData({"trait1"})
+        batch_element_error2 = BatchElementError(
+            BatchElementError.ErrorCode.kEntityAccessError, "2 some string ✨"
+        )
+        traitsdata3 = TraitsData({"trait3"})
+
+        def call_callbacks(*_args):
+            method.call_args[0][4](3, traitsdata3)
+            method.call_args[0][5](2, batch_element_error2)
+            method.call_args[0][4](1, traitsdata1)
+            method.call_args[0][5](0, batch_element_error0)
+
+        method.side_effect = call_callbacks
+
+        actual_traitsdatas, actual_errors = manager.resolve(
+            entity_refs,
+            an_entity_trait_set,
+            a_context,
+            Manager.BatchElementErrorPolicyTag.kCollect,
+        )
+
+        method.assert_called_once_with(
+            entity_refs,
+            an_entity_trait_set,
+            a_context,
+            a_host_session,
+            mock.ANY,
+            mock.ANY,
+        )
+
+        assert actual_traitsdatas == [None, traitsdata1, None, traitsdata3]
+        assert [idx for idx, _ in actual_errors] == [0, 2]
+        assert_BatchElementError_eq(actual_errors[0][1], batch_element_error0)
+        assert_BatchElementError_eq(actual_errors[1][1], batch_element_error2)
+
+    def test_when_no_errors_then_error_list_empty(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = (
+            lambda refs, _traitSet, _context, _hostSession, success, _error: [
+                success(idx, TraitsData()) for idx in range(len(refs))
+            ]
+        )
+
+        actual_traitsdatas, actual_errors = manager.resolve(
+            some_refs,
+            an_entity_trait_set,
+            a_context,
+            Manager.BatchElementErrorPolicyTag.kCollect,
+        )
+
+        assert len(actual_traitsdatas) == len(some_refs)
+        assert None not in actual_traitsdatas
+        assert actual_errors == []
+
+    def test_when_whole_batch_error_then_raised(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = ValueError("whole batch")
+
+        with pytest.raises(ValueError, match="whole batch"):
+            manager.resolve(
+                some_refs,
+                an_entity_trait_set,
+                a_context,
+                Manager.BatchElementErrorPolicyTag.kCollect,
+            )
+
+
+class Test_Manager_resolve_with_batch_skip_overload:
+    def test_when_mixed_output_then_failures_are_none(
+        self,
+        manager,
+        mock_manager_interface,
+        a_ref,
+        an_entity_trait_set,
+        a_context,
+    ):
+        method = mock_manager_interface.mock.resolve
+
+        entity_refs = [a_ref] * 3
+
+        traitsdata0 = TraitsData({"trait0"})
+        traitsdata2 = TraitsData({"trait2"})
+
+        def call_callbacks(*_args):
+            method.call_args[0][4](2, traitsdata2)
+            method.call_args[0][5](
+                1, BatchElementError(BatchElementError.ErrorCode.kUnknown, "some string ✨")
+            )
+            method.call_args[0][4](0, traitsdata0)
+
+        method.side_effect = call_callbacks
+
+        actual_traitsdatas = manager.resolve(
+            entity_refs,
+            an_entity_trait_set,
+            a_context,
+            Manager.BatchElementErrorPolicyTag.kSkip,
+        )
+
+        assert actual_traitsdatas == [traitsdata0, None, traitsdata2]
+
+    def test_when_whole_batch_error_then_raised(
+        self, manager, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = ValueError("whole batch")
+
+        with pytest.raises(ValueError, match="whole batch"):
+            manager.resolve(
+                some_refs,
+                an_entity_trait_set,
+                a_context,
+                Manager.BatchElementErrorPolicyTag.kSkip,
+            )
+
+
 class Test_Manager_managementPolicy:
     def test_method_defined_in_cpp(self, method_introspector):
         assert not method_introspector.is_defined_in_python(Manager.managementPolicy)
@@ -1387,6 +2516,14 @@ class Test_Manager_createChildContext:
         assert context_b.locale == context_b.locale
         mock_manager_interface.mock.createChildState.assert_not_called()
 
+    def test_when_parent_has_cancellationToken_then_shared_with_child(self, manager):
+        context_a = Context()
+        context_a.cancellationToken = CancellationToken()
+
+        context_b = manager.createChildContext(context_a)
+
+        assert context_b.cancellationToken is context_a.cancellationToken
+
 
 class Test_Manager_persistenceTokenForContext:
     def test_method_defined_in_cpp(self, method_introspector):
@@ -1448,7 +2585,300 @@ class Test_Manager_contextFromPersistenceToken:
         mock_manager_interface.mock.stateFromPersistenceToken.assert_not_called()
 
 
+class Test_ManagerMetrics:
+    def test_method_names(self):
+        assert ManagerMetrics.kMethodNames[int(ManagerMetrics.Method.kResolve)] == "resolve"
+        assert ManagerMetrics.kMethodNames[int(ManagerMetrics.Method.kRegister)] == "register"
+        assert (
+            ManagerMetrics.kMethodNames[int(ManagerMetrics.Method.kResolveAsync)] == "resolveAsync"
+        )
+        assert (
+            ManagerMetrics.kMethodNames[int(ManagerMetrics.Method.kContextFromPersistenceToken)]
+            == "contextFromPersistenceToken"
+        )
+        assert len(ManagerMetrics.kMethodNames) == len(ManagerMetrics.Method.__members__)
+
+    @pytest.mark.parametrize(
+        "value,expected_bucket",
+        ((0, 0), (1, 1), (2, 2), (3, 2), (4, 3), (1023, 10), (1024, 11), (2**64 - 1, 63)),
+    )
+    def test_histogramBucket(self, value, expected_bucket):
+        assert ManagerMetrics.histogramBucket(value) == expected_bucket
+
+
+class Test_Manager_metrics:
+    @pytest.fixture
+    def metrics(self, manager):
+        a_metrics = manager.metrics()
+        # Discard calls made whilst constructing fixtures.
+        a_metrics.reset()
+        return a_metrics
+
+    def test_method_defined_in_cpp(self, method_introspector):
+        assert not method_introspector.is_defined_in_python(Manager.metrics)
+        assert method_introspector.is_implemented_once(Manager, "metrics")
+
+    def test_when_created_then_enabled_and_empty(self, manager):
+        metrics = manager.metrics()
+
+        assert metrics.isEnabled() is True
+        for method in ManagerMetrics.Method.__members__.values():
+            method_metrics = metrics.methodMetrics(method)
+            assert method_metrics.callCount == 0
+            assert sum(method_metrics.batchSizeHistogram) == 0
+            assert len(method_metrics.batchSizeHistogram) == ManagerMetrics.kNumHistogramBuckets
+
+    def test_outlives_python_reference_to_manager(self, mock_manager_interface, a_host_session):
+        metrics = Manager(mock_manager_interface, a_host_session).metrics()
+
+        metrics.reset()
+
+        assert metrics.methodMetrics(ManagerMetrics.Method.kResolve).callCount == 0
+
+    def test_when_resolve_called_then_call_batch_size_latency_and_errors_recorded(
+        self, manager, metrics, mock_manager_interface, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+        refs = [EntityReference(f"asset://{idx}") for idx in range(1, 5)]
+
+        manager.resolve(
+            refs,
+            an_entity_trait_set,
+            a_context,
+            Manager.BatchElementErrorPolicyTag.kVariant,
+        )
+        manager.resolve(refs[0], an_entity_trait_set, a_context)
+
+        resolve_metrics = metrics.methodMetrics(ManagerMetrics.Method.kResolve)
+        assert resolve_metrics.callCount == 2
+        assert resolve_metrics.exceptionCount == 0
+        assert resolve_metrics.batchSizeHistogram[ManagerMetrics.histogramBucket(4)] == 1
+        assert resolve_metrics.batchSizeHistogram[ManagerMetrics.histogramBucket(1)] == 1
+        assert sum(resolve_metrics.latencyNsHistogram) == 2
+        assert resolve_metrics.totalLatencyNs > 0
+        assert resolve_metrics.errorCount(BatchElementError.ErrorCode.kUnknown) == 1
+        assert resolve_metrics.errorCount(BatchElementError.ErrorCode.kEntityResolutionError) == 0
+
+    def test_when_resolve_raises_then_exception_recorded(
+        self, manager, metrics, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = RuntimeError("oops")
+
+        with pytest.raises(RuntimeError):
+            manager.resolve(some_refs, an_entity_trait_set, a_context)
+
+        resolve_metrics = metrics.methodMetrics(ManagerMetrics.Method.kResolve)
+        assert resolve_metrics.callCount == 1
+        assert resolve_metrics.exceptionCount == 1
+
+    def test_when_resolveToBatch_called_then_recorded_as_resolve(
+        self, manager, metrics, mock_manager_interface, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+        refs = [EntityReference(f"asset://{idx}") for idx in range(1, 5)]
+
+        manager.resolveToBatch(refs, an_entity_trait_set, a_context)
+
+        resolve_metrics = metrics.methodMetrics(ManagerMetrics.Method.kResolve)
+        assert resolve_metrics.callCount == 1
+        assert resolve_metrics.batchSizeHistogram[ManagerMetrics.histogramBucket(4)] == 1
+        assert resolve_metrics.errorCount(BatchElementError.ErrorCode.kUnknown) == 1
+
+    def test_when_resolveAsync_called_then_recorded_as_resolveAsync(
+        self, manager, metrics, mock_manager_interface, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = (
+            Test_Manager_setResolveConcurrency.resolve_refs_to_their_string
+        )
+        refs = [EntityReference(f"asset://{idx}") for idx in range(1, 5)]
+
+        manager.resolveAsync(
+            refs, an_entity_trait_set, a_context, Manager.BatchElementErrorPolicyTag.kVariant
+        ).result(timeout=10)
+
+        async_metrics = metrics.methodMetrics(ManagerMetrics.Method.kResolveAsync)
+        assert async_metrics.callCount == 1
+        assert async_metrics.exceptionCount == 0
+        assert async_metrics.batchSizeHistogram[ManagerMetrics.histogramBucket(4)] == 1
+        assert async_metrics.totalLatencyNs > 0
+        assert async_metrics.errorCount(BatchElementError.ErrorCode.kUnknown) == 1
+        assert metrics.methodMetrics(ManagerMetrics.Method.kResolve).callCount == 0
+
+    def test_when_resolveAsync_fails_then_exception_recorded(
+        self, manager, metrics, mock_manager_interface, some_refs, an_entity_trait_set, a_context
+    ):
+        mock_manager_interface.mock.resolve.side_effect = RuntimeError("oops")
+
+        with pytest.raises(RuntimeError):
+            manager.resolveAsync(some_refs, an_entity_trait_set, a_context).result(timeout=10)
+
+        async_metrics = metrics.methodMetrics(ManagerMetrics.Method.kResolveAsync)
+        assert async_metrics.callCount == 1
+        assert async_metrics.exceptionCount == 1
+
+    def test_when_interface_is_async_then_resolveAsync_recorded_on_completion(
+        self, a_host_session, an_entity_trait_set, a_context
+    ):
+        class AsyncManagerInterface(managerApi.ManagerInterface):
+            def __init__(self):
+                super().__init__()
+                self.callbacks = None
+
+            def resolveAsync(self, _refs, _traitSet, _context, _hostSession, *callbacks):
+                self.callbacks = callbacks
+                return True
+
+        manager_interface = AsyncManagerInterface()
+        manager = Manager(manager_interface, a_host_session)
+        metrics = manager.metrics()
+        future = manager.resolveAsync(
+            [EntityReference("asset://a")], an_entity_trait_set, a_context
+        )
+
+        assert metrics.methodMetrics(ManagerMetrics.Method.kResolveAsync).callCount == 0
+
+        _success, error, completion = manager_interface.callbacks
+        error(0, BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, ""))
+        completion(None)
+
+        with pytest.raises(EntityAccessErrorBatchElementException):
+            future.result(timeout=10)
+        async_metrics = metrics.methodMetrics(ManagerMetrics.Method.kResolveAsync)
+        assert async_metrics.callCount == 1
+        assert async_metrics.exceptionCount == 0
+        assert async_metrics.errorCount(BatchElementError.ErrorCode.kEntityAccessError) == 1
+
+    def test_when_preflight_and_register_report_errors_then_recorded(
+        self,
+        manager,
+        metrics,
+        mock_manager_interface,
+        some_refs,
+        an_entity_trait_set,
+        some_entity_traitsdatas,
+        a_context,
+    ):
+        def report_access_error(*args):
+            error_callback = args[-1]
+            error_callback(
+                0, BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, "")
+            )
+
+        mock_manager_interface.mock.preflight.side_effect = report_access_error
+        mock_manager_interface.mock.register.side_effect = report_access_error
+
+        manager.preflight(some_refs, an_entity_trait_set, a_context, mock.Mock(), mock.Mock())
+        manager.register(some_refs, some_entity_traitsdatas, a_context, mock.Mock(), mock.Mock())
+
+        for method in (ManagerMetrics.Method.kPreflight, ManagerMetrics.Method.kRegister):
+            method_metrics = metrics.methodMetrics(method)
+            assert method_metrics.callCount == 1
+            assert (
+                method_metrics.batchSizeHistogram[ManagerMetrics.histogramBucket(len(some_refs))]
+                == 1
+            )
+            assert method_metrics.errorCount(BatchElementError.ErrorCode.kEntityAccessError) == 1
+
+    def test_when_other_methods_called_then_recorded(
+        self, manager, metrics, mock_manager_interface, some_entity_trait_sets, a_context
+    ):
+        mock_manager_interface.mock.managementPolicy.return_value = [
+            TraitsData() for _ in some_entity_trait_sets
+        ]
+        mock_manager_interface.mock.createState.return_value = managerApi.ManagerStateBase()
+        mock_manager_interface.mock.createChildState.return_value = managerApi.ManagerStateBase()
+        mock_manager_interface.mock.persistenceTokenForState.return_value = "token"
+        mock_manager_interface.mock.stateFromPersistenceToken.return_value = (
+            managerApi.ManagerStateBase()
+        )
+
+        manager.managementPolicy(some_entity_trait_sets, a_context)
+        manager.isEntityReferenceString("asset://a")
+        context = manager.createContext()
+        manager.createChildContext(context)
+        manager.persistenceTokenForContext(context)
+        manager.contextFromPersistenceToken("token")
+
+        for method in (
+            ManagerMetrics.Method.kManagementPolicy,
+            ManagerMetrics.Method.kIsEntityReferenceString,
+            ManagerMetrics.Method.kCreateContext,
+            ManagerMetrics.Method.kCreateChildContext,
+            ManagerMetrics.Method.kPersistenceTokenForContext,
+            ManagerMetrics.Method.kContextFromPersistenceToken,
+        ):
+            assert metrics.methodMetrics(method).callCount == 1
+
+        assert (
+            metrics.methodMetrics(ManagerMetrics.Method.kManagementPolicy).batchSizeHistogram[
+                ManagerMetrics.histogramBucket(len(some_entity_trait_sets))
+            ]
+            == 1
+        )
+
+    def test_when_reset_then_all_counts_zeroed(self, manager, metrics, mock_manager_interface):
+        mock_manager_interface.mock.createState.return_value = managerApi.ManagerStateBase()
+        manager.isEntityReferenceString("asset://a")
+        manager.createContext()
+
+        metrics.reset()
+
+        for method in ManagerMetrics.Method.__members__.values():
+            method_metrics = metrics.methodMetrics(method)
+            assert method_metrics.callCount == 0
+            assert method_metrics.totalLatencyNs == 0
+            assert sum(method_metrics.latencyNsHistogram) == 0
+
+    def test_when_disabled_then_calls_not_recorded(self, manager, metrics):
+        metrics.setEnabled(False)
+
+        manager.isEntityReferenceString("asset://a")
+
+        assert metrics.isEnabled() is False
+        assert metrics.methodMetrics(ManagerMetrics.Method.kIsEntityReferenceString).callCount == 0
+
+        metrics.setEnabled(True)
+        manager.isEntityReferenceString("asset://a")
+
+        assert metrics.methodMetrics(ManagerMetrics.Method.kIsEntityReferenceString).callCount == 1
+
+
 def assert_BatchElementError_eq(actual: BatchElementError, expected: BatchElementError):
     assert isinstance(actual, BatchElementError)
     assert actual.code == expected.code
     assert actual.message == expected.message
+
+
+class Test_Manager_setDebugCallsEnabled:
+    def test_when_not_enabled_then_calls_are_not_traced(self, manager, mock_logger):
+        manager.flushCaches()
+
+        assert manager.__class__ is Manager
+        mock_logger.mock.log.assert_not_called()
+
+    def test_when_enabled_then_calls_are_traced_to_host_session_logger(self, manager, mock_logger):
+        manager.setDebugCallsEnabled(True)
+
+        manager.flushCaches()
+
+        severities_and_messages = mock_logger.mock.log.call_args_list
+        assert len(severities_and_messages) == 2
+        entry, exit_ = (call.args for call in severities_and_messages)
+        assert entry[0] == LoggerInterface.Severity.kDebugApi
+        assert entry[1].startswith("-> ")
+        assert "flushCaches" in entry[1]
+        assert exit_[0] == LoggerInterface.Severity.kDebugApi
+        assert exit_[1].startswith("<- ")
+
+    def test_when_disabled_then_calls_are_no_longer_traced(self, manager, mock_logger):
+        manager.setDebugCallsEnabled(True)
+        manager.setDebugCallsEnabled(False)
+
+        manager.flushCaches()
+
+        assert manager.__class__ is Manager
+        mock_logger.mock.log.assert_not_called()
@@ -127,6 +127,57 @@ class Test_ManagerFactory_availableManagers:
 
         assert actual == expected
 
+    def test_when_factory_provides_details_then_implementation_not_instantiated(
+        self, mock_manager_implementation_factory, a_manager_factory
+    ):
+        identifiers = ["first.identifier", "second.identifier"]
+        mock_manager_implementation_factory.mock.identifiers.return_value = identifiers
+        first_detail = ManagerFactory.ManagerDetail(
+            identifier="first.identifier", displayName="First", info={"first": "info"}
+        )
+        second_detail = ManagerFactory.ManagerDetail(
+            identifier="second.identifier", displayName="Second", info={"second": "info"}
+        )
+        mock_manager_implementation_factory.mock.managerDetail.side_effect = [
+            first_detail,
+            second_detail,
+        ]
+
+        actual = a_manager_factory.availableManagers()
+
+        assert actual == {"first.identifier": first_detail, "second.identifier": second_detail}
+        mock_manager_implementation_factory.mock.instantiate.assert_not_called()
+
+    def test_when_factory_provides_some_details_then_only_others_instantiated(
+        self, create_mock_manager_interface, mock_manager_implementation_factory, a_manager_factory
+    ):
+        identifiers = ["first.identifier", "second.identifier"]
+        mock_manager_implementation_factory.mock.identifiers.return_value = identifiers
+        first_detail = ManagerFactory.ManagerDetail(
+            identifier="first.identifier", displayName="First", info={"first": "info"}
+        )
+        mock_manager_implementation_factory.mock.managerDetail.side_effect = [first_detail, None]
+
+        second_manager_interface = create_mock_manager_interface()
+        second_manager_interface.mock.identifier.return_value = "second.identifier"
+        second_manager_interface.mock.displayName.return_value = "Second"
+        second_manager_interface.mock.info.return_value = {"second": "info"}
+        mock_manager_implementation_factory.mock.instantiate.return_value = (
+            second_manager_interface
+        )
+
+        actual = a_manager_factory.availableManagers()
+
+        assert actual == {
+            "first.identifier": first_detail,
+            "second.identifier": ManagerFactory.ManagerDetail(
+                identifier="second.identifier", displayName="Second", info={"second": "info"}
+            ),
+        }
+        mock_manager_implementation_factory.mock.instantiate.assert_called_once_with(
+            "second.identifier"
+        )
+
 
 class Test_ManagerFactory_kDefaultManagerConfigEnvVarName:
     def test_has_expected_value(self):
@@ -144,6 +195,18 @@ class Test_ManagerFactory_defaultManagerForInterface:
             is None
         )
 
+    def test_when_debug_severity_not_logged_then_no_messages_logged(
+        self, mock_manager_implementation_factory, mock_host_interface, mock_logger
+    ):
+        mock_logger.mock.isSeverityLogged.return_value = False
+
+        ManagerFactory.defaultManagerForInterface(
+            mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        mock_logger.mock.isSeverityLogged.assert_called_once_with(mock_logger.Severity.kDebug)
+        mock_logger.mock.log.assert_not_called()
+
     def test_when_var_set_to_non_existent_path_then_runtime_error_raised(
         self,
         env_with_non_existent_manager_config,  # pylint: disable=unused-argument
@@ -218,6 +281,197 @@ class Test_ManagerFactory_defaultManagerForInterface:
         mock_manager_interface.mock.initialize.assert_called_once()
 
 
+class Test_ManagerFactory_loadDefaultManagerConfig:
+    def test_when_valid_config_then_identifier_and_settings_returned(self, resources_dir):
+        config = ManagerFactory.loadDefaultManagerConfig(
+            os.path.join(resources_dir, "default_manager.toml")
+        )
+
+        assert config == ManagerFactory.DefaultManagerConfig(
+            identifier="identifier.from.toml.file",
+            settings={
+                "a_string": "Hello 🐈",
+                "a_float": 3.141579,
+                "a_bool": False,
+                "a_int": 42,
+            },
+        )
+
+    def test_when_file_does_not_exist_then_runtime_error_raised(self):
+        with pytest.raises(RuntimeError) as exc:
+            ManagerFactory.loadDefaultManagerConfig("i/do/not/exist")
+        assert (
+            str(exc.value)
+            == "Could not load default manager config from 'i/do/not/exist', file does not exist."
+        )
+
+    def test_when_path_is_directory_then_runtime_error_raised_and_not_cached(self, tmp_path):
+        config_path = tmp_path / "config.toml"
+        config_path.mkdir()
+
+        with pytest.raises(RuntimeError) as exc:
+            ManagerFactory.loadDefaultManagerConfig(str(config_path))
+        assert str(exc.value).startswith(
+            f"Could not load default manager config from '{config_path}', "
+        )
+
+        config_path.rmdir()
+        config_path.write_text('[manager]\nidentifier = "an.identifier"\n')
+
+        config = ManagerFactory.loadDefaultManagerConfig(str(config_path))
+
+        assert config.identifier == "an.identifier"
+
+    def test_when_identifier_missing_then_runtime_error_raised(self, tmp_path):
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[manager.settings]\na_string = "value"\n')
+
+        with pytest.raises(RuntimeError) as exc:
+            ManagerFactory.loadDefaultManagerConfig(str(config_path))
+        assert str(exc.value) == (
+            f"Could not load default manager config from '{config_path}', no manager "
+            "identifier specified."
+        )
+
+    def test_when_file_unchanged_then_not_reparsed(self, tmp_path):
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[manager]\nidentifier = "first"\n')
+        ManagerFactory.loadDefaultManagerConfig(str(config_path))
+
+        # Keep the same size and modification time, such that the file
+        # appears unchanged.
+        stat = config_path.stat()
+        config_path.write_text('[manager]\nidentifier = "other"\n')
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        config = ManagerFactory.loadDefaultManagerConfig(str(config_path))
+
+        assert config.identifier == "first"
+
+    def test_when_file_modified_then_reparsed(self, tmp_path):
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[manager]\nidentifier = "first"\n')
+        ManagerFactory.loadDefaultManagerConfig(str(config_path))
+
+        config_path.write_text('[manager]\nidentifier = "modified"\n')
+
+        config = ManagerFactory.loadDefaultManagerConfig(str(config_path))
+
+        assert config.identifier == "modified"
+
+    def test_when_cache_cleared_then_reparsed(self, tmp_path):
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[manager]\nidentifier = "first"\n')
+        ManagerFactory.loadDefaultManagerConfig(str(config_path))
+
+        stat = config_path.stat()
+        config_path.write_text('[manager]\nidentifier = "other"\n')
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        ManagerFactory.clearDefaultManagerConfigCache()
+
+        config = ManagerFactory.loadDefaultManagerConfig(str(config_path))
+
+        assert config.identifier == "other"
+
+
+class Test_ManagerFactory_defaultManagerPooling:
+    def test_when_not_set_then_pooling_disabled(self):
+        assert ManagerFactory.defaultManagerPooling() is False
+
+    @pytest.mark.usefixtures("pooling_enabled")
+    def test_when_enabled_then_reports_enabled(self):
+        assert ManagerFactory.defaultManagerPooling() is True
+
+    @pytest.mark.usefixtures("env_with_test_manager_config", "pooling_enabled")
+    def test_when_pooling_enabled_then_manager_initialized_once(
+        self,
+        mock_manager_implementation_factory,
+        mock_host_interface,
+        mock_logger,
+        mock_manager_interface,
+    ):
+        mock_host_interface.mock.identifier.return_value = "a.host"
+
+        for _ in range(3):
+            ManagerFactory.defaultManagerForInterface(
+                mock_host_interface, mock_manager_implementation_factory, mock_logger
+            )
+
+        mock_manager_implementation_factory.mock.instantiate.assert_called_once()
+        mock_manager_interface.mock.initialize.assert_called_once()
+
+    @pytest.mark.usefixtures("env_with_test_manager_config")
+    def test_when_pooling_disabled_then_manager_initialized_each_time(
+        self,
+        mock_manager_implementation_factory,
+        mock_host_interface,
+        mock_logger,
+        mock_manager_interface,
+    ):
+        for _ in range(3):
+            ManagerFactory.defaultManagerForInterface(
+                mock_host_interface, mock_manager_implementation_factory, mock_logger
+            )
+
+        assert mock_manager_implementation_factory.mock.instantiate.call_count == 3
+        assert mock_manager_interface.mock.initialize.call_count == 3
+
+    @pytest.mark.usefixtures("env_with_test_manager_config", "pooling_enabled")
+    def test_when_host_identifier_differs_then_new_manager_created(
+        self,
+        mock_manager_implementation_factory,
+        create_mock_host_interface,
+        mock_logger,
+    ):
+        for host_identifier in ("a.host", "another.host"):
+            host_interface = create_mock_host_interface()
+            host_interface.mock.identifier.return_value = host_identifier
+            ManagerFactory.defaultManagerForInterface(
+                host_interface, mock_manager_implementation_factory, mock_logger
+            )
+
+        assert mock_manager_implementation_factory.mock.instantiate.call_count == 2
+
+    @pytest.mark.usefixtures("env_with_test_manager_config", "pooling_enabled")
+    def test_when_instances_differ_but_host_identifier_same_then_manager_reused(
+        self,
+        mock_logger,
+        mock_manager_interface,
+        create_mock_host_interface,
+    ):
+        factories = []
+        for _ in range(2):
+            host_interface = create_mock_host_interface()
+            host_interface.mock.identifier.return_value = "a.host"
+            factory = MockManagerImplementationFactory(mock_logger)
+            factory.mock.instantiate.return_value = mock_manager_interface
+            ManagerFactory.defaultManagerForInterface(host_interface, factory, mock_logger)
+            factories.append(factory)
+
+        factories[0].mock.instantiate.assert_called_once()
+        factories[1].mock.instantiate.assert_not_called()
+        mock_manager_interface.mock.initialize.assert_called_once()
+
+    @pytest.mark.usefixtures("env_with_test_manager_config", "pooling_enabled")
+    def test_when_pool_cleared_then_new_manager_created(
+        self,
+        mock_manager_implementation_factory,
+        mock_host_interface,
+        mock_logger,
+    ):
+        mock_host_interface.mock.identifier.return_value = "a.host"
+
+        ManagerFactory.defaultManagerForInterface(
+            mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+        ManagerFactory.clearDefaultManagerPool()
+        ManagerFactory.defaultManagerForInterface(
+            mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        assert mock_manager_implementation_factory.mock.instantiate.call_count == 2
+
+
 # TODO(DF) C++ specific tests can be removed once ManagerFactory is
 #  fully migrated to C++ (i.e. once Manager and possibly HostSession is
 #  fully migrated to C++).
@@ -394,9 +648,18 @@ def a_cpp_manager_factory(mock_host_interface, mock_manager_implementation_facto
 def mock_manager_implementation_factory(mock_logger, mock_manager_interface):
     factory = MockManagerImplementationFactory(mock_logger)
     factory.mock.instantiate.return_value = mock_manager_interface
+    factory.mock.managerDetail.return_value = None
     return factory
 
 
+@pytest.fixture
+def pooling_enabled():
+    ManagerFactory.setDefaultManagerPooling(True)
+    yield
+    ManagerFactory.setDefaultManagerPooling(False)
+    ManagerFactory.clearDefaultManagerPool()
+
+
 @pytest.fixture
 def resources_dir():
     test_dir = os.path.dirname(__file__)
@@ -437,3 +700,6 @@ class MockManagerImplementationFactory(ManagerImplementationFactoryInterface):
 
     def instantiate(self, identifier):
         return self.mock.instantiate(identifier)
+
+    def managerDetail(self, identifier):
+        return self.mock.managerDetail(identifier)
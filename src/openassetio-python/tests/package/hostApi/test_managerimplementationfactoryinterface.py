@@ -64,6 +64,11 @@ class Test_ManagerImplementationFactoryInterface_instantiate:
         )
 
 
+class Test_ManagerImplementationFactoryInterface_managerDetail:
+    def test_when_not_overridden_then_returns_none(self, a_manager_interface_factory_interface):
+        assert a_manager_interface_factory_interface.managerDetail("a.manager.identifier") is None
+
+
 @pytest.fixture
 def a_manager_interface_factory_interface(mock_logger):
     return ManagerImplementationFactoryInterface(mock_logger)
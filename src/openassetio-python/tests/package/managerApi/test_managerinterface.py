@@ -25,7 +25,13 @@ from unittest.mock import Mock
 
 import pytest
 
-from openassetio import EntityReference
+from openassetio import (
+    BatchElementError,
+    Context,
+    EntityReference,
+    TraitsData,
+    TraitsDataBatch,
+)
 from openassetio.managerApi import ManagerInterface, ManagerStateBase
 
 
@@ -126,6 +132,111 @@ class Test_ManagerInterface_stateFromPersistenceToken:
             ManagerInterface().stateFromPersistenceToken("", a_host_session)
 
 
+class Test_ManagerInterface_isEntityReferenceStrings:
+    def test_method_defined_in_cpp(self, method_introspector):
+        assert not method_introspector.is_defined_in_python(
+            ManagerInterface.isEntityReferenceStrings
+        )
+        assert method_introspector.is_implemented_once(
+            ManagerInterface, "isEntityReferenceStrings"
+        )
+
+    def test_default_implementation_calls_isEntityReferenceString_for_each_string(
+        self, a_host_session
+    ):
+        class PrefixManagerInterface(ManagerInterface):
+            def __init__(self):
+                super().__init__()
+                self.calls = []
+
+            def isEntityReferenceString(self, someString, hostSession):
+                self.calls.append((someString, hostSession))
+                return someString.startswith("asset://")
+
+        manager_interface = PrefixManagerInterface()
+
+        result = manager_interface.isEntityReferenceStrings(
+            ["asset://a", "other://b"], a_host_session
+        )
+
+        assert result == [True, False]
+        assert manager_interface.calls == [
+            ("asset://a", a_host_session),
+            ("other://b", a_host_session),
+        ]
+
+
+class Test_ManagerInterface_resolveToBatch:
+    def test_method_defined_in_cpp(self, method_introspector):
+        assert not method_introspector.is_defined_in_python(ManagerInterface.resolveToBatch)
+        assert method_introspector.is_implemented_once(ManagerInterface, "resolveToBatch")
+
+    def test_default_implementation_copies_resolve_results_into_batch(self, a_host_session):
+        class ResolvingManagerInterface(ManagerInterface):
+            def resolve(self, _entityRefs, _traitSet, _context, _hostSession, success, error):
+                data = TraitsData({"a_trait"})
+                data.setTraitProperty("b_trait", "b", 1)
+                success(0, data)
+                error(1, BatchElementError(BatchElementError.ErrorCode.kUnknown, "bad"))
+
+        results = TraitsDataBatch(2)
+        refs = [EntityReference("asset://a"), EntityReference("asset://b")]
+
+        ResolvingManagerInterface().resolveToBatch(
+            refs, {"a_trait", "b_trait"}, Context(), a_host_session, results
+        )
+
+        assert results.traitsData(0).toDict() == {"a_trait": {}, "b_trait": {"b": 1}}
+        assert results.error(0) is None
+        assert results.error(1).code == BatchElementError.ErrorCode.kUnknown
+        assert results.error(1).message == "bad"
+
+    def test_when_property_type_differs_between_entities_then_element_error(self, a_host_session):
+        class MixedTypeManagerInterface(ManagerInterface):
+            def resolve(self, entityRefs, _traitSet, _context, _hostSession, success, _error):
+                for idx, fps in enumerate((24, 23.976, 25)):
+                    data = TraitsData()
+                    data.setTraitProperty("rate", "fps", fps)
+                    data.setTraitProperty("rate", "ref", entityRefs[idx].toString())
+                    success(idx, data)
+
+        results = TraitsDataBatch(3)
+        refs = [EntityReference(f"asset://{idx}") for idx in range(3)]
+
+        MixedTypeManagerInterface().resolveToBatch(
+            refs, {"rate"}, Context(), a_host_session, results
+        )
+
+        assert results.error(0) is None
+        assert results.error(2) is None
+        assert results.traitsData(2).toDict() == {"rate": {"fps": 25, "ref": "asset://2"}}
+        assert results.error(1).code == BatchElementError.ErrorCode.kEntityResolutionError
+        assert "rate.fps" in results.error(1).message
+        assert not results.hasTrait(1, "rate")
+
+
+class Test_ManagerInterface_resolveAsync:
+    def test_method_defined_in_cpp(self, method_introspector):
+        assert not method_introspector.is_defined_in_python(ManagerInterface.resolveAsync)
+        assert method_introspector.is_implemented_once(ManagerInterface, "resolveAsync")
+
+    def test_default_implementation_returns_false_without_calling_callbacks(self, a_host_session):
+        callback = Mock()
+
+        accepted = ManagerInterface().resolveAsync(
+            [EntityReference("asset://a")],
+            {"a_trait"},
+            Context(),
+            a_host_session,
+            callback,
+            callback,
+            callback,
+        )
+
+        assert accepted is False
+        callback.assert_not_called()
+
+
 class Test_ManagerInterface_defaultEntityReference:
     def test_method_defined_in_python(self, method_introspector):
         assert method_introspector.is_defined_in_python(ManagerInterface.defaultEntityReference)
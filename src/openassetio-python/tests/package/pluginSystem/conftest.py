@@ -39,6 +39,16 @@ def entry_point_plugin_identifier(package_plugin_identifier):
     return package_plugin_identifier
 
 
+@pytest.fixture
+def deferred_entry_point_plugin_identifier():
+    return "org.openassetio.test.pluginSystem.resources.deferredPlugin"
+
+
+@pytest.fixture
+def mismatched_entry_point_plugin_identifier():
+    return "org.openassetio.test.pluginSystem.resources.mismatchedPlugin"
+
+
 @pytest.fixture
 def a_plugin_path_with_symlinks(the_resources_directory_path):
     return os.path.join(the_resources_directory_path, "symlinkPath")
@@ -64,6 +74,11 @@ def an_entry_point_package_plugin_root(the_resources_directory_path):
     return os.path.join(the_resources_directory_path, "entryPoint", "site-packages")
 
 
+@pytest.fixture
+def a_deferred_entry_point_package_plugin_root(the_resources_directory_path):
+    return os.path.join(the_resources_directory_path, "deferredEntryPoint", "site-packages")
+
+
 @pytest.fixture
 def the_resources_directory_path():
     return os.path.join(os.path.dirname(__file__), "resources")
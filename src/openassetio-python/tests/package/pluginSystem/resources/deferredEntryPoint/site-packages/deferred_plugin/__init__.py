@@ -0,0 +1,13 @@
+"""
+Provides a test PythonPluginSystemPlugin implemented within a package
+whose entry point declares its identifier.
+"""
+
+# pylint gets upset, but this is fine due to
+# the way the plugin system loads plugins.
+# pylint: disable=import-error
+from .DeferredPlugin import DeferredPlugin
+
+
+# pylint: disable=invalid-name
+plugin = DeferredPlugin
@@ -0,0 +1,19 @@
+"""
+Provides a test PythonPluginSystemPlugin implementation.
+"""
+
+from openassetio.pluginSystem import PythonPluginSystemManagerPlugin
+
+
+class DeferredPlugin(PythonPluginSystemManagerPlugin):
+    # pylint: disable=missing-class-docstring
+
+    @classmethod
+    def identifier(cls):
+        return "org.openassetio.test.pluginSystem.resources.deferredPlugin"
+
+    @classmethod
+    def interface(cls):
+        # This is nonsense, but allows us to check where this was
+        # loaded from.
+        return {"file": __file__}
@@ -13,6 +13,14 @@ class ModulePlugin(PythonPluginSystemManagerPlugin):
     def identifier(cls):
         return "org.openassetio.test.pluginSystem.resources.modulePlugin"
 
+    @classmethod
+    def displayName(cls):
+        return "Module Plugin"
+
+    @classmethod
+    def info(cls):
+        return {"file": __file__}
+
     @classmethod
     def interface(cls):
         # This is nonsense, but allows us to check where this was
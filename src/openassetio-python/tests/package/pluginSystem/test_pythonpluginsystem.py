@@ -21,12 +21,17 @@ These tests check the functionality of the PythonPluginSystem class.
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import hashlib
+import importlib.util
+import json
 import os
+import shutil
 import sys
 from typing import List
 
 import pytest
 
+from openassetio import exceptions
 from openassetio.log import ConsoleLogger
 from openassetio.pluginSystem import PythonPluginSystem
 
@@ -108,6 +113,26 @@ class Test_PythonPluginSystem_scan:
         expected_identifiers = set([package_plugin_identifier, module_plugin_identifier])
         assert set(a_plugin_system.identifiers()) == expected_identifiers
 
+    def test_when_path_is_not_a_directory_then_skipped(
+        self, a_plugin_system, a_module_plugin_path, module_plugin_identifier, tmp_path
+    ):
+        missing_path = str(tmp_path / "missing")
+        a_plugin_system.scan(os.pathsep.join([missing_path, a_module_plugin_path]))
+        assert a_plugin_system.identifiers() == [module_plugin_identifier]
+
+    def test_when_debug_severity_not_logged_then_debug_messages_not_logged(
+        self, a_module_plugin_path, module_plugin_identifier, mock_logger
+    ):
+        mock_logger.mock.isSeverityLogged.side_effect = (
+            lambda severity: severity > mock_logger.Severity.kDebug
+        )
+        plugin_system = PythonPluginSystem(mock_logger)
+
+        plugin_system.scan(a_module_plugin_path)
+
+        assert plugin_system.identifiers() == [module_plugin_identifier]
+        mock_logger.mock.log.assert_not_called()
+
     def test_when_plugins_broken_then_skipped_with_expected_errors(
         self, broken_plugins_path, mock_logger
     ):
@@ -133,6 +158,245 @@ class Test_PythonPluginSystem_scan:
         )
 
 
+class Test_PythonPluginSystem_scan_parallel:
+    def test_when_path_contains_multiple_entries_then_all_plugins_are_loaded(
+        self,
+        a_plugin_system,
+        a_package_plugin_path,
+        a_module_plugin_path,
+        package_plugin_identifier,
+        module_plugin_identifier,
+    ):
+        combined_path = os.pathsep.join([a_package_plugin_path, a_module_plugin_path])
+        a_plugin_system.scan(combined_path, parallel=True)
+
+        expected_identifiers = set([package_plugin_identifier, module_plugin_identifier])
+        assert set(a_plugin_system.identifiers()) == expected_identifiers
+
+    def test_when_multiple_plugins_share_identifiers_then_leftmost_is_used(
+        self, a_plugin_system, the_resources_directory_path, module_plugin_identifier
+    ):
+        path_a = os.path.join(the_resources_directory_path, "pathA")
+        path_c = os.path.join(the_resources_directory_path, "pathC")
+
+        a_plugin_system.scan(paths=os.pathsep.join((path_a, path_c)), parallel=True)
+        assert "pathA" in a_plugin_system.plugin(module_plugin_identifier).__file__
+
+        a_plugin_system.reset()
+
+        a_plugin_system.scan(paths=os.pathsep.join((path_c, path_a)), parallel=True)
+        assert "pathC" in a_plugin_system.plugin(module_plugin_identifier).__file__
+
+    def test_when_index_used_then_indexed_modules_not_imported(
+        self, a_logger, an_index_path, a_module_plugin_path, module_plugin_identifier
+    ):
+        PythonPluginSystem(a_logger, indexPath=an_index_path).scan(
+            a_module_plugin_path, parallel=True
+        )
+        module_name = module_name_for_path(os.path.join(a_module_plugin_path, "modulePlugin.py"))
+        sys.modules.pop(module_name)
+
+        plugin_system = PythonPluginSystem(a_logger, indexPath=an_index_path)
+        plugin_system.scan(a_module_plugin_path, parallel=True)
+
+        assert plugin_system.identifiers() == [module_plugin_identifier]
+        assert module_name not in sys.modules
+
+    def test_when_module_scanned_then_bytecode_cached(
+        self, a_plugin_system, a_copied_module_plugin_path, module_plugin_identifier, monkeypatch
+    ):
+        # E.g. if PYTHONDONTWRITEBYTECODE is set.
+        monkeypatch.setattr(sys, "dont_write_bytecode", False)
+        module_path = os.path.join(a_copied_module_plugin_path, "modulePlugin.py")
+        cache_path = importlib.util.cache_from_source(module_path)
+        shutil.rmtree(os.path.dirname(cache_path), ignore_errors=True)
+
+        a_plugin_system.scan(a_copied_module_plugin_path, parallel=True)
+
+        assert a_plugin_system.identifiers() == [module_plugin_identifier]
+        assert os.path.exists(cache_path)
+
+    def test_when_plugins_broken_then_skipped_with_expected_errors(
+        self, broken_plugins_path, mock_logger
+    ):
+        plugin_system = PythonPluginSystem(mock_logger)
+        plugin_system.scan(broken_plugins_path, parallel=True)
+
+        assert not plugin_system.identifiers()
+        missing_plugin_path = os.path.join(broken_plugins_path, "missing_plugin.py")
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kError,
+            f"PythonPluginSystem: No top-level 'plugin' variable {missing_plugin_path}",
+        )
+        raises_exception_path = os.path.join(broken_plugins_path, "raises_exception.py")
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kError,
+            StringContaining(
+                [
+                    f"PythonPluginSystem: Caught exception loading {raises_exception_path}:\n",
+                    f'  File "{raises_exception_path}", line 4, in <module>\n',
+                    '    raise RuntimeError("An exception")',
+                ]
+            ),
+        )
+
+
+class Test_PythonPluginSystem_scan_with_index:
+    def test_when_index_does_not_exist_then_plugins_loaded_and_index_written(
+        self, a_logger, an_index_path, a_module_plugin_path, module_plugin_identifier
+    ):
+        plugin_system = PythonPluginSystem(a_logger, indexPath=an_index_path)
+        plugin_system.scan(a_module_plugin_path)
+
+        assert plugin_system.identifiers() == [module_plugin_identifier]
+        with open(an_index_path, encoding="utf-8") as index_file:
+            index = json.load(index_file)
+        module_path = os.path.join(a_module_plugin_path, "modulePlugin.py")
+        entry = index["paths"][a_module_plugin_path][module_path]
+        assert entry["identifier"] == module_plugin_identifier
+
+    def test_when_module_indexed_then_not_imported_until_plugin_requested(
+        self, a_logger, an_index_path, a_module_plugin_path, module_plugin_identifier
+    ):
+        PythonPluginSystem(a_logger, indexPath=an_index_path).scan(a_module_plugin_path)
+        module_path = os.path.join(a_module_plugin_path, "modulePlugin.py")
+        module_name = module_name_for_path(module_path)
+        sys.modules.pop(module_name)
+
+        plugin_system = PythonPluginSystem(a_logger, indexPath=an_index_path)
+        plugin_system.scan(a_module_plugin_path)
+
+        assert plugin_system.identifiers() == [module_plugin_identifier]
+        assert module_name not in sys.modules
+
+        plugin = plugin_system.plugin(module_plugin_identifier)
+
+        assert module_name in sys.modules
+        assert plugin.identifier() == module_plugin_identifier
+        assert plugin.__file__ == module_path
+
+    def test_when_metadata_fn_supplied_then_metadata_indexed(
+        self, a_logger, an_index_path, a_module_plugin_path, module_plugin_identifier
+    ):
+        def metadata_fn(cls):
+            return {"identifier": cls.identifier()}
+
+        PythonPluginSystem(a_logger, indexPath=an_index_path, metadataFn=metadata_fn).scan(
+            a_module_plugin_path
+        )
+        module_name = module_name_for_path(os.path.join(a_module_plugin_path, "modulePlugin.py"))
+        sys.modules.pop(module_name)
+
+        plugin_system = PythonPluginSystem(
+            a_logger, indexPath=an_index_path, metadataFn=metadata_fn
+        )
+        plugin_system.scan(a_module_plugin_path)
+
+        assert plugin_system.metadata(module_plugin_identifier) == {
+            "identifier": module_plugin_identifier
+        }
+        assert module_name not in sys.modules
+
+    def test_when_indexed_module_modified_then_reimported(
+        self, a_logger, an_index_path, a_copied_module_plugin_path, module_plugin_identifier
+    ):
+        PythonPluginSystem(a_logger, indexPath=an_index_path).scan(a_copied_module_plugin_path)
+        module_path = os.path.join(a_copied_module_plugin_path, "modulePlugin.py")
+        module_name = module_name_for_path(module_path)
+        sys.modules.pop(module_name)
+
+        with open(module_path, "a", encoding="utf-8") as module_file:
+            module_file.write("# Modified\n")
+
+        plugin_system = PythonPluginSystem(a_logger, indexPath=an_index_path)
+        plugin_system.scan(a_copied_module_plugin_path)
+
+        assert module_name in sys.modules
+        assert plugin_system.identifiers() == [module_plugin_identifier]
+
+    def test_when_indexed_module_removed_then_dropped_from_index(
+        self, a_logger, an_index_path, a_copied_module_plugin_path
+    ):
+        PythonPluginSystem(a_logger, indexPath=an_index_path).scan(a_copied_module_plugin_path)
+        os.remove(os.path.join(a_copied_module_plugin_path, "modulePlugin.py"))
+
+        plugin_system = PythonPluginSystem(a_logger, indexPath=an_index_path)
+        plugin_system.scan(a_copied_module_plugin_path)
+
+        assert plugin_system.identifiers() == []
+        with open(an_index_path, encoding="utf-8") as index_file:
+            index = json.load(index_file)
+        assert index["paths"][a_copied_module_plugin_path] == {}
+
+    def test_when_multiple_plugins_share_identifiers_then_leftmost_is_used(
+        self, a_logger, an_index_path, the_resources_directory_path, module_plugin_identifier
+    ):
+        path_a = os.path.join(the_resources_directory_path, "pathA")
+        path_c = os.path.join(the_resources_directory_path, "pathC")
+        PythonPluginSystem(a_logger, indexPath=an_index_path).scan(
+            paths=os.pathsep.join((path_a, path_c))
+        )
+
+        plugin_system = PythonPluginSystem(a_logger, indexPath=an_index_path)
+        plugin_system.scan(paths=os.pathsep.join((path_c, path_a)))
+
+        assert "pathC" in plugin_system.plugin(module_plugin_identifier).__file__
+
+    def test_when_indexed_identifier_is_stale_then_plugin_raises_and_entry_discarded(
+        self,
+        a_logger,
+        an_index_path,
+        a_module_plugin_path,
+        a_package_plugin_path,
+        package_plugin_identifier,
+    ):
+        search_paths = os.pathsep.join((a_module_plugin_path, a_package_plugin_path))
+        PythonPluginSystem(a_logger, indexPath=an_index_path).scan(search_paths)
+        with open(an_index_path, encoding="utf-8") as index_file:
+            index = json.load(index_file)
+        module_path = os.path.join(a_module_plugin_path, "modulePlugin.py")
+        index["paths"][a_module_plugin_path][module_path]["identifier"] = "some.other.identifier"
+        with open(an_index_path, "w", encoding="utf-8") as index_file:
+            json.dump(index, index_file)
+
+        plugin_system = PythonPluginSystem(a_logger, indexPath=an_index_path)
+        plugin_system.scan(search_paths)
+        assert set(plugin_system.identifiers()) == {
+            "some.other.identifier",
+            package_plugin_identifier,
+        }
+
+        with pytest.raises(exceptions.PluginError):
+            plugin_system.plugin("some.other.identifier")
+
+        assert plugin_system.identifiers() == [package_plugin_identifier]
+        with open(an_index_path, encoding="utf-8") as index_file:
+            paths = json.load(index_file)["paths"]
+        assert paths[a_module_plugin_path] == {}
+        assert paths[a_package_plugin_path] == index["paths"][a_package_plugin_path]
+
+    def test_when_index_unreadable_then_warning_logged_and_plugins_loaded(
+        self,
+        mock_logger,
+        an_index_path,
+        a_module_plugin_path,
+        module_plugin_identifier,
+    ):
+        with open(an_index_path, "w", encoding="utf-8") as index_file:
+            index_file.write("not json")
+
+        plugin_system = PythonPluginSystem(mock_logger, indexPath=an_index_path)
+        plugin_system.scan(a_module_plugin_path)
+
+        assert plugin_system.identifiers() == [module_plugin_identifier]
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kWarning,
+            StringContaining(
+                [f"PythonPluginSystem: Ignoring unreadable plugin index {an_index_path}: "]
+            ),
+        )
+
+
 class Test_PythonPluginSystem_scan_entry_points:
     def test_when_no_package_with_entry_point_installed_then_nothing_loaded_and_true_returned(
         self, a_plugin_system
@@ -153,6 +417,91 @@ class Test_PythonPluginSystem_scan_entry_points:
         assert a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP) is True
         assert a_plugin_system.identifiers() == [entry_point_plugin_identifier]
 
+    def test_when_entry_point_declares_identifier_then_registered_without_import(
+        self,
+        a_plugin_system,
+        a_deferred_entry_point_package_plugin_root,
+        deferred_entry_point_plugin_identifier,
+        mismatched_entry_point_plugin_identifier,
+        monkeypatch,
+    ):
+        monkeypatch.syspath_prepend(a_deferred_entry_point_package_plugin_root)
+        monkeypatch.delitem(sys.modules, "deferred_plugin", raising=False)
+
+        assert a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP) is True
+
+        assert set(a_plugin_system.identifiers()) == {
+            deferred_entry_point_plugin_identifier,
+            mismatched_entry_point_plugin_identifier,
+        }
+        assert "deferred_plugin" not in sys.modules
+
+    def test_when_deferred_entry_point_plugin_requested_then_imported(
+        self,
+        a_plugin_system,
+        a_deferred_entry_point_package_plugin_root,
+        deferred_entry_point_plugin_identifier,
+        monkeypatch,
+    ):
+        monkeypatch.syspath_prepend(a_deferred_entry_point_package_plugin_root)
+        monkeypatch.delitem(sys.modules, "deferred_plugin", raising=False)
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP)
+
+        plugin = a_plugin_system.plugin(deferred_entry_point_plugin_identifier)
+
+        assert "deferred_plugin" in sys.modules
+        assert plugin.identifier() == deferred_entry_point_plugin_identifier
+        assert a_deferred_entry_point_package_plugin_root in plugin.__file__
+        assert a_plugin_system.plugin(deferred_entry_point_plugin_identifier) is plugin
+
+    def test_when_index_used_then_deferred_entry_point_metadata_retrieved_without_import(
+        self,
+        a_logger,
+        an_index_path,
+        a_deferred_entry_point_package_plugin_root,
+        deferred_entry_point_plugin_identifier,
+        monkeypatch,
+    ):
+        monkeypatch.syspath_prepend(a_deferred_entry_point_package_plugin_root)
+        monkeypatch.delitem(sys.modules, "deferred_plugin", raising=False)
+        monkeypatch.delitem(sys.modules, "deferred_plugin.DeferredPlugin", raising=False)
+
+        def metadata_fn(cls):
+            return {"identifier": cls.identifier()}
+
+        plugin_system = PythonPluginSystem(
+            a_logger, indexPath=an_index_path, metadataFn=metadata_fn
+        )
+        plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP)
+        expected_metadata = {"identifier": deferred_entry_point_plugin_identifier}
+        assert plugin_system.metadata(deferred_entry_point_plugin_identifier) == expected_metadata
+        del sys.modules["deferred_plugin"]
+        del sys.modules["deferred_plugin.DeferredPlugin"]
+
+        plugin_system = PythonPluginSystem(
+            a_logger, indexPath=an_index_path, metadataFn=metadata_fn
+        )
+        plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP)
+
+        assert plugin_system.metadata(deferred_entry_point_plugin_identifier) == expected_metadata
+        assert "deferred_plugin" not in sys.modules
+
+    def test_when_deferred_entry_point_identifier_mismatched_then_plugin_raises(
+        self,
+        a_plugin_system,
+        a_deferred_entry_point_package_plugin_root,
+        deferred_entry_point_plugin_identifier,
+        mismatched_entry_point_plugin_identifier,
+        monkeypatch,
+    ):
+        monkeypatch.syspath_prepend(a_deferred_entry_point_package_plugin_root)
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP)
+
+        with pytest.raises(exceptions.PluginError):
+            a_plugin_system.plugin(mismatched_entry_point_plugin_identifier)
+
+        assert a_plugin_system.identifiers() == [deferred_entry_point_plugin_identifier]
+
     def test_when_importlib_metadata_missing_then_a_warning_is_loggeed_and_false_returned(
         self, mock_logger, monkeypatch
     ):
@@ -203,6 +552,26 @@ def a_plugin_system(a_logger):
     return PythonPluginSystem(a_logger)
 
 
+@pytest.fixture
+def an_index_path(tmp_path):
+    return str(tmp_path / "pluginIndex.json")
+
+
+@pytest.fixture
+def a_copied_module_plugin_path(a_module_plugin_path, tmp_path):
+    path = str(tmp_path / "plugins")
+    shutil.copytree(a_module_plugin_path, path)
+    return path
+
+
+def module_name_for_path(path):
+    """
+    Returns the name the plugin system uses for the module loaded
+    from the given path.
+    """
+    return hashlib.md5(path.encode("utf-8")).hexdigest()
+
+
 # We use a real logger vs a mock, as it makes debugging test failures
 # easier as it surfaces any actual in-flight errors from the plugin
 # system.
@@ -23,8 +23,14 @@ ManagerImplementationFactoryInterface implementation.
 # pylint: disable=missing-class-docstring,missing-function-docstring
 # pylint: disable=use-implicit-booleaness-not-comparison
 
+import hashlib
+import os
+import sys
+import textwrap
+
 import pytest
 
+from openassetio.hostApi import ManagerFactory
 from openassetio.log import ConsoleLogger
 from openassetio.pluginSystem import PythonPluginSystemManagerImplementationFactory
 
@@ -42,6 +48,24 @@ class Test_PythonPluginSystemManagerImplementationFactory:
             == "OPENASSETIO_DISABLE_ENTRYPOINTS_PLUGINS"
         )
 
+    def test_exposes_plugin_index_var_name_with_expected_value(self):
+        assert (
+            PythonPluginSystemManagerImplementationFactory.kPluginIndexEnvVar
+            == "OPENASSETIO_PLUGIN_INDEX_PATH"
+        )
+
+    def test_exposes_parallel_scan_var_name_with_expected_value(self):
+        assert (
+            PythonPluginSystemManagerImplementationFactory.kParallelScanEnvVar
+            == "OPENASSETIO_PLUGIN_PARALLEL_SCAN"
+        )
+
+    def test_exposes_shared_registry_var_name_with_expected_value(self):
+        assert (
+            PythonPluginSystemManagerImplementationFactory.kSharedRegistryEnvVar
+            == "OPENASSETIO_PLUGIN_SHARED_REGISTRY"
+        )
+
     def test_exposes_entry_point_group_with_expected_value(self):
         assert (
             PythonPluginSystemManagerImplementationFactory.kPackageEntryPointGroup
@@ -139,6 +163,29 @@ class Test_PythonPluginSystemManagerImplementationFactory_init:
             entry_point_plugin_identifier,
         ]
 
+    def test_when_index_path_env_set_then_index_written(
+        self, a_module_plugin_path, module_plugin_identifier, tmp_path, monkeypatch
+    ):
+        index_path = tmp_path / "pluginIndex.json"
+        monkeypatch.setenv(
+            PythonPluginSystemManagerImplementationFactory.kPluginIndexEnvVar, str(index_path)
+        )
+        factory = PythonPluginSystemManagerImplementationFactory(
+            ConsoleLogger(), paths=a_module_plugin_path, disableEntryPointsPlugins=True
+        )
+
+        assert factory.identifiers() == [module_plugin_identifier]
+        assert index_path.exists()
+
+    def test_when_parallel_scan_env_set_then_path_plugins_loaded(
+        self, a_module_plugin_path, module_plugin_identifier, monkeypatch
+    ):
+        monkeypatch.setenv(PythonPluginSystemManagerImplementationFactory.kParallelScanEnvVar, "1")
+        factory = PythonPluginSystemManagerImplementationFactory(
+            ConsoleLogger(), paths=a_module_plugin_path, disableEntryPointsPlugins=True
+        )
+        assert factory.identifiers() == [module_plugin_identifier]
+
     def test_when_paths_empty_then_returns_empty_list(self, mock_logger):
 
         plugin_paths = ""
@@ -164,6 +211,199 @@ class Test_PythonPluginSystemManagerImplementationFactory_init:
         assert a_package_plugin_path in factory.instantiate(package_plugin_identifier)["file"]
 
 
+class Test_PythonPluginSystemManagerImplementationFactory_managerDetail:
+    def test_when_plugin_provides_display_name_then_returns_details_from_plugin(
+        self, a_module_plugin_path, module_plugin_identifier, mock_logger
+    ):
+        factory = PythonPluginSystemManagerImplementationFactory(
+            mock_logger, paths=a_module_plugin_path, disableEntryPointsPlugins=True
+        )
+
+        detail = factory.managerDetail(module_plugin_identifier)
+
+        assert detail.identifier == module_plugin_identifier
+        assert detail.displayName == "Module Plugin"
+        assert a_module_plugin_path in detail.info["file"]
+
+    def test_when_plugin_does_not_provide_display_name_then_returns_none(
+        self, a_package_plugin_path, package_plugin_identifier, mock_logger
+    ):
+        factory = PythonPluginSystemManagerImplementationFactory(
+            mock_logger, paths=a_package_plugin_path, disableEntryPointsPlugins=True
+        )
+
+        assert factory.managerDetail(package_plugin_identifier) is None
+
+    def test_when_index_used_then_details_retrieved_without_import(
+        self, a_module_plugin_path, module_plugin_identifier, module_plugin_module_name, tmp_path
+    ):
+        index_path = str(tmp_path / "pluginIndex.json")
+        expected_detail = PythonPluginSystemManagerImplementationFactory(
+            ConsoleLogger(),
+            paths=a_module_plugin_path,
+            disableEntryPointsPlugins=True,
+            indexPath=index_path,
+        ).managerDetail(module_plugin_identifier)
+        sys.modules.pop(module_plugin_module_name)
+
+        detail = PythonPluginSystemManagerImplementationFactory(
+            ConsoleLogger(),
+            paths=a_module_plugin_path,
+            disableEntryPointsPlugins=True,
+            indexPath=index_path,
+        ).managerDetail(module_plugin_identifier)
+
+        assert detail == expected_detail
+        assert detail.displayName == "Module Plugin"
+        assert module_plugin_module_name not in sys.modules
+
+    def test_when_used_by_manager_factory_then_available_managers_uses_plugin_details(
+        self, a_module_plugin_path, module_plugin_identifier, mock_logger, mock_host_interface
+    ):
+        factory = PythonPluginSystemManagerImplementationFactory(
+            mock_logger, paths=a_module_plugin_path, disableEntryPointsPlugins=True
+        )
+        manager_factory = ManagerFactory(mock_host_interface, factory, mock_logger)
+
+        details = manager_factory.availableManagers()
+
+        assert details == {
+            module_plugin_identifier: factory.managerDetail(module_plugin_identifier)
+        }
+
+
+class Test_PythonPluginSystemManagerImplementationFactory_sharedRegistry:
+    def test_when_shared_registry_used_then_plugins_not_rescanned(
+        self, a_module_plugin_path, module_plugin_identifier, module_plugin_module_name
+    ):
+        first = a_shared_factory(a_module_plugin_path)
+        assert first.identifiers() == [module_plugin_identifier]
+        sys.modules.pop(module_plugin_module_name)
+
+        second = a_shared_factory(a_module_plugin_path)
+
+        assert second.identifiers() == [module_plugin_identifier]
+        assert module_plugin_module_name not in sys.modules
+        assert second.instantiate(module_plugin_identifier) == first.instantiate(
+            module_plugin_identifier
+        )
+
+    def test_when_shared_registry_env_set_then_plugins_not_rescanned(
+        self, a_module_plugin_path, module_plugin_module_name, monkeypatch
+    ):
+        monkeypatch.setenv(
+            PythonPluginSystemManagerImplementationFactory.kSharedRegistryEnvVar, "1"
+        )
+        PythonPluginSystemManagerImplementationFactory(
+            ConsoleLogger(), paths=a_module_plugin_path, disableEntryPointsPlugins=True
+        ).identifiers()
+        sys.modules.pop(module_plugin_module_name)
+
+        PythonPluginSystemManagerImplementationFactory(
+            ConsoleLogger(), paths=a_module_plugin_path, disableEntryPointsPlugins=True
+        ).identifiers()
+
+        assert module_plugin_module_name not in sys.modules
+
+    def test_when_paths_differ_then_plugins_scanned_separately(
+        self,
+        a_module_plugin_path,
+        a_package_plugin_path,
+        module_plugin_identifier,
+        package_plugin_identifier,
+    ):
+        assert a_shared_factory(a_module_plugin_path).identifiers() == [module_plugin_identifier]
+        assert a_shared_factory(a_package_plugin_path).identifiers() == [package_plugin_identifier]
+
+    def test_when_not_opted_in_then_plugins_rescanned(
+        self, a_module_plugin_path, module_plugin_module_name
+    ):
+        a_shared_factory(a_module_plugin_path).identifiers()
+        sys.modules.pop(module_plugin_module_name)
+
+        PythonPluginSystemManagerImplementationFactory(
+            ConsoleLogger(), paths=a_module_plugin_path, disableEntryPointsPlugins=True
+        ).identifiers()
+
+        assert module_plugin_module_name in sys.modules
+
+    def test_when_plugin_module_uses_shared_registry_then_does_not_deadlock(
+        self, a_module_plugin_path, module_plugin_identifier, tmp_path
+    ):
+        plugin_dir = tmp_path / "plugins"
+        plugin_dir.mkdir()
+        (plugin_dir / "nestingPlugin.py").write_text(
+            textwrap.dedent(
+                f"""
+                from openassetio.log import ConsoleLogger
+                from openassetio.pluginSystem import (
+                    PythonPluginSystemManagerImplementationFactory,
+                    PythonPluginSystemManagerPlugin,
+                )
+
+                nestedIdentifiers = PythonPluginSystemManagerImplementationFactory(
+                    ConsoleLogger(),
+                    paths={a_module_plugin_path!r},
+                    disableEntryPointsPlugins=True,
+                    useSharedRegistry=True,
+                ).identifiers()
+
+                class NestingPlugin(PythonPluginSystemManagerPlugin):
+                    @classmethod
+                    def identifier(cls):
+                        return "org.openassetio.test.nestingPlugin"
+
+                    @classmethod
+                    def interface(cls):
+                        return nestedIdentifiers
+
+                plugin = NestingPlugin
+                """
+            ),
+            encoding="utf-8",
+        )
+
+        factory = a_shared_factory(str(plugin_dir))
+
+        assert factory.identifiers() == ["org.openassetio.test.nestingPlugin"]
+        assert factory.instantiate("org.openassetio.test.nestingPlugin") == [
+            module_plugin_identifier
+        ]
+
+    def test_when_invalidated_then_plugins_rescanned_by_existing_factories(
+        self, a_module_plugin_path, module_plugin_identifier, module_plugin_module_name
+    ):
+        factory = a_shared_factory(a_module_plugin_path)
+        factory.identifiers()
+        sys.modules.pop(module_plugin_module_name)
+
+        PythonPluginSystemManagerImplementationFactory.invalidateSharedRegistry()
+
+        assert factory.identifiers() == [module_plugin_identifier]
+        assert module_plugin_module_name in sys.modules
+
+
+def a_shared_factory(paths):
+    return PythonPluginSystemManagerImplementationFactory(
+        ConsoleLogger(), paths=paths, disableEntryPointsPlugins=True, useSharedRegistry=True
+    )
+
+
+@pytest.fixture(autouse=True)
+def invalidated_shared_registry():
+    PythonPluginSystemManagerImplementationFactory.invalidateSharedRegistry()
+    yield
+    PythonPluginSystemManagerImplementationFactory.invalidateSharedRegistry()
+
+
+@pytest.fixture
+def module_plugin_module_name(a_module_plugin_path):
+    # The plugin system loads modules under a name derived from their
+    # path.
+    module_path = os.path.join(a_module_plugin_path, "modulePlugin.py")
+    return hashlib.md5(module_path.encode("utf-8")).hexdigest()
+
+
 @pytest.fixture
 def prepended_sys_path_with_entry_point_plugin(an_entry_point_package_plugin_root, monkeypatch):
     monkeypatch.syspath_prepend(an_entry_point_package_plugin_root)
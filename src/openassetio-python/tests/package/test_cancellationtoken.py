@@ -0,0 +1,53 @@
+#
+#   Copyright 2013-2022 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests that cover the openassetio.CancellationToken class.
+"""
+
+# pylint: disable=invalid-name,no-self-use,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+import threading
+
+from openassetio import CancellationToken
+
+
+class Test_CancellationToken:
+    def test_when_constructed_then_not_cancelled(self):
+        assert CancellationToken().isCancelled() is False
+
+    def test_when_cancelled_then_is_cancelled(self):
+        token = CancellationToken()
+
+        token.cancel()
+
+        assert token.isCancelled() is True
+
+    def test_when_cancelled_twice_then_remains_cancelled(self):
+        token = CancellationToken()
+
+        token.cancel()
+        token.cancel()
+
+        assert token.isCancelled() is True
+
+    def test_when_cancelled_from_other_thread_then_is_cancelled(self):
+        token = CancellationToken()
+
+        thread = threading.Thread(target=token.cancel)
+        thread.start()
+        thread.join()
+
+        assert token.isCancelled() is True
@@ -21,7 +21,7 @@ Tests that cover the openassetio.Context class.
 # pylint: disable=missing-class-docstring,missing-function-docstring
 import pytest
 
-from openassetio import Context, managerApi, TraitsData
+from openassetio import CancellationToken, Context, managerApi, TraitsData
 
 
 class Test_Context:
@@ -73,6 +73,7 @@ class Test_Context_init:
         assert context.retention == Context.Retention.kTransient
         assert context.locale is None
         assert context.managerState is None
+        assert context.cancellationToken is None
 
     def test_when_constructed_with_args_then_has_configuration_from_args(self):
         class TestState(managerApi.ManagerStateBase):
@@ -181,6 +182,23 @@ class Test_Context_managerState:
         assert actual_data is expected_data
 
 
+class Test_Context_cancellationToken:
+    def test_when_set_to_unknown_type_then_raises_TypeError(self, a_context):
+        with pytest.raises(TypeError):
+            a_context.cancellationToken = object()
+
+    def test_when_set_to_None_then_returns_None(self, a_context):
+        a_context.cancellationToken = None
+
+        assert a_context.cancellationToken is None
+
+    def test_when_set_to_token_then_holds_reference_to_that_token(self, a_context):
+        expected_token = CancellationToken()
+        a_context.cancellationToken = expected_token
+
+        assert a_context.cancellationToken is expected_token
+
+
 class Test_Context_isForRead:
     def test_when_called_with_read_context_then_returns_true(self):
         assert Context(access=Context.Access.kRead).isForRead() is True
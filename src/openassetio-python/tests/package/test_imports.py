@@ -50,6 +50,9 @@ class Test_package_imports:
     def test_importing_constants_succeeds(self):
         from openassetio import constants
 
+    def test_importing_CancellationToken_succeeds(self):
+        from openassetio import CancellationToken
+
     def test_importing_Context_succeeds(self):
         from openassetio import Context
 
@@ -71,6 +74,9 @@ class Test_package_imports:
     def test_importing_TraitsData_succeeds(self):
         from openassetio import TraitsData
 
+    def test_importing_TraitsDataBatch_succeeds(self):
+        from openassetio import TraitsDataBatch
+
 
 class Test_core_imports:
     def test_importing_audit_succeeds(self):
@@ -21,8 +21,13 @@ Tests that cover the openassetio.log module.
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import json
+import threading
+from unittest import mock
+
 import pytest
 
+from openassetio import BatchElementError
 import openassetio.log as lg
 
 
@@ -55,6 +60,36 @@ all_severities = (
 severity_control_envvar = "OPENASSETIO_LOGGING_SEVERITY"
 
 
+class RecordingLogger(lg.LoggerInterface):
+    """
+    Logger that captures structured records as they are logged.
+    """
+
+    def __init__(self):
+        lg.LoggerInterface.__init__(self)
+        self.records = []
+
+    def log(self, severity, message):
+        pass
+
+    def logRecord(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def a_full_record():
+    return lg.LogRecord(
+        severity=lg.LoggerInterface.Severity.kDebugApi,
+        message="a message",
+        method="resolve",
+        managerIdentifier="org.openassetio.test.manager",
+        batchSize=3,
+        durationNs=1234,
+        errorCode=BatchElementError.ErrorCode.kEntityResolutionError,
+        timestampNs=5678,
+    )
+
+
 class Test_ConsoleLogger_inheritance:
     def test_class_is_final(self):
         with pytest.raises(TypeError):
@@ -183,6 +218,18 @@ class Test_LoggerInterface:
         )
 
 
+class Test_LoggerInterface_isSeverityLogged:
+    def test_when_not_overridden_then_all_severities_logged(self):
+        class Logger(lg.LoggerInterface):
+            def log(self, severity, message):
+                pass
+
+        a_logger = Logger()
+
+        for severity in all_severities:
+            assert a_logger.isSeverityLogged(severity) is True
+
+
 class Test_SeverityFilter_inheritance:
     def test_class_is_final(self):
         with pytest.raises(TypeError):
@@ -279,7 +326,331 @@ class Test_SeverityFilter_log:
                     mock_logger.mock.log.assert_not_called()
 
 
+class Test_SeverityFilter_isSeverityLogged:
+    def test_only_severities_of_equal_or_greater_severity_are_logged(self, severity_filter):
+        for filter_severity in all_severities:
+            severity_filter.setSeverity(filter_severity)
+
+            for message_severity in all_severities:
+                assert severity_filter.isSeverityLogged(message_severity) == (
+                    message_severity >= filter_severity
+                )
+
+    def test_when_upstream_logger_does_not_log_severity_then_not_logged(self, mock_logger):
+        mock_logger.mock.isSeverityLogged.side_effect = (
+            lambda severity: severity > lg.LoggerInterface.Severity.kInfo
+        )
+        a_filter = lg.SeverityFilter(mock_logger)
+        a_filter.setSeverity(lg.LoggerInterface.Severity.kDebug)
+
+        assert not a_filter.isSeverityLogged(lg.LoggerInterface.Severity.kInfo)
+        assert a_filter.isSeverityLogged(lg.LoggerInterface.Severity.kProgress)
+
+
 class Test_SeverityFilter_upstreamLogger:
     def test_returns_the_constructor_supplied_logger(self, mock_logger):
         a_filter = lg.SeverityFilter(mock_logger)
         assert a_filter.upstreamLogger() is mock_logger
+
+
+class Test_AsyncLogger_inheritance:
+    def test_class_is_final(self):
+        with pytest.raises(TypeError):
+
+            class _(lg.AsyncLogger):
+                pass
+
+
+class Test_AsyncLogger_init:
+    def test_when_logger_is_None_then_raises_TypeError(self):
+        with pytest.raises(TypeError) as err:
+            lg.AsyncLogger(None)
+
+        assert str(err.value).startswith("__init__(): incompatible constructor arguments")
+
+    def test_when_capacity_is_zero_then_raises_ValueError(self, mock_logger):
+        with pytest.raises(ValueError, match="capacity must be greater than zero"):
+            lg.AsyncLogger(mock_logger, 0)
+
+    def test_defaults(self, mock_logger):
+        a_logger = lg.AsyncLogger(mock_logger)
+
+        assert a_logger.upstreamLogger() is mock_logger
+        assert a_logger.capacity() == lg.AsyncLogger.kDefaultCapacity
+        assert a_logger.overflowPolicy() == lg.AsyncLogger.OverflowPolicy.kDropNewest
+        assert a_logger.droppedCount() == 0
+
+    def test_when_arguments_provided_then_reflected_in_accessors(self, mock_logger):
+        a_logger = lg.AsyncLogger(mock_logger, 3, lg.AsyncLogger.OverflowPolicy.kDropOldest)
+
+        assert a_logger.capacity() == 3
+        assert a_logger.overflowPolicy() == lg.AsyncLogger.OverflowPolicy.kDropOldest
+
+
+class Test_AsyncLogger_log:
+    def test_when_flushed_then_messages_relayed_in_order(self, mock_logger):
+        a_logger = lg.AsyncLogger(mock_logger)
+
+        for severity in all_severities:
+            a_logger.log(severity, f"A {severity.name} message")
+        a_logger.flush()
+
+        assert mock_logger.mock.log.call_args_list == [
+            mock.call(severity, f"A {severity.name} message") for severity in all_severities
+        ]
+
+    def test_when_destroyed_then_queued_messages_relayed(self, mock_logger):
+        a_logger = lg.AsyncLogger(mock_logger)
+        for idx in range(100):
+            a_logger.info(f"message {idx}")
+
+        del a_logger
+
+        assert mock_logger.mock.log.call_args_list == [
+            mock.call(lg.LoggerInterface.Severity.kInfo, f"message {idx}") for idx in range(100)
+        ]
+
+    def test_does_not_block_on_upstream_logger(self, mock_logger):
+        upstream_released = threading.Event()
+        mock_logger.mock.log.side_effect = lambda *_args: upstream_released.wait(timeout=10)
+        a_logger = lg.AsyncLogger(mock_logger)
+
+        a_logger.info("first")
+        a_logger.info("second")
+        upstream_released.set()
+        a_logger.flush()
+
+        assert mock_logger.mock.log.call_count == 2
+
+    def test_when_upstream_logger_raises_then_subsequent_messages_relayed(self, mock_logger):
+        mock_logger.mock.log.side_effect = [RuntimeError("oops"), None]
+        a_logger = lg.AsyncLogger(mock_logger)
+
+        a_logger.info("first")
+        a_logger.info("second")
+        a_logger.flush()
+
+        assert mock_logger.mock.log.call_args_list[-1] == mock.call(
+            lg.LoggerInterface.Severity.kInfo, "second"
+        )
+
+    @pytest.mark.parametrize(
+        "overflow_policy,expected_messages",
+        (
+            (lg.AsyncLogger.OverflowPolicy.kDropNewest, ["blocking", "0", "1"]),
+            (lg.AsyncLogger.OverflowPolicy.kDropOldest, ["blocking", "2", "3"]),
+        ),
+    )
+    def test_when_queue_full_then_messages_dropped_according_to_policy(
+        self, mock_logger, overflow_policy, expected_messages
+    ):
+        upstream_entered = threading.Event()
+        upstream_released = threading.Event()
+
+        def block_first_message(_severity, message):
+            if message == "blocking":
+                upstream_entered.set()
+                upstream_released.wait(timeout=10)
+
+        mock_logger.mock.log.side_effect = block_first_message
+        a_logger = lg.AsyncLogger(mock_logger, 2, overflow_policy)
+
+        # Wait for the background thread to take the first message, so
+        # the queue is empty.
+        a_logger.info("blocking")
+        assert upstream_entered.wait(timeout=10)
+        for idx in range(4):
+            a_logger.info(str(idx))
+        upstream_released.set()
+        a_logger.flush()
+
+        messages = [call.args[1] for call in mock_logger.mock.log.call_args_list]
+        assert messages == expected_messages + [
+            "AsyncLogger: 2 message(s) dropped due to a full queue"
+        ]
+        assert mock_logger.mock.log.call_args_list[-1].args[0] == (
+            lg.LoggerInterface.Severity.kWarning
+        )
+        assert a_logger.droppedCount() == 2
+
+
+class Test_AsyncLogger_isSeverityLogged:
+    def test_returns_upstream_logger_result(self, mock_logger):
+        mock_logger.mock.isSeverityLogged.side_effect = (
+            lambda severity: severity > lg.LoggerInterface.Severity.kInfo
+        )
+        a_logger = lg.AsyncLogger(mock_logger)
+
+        for severity in all_severities:
+            assert a_logger.isSeverityLogged(severity) == (
+                severity > lg.LoggerInterface.Severity.kInfo
+            )
+
+
+class Test_LogRecord:
+    def test_defaults(self):
+        a_record = lg.LogRecord()
+
+        assert a_record.severity == lg.LoggerInterface.Severity.kInfo
+        assert a_record.message == ""
+        assert a_record.method == ""
+        assert a_record.managerIdentifier == ""
+        assert a_record.batchSize is None
+        assert a_record.durationNs is None
+        assert a_record.errorCode is None
+        assert a_record.timestampNs is None
+
+    def test_fields_are_writable(self):
+        a_record = lg.LogRecord()
+
+        a_record.method = "preflight"
+        a_record.batchSize = 2
+        a_record.errorCode = BatchElementError.ErrorCode.kEntityAccessError
+
+        assert a_record.method == "preflight"
+        assert a_record.batchSize == 2
+        assert a_record.errorCode == BatchElementError.ErrorCode.kEntityAccessError
+
+
+class Test_LoggerInterface_logRecord:
+    def test_when_not_overridden_then_log_called_with_severity_and_message(
+        self, mock_logger, a_full_record
+    ):
+        mock_logger.logRecord(a_full_record)
+
+        mock_logger.mock.log.assert_called_once_with(
+            lg.LoggerInterface.Severity.kDebugApi, "a message"
+        )
+
+
+class Test_SeverityFilter_logRecord:
+    def test_when_record_is_at_or_above_severity_then_relayed(self, a_full_record):
+        recording_logger = RecordingLogger()
+        a_filter = lg.SeverityFilter(recording_logger)
+        a_filter.setSeverity(lg.LoggerInterface.Severity.kDebugApi)
+
+        a_filter.logRecord(a_full_record)
+
+        assert len(recording_logger.records) == 1
+        assert recording_logger.records[0].method == "resolve"
+        assert recording_logger.records[0].durationNs == 1234
+
+    def test_when_record_is_below_severity_then_dropped(self, a_full_record):
+        recording_logger = RecordingLogger()
+        a_filter = lg.SeverityFilter(recording_logger)
+        a_filter.setSeverity(lg.LoggerInterface.Severity.kDebug)
+
+        a_filter.logRecord(a_full_record)
+
+        assert recording_logger.records == []
+
+
+class Test_AsyncLogger_logRecord:
+    def test_when_flushed_then_record_relayed_with_all_fields(self, a_full_record):
+        recording_logger = RecordingLogger()
+        a_logger = lg.AsyncLogger(recording_logger)
+
+        a_logger.logRecord(a_full_record)
+        a_logger.flush()
+
+        assert len(recording_logger.records) == 1
+        relayed = recording_logger.records[0]
+        assert relayed.severity == a_full_record.severity
+        assert relayed.message == a_full_record.message
+        assert relayed.method == a_full_record.method
+        assert relayed.managerIdentifier == a_full_record.managerIdentifier
+        assert relayed.batchSize == a_full_record.batchSize
+        assert relayed.durationNs == a_full_record.durationNs
+        assert relayed.errorCode == a_full_record.errorCode
+        assert relayed.timestampNs == a_full_record.timestampNs
+
+    def test_when_message_logged_then_record_relayed_with_timestamp(self):
+        recording_logger = RecordingLogger()
+        a_logger = lg.AsyncLogger(recording_logger)
+
+        a_logger.log(lg.LoggerInterface.Severity.kInfo, "a message")
+        a_logger.flush()
+
+        assert len(recording_logger.records) == 1
+        assert recording_logger.records[0].message == "a message"
+        assert recording_logger.records[0].timestampNs > 0
+
+
+class Test_JsonLinesLogger_inheritance:
+    def test_class_is_final(self):
+        with pytest.raises(TypeError):
+
+            class _(lg.JsonLinesLogger):
+                pass
+
+
+class Test_JsonLinesLogger_init:
+    def test_when_file_cannot_be_opened_then_raises_RuntimeError(self, tmp_path):
+        a_path = str(tmp_path / "missing" / "log.jsonl")
+
+        with pytest.raises(RuntimeError, match="Unable to open"):
+            lg.JsonLinesLogger(a_path)
+
+    def test_path_is_reflected(self, tmp_path):
+        a_path = str(tmp_path / "log.jsonl")
+
+        assert lg.JsonLinesLogger(a_path).path() == a_path
+
+
+class Test_JsonLinesLogger_log:
+    def test_writes_one_json_object_per_line(self, tmp_path):
+        a_path = tmp_path / "log.jsonl"
+        a_logger = lg.JsonLinesLogger(str(a_path))
+
+        a_logger.log(lg.LoggerInterface.Severity.kWarning, 'a "quoted"\nmessage\x01')
+        a_logger.info("another message")
+
+        lines = a_path.read_text().splitlines()
+        assert len(lines) == 2
+        first, second = (json.loads(line) for line in lines)
+        assert set(first.keys()) == {"timestampNs", "severity", "message"}
+        assert first["severity"] == "warning"
+        assert first["message"] == 'a "quoted"\nmessage\x01'
+        assert first["timestampNs"] > 0
+        assert second["severity"] == "info"
+        assert second["message"] == "another message"
+
+    def test_when_file_exists_then_appended_to(self, tmp_path):
+        a_path = tmp_path / "log.jsonl"
+        a_path.write_text('{"existing": true}\n')
+
+        lg.JsonLinesLogger(str(a_path)).info("a message")
+
+        lines = a_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["message"] == "a message"
+
+
+class Test_JsonLinesLogger_logRecord:
+    def test_writes_all_populated_fields(self, tmp_path, a_full_record):
+        a_path = tmp_path / "log.jsonl"
+
+        lg.JsonLinesLogger(str(a_path)).logRecord(a_full_record)
+
+        assert json.loads(a_path.read_text()) == {
+            "timestampNs": 5678,
+            "severity": "debugApi",
+            "message": "a message",
+            "method": "resolve",
+            "managerIdentifier": "org.openassetio.test.manager",
+            "batchSize": 3,
+            "durationNs": 1234,
+            "errorCode": "kEntityResolutionError",
+        }
+
+    def test_when_wrapped_in_async_logger_then_fields_preserved(self, tmp_path, a_full_record):
+        a_path = tmp_path / "log.jsonl"
+        a_logger = lg.AsyncLogger(lg.JsonLinesLogger(str(a_path)))
+
+        a_logger.logRecord(a_full_record)
+        a_logger.flush()
+
+        written = json.loads(a_path.read_text())
+        assert written["method"] == "resolve"
+        assert written["durationNs"] == 1234
+        assert written["errorCode"] == "kEntityResolutionError"
@@ -36,6 +36,25 @@ class Test_TraitsData_Copy_Constructor:
         assert data_a.getTraitProperty("a", "p") == 1
         assert not data_a.hasTrait("b")
 
+    def test_when_original_modified_after_copying_then_copy_unaffected(self):
+        data_a = TraitsData()
+        data_a.setTraitProperty("a", "p", 1)
+        data_b = TraitsData(data_a)
+        data_a.addTraits({"b", "c"})
+        data_a.setTraitProperty("a", "p", 2)
+        assert data_b.getTraitProperty("a", "p") == 1
+        assert data_b.traitSet() == {"a"}
+
+    def test_when_copy_of_copy_modified_then_others_unaffected(self):
+        data_a = TraitsData({"a"})
+        data_b = TraitsData(data_a)
+        data_c = TraitsData(data_b)
+        data_c.addTrait("c")
+        data_b.addTrait("b")
+        assert data_a.traitSet() == {"a"}
+        assert data_b.traitSet() == {"a", "b"}
+        assert data_c.traitSet() == {"a", "c"}
+
 
 class Test_TraitsData_traitSet:
     ## TODO(TC): Asset that result is a set, and not a reference to
@@ -150,6 +169,125 @@ class Test_TraitsData_traitPropertyKeys:
         assert a_traitsdata.traitPropertyKeys("a_trait") == set()
 
 
+class Test_TraitsData_getTraitProperties:
+    def test_when_trait_has_properties_then_returns_dict_of_values(self, a_traitsdata):
+        a_traitsdata.setTraitProperty("first_trait", "a_string", "")
+        a_traitsdata.setTraitProperty("first_trait", "a_float", 1.2)
+        assert a_traitsdata.getTraitProperties("first_trait") == {
+            "a_string": "",
+            "a_float": 1.2,
+        }
+
+    def test_when_trait_has_no_properties_then_returns_empty_dict(self, a_traitsdata):
+        assert a_traitsdata.getTraitProperties("second_trait") == {}
+
+    def test_when_trait_is_not_found_then_raises_IndexError(self, a_traitsdata):
+        with pytest.raises(IndexError):
+            a_traitsdata.getTraitProperties("missingTrait")
+
+
+class Test_TraitsData_setTraitProperties:
+    def test_when_trait_is_new_then_trait_added_with_properties(self):
+        data = TraitsData()
+        data.setTraitProperties("a_trait", {"a": 1, "b": "b"})
+        assert data.traitSet() == {"a_trait"}
+        assert data.getTraitProperty("a_trait", "a") == 1
+        assert data.getTraitProperty("a_trait", "b") == "b"
+
+    def test_when_trait_exists_then_properties_merged(self):
+        data = TraitsData()
+        data.setTraitProperty("a_trait", "a", 1)
+        data.setTraitProperty("a_trait", "b", 2)
+        data.setTraitProperties("a_trait", {"b": 3, "c": 4})
+        assert data.getTraitProperties("a_trait") == {"a": 1, "b": 3, "c": 4}
+
+    def test_when_value_is_not_supported_then_raises_TypeError(self):
+        data = TraitsData()
+        with pytest.raises(TypeError):
+            data.setTraitProperties("a_trait", {"a": None})
+
+
+class Test_TraitsData_setProperties:
+    def test_when_traits_are_new_then_all_traits_added_with_properties(self):
+        data = TraitsData({"existing"})
+        data.setProperties({"a_trait": {"a": 1}, "b_trait": {"b": True}, "c_trait": {}})
+        assert data.traitSet() == {"existing", "a_trait", "b_trait", "c_trait"}
+        assert data.getTraitProperty("a_trait", "a") == 1
+        assert data.getTraitProperty("b_trait", "b") is True
+
+    def test_when_traits_exist_then_properties_merged(self):
+        data = TraitsData()
+        data.setTraitProperty("a_trait", "a", 1)
+        data.setTraitProperty("b_trait", "b", 2)
+        data.setProperties({"a_trait": {"a": 3}, "b_trait": {"c": 4}})
+        assert data.toDict() == {"a_trait": {"a": 3}, "b_trait": {"b": 2, "c": 4}}
+
+    def test_when_value_is_not_supported_then_raises_TypeError(self):
+        data = TraitsData()
+        with pytest.raises(TypeError):
+            data.setProperties({"a_trait": {"a": None}})
+        with pytest.raises(TypeError):
+            data.setProperties({"a_trait": {"a": object()}})
+
+
+class Test_TraitsData_toDict:
+    def test_when_empty_then_returns_empty_dict(self):
+        assert TraitsData().toDict() == {}
+
+    def test_returns_all_traits_and_properties(self, a_traitsdata):
+        a_traitsdata.setTraitProperty("first_trait", "a_string", "")
+        a_traitsdata.setTraitProperty("first_trait", "a_float", 1.2)
+        assert a_traitsdata.toDict() == {
+            "first_trait": {"a_string": "", "a_float": 1.2},
+            "second_trait": {},
+        }
+
+
+class Test_TraitsData_fromDict:
+    def test_when_round_tripped_then_equal(self, a_traitsdata):
+        a_traitsdata.setTraitProperty("first_trait", "an_int", 1)
+        assert TraitsData.fromDict(a_traitsdata.toDict()) == a_traitsdata
+
+    def test_returns_new_instance_with_given_data(self):
+        data = TraitsData.fromDict({"a_trait": {"a": 1.5}, "b_trait": {}})
+        assert data.traitSet() == {"a_trait", "b_trait"}
+        assert data.getTraitProperty("a_trait", "a") == 1.5
+
+    def test_when_value_is_not_supported_then_raises_TypeError(self):
+        with pytest.raises(TypeError):
+            TraitsData.fromDict({"a_trait": {"a": None}})
+
+
+class Test_TraitsData_traitProperties:
+    def test_when_has_no_properties_then_iterator_is_empty(self):
+        data = TraitsData({"a_trait"})
+        assert list(data.traitProperties()) == []
+
+    def test_when_has_properties_then_yields_all_trait_property_value_triples(self):
+        data = TraitsData({"empty_trait"})
+        data.setTraitProperty("a_trait", "a_property", 1)
+        data.setTraitProperty("a_trait", "another_property", "a")
+        data.setTraitProperty("b_trait", "b_property", True)
+
+        triples = data.traitProperties()
+
+        assert iter(triples) is triples
+        assert sorted(triples) == [
+            ("a_trait", "a_property", 1),
+            ("a_trait", "another_property", "a"),
+            ("b_trait", "b_property", True),
+        ]
+
+    def test_when_modified_during_iteration_then_iterator_unaffected(self):
+        data = TraitsData()
+        data.setTraitProperty("a_trait", "a_property", 1)
+
+        triples = data.traitProperties()
+        data.setTraitProperty("b_trait", "b_property", 2)
+
+        assert list(triples) == [("a_trait", "a_property", 1)]
+
+
 class Test_TraitsData_equality:
     def test_when_comparing_with_same_data_then_are_equal(self):
         data_a = TraitsData({"a_trait"})
@@ -158,6 +296,17 @@ class Test_TraitsData_equality:
         data_b.setTraitProperty("a_trait", "a_property", 1)
         assert data_a == data_b
 
+    def test_when_comparing_with_same_data_set_in_different_order_then_are_equal(self):
+        data_a = TraitsData()
+        data_a.setTraitProperty("a_trait", "a_property", 1)
+        data_a.setTraitProperty("b_trait", "b_property", "b")
+        data_a.setTraitProperty("a_trait", "c_property", 3.0)
+        data_b = TraitsData()
+        data_b.setTraitProperty("b_trait", "b_property", "b")
+        data_b.setTraitProperty("a_trait", "c_property", 3.0)
+        data_b.setTraitProperty("a_trait", "a_property", 1)
+        assert data_a == data_b
+
     def test_when_comparing_with_different_property_value_then_are_not_equal(self):
         data_a = TraitsData({"a_trait"})
         data_a.setTraitProperty("a_trait", "a_property", 1)
@@ -0,0 +1,122 @@
+"""
+Tests for the columnar traits data batch container
+"""
+# pylint: disable=invalid-name,missing-class-docstring
+# pylint: disable=redefined-outer-name,no-self-use
+# pylint: disable=missing-function-docstring
+import pytest
+
+# TODO(DF): @pylint - re-enable once Python dev vs. install mess sorted.
+# pylint: disable=no-name-in-module
+from openassetio import BatchElementError, TraitsDataBatch
+
+
+class Test_TraitsDataBatch_Inheritance:
+    def test_class_is_final(self):
+        with pytest.raises(TypeError):
+
+            class _(TraitsDataBatch):
+                pass
+
+
+class Test_TraitsDataBatch_init:
+    def test_has_given_size_and_no_traits(self):
+        batch = TraitsDataBatch(3)
+        assert batch.size() == 3
+        assert len(batch) == 3
+        assert batch.traitSet() == set()
+
+
+class Test_TraitsDataBatch_addTrait:
+    def test_when_trait_added_then_only_given_element_has_trait(self, a_batch):
+        a_batch.addTrait(1, "a_trait")
+        assert not a_batch.hasTrait(0, "a_trait")
+        assert a_batch.hasTrait(1, "a_trait")
+        assert a_batch.traitSet() == {"a_trait"}
+
+    def test_when_index_out_of_range_then_raises_IndexError(self, a_batch):
+        with pytest.raises(IndexError):
+            a_batch.addTrait(3, "a_trait")
+
+
+class Test_TraitsDataBatch_setTraitProperty:
+    @pytest.mark.parametrize("value", (True, 1, 1.5, "a"))
+    def test_when_set_then_value_retrieved(self, a_batch, value):
+        a_batch.setTraitProperty(2, "a_trait", "a", value)
+        assert a_batch.getTraitProperty(2, "a_trait", "a") == value
+        assert type(a_batch.getTraitProperty(2, "a_trait", "a")) is type(value)
+        assert a_batch.getTraitProperty(0, "a_trait", "a") is None
+        assert a_batch.hasTrait(2, "a_trait")
+
+    def test_when_type_differs_from_column_then_raises_ValueError(self, a_batch):
+        a_batch.setTraitProperty(0, "a_trait", "a", 1)
+        with pytest.raises(ValueError):
+            a_batch.setTraitProperty(1, "a_trait", "a", "a")
+
+    def test_when_value_is_None_then_raises_TypeError(self, a_batch):
+        with pytest.raises(TypeError):
+            a_batch.setTraitProperty(0, "a_trait", "a", None)
+
+
+class Test_TraitsDataBatch_column:
+    def test_when_no_values_set_then_returns_None(self, a_batch):
+        assert a_batch.column("a_trait", "a") is None
+
+    def test_when_some_values_set_then_returns_list_with_None_for_unset(self, a_batch):
+        a_batch.setTraitProperty(0, "a_trait", "a", "x")
+        a_batch.setTraitProperty(2, "a_trait", "a", "z")
+        assert a_batch.column("a_trait", "a") == ["x", None, "z"]
+
+
+class Test_TraitsDataBatch_setColumn:
+    @pytest.mark.parametrize(
+        "values", ([True, False, True], [1, 2, 3], [1.5, 2.5, 3.5], ["a", "b", "c"])
+    )
+    def test_when_set_then_all_values_set_with_original_type(self, a_batch, values):
+        a_batch.setColumn("a_trait", "a", values)
+
+        column = a_batch.column("a_trait", "a")
+        assert column == values
+        assert [type(value) for value in column] == [type(value) for value in values]
+        assert all(a_batch.hasTrait(idx, "a_trait") for idx in range(3))
+
+    def test_when_wrong_length_then_raises_ValueError(self, a_batch):
+        with pytest.raises(ValueError):
+            a_batch.setColumn("a_trait", "a", [1, 2])
+
+    @pytest.mark.parametrize("values", ([1, "b", 3], [1, 2.5, True], [None, None, None]))
+    def test_when_mixed_or_unsupported_types_then_raises_TypeError(self, a_batch, values):
+        with pytest.raises(TypeError):
+            a_batch.setColumn("a_trait", "a", values)
+
+
+class Test_TraitsDataBatch_error:
+    def test_when_not_set_then_returns_None(self, a_batch):
+        assert a_batch.error(0) is None
+
+    def test_when_set_then_returns_error(self, a_batch):
+        a_batch.setError(
+            1, BatchElementError(BatchElementError.ErrorCode.kEntityResolutionError, "oops")
+        )
+        error = a_batch.error(1)
+        assert error.code == BatchElementError.ErrorCode.kEntityResolutionError
+        assert error.message == "oops"
+
+
+class Test_TraitsDataBatch_traitsData:
+    def test_returns_traits_and_properties_of_element(self, a_batch):
+        a_batch.addTrait(1, "empty_trait")
+        a_batch.setColumn("a_trait", "a", [1, 2, 3])
+        a_batch.setTraitProperty(1, "b_trait", "b", "b")
+
+        assert a_batch.traitsData(0).toDict() == {"a_trait": {"a": 1}}
+        assert a_batch.traitsData(1).toDict() == {
+            "empty_trait": {},
+            "a_trait": {"a": 2},
+            "b_trait": {"b": "b"},
+        }
+
+
+@pytest.fixture
+def a_batch():
+    return TraitsDataBatch(3)